@@ -13,19 +13,27 @@ from darts.config import (
     set_option,
 )
 from darts.timeseries import (
+    StreamingTimeSeries,
     TimeSeries,
+    TimeSeriesCollection,
     concatenate,
     slice_intersect,
+    to_arrow,
     to_group_dataframe,
+    to_parquet,
 )
 
 __version__ = "0.46.1"
 
 __all__ = [
     "TimeSeries",
+    "TimeSeriesCollection",
+    "StreamingTimeSeries",
     "concatenate",
     "slice_intersect",
     "to_group_dataframe",
+    "to_arrow",
+    "to_parquet",
     "get_option",
     "set_option",
     "reset_option",
@@ -26,6 +26,50 @@ Available Options
     configure both backends with a custom style optimized for time series visualization. When False,
     the default or user-configured styles will be used. Changes to this option take effect immediately.
 
+**Computation Options**
+
+- ``compute.dtype`` : str or None (default: None)
+    The floating point dtype (``"float32"`` or ``"float64"``) of the values of all ``TimeSeries`` created from user
+    inputs (the ``TimeSeries`` constructor and the ``TimeSeries.from_*()`` methods) or generated with
+    :mod:`darts.utils.timeseries_generation`. It takes precedence over the dtype of the inputs. Operations on these
+    series (data transformers such as ``Scaler``, the covariates generated by the encoders, the lagged features of
+    the regression models, the samples of the torch datasets, forecasts, ...) keep their dtype. When None, floating
+    point inputs keep their dtype and other inputs are converted to ``float64``. Using ``"float32"`` halves the
+    memory usage and speeds up many computations.
+
+**Debugging Options**
+
+- ``debug.validate_series`` : bool (default: False)
+    Whether to fully validate all ``TimeSeries`` that Darts creates internally from already valid inputs (e.g.
+    when slicing a series, or when building forecasts). By default, these series skip the (costly) checks of the
+    ``TimeSeries`` constructor. When True, they are created through the full constructor, and an error is raised if
+    the inputs violate any of the ``TimeSeries`` guarantees. Useful for debugging.
+
+**Profiling Options**
+
+- ``profiling.enabled`` : bool (default: False)
+    Whether to record named spans (e.g. ``"tabularize"``, ``"estimator.fit"``, ``"predict_rollout"``,
+    ``"transform"``, ``"metric"``, ...) with their number of calls, wall time and allocated memory in the hot paths of
+    Darts. The report is retrieved with :func:`darts.utils.profiling.get_profiling_report()`. When False, the
+    instrumentation has a negligible overhead.
+
+- ``profiling.track_memory`` : bool (default: True)
+    Whether to trace the memory allocated by the profiled spans with ``tracemalloc`` when ``profiling.enabled`` is
+    True. Tracing the memory slows down Python code; disable it to only record the number of calls and wall times.
+
+**Tabularization Options**
+
+- ``tabularization.cache_max_bytes`` : int (default: 0)
+    The maximum number of bytes of lagged training data (features, labels and sample weights) that ``SKLearnModel``
+    keeps in memory, to skip the tabularization in repeated fits on the same series with the same lag configuration
+    (e.g. in a gridsearch over the estimator hyperparameters). The least recently used entries are evicted first.
+    ``0`` disables the in-memory cache. See :mod:`darts.utils.data.tabularization.cache`.
+
+- ``tabularization.cache_dir`` : str | None (default: None)
+    Optionally, a directory to which the entries evicted from the in-memory tabularization cache are written, and
+    from which they are read again on a later hit (also in later Python sessions). When set, the lagged training
+    data is cached even if ``tabularization.cache_max_bytes`` is ``0``.
+
 Examples
 ========
 >>> from darts import get_option, set_option, option_context
@@ -133,12 +177,79 @@ class _OptionsManager:
             callback=self._on_plotting_style_change,
         )
 
+        # Computation options
+        compute_dtype = _Option(
+            key="compute.dtype",
+            default_value=None,
+            description="The floating point dtype ('float32' or 'float64') of the values of all TimeSeries created "
+            "from user inputs or generated with `darts.utils.timeseries_generation`. It takes precedence over the "
+            "dtype of the inputs. When None, floating point inputs keep their dtype and other inputs are converted "
+            "to float64.",
+            validator=self._validate_dtype,
+        )
+
+        # Debugging options
+        debug_validate_series = _Option(
+            key="debug.validate_series",
+            default_value=False,
+            description="Whether to fully validate all TimeSeries that Darts creates internally from already "
+            "valid inputs (e.g. when slicing a series, or when building forecasts). When True, they are created "
+            "through the full TimeSeries constructor, and an error is raised if the inputs violate any of the "
+            "TimeSeries guarantees.",
+            validator=self._validate_bool,
+        )
+
+        # Profiling options
+        profiling_enabled = _Option(
+            key="profiling.enabled",
+            default_value=False,
+            description="Whether to record named spans (e.g. 'tabularize', 'estimator.fit', 'predict_rollout', "
+            "'transform', 'metric', ...) with their number of calls, wall time and allocated memory in the hot "
+            "paths of Darts. The report is retrieved with `darts.utils.profiling.get_profiling_report()`.",
+            validator=self._validate_bool,
+            callback=self._on_profiling_change,
+        )
+
+        profiling_track_memory = _Option(
+            key="profiling.track_memory",
+            default_value=True,
+            description="Whether to trace the memory allocated by the profiled spans with `tracemalloc` when "
+            "`profiling.enabled` is True. Tracing the memory slows down Python code.",
+            validator=self._validate_bool,
+            callback=self._on_profiling_change,
+        )
+
+        # Tabularization options
+        tabularization_cache_max_bytes = _Option(
+            key="tabularization.cache_max_bytes",
+            default_value=0,
+            description="The maximum number of bytes of lagged training data that `SKLearnModel` keeps in memory to "
+            "skip the tabularization in repeated fits on the same series with the same lag configuration. `0` "
+            "disables the in-memory cache.",
+            validator=self._validate_non_negative_int,
+            callback=self._on_tabularization_cache_change,
+        )
+
+        tabularization_cache_dir = _Option(
+            key="tabularization.cache_dir",
+            default_value=None,
+            description="Optionally, a directory to which the entries evicted from the in-memory tabularization "
+            "cache are written, and from which they are read again on a later hit.",
+            validator=self._validate_optional_str,
+        )
+
         self._options = {
             opt.key: opt
             for opt in [
                 display_max_rows,
                 display_max_cols,
                 plotting_use_darts_style,
+                compute_dtype,
+                debug_validate_series,
+                profiling_enabled,
+                profiling_track_memory,
+                tabularization_cache_max_bytes,
+                tabularization_cache_dir,
             ]
         }
         # remember if user applied Darts style
@@ -153,12 +264,44 @@ class _OptionsManager:
         if not isinstance(value, int) or value <= 0:
             raise_log(ValueError("Value must be a positive integer"))
 
+    @staticmethod
+    def _validate_non_negative_int(value: Any):
+        """Validator for non-negative integers."""
+        if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+            raise_log(ValueError("Value must be a non-negative integer"))
+
+    @staticmethod
+    def _validate_optional_str(value: Any):
+        """Validator for optional strings."""
+        if value is not None and not isinstance(value, str):
+            raise_log(ValueError("Value must be a string or `None`"))
+
     @staticmethod
     def _validate_bool(value: Any):
         """Validator for boolean values."""
         if not isinstance(value, bool):
             raise_log(ValueError("Value must be a boolean"))
 
+    @staticmethod
+    def _validate_dtype(value: Any):
+        """Validator for floating point dtypes."""
+        if value not in {None, "float32", "float64"}:
+            raise_log(ValueError("Value must be one of `None`, 'float32' or 'float64'"))
+
+    @staticmethod
+    def _on_profiling_change(value: bool) -> None:
+        """Callback for when profiling.enabled or profiling.track_memory changes."""
+        from darts.utils.profiling import _update_profiling
+
+        _update_profiling()
+
+    @staticmethod
+    def _on_tabularization_cache_change(value: int) -> None:
+        """Callback for when tabularization.cache_max_bytes changes."""
+        from darts.utils.data.tabularization.cache import _evict
+
+        _evict(value)
+
     def _on_plotting_style_change(self, value: bool) -> None:
         """Callback for when plotting.use_darts_style changes."""
         # matplotlib
@@ -357,6 +500,10 @@ def get_option(pat: str) -> Any:
 
     - display.[max_rows, max_cols]
     - plotting.use_darts_style
+    - compute.dtype
+    - debug.validate_series
+    - profiling.[enabled, track_memory]
+    - tabularization.[cache_max_bytes, cache_dir]
 
     Parameters
     ----------
@@ -390,6 +537,10 @@ def set_option(pat: str, value: Any) -> None:
 
     - display.[max_rows, max_cols]
     - plotting.use_darts_style
+    - compute.dtype
+    - debug.validate_series
+    - profiling.[enabled, track_memory]
+    - tabularization.[cache_max_bytes, cache_dir]
 
     Parameters
     ----------
@@ -419,6 +570,10 @@ def reset_option(pat: str) -> None:
 
     - display.[max_rows, max_cols]
     - plotting.use_darts_style
+    - compute.dtype
+    - debug.validate_series
+    - profiling.[enabled, track_memory]
+    - tabularization.[cache_max_bytes, cache_dir]
 
     Parameters
     ----------
@@ -448,6 +603,10 @@ def describe_option(pat: str) -> str:
 
     - display.[max_rows, max_cols]
     - plotting.use_darts_style
+    - compute.dtype
+    - debug.validate_series
+    - profiling.[enabled, track_memory]
+    - tabularization.[cache_max_bytes, cache_dir]
 
     Parameters
     ----------
@@ -487,6 +646,10 @@ def option_context(*args) -> Generator[None, None, None]:
 
     - display.[max_rows, max_cols]
     - plotting.use_darts_style
+    - compute.dtype
+    - debug.validate_series
+    - profiling.[enabled, track_memory]
+    - tabularization.[cache_max_bytes, cache_dir]
 
     Parameters
     ----------
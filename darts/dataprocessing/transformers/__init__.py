@@ -39,6 +39,7 @@ if TYPE_CHECKING:
     from darts.dataprocessing.transformers.reconciliation import (
         TopDownReconciliator as TopDownReconciliator,
     )
+    from darts.dataprocessing.transformers.resampler import Resampler as Resampler
     from darts.dataprocessing.transformers.scaler import Scaler as Scaler
     from darts.dataprocessing.transformers.static_covariates_transformer import (
         StaticCovariatesTransformer as StaticCovariatesTransformer,
@@ -60,6 +61,7 @@ _LAZY_IMPORTS: dict[str, str] = {
     "BottomUpReconciliator": "darts.dataprocessing.transformers.reconciliation",
     "MinTReconciliator": "darts.dataprocessing.transformers.reconciliation",
     "TopDownReconciliator": "darts.dataprocessing.transformers.reconciliation",
+    "Resampler": "darts.dataprocessing.transformers.resampler",
     "Scaler": "darts.dataprocessing.transformers.scaler",
     "StaticCovariatesTransformer": "darts.dataprocessing.transformers.static_covariates_transformer",
     "WindowTransformer": "darts.dataprocessing.transformers.window_transformer",
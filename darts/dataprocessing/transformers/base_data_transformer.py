@@ -15,6 +15,7 @@ from darts import TimeSeries
 from darts.logging import get_logger, raise_log
 from darts.typing import TimeSeriesLike
 from darts.utils import _build_tqdm_iterator, _parallel_apply
+from darts.utils.profiling import profiled
 from darts.utils.ts_utils import SeriesType, get_series_seq_type, series2seq
 
 logger = get_logger(__name__)
@@ -292,6 +293,7 @@ class BaseDataTransformer(ABC):
         """
         pass
 
+    @profiled("transform")
     def transform(
         self,
         series: TimeSeriesLike,
@@ -610,11 +612,12 @@ class BaseDataTransformer(ABC):
                     ),
                 )
             if isinstance(vals_, TimeSeries):
-                # remove timepoints not present in transformed data (returns a copy)
+                # remove timepoints not present in transformed data
                 unmasked = series_.slice_intersect(vals_)
-                # populate with new values
-                unmasked_vals = unmasked.all_values(copy=False)
+                # populate a copy with new values
+                unmasked_vals = unmasked.all_values(copy=True)
                 unmasked_vals[:, component_mask, :] = vals_.all_values(copy=False)
+                unmasked = unmasked._with_trusted_values(unmasked_vals)
             else:
                 unmasked = series_.all_values(copy=True)
                 unmasked[:, component_mask, :] = vals_
@@ -17,6 +17,7 @@ from darts.dataprocessing.transformers.base_data_transformer import (
 from darts.logging import get_logger, raise_log
 from darts.typing import TimeSeriesLike
 from darts.utils import _build_tqdm_iterator, _parallel_apply
+from darts.utils.profiling import profiled
 
 logger = get_logger(__name__)
 
@@ -217,6 +218,7 @@ class FittableDataTransformer(BaseDataTransformer):
         """
         pass
 
+    @profiled("transformer.fit")
     def fit(
         self,
         series: TimeSeriesLike,
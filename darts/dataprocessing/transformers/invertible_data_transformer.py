@@ -17,6 +17,7 @@ from darts.dataprocessing.transformers.base_data_transformer import (
 from darts.logging import raise_log
 from darts.typing import TimeSeriesLike
 from darts.utils import _build_tqdm_iterator, _parallel_apply
+from darts.utils.profiling import profiled
 
 
 class InvertibleDataTransformer(BaseDataTransformer):
@@ -239,6 +240,7 @@ class InvertibleDataTransformer(BaseDataTransformer):
         """
         pass
 
+    @profiled("inverse_transform")
     def inverse_transform(
         self,
         series: TimeSeriesLike | Sequence[Sequence[TimeSeries]],
@@ -0,0 +1,127 @@
+"""
+Resampler
+---------
+"""
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from darts import TimeSeries
+from darts.dataprocessing.transformers import BaseDataTransformer
+from darts.timeseries import _resample
+from darts.typing import TimeSeriesLike
+from darts.utils.profiling import profiled
+
+
+class Resampler(BaseDataTransformer):
+    def __init__(
+        self,
+        freq: str | pd.DateOffset,
+        method: str = "pad",
+        method_kwargs: dict[str, Any] | None = None,
+        resample_kwargs: dict[str, Any] | None = None,
+        name: str = "Resampler",
+        n_jobs: int = 1,
+        verbose: bool = False,
+    ):
+        """
+        A transformer that resamples a TimeSeries or a Sequence of TimeSeries with a given frequency, see
+        :meth:`TimeSeries.resample() <darts.timeseries.TimeSeries.resample>`.
+
+        The methods "first", "interpolate", "last", "max", "mean", "min", and "sum" (without `method_kwargs`) are
+        computed with NumPy for series with a ``pandas.DatetimeIndex``. With `n_jobs=1`, series sharing the same
+        time index and dtype (e.g. a panel of series covering the same calendar) are resampled at once, with the
+        resampling bins computed only once.
+
+        Parameters
+        ----------
+        freq
+            The new time difference between two adjacent entries in the resampled series.
+            Expects a `pandas.DateOffset` or `DateOffset` alias.
+        method
+            A method to either aggregate grouped values (for down-sampling) or fill holes (for up-sampling)
+            in the resampled series. See :meth:`TimeSeries.resample() <darts.timeseries.TimeSeries.resample>` for the
+            supported methods.
+        method_kwargs
+            Additional keyword arguments for the specified `method`.
+        resample_kwargs
+            Additional keyword arguments for the resampling, notably `offset` to indicate where to start the
+            resampling. See :meth:`TimeSeries.resample() <darts.timeseries.TimeSeries.resample>`.
+        name
+            A specific name for the transformer.
+        n_jobs
+            The number of jobs to run in parallel. Parallel jobs are created only when a ``Sequence[TimeSeries]`` is
+            passed as input to a method, parallelising operations regarding different ``TimeSeries``. Defaults to `1`
+            (sequential). Setting the parameter to `-1` means using all the available processors.
+            Note: for a small amount of data, the parallelisation overhead could end up increasing the total
+            required amount of time.
+        verbose
+            Whether to print operations progress.
+
+        Examples
+        --------
+        >>> import pandas as pd
+        >>> from darts import TimeSeries
+        >>> from darts.dataprocessing.transformers import Resampler
+        >>> times = pd.date_range("2020-01-01", periods=4, freq="30min")
+        >>> series = TimeSeries.from_times_and_values(times, [1.0, 2.0, 3.0, 4.0])
+        >>> transformer = Resampler(freq="1h", method="mean")
+        >>> series_transformed = transformer.transform(series)
+        >>> print(series_transformed.values())
+        [[1.5]
+         [3.5]]
+        """
+        # Define fixed params (i.e. attributes defined before calling `super().__init__`):
+        self.freq = freq
+        self.method = method
+        self.method_kwargs = method_kwargs
+        self.resample_kwargs = resample_kwargs
+        # the resampled series have a different time index, the components cannot be masked
+        super().__init__(name, n_jobs, verbose, mask_components=False)
+
+    @staticmethod
+    def ts_transform(series: TimeSeries, params: Mapping[str, Any]) -> TimeSeries:
+        fixed_params = params["fixed"]
+        return series.resample(
+            freq=fixed_params["freq"],
+            method=fixed_params["method"],
+            method_kwargs=fixed_params["method_kwargs"],
+            **(fixed_params["resample_kwargs"] or {}),
+        )
+
+    @profiled("transform")
+    def transform(
+        self,
+        series: TimeSeriesLike,
+        *args,
+        component_mask: np.ndarray | None = None,
+        series_idx: int | Sequence[int] | None = None,
+        **kwargs,
+    ) -> TimeSeries | list[TimeSeries]:
+        if (
+            isinstance(series, TimeSeries)
+            or len(series) < 2
+            or self._n_jobs != 1
+            or args
+            or kwargs
+            or component_mask is not None
+        ):
+            return super().transform(
+                series,
+                *args,
+                component_mask=component_mask,
+                series_idx=series_idx,
+                **kwargs,
+            )
+
+        # resample the series sharing the same time index at once
+        return _resample(
+            series,
+            freq=self.freq,
+            method=self.method,
+            method_kwargs=self.method_kwargs,
+            **(self.resample_kwargs or {}),
+        )
@@ -3,11 +3,17 @@ Window Transformer
 ------------------
 """
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from typing import Any
 
+import numpy as np
+
 from darts import TimeSeries
 from darts.dataprocessing.transformers import BaseDataTransformer
+from darts.timeseries import _window_transform
+from darts.typing import TimeSeriesLike
+from darts.utils import _build_tqdm_iterator
+from darts.utils.profiling import profiled
 
 
 class WindowTransformer(BaseDataTransformer):
@@ -28,6 +34,11 @@ class WindowTransformer(BaseDataTransformer):
         dictionary or a list of dictionaries specifying the window transformation(s) to be applied. All series in the
         sequence will be transformed with the same transformations.
 
+        The builtin functions "sum", "mean", "std", "var", "min", "max", "median" and "quantile" of the "rolling"
+        mode (with an integer window), "sum", "mean", "min" and "max" of the "expanding" mode, and "mean" of the
+        "ewm" mode are computed with NumPy instead of pandas. With `n_jobs=1`, series of the same length, components
+        and number of samples are transformed at once.
+
         Parameters
         ----------
         transforms
@@ -169,3 +180,49 @@ class WindowTransformer(BaseDataTransformer):
     @staticmethod
     def ts_transform(series: TimeSeries, params: Mapping[str, Any]) -> TimeSeries:
         return series.window_transform(**params["fixed"])
+
+    @profiled("transform")
+    def transform(
+        self,
+        series: TimeSeriesLike,
+        *args,
+        component_mask: np.ndarray | None = None,
+        series_idx: int | Sequence[int] | None = None,
+        **kwargs,
+    ) -> TimeSeries | list[TimeSeries]:
+        if (
+            isinstance(series, TimeSeries)
+            or len(series) < 2
+            or self._n_jobs != 1
+            or args
+            or kwargs
+            or component_mask is not None
+            or self._columns is not None
+        ):
+            return super().transform(
+                series,
+                *args,
+                component_mask=component_mask,
+                series_idx=series_idx,
+                **kwargs,
+            )
+
+        # transform the series with the same length, components and number of samples at once
+        groups = {}
+        for idx, ts in enumerate(series):
+            key = (len(ts), tuple(ts.components), ts.n_samples)
+            groups.setdefault(key, []).append(idx)
+
+        transformed = [None] * len(series)
+        for group in _build_tqdm_iterator(
+            groups.values(),
+            verbose=self._verbose,
+            desc=f"Transform ({self._name})",
+            total=len(groups),
+        ):
+            group_transformed = _window_transform(
+                [series[idx] for idx in group], **self._fixed_params
+            )
+            for idx, ts in zip(group, group_transformed):
+                transformed[idx] = ts
+        return transformed
@@ -15,10 +15,12 @@ import pandas as pd
 
 from darts import TimeSeries
 from darts.logging import get_logger, raise_log
+from darts.timeseries import _interpolate_quantiles, _parse_quantile_components
 from darts.utils.likelihood_models.base import (
     likelihood_component_names,
     quantile_names,
 )
+from darts.utils.profiling import profiled
 from darts.utils.ts_utils import SeriesType, get_series_seq_type, series2seq
 from darts.utils.utils import (
     _build_tqdm_iterator,
@@ -168,6 +170,7 @@ def multi_ts_support(func) -> Callable[..., METRIC_OUTPUT_TYPE]:
     """
 
     @wraps(func)
+    @profiled("metric")
     def wrapper_multi_ts_support(*args, **kwargs):
         actual_series = (
             kwargs["actual_series"] if "actual_series" in kwargs else args[0]
@@ -415,7 +418,15 @@ def multivariate_support(func) -> Callable[..., METRIC_OUTPUT_TYPE]:
 def _regression_handling(actual_series, pred_series, params, kwargs):
     """Handles the regression metrics input parameters and checks."""
     q, q_comp_names = kwargs.get(_PARAM_Q), None
-    if q is None:
+    # quantile series hold the predicted quantiles of the actual components, from which we interpolate `q`
+    quantile_encoding = pred_series._quantile_encoding()
+    is_quantile = quantile_encoding is not None and quantile_encoding[0].equals(
+        actual_series.components
+    )
+    if q is None and is_quantile and _PARAM_Q in params:
+        # compute median for quantile predictions
+        q = np.array([0.5])
+    elif q is None:
         # without quantiles, the number of components must match
         if actual_series.n_components != pred_series.n_components:
             raise_log(
@@ -438,7 +449,13 @@ def _regression_handling(actual_series, pred_series, params, kwargs):
                 ),
             )
         q, q_comp_names = q
-        if not pred_series.is_stochastic:
+        if (
+            is_quantile
+            and ((quantile_encoding[1][0] <= q) & (q <= quantile_encoding[1][-1])).all()
+        ):
+            # quantiles within the levels of a quantile series are interpolated
+            q_comp_names = None
+        elif not pred_series.is_stochastic:
             # quantile component names are required if the predictions are not stochastic (as for stochastic
             # predictions, the quantiles can be retrieved from the sample dimension for each component)
             if q_comp_names is None:
@@ -539,6 +556,18 @@ def _get_values(
             # rearrange into (times, components, quantiles)
             n_quantiles = vals.shape[1] // len(actual_components)
             vals = vals.reshape((len(vals), len(actual_components), n_quantiles))
+        elif q is not None and not vals_components.equals(actual_components):
+            # quantile series: interpolate the quantiles from the predicted quantile levels
+            _, levels = _parse_quantile_components(vals_components)
+            if not ((levels[0] <= q) & (q <= levels[-1])).all():
+                raise_log(
+                    ValueError(
+                        f"The quantiles `{_PARAM_Q}={q}` must be within the range of the quantile levels of the "
+                        f"quantile `pred_series` `[{levels[0]}, {levels[-1]}]`."
+                    ),
+                )
+            vals = vals.reshape((len(vals), len(actual_components), len(levels)))
+            vals = _interpolate_quantiles(vals, levels, np.asarray(q, dtype=float))
         return vals
 
     # probabilistic input
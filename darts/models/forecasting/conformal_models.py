@@ -409,6 +409,7 @@ class ConformalModel(GlobalForecastingModel, ABC):
         verbose: bool = False,
         show_warnings: bool = True,
         predict_likelihood_parameters: bool = False,
+        predict_quantiles: Sequence[float] | None = None,
         enable_optimization: bool = True,
         data_transformers: dict[str, BaseDataTransformer | Pipeline] | None = None,
         fit_kwargs: dict[str, Any] | None = None,
@@ -517,6 +518,10 @@ class ConformalModel(GlobalForecastingModel, ABC):
             `train_length`.
         predict_likelihood_parameters
             If set to `True`, generates the quantile predictions directly. Only supported with `num_samples = 1`.
+        predict_quantiles
+            Optionally, a sequence of increasing quantiles (between 0 and 1) to return for each calibrated forecast
+            instead of the `num_samples` samples (see :attr:`~darts.timeseries.TimeSeries.is_quantile`). Only
+            supported for `num_samples > 1`.
         enable_optimization
             Whether to use the optimized version of `historical_forecasts` when supported and available.
             Default: ``True``.
@@ -558,6 +563,10 @@ class ConformalModel(GlobalForecastingModel, ABC):
             is over the series provided in the input sequence, and the inner lists contain the historical forecasts for
             each series.
         """
+        if predict_quantiles is not None:
+            self._sanity_check_predict_quantiles(
+                predict_quantiles, num_samples, predict_likelihood_parameters
+            )
         called_with_single_series = get_series_seq_type(series) == SeriesType.SINGLE
         series = series2seq(series)
         past_covariates = series2seq(past_covariates)
@@ -620,6 +629,10 @@ class ConformalModel(GlobalForecastingModel, ABC):
             predict_likelihood_parameters=predict_likelihood_parameters,
             random_state=random_state,
         )
+        if predict_quantiles is not None:
+            calibrated_forecasts = self._to_quantile_series(
+                calibrated_forecasts, predict_quantiles
+            )
         return (
             calibrated_forecasts[0]
             if called_with_single_series
@@ -651,6 +664,7 @@ class ConformalModel(GlobalForecastingModel, ABC):
         verbose: bool = False,
         show_warnings: bool = True,
         predict_likelihood_parameters: bool = False,
+        predict_quantiles: Sequence[float] | None = None,
         enable_optimization: bool = True,
         data_transformers: dict[str, BaseDataTransformer | Pipeline] | None = None,
         metric_kwargs: dict[str, Any] | list[dict[str, Any]] | None = None,
@@ -776,6 +790,10 @@ class ConformalModel(GlobalForecastingModel, ABC):
             `train_length`.
         predict_likelihood_parameters
             If set to `True`, generates the quantile predictions directly. Only supported with `num_samples = 1`.
+        predict_quantiles
+            Optionally, a sequence of increasing quantiles (between 0 and 1) to return for each calibrated forecast
+            instead of the `num_samples` samples (see :attr:`~darts.timeseries.TimeSeries.is_quantile`). Only
+            supported for `num_samples > 1`.
         enable_optimization
             Whether to use the optimized version of `historical_forecasts` when supported and available.
             Default: ``True``.
@@ -850,6 +868,7 @@ class ConformalModel(GlobalForecastingModel, ABC):
             verbose=verbose,
             show_warnings=show_warnings,
             predict_likelihood_parameters=predict_likelihood_parameters,
+            predict_quantiles=predict_quantiles,
             enable_optimization=enable_optimization,
             data_transformers=data_transformers,
             metric_kwargs=metric_kwargs,
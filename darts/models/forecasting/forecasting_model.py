@@ -65,6 +65,7 @@ from darts.utils.historical_forecasts.utils import (
     _process_historical_forecast_for_backtest,
     _slice_intersect_series,
 )
+from darts.utils.profiling import profiled
 from darts.utils.timeseries_generation import (
     _build_forecast_series,
     _generate_new_dates,
@@ -670,6 +671,7 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
         """By default, historical forecasts cannot be optimized"""
         return False
 
+    @profiled("historical_forecasts")
     @_with_sanity_checks("_historical_forecasts_sanity_checks")
     def historical_forecasts(
         self,
@@ -690,6 +692,7 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
         verbose: bool = False,
         show_warnings: bool = True,
         predict_likelihood_parameters: bool = False,
+        predict_quantiles: Sequence[float] | None = None,
         enable_optimization: bool = True,
         data_transformers: dict[str, BaseDataTransformer | Pipeline] | None = None,
         fit_kwargs: dict[str, Any] | None = None,
@@ -835,6 +838,11 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
             If set to `True`, the model predicts the parameters of its `likelihood` instead of the target. Only
             supported for probabilistic models with a likelihood, `num_samples = 1` and `n<=output_chunk_length`.
             Default: ``False``.
+        predict_quantiles
+            Optionally, a sequence of increasing quantiles (between 0 and 1) to return for each forecast instead of
+            the `num_samples` samples. Each forecast is converted into a quantile series (see
+            :attr:`~darts.timeseries.TimeSeries.is_quantile`) right after it was generated, which takes much less
+            memory than the samples. Only supported for `num_samples > 1`.
         enable_optimization
             Whether to use the optimized version of `historical_forecasts` when supported and available.
             Default: ``True``.
@@ -885,6 +893,10 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
         """
         # note: decorator already sanity-checked the parameters
         model: ForecastingModel = self
+        if predict_quantiles is not None:
+            self._sanity_check_predict_quantiles(
+                predict_quantiles, num_samples, predict_likelihood_parameters
+            )
 
         fit_kwargs = fit_kwargs or {}
         predict_kwargs = predict_kwargs or {}
@@ -963,11 +975,14 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
                 predict_kwargs=predict_kwargs,
             )
 
-            return _apply_inverse_data_transformers(
+            forecasts = _apply_inverse_data_transformers(
                 series=series2seq(series, seq_type_out=sequence_type_in),
                 forecasts=series2seq(forecasts, seq_type_out=sequence_type_in),
                 data_transformers=data_transformers,
             )
+            if predict_quantiles is not None:
+                forecasts = self._to_quantile_series(forecasts, predict_quantiles)
+            return forecasts
 
         forecasts_list = [[] for _ in range(len(series))]
         if apply_globally:
@@ -1219,6 +1234,9 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
                     data_transformers=data_transformers,
                     series_idx=series_idx,
                 )
+                if predict_quantiles is not None:
+                    # convert right away to only keep the quantiles in memory
+                    forecast = self._to_quantile_series(forecast, predict_quantiles)
 
                 show_predict_warnings = False
 
@@ -1275,6 +1293,7 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
         verbose: bool = False,
         show_warnings: bool = True,
         predict_likelihood_parameters: bool = False,
+        predict_quantiles: Sequence[float] | None = None,
         enable_optimization: bool = True,
         data_transformers: dict[str, BaseDataTransformer | Pipeline] | None = None,
         metric_kwargs: dict[str, Any] | list[dict[str, Any]] | None = None,
@@ -1421,6 +1440,11 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
             If set to `True`, the model predicts the parameters of its `likelihood` instead of the target. Only
             supported for probabilistic models with a likelihood, `num_samples = 1` and `n<=output_chunk_length`.
             Default: ``False``.
+        predict_quantiles
+            Optionally, a sequence of increasing quantiles (between 0 and 1) to return for each forecast instead of
+            the `num_samples` samples. Each forecast is converted into a quantile series (see
+            :attr:`~darts.timeseries.TimeSeries.is_quantile`) right after it was generated, which takes much less
+            memory than the samples. Only supported for `num_samples > 1`.
         enable_optimization
             Whether to use the optimized version of `historical_forecasts` when supported and available.
             Default: ``True``.
@@ -1518,6 +1542,7 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
             verbose=verbose,
             show_warnings=show_warnings,
             predict_likelihood_parameters=predict_likelihood_parameters,
+            predict_quantiles=predict_quantiles,
             enable_optimization=enable_optimization,
             data_transformers=data_transformers,
             fit_kwargs=fit_kwargs,
@@ -2902,6 +2927,50 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
                 ),
             )
 
+    @staticmethod
+    def _sanity_check_predict_quantiles(
+        predict_quantiles: Sequence[float],
+        num_samples: int,
+        predict_likelihood_parameters: bool,
+    ):
+        """Verify that the assumptions for quantile prediction are verified:
+        - `num_samples>1` and `predict_likelihood_parameters=False`
+        - increasing quantiles between 0 and 1
+        """
+        if num_samples <= 1 or predict_likelihood_parameters:
+            raise_log(
+                ValueError(
+                    "`predict_quantiles` is only supported for `num_samples > 1` and "
+                    "`predict_likelihood_parameters=False`."
+                ),
+            )
+        q = np.asarray(predict_quantiles)
+        if (
+            q.ndim != 1
+            or not len(q)
+            or not ((0 <= q) & (q <= 1)).all()
+            or not (np.diff(q) > 0).all()
+        ):
+            raise_log(
+                ValueError(
+                    f"`predict_quantiles` must be a sequence of increasing quantiles between 0 and 1. "
+                    f"Received `predict_quantiles={predict_quantiles}`."
+                ),
+            )
+
+    @staticmethod
+    def _to_quantile_series(
+        forecasts: TimeSeries | Sequence[TimeSeries] | Sequence[Sequence[TimeSeries]],
+        predict_quantiles: Sequence[float],
+    ) -> TimeSeries | list[TimeSeries] | list[list[TimeSeries]]:
+        """Convert (possibly nested sequences of) stochastic forecasts into quantile series."""
+        if isinstance(forecasts, TimeSeries):
+            return forecasts.quantile(list(predict_quantiles))
+        return [
+            ForecastingModel._to_quantile_series(fc, predict_quantiles)
+            for fc in forecasts
+        ]
+
 
 class LocalForecastingModel(ForecastingModel, ABC):
     """The base class for "local" forecasting models, handling only single univariate time series.
@@ -63,7 +63,7 @@ from typing import Any, Literal
 
 import numpy as np
 import pandas as pd
-from sklearn.base import is_classifier
+from sklearn.base import clone, is_classifier
 from sklearn.linear_model import LinearRegression, LogisticRegression
 from sklearn.utils.validation import has_fit_parameter
 
@@ -72,9 +72,18 @@ from darts.logging import get_logger, raise_deprecation_warning, raise_log
 from darts.models.forecasting.forecasting_model import GlobalForecastingModel
 from darts.typing import TimeSeriesLike
 from darts.utils.data.tabularization import (
+    LagPlan,
     _create_lagged_data_autoregression,
+    _get_static_covariates_values,
     create_lagged_component_names,
     create_lagged_training_data,
+    create_lagged_training_data_chunks,
+)
+from darts.utils.data.tabularization.cache import (
+    _cache_enabled,
+    _cache_get,
+    _cache_key,
+    _cache_put,
 )
 from darts.utils.historical_forecasts import (
     _check_optimizable_historical_forecasts_global_models,
@@ -89,6 +98,7 @@ from darts.utils.likelihood_models.sklearn import (
     _get_likelihood,
 )
 from darts.utils.multioutput import MultiOutputMixin, get_multioutput_estimator_cls
+from darts.utils.profiling import profile_span, profiled
 from darts.utils.ts_utils import get_single_series, seq2series, series2seq
 from darts.utils.utils import ModelType, random_method
 
@@ -249,8 +259,8 @@ class SKLearnModel(GlobalForecastingModel):
         self.multi_models = True if multi_models or output_chunk_length == 1 else False
         self._considers_static_covariates = use_static_covariates
         self._static_covariates_shape: tuple[int, int] | None = None
-        self._lagged_feature_names: list[str] | None = None
-        self._lagged_label_names: list[str] | None = None
+        # the lagged features of the fitted model
+        self._lag_plan: LagPlan | None = None
 
         # optionally, the model can be wrapped in a likelihood model
         self._likelihood: SKLearnLikelihood | None = getattr(self, "_likelihood", None)
@@ -766,6 +776,7 @@ class SKLearnModel(GlobalForecastingModel):
             val_set_params = {val_set_name: val_sets}
         return dict(kwargs, **{**val_set_params, val_weight_name: val_weights})
 
+    @profiled("tabularize")
     def _create_lagged_data(
         self,
         series: Sequence[TimeSeries],
@@ -775,7 +786,36 @@ class SKLearnModel(GlobalForecastingModel):
         sample_weight: TimeSeries | str | None = None,
         stride: int = 1,
         last_static_covariates_shape: tuple[int, int] | None = None,
+        n_jobs: int = 1,
     ):
+        cache_key = None
+        if _cache_enabled():
+            cache_key = _cache_key(
+                series,
+                past_covariates,
+                future_covariates,
+                sample_weight,
+                lags=self._get_lags("target"),
+                lags_past_covariates=self._get_lags("past"),
+                lags_future_covariates=self._get_lags("future"),
+                output_chunk_length=self.output_chunk_length,
+                output_chunk_shift=self.output_chunk_shift,
+                multi_models=self.multi_models,
+                uses_static_covariates=self.uses_static_covariates,
+                last_static_covariates_shape=last_static_covariates_shape,
+                max_samples_per_ts=max_samples_per_ts,
+                stride=stride,
+            )
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                features, labels, sample_weights, self._static_covariates_shape = cached
+                features, labels = self._format_samples(features, labels)
+                return features, labels, sample_weights
+
+        # the dimensions of the training series are known once `fit()` was called
+        if self.input_dim is not None:
+            self._check_widths(series, past_covariates, future_covariates)
+
         (
             features,
             labels,
@@ -796,40 +836,15 @@ class SKLearnModel(GlobalForecastingModel):
             max_samples_per_ts=max_samples_per_ts,
             multi_models=self.multi_models,
             check_inputs=False,
-            concatenate=False,
+            concatenate=True,
             sample_weight=sample_weight,
             stride=stride,
+            n_jobs=n_jobs,
+            lag_plan=self._lag_plan,
         )
-
-        expected_nb_feat = (
-            features[0].shape[1]
-            if isinstance(features, Sequence)
-            else features.shape[1]
-        )
-        for i, (X_i, y_i) in enumerate(zip(features, labels)):
-            # TODO: account for scenario where two wrong shapes can silently hide the problem
-            if expected_nb_feat != X_i.shape[1]:
-                shape_error_msg = []
-                for ts, cov_name, arg_name in zip(
-                    [series, past_covariates, future_covariates],
-                    ["target", "past", "future"],
-                    ["series", "past_covariates", "future_covariates"],
-                ):
-                    if ts is not None and ts[i].width != self.input_dim[cov_name]:
-                        shape_error_msg.append(
-                            f"Expected {self.input_dim[cov_name]} components but received "
-                            f"{ts[i].width} components at index {i} of `{arg_name}`."
-                        )
-                raise_log(ValueError("\n".join(shape_error_msg)))
-            features[i] = X_i[:, :, 0]
-            labels[i] = y_i[:, :, 0]
-            if sample_weights is not None:
-                sample_weights[i] = sample_weights[i][:, :, 0]
-
-        features = np.concatenate(features, axis=0)
-        labels = np.concatenate(labels, axis=0)
+        features, labels = features[:, :, 0], labels[:, :, 0]
         if sample_weights is not None:
-            sample_weights = np.concatenate(sample_weights, axis=0)
+            sample_weights = sample_weights[:, :, 0]
 
         # if labels are of shape (n_samples, 1) flatten it to shape (n_samples,)
         if labels.ndim == 2 and labels.shape[1] == 1:
@@ -841,10 +856,39 @@ class SKLearnModel(GlobalForecastingModel):
         ):
             sample_weights = sample_weights.ravel()
 
+        if cache_key is not None:
+            features, labels, sample_weights, _ = _cache_put(
+                cache_key,
+                (features, labels, sample_weights, self._static_covariates_shape),
+            )
+
         features, labels = self._format_samples(features, labels)
 
         return features, labels, sample_weights
 
+    def _check_widths(
+        self,
+        series: Sequence[TimeSeries],
+        past_covariates: Sequence[TimeSeries] | None,
+        future_covariates: Sequence[TimeSeries] | None,
+    ):
+        """Raises an error for the first series (and covariates) that do not have the expected number of
+        components."""
+        for idx in range(len(series)):
+            shape_error_msg = []
+            for ts, cov_name, arg_name in zip(
+                [series, past_covariates, future_covariates],
+                ["target", "past", "future"],
+                ["series", "past_covariates", "future_covariates"],
+            ):
+                if ts is not None and ts[idx].width != self.input_dim[cov_name]:
+                    shape_error_msg.append(
+                        f"Expected {self.input_dim[cov_name]} components but received "
+                        f"{ts[idx].width} components at index {idx} of `{arg_name}`."
+                    )
+            if shape_error_msg:
+                raise_log(ValueError("\n".join(shape_error_msg)))
+
     def _format_samples(
         self, samples: np.ndarray, labels: np.ndarray | None = None
     ) -> tuple[Any, Any]:
@@ -866,12 +910,61 @@ class SKLearnModel(GlobalForecastingModel):
         val_future_covariates: Sequence[TimeSeries] | None = None,
         val_sample_weight: Sequence[TimeSeries] | str | None = None,
         verbose: bool | None = None,
+        max_samples_per_chunk: int | None = None,
+        n_jobs: int = 1,
         **kwargs,
     ):
         """
         Function that fit the model. Deriving classes can override this method for adding additional
         parameters (e.g., adding validation data), keeping the sanity checks on series performed by fit().
         """
+        if max_samples_per_chunk is not None:
+            self._partial_fit_model(
+                series=series,
+                past_covariates=past_covariates,
+                future_covariates=future_covariates,
+                max_samples_per_ts=max_samples_per_ts,
+                sample_weight=sample_weight,
+                stride=stride,
+                max_samples_per_chunk=max_samples_per_chunk,
+                val_series=val_series,
+                verbose=verbose,
+                **kwargs,
+            )
+        else:
+            self._fit_model_at_once(
+                series=series,
+                past_covariates=past_covariates,
+                future_covariates=future_covariates,
+                max_samples_per_ts=max_samples_per_ts,
+                sample_weight=sample_weight,
+                stride=stride,
+                val_series=val_series,
+                val_past_covariates=val_past_covariates,
+                val_future_covariates=val_future_covariates,
+                val_sample_weight=val_sample_weight,
+                verbose=verbose,
+                n_jobs=n_jobs,
+                **kwargs,
+            )
+
+    def _fit_model_at_once(
+        self,
+        series: Sequence[TimeSeries],
+        past_covariates: Sequence[TimeSeries],
+        future_covariates: Sequence[TimeSeries],
+        max_samples_per_ts: int,
+        sample_weight: Sequence[TimeSeries] | str | None,
+        stride: int,
+        val_series: Sequence[TimeSeries] | None,
+        val_past_covariates: Sequence[TimeSeries] | None,
+        val_future_covariates: Sequence[TimeSeries] | None,
+        val_sample_weight: Sequence[TimeSeries] | str | None,
+        verbose: bool | None,
+        n_jobs: int,
+        **kwargs,
+    ):
+        """Fits the model on all the lagged training data created at once."""
         training_samples, training_labels, sample_weights = self._create_lagged_data(
             series=series,
             past_covariates=past_covariates,
@@ -880,6 +973,7 @@ class SKLearnModel(GlobalForecastingModel):
             sample_weight=sample_weight,
             last_static_covariates_shape=None,
             stride=stride,
+            n_jobs=n_jobs,
         )
 
         if self._supports_val_series and val_series is not None:
@@ -912,28 +1006,145 @@ class SKLearnModel(GlobalForecastingModel):
         ):
             kwargs["verbose"] = verbose
 
-        self.model.fit(
-            training_samples,
-            training_labels,
-            **sample_weight_kwargs,
-            **kwargs,
-        )
+        with profile_span("estimator.fit"):
+            self.model.fit(
+                training_samples,
+                training_labels,
+                **sample_weight_kwargs,
+                **kwargs,
+            )
 
-        # generate and store the lagged components names (for feature importance analysis)
-        self._lagged_feature_names, self._lagged_label_names = (
-            create_lagged_component_names(
-                target_series=series,
-                past_covariates=past_covariates,
-                future_covariates=future_covariates,
-                lags=self._get_lags("target"),
-                lags_past_covariates=self._get_lags("past"),
-                lags_future_covariates=self._get_lags("future"),
-                output_chunk_length=self.output_chunk_length,
-                concatenate=False,
-                use_static_covariates=self.uses_static_covariates,
+    def _partial_fit_model(
+        self,
+        series: Sequence[TimeSeries],
+        past_covariates: Sequence[TimeSeries],
+        future_covariates: Sequence[TimeSeries],
+        max_samples_per_ts: int,
+        sample_weight: Sequence[TimeSeries] | str | None,
+        stride: int,
+        max_samples_per_chunk: int,
+        val_series: Sequence[TimeSeries] | None,
+        verbose: bool | None,
+        **kwargs,
+    ):
+        """Fits the model incrementally on chunks of the lagged training data with the `partial_fit()` method of
+        the underlying estimator."""
+        if not hasattr(self.model, "partial_fit"):
+            raise_log(
+                ValueError(
+                    "`max_samples_per_chunk` is only supported by estimators with a `partial_fit()` method, but "
+                    f"`{self.model.__class__.__name__}` has none."
+                ),
+            )
+        if val_series is not None:
+            raise_log(
+                ValueError(
+                    "`max_samples_per_chunk` is not supported with validation series (`val_series`)."
+                ),
             )
+        self._check_widths(series, past_covariates, future_covariates)
+
+        # train from scratch as `partial_fit()` continues training an already fitted estimator
+        self.model = clone(self.model)
+        if (
+            verbose is not None
+            and "verbose" in inspect.signature(self.model.partial_fit).parameters
+        ):
+            kwargs["verbose"] = verbose
+
+        chunks_kwargs = dict(
+            target_series=series,
+            output_chunk_length=self.output_chunk_length,
+            output_chunk_shift=self.output_chunk_shift,
+            past_covariates=past_covariates,
+            future_covariates=future_covariates,
+            lags=self._get_lags("target"),
+            lags_past_covariates=self._get_lags("past"),
+            lags_future_covariates=self._get_lags("future"),
+            uses_static_covariates=self.uses_static_covariates,
+            max_samples_per_ts=max_samples_per_ts,
+            multi_models=self.multi_models,
+            check_inputs=False,
+            sample_weight=sample_weight,
+            stride=stride,
+            max_samples_per_chunk=max_samples_per_chunk,
+            lag_plan=self._lag_plan,
+        )
+        # `partial_fit()` of classifiers requires the classes of all chunks with the first call; they are collected
+        # with a first pass over the labels
+        classes = (
+            self._get_chunked_label_classes(chunks_kwargs)
+            if self._model_type == ModelType.FORECASTING_CLASSIFIER
+            else None
+        )
+        estimator = (
+            self.model.estimator
+            if isinstance(self.model, MultiOutputMixin)
+            else self.model
         )
+        supports_sample_weight = (
+            "sample_weight" in inspect.signature(estimator.partial_fit).parameters
+        )
+
+        chunks = create_lagged_training_data_chunks(**chunks_kwargs)
+        while True:
+            with profile_span("tabularize"):
+                chunk = next(chunks, None)
+            if chunk is None:
+                break
+            features, labels, _, self._static_covariates_shape, sample_weights = chunk
+            features, labels = features[:, :, 0], labels[:, :, 0]
+            # if labels are of shape (n_samples, 1) flatten them to shape (n_samples,)
+            if labels.shape[1] == 1:
+                labels = labels.ravel()
+            sample_weight_kwargs = dict()
+            if sample_weights is not None:
+                sample_weights = sample_weights[:, :, 0]
+                if sample_weights.shape[1] == 1:
+                    sample_weights = sample_weights.ravel()
+                if supports_sample_weight:
+                    sample_weight_kwargs = {"sample_weight": sample_weights}
+            # the classes are only passed with the first chunk
+            classes_kwargs = {"classes": classes} if classes is not None else dict()
+            classes = None
+            features, labels = self._format_samples(features, labels)
+            with profile_span("estimator.fit"):
+                self.model.partial_fit(
+                    features,
+                    labels,
+                    **classes_kwargs,
+                    **sample_weight_kwargs,
+                    **kwargs,
+                )
+        if sample_weight is not None and not supports_sample_weight:
+            logger.warning(
+                "`sample_weight` was ignored since underlying regression model's "
+                "`partial_fit()` method does not support it."
+            )
+
+    def _get_chunked_label_classes(
+        self, chunks_kwargs: dict[str, Any]
+    ) -> np.ndarray | list[np.ndarray]:
+        """Returns the classes of each output of the lagged training labels, collected over all chunks of
+        `create_lagged_training_data_chunks(**chunks_kwargs)`.
 
+        The classes are a list with one array per output for the `MultiOutputClassifier`, and a single array
+        otherwise.
+        """
+        classes = None
+        for _, labels, _, _, _ in create_lagged_training_data_chunks(**chunks_kwargs):
+            labels = labels[:, :, 0]
+            chunk_classes = [np.unique(labels[:, i]) for i in range(labels.shape[1])]
+            classes = (
+                chunk_classes
+                if classes is None
+                else [np.union1d(c, c_new) for c, c_new in zip(classes, chunk_classes)]
+            )
+        if len(classes) == 1 and not isinstance(self.model, MultiOutputMixin):
+            return classes[0]
+        return classes
+
+    @profiled("fit")
     def fit(
         self,
         series: TimeSeriesLike,
@@ -944,6 +1155,8 @@ class SKLearnModel(GlobalForecastingModel):
         sample_weight: TimeSeriesLike | str | None = None,
         stride: int = 1,
         verbose: bool | None = None,
+        max_samples_per_chunk: int | None = None,
+        n_jobs: int = 1,
         **kwargs,
     ):
         """
@@ -983,8 +1196,21 @@ class SKLearnModel(GlobalForecastingModel):
             used with caution as it might introduce bias in the forecasts.
         verbose
             Optionally, set the fit verbosity. Not effective for all models.
+        max_samples_per_chunk
+            Optionally, train the model incrementally on chunks of at most `max_samples_per_chunk` samples (across
+            all series) with the `partial_fit()` method of the underlying estimator (e.g. scikit-learn's
+            `SGDRegressor`), instead of creating all samples at once. This bounds the memory used by the training
+            data, to train on more data than fits in memory. Only supported by estimators with a `partial_fit()`
+            method, and not with validation series. For classifiers, the classes are collected with a first pass
+            over the chunks, as they are required by the first `partial_fit()` call. If `None`, all samples are
+            created at once.
+        n_jobs
+            The number of jobs to run in parallel to create the training samples (tabularization) of the different
+            `series`, in threads. Defaults to `1` (sequential). Setting the parameter to `-1` means using all the
+            available processors. Not used with `max_samples_per_chunk`.
         **kwargs
-            Additional keyword arguments passed to the `fit` method of the model.
+            Additional keyword arguments passed to the `fit` method of the model (or `partial_fit` method if
+            `max_samples_per_chunk` is not `None`).
         """
         # guarantee that all inputs are either list of TimeSeries or None
         series = series2seq(series)
@@ -1144,6 +1370,28 @@ class SKLearnModel(GlobalForecastingModel):
         if len(component_lags_error_msg) > 0:
             raise_log(ValueError("\n".join(component_lags_error_msg)))
 
+        # the lagged components names (for feature importance analysis), and the indices of the lagged features
+        # reused by the tabularization, the auto-regression and the optimized historical forecasts
+        lagged_feature_names, lagged_label_names = create_lagged_component_names(
+            target_series=series,
+            past_covariates=past_covariates,
+            future_covariates=future_covariates,
+            lags=self._get_lags("target"),
+            lags_past_covariates=self._get_lags("past"),
+            lags_future_covariates=self._get_lags("future"),
+            output_chunk_length=self.output_chunk_length,
+            concatenate=False,
+            use_static_covariates=self.uses_static_covariates,
+        )
+        self._lag_plan = LagPlan(
+            lags=self._get_lags("target"),
+            lags_past_covariates=self._get_lags("past"),
+            lags_future_covariates=self._get_lags("future"),
+            n_components=[self.input_dim[key] for key in ["target", "past", "future"]],
+            feature_names=lagged_feature_names,
+            label_names=lagged_label_names,
+        )
+
         self._fit_model(
             series=series,
             past_covariates=past_covariates,
@@ -1156,6 +1404,8 @@ class SKLearnModel(GlobalForecastingModel):
             max_samples_per_ts=max_samples_per_ts,
             stride=stride,
             verbose=verbose,
+            max_samples_per_chunk=max_samples_per_chunk,
+            n_jobs=n_jobs,
             **kwargs,
         )
 
@@ -1164,6 +1414,7 @@ class SKLearnModel(GlobalForecastingModel):
             likelihood.fit(self)
         return self
 
+    @profiled("predict")
     def predict(
         self,
         n: int,
@@ -1173,6 +1424,7 @@ class SKLearnModel(GlobalForecastingModel):
         num_samples: int = 1,
         verbose: bool | None = None,
         predict_likelihood_parameters: bool = False,
+        predict_quantiles: Sequence[float] | None = None,
         show_warnings: bool = True,
         random_state: int | None = None,
         **kwargs,
@@ -1202,6 +1454,11 @@ class SKLearnModel(GlobalForecastingModel):
             If set to `True`, the model predicts the parameters of its `likelihood` instead of the target. Only
             supported for probabilistic models with a likelihood, `num_samples = 1` and `n<=output_chunk_length`.
             Default: ``False``
+        predict_quantiles
+            Optionally, a sequence of increasing quantiles (between 0 and 1) to return instead of the `num_samples`
+            samples. The forecasts are returned as quantile series (see
+            :attr:`~darts.timeseries.TimeSeries.is_quantile`), which take much less memory than the samples. Only
+            supported for `num_samples > 1`.
         show_warnings
             Optionally, control whether warnings are shown. Not effective for all models.
         random_state
@@ -1256,6 +1513,10 @@ class SKLearnModel(GlobalForecastingModel):
             predict_likelihood_parameters=predict_likelihood_parameters,
             show_warnings=show_warnings,
         )
+        if predict_quantiles is not None:
+            self._sanity_check_predict_quantiles(
+                predict_quantiles, num_samples, predict_likelihood_parameters
+            )
 
         # check that the input sizes of the target series and covariates match
         pred_input_dim = {
@@ -1316,13 +1577,10 @@ class SKLearnModel(GlobalForecastingModel):
 
         # dictionary containing covariate data over time span required for prediction
         covariate_matrices = {}
-        # dictionary containing covariate lags relative to minimum covariate lag
-        relative_cov_lags = {}
         for cov_type, (covs, lags) in covariates.items():
             if covs is None:
                 continue
 
-            relative_cov_lags[cov_type] = np.array(lags) - lags[0]
             covariate_matrices[cov_type] = []
             for idx, (ts, cov) in enumerate(zip(series, covs)):
                 # how many steps to go back from end of target series for start of covariates
@@ -1362,6 +1620,8 @@ class SKLearnModel(GlobalForecastingModel):
 
             covariate_matrices[cov_type] = np.stack(covariate_matrices[cov_type])
 
+        # the covariates and the target history are identical for all samples of a series: their lagged values are
+        # extracted once per series and then repeated per sample (see `_create_lagged_data_autoregression()`)
         series_matrix = None
         if "target" in self.lags:
             series_matrix = np.stack([
@@ -1369,13 +1629,17 @@ class SKLearnModel(GlobalForecastingModel):
                 for ts in series
             ])
 
-        # repeat series_matrix to shape (num_samples * num_series, n_lags, n_components)
-        # [series 0 sample 0, series 0 sample 1, ..., series n sample k]
-        series_matrix = np.repeat(series_matrix, num_samples, axis=0)
-
-        # same for covariate matrices
-        for cov_type, data in covariate_matrices.items():
-            covariate_matrices[cov_type] = np.repeat(data, num_samples, axis=0)
+        # static covariates of each series and sample: [series 0 sample 0, series 0 sample 1, ..., series n sample k]
+        static_covariates = None
+        if self.uses_static_covariates:
+            static_covariates, _ = _get_static_covariates_values(
+                series,
+                uses_static_covariates=True,
+                last_shape=self._static_covariates_shape,
+            )
+            static_covariates = np.repeat(
+                np.stack(static_covariates), num_samples, axis=0
+            )
 
         # for concatenating target with predictions (or quantile parameters)
         likelihood = self.likelihood
@@ -1386,50 +1650,66 @@ class SKLearnModel(GlobalForecastingModel):
         else:
             sample_slice = slice(None)
 
+        # the autoregressive forecasts are written into a buffer of shape (num_series * num_samples, n_history +
+        # n_forecasts, n_components) after the target history, allocated at the first forecast
+        rollout_buffer = None
+        n_filled = 0 if series_matrix is None else series_matrix.shape[1]
+        n_rollout = n_filled + step * (len(range(0, n, step)) - 1)
+
         # prediction
         predictions = []
         last_step_shift = 0
-        # t_pred indicates the number of time steps after the first prediction
-        for t_pred in range(0, n, step):
-            # in case of autoregressive forecast `(t_pred > 0)` and if `n` is not a round multiple of `step`,
-            # we have to step back `step` from `n` in the last iteration
-            if 0 < n - t_pred < step and t_pred > 0:
-                last_step_shift = t_pred - (n - step)
-                t_pred = n - step
-
-            # concatenate previous iteration forecasts
-            if "target" in self.lags and predictions:
-                series_matrix = np.concatenate(
-                    [series_matrix, predictions[-1][:, :, sample_slice]], axis=1
+        with profile_span("predict_rollout"):
+            # t_pred indicates the number of time steps after the first prediction
+            for t_pred in range(0, n, step):
+                # in case of autoregressive forecast `(t_pred > 0)` and if `n` is not a round multiple of `step`,
+                # we have to step back `step` from `n` in the last iteration
+                if 0 < n - t_pred < step and t_pred > 0:
+                    last_step_shift = t_pred - (n - step)
+                    t_pred = n - step
+
+                # append previous iteration forecasts to the target history
+                if "target" in self.lags and predictions:
+                    forecast = predictions[-1][:, :, sample_slice]
+                    if rollout_buffer is None:
+                        rollout_buffer = np.empty(
+                            (len(forecast), n_rollout, forecast.shape[2]),
+                            dtype=np.result_type(series_matrix.dtype, forecast.dtype),
+                        )
+                        rollout_buffer.reshape(len(series), num_samples, n_rollout, -1)[
+                            :, :, :n_filled
+                        ] = series_matrix[:, None]
+                    rollout_buffer[:, n_filled : n_filled + forecast.shape[1]] = (
+                        forecast
+                    )
+                    n_filled += forecast.shape[1]
+                    series_matrix = rollout_buffer[:, :n_filled]
+
+                # extract and concatenate lags from target and covariates series
+                X = _create_lagged_data_autoregression(
+                    target_series=series,
+                    t_pred=t_pred,
+                    shift=shift,
+                    last_step_shift=last_step_shift,
+                    series_matrix=series_matrix,
+                    covariate_matrices=covariate_matrices,
+                    lags=self.lags,
+                    lag_plan=self._lag_plan,
+                    static_covariates=static_covariates,
+                    num_samples=num_samples,
                 )
 
-            # extract and concatenate lags from target and covariates series
-            X = _create_lagged_data_autoregression(
-                target_series=series,
-                t_pred=t_pred,
-                shift=shift,
-                last_step_shift=last_step_shift,
-                series_matrix=series_matrix,
-                covariate_matrices=covariate_matrices,
-                lags=self.lags,
-                component_lags=self.component_lags,
-                relative_cov_lags=relative_cov_lags,
-                num_samples=num_samples,
-                uses_static_covariates=self.uses_static_covariates,
-                last_static_covariates_shape=self._static_covariates_shape,
-            )
-
-            # X has shape (n_series * n_samples, n_regression_features)
-            prediction = self._predict(
-                x=X,
-                num_samples=num_samples,
-                predict_likelihood_parameters=predict_likelihood_parameters,
-                random_state=random_state,
-                **kwargs,
-            )
-            # prediction shape (n_series * n_samples, output_chunk_length, n_components)
-            # append prediction to final predictions
-            predictions.append(prediction[:, last_step_shift:])
+                # X has shape (n_series * n_samples, n_regression_features)
+                prediction = self._predict(
+                    x=X,
+                    num_samples=num_samples,
+                    predict_likelihood_parameters=predict_likelihood_parameters,
+                    random_state=random_state,
+                    **kwargs,
+                )
+                # prediction shape (n_series * n_samples, output_chunk_length, n_components)
+                # append prediction to final predictions
+                predictions.append(prediction[:, last_step_shift:])
 
         # concatenate and use first n points as prediction
         predictions = np.concatenate(predictions, axis=1)[:, :n]
@@ -1439,23 +1719,26 @@ class SKLearnModel(GlobalForecastingModel):
             predictions.reshape(len(series), num_samples, n, -1), 1, -1
         )
 
-        # build time series from the predicted values starting after end of series
-        predictions = [
-            self._build_forecast_series(
-                points_preds=row,
-                input_series=input_tgt,
-                custom_components=(
-                    self.likelihood.component_names(series=input_tgt)
-                    if predict_likelihood_parameters
-                    else None
-                ),
-                with_static_covs=False if predict_likelihood_parameters else True,
-                with_hierarchy=False if predict_likelihood_parameters else True,
-                pred_start=input_tgt.end_time()
-                + (1 + self.output_chunk_shift) * input_tgt.freq,
-            )
-            for idx_ts, (row, input_tgt) in enumerate(zip(predictions, series))
-        ]
+        with profile_span("build_forecast_series"):
+            # build time series from the predicted values starting after end of series
+            predictions = [
+                self._build_forecast_series(
+                    points_preds=row,
+                    input_series=input_tgt,
+                    custom_components=(
+                        self.likelihood.component_names(series=input_tgt)
+                        if predict_likelihood_parameters
+                        else None
+                    ),
+                    with_static_covs=False if predict_likelihood_parameters else True,
+                    with_hierarchy=False if predict_likelihood_parameters else True,
+                    pred_start=input_tgt.end_time()
+                    + (1 + self.output_chunk_shift) * input_tgt.freq,
+                )
+                for idx_ts, (row, input_tgt) in enumerate(zip(predictions, series))
+            ]
+        if predict_quantiles is not None:
+            predictions = self._to_quantile_series(predictions, predict_quantiles)
 
         return predictions[0] if called_with_single_series else predictions
 
@@ -1505,7 +1788,7 @@ class SKLearnModel(GlobalForecastingModel):
             - ``{comp}`` the target component name of the (first) that the static covariate act on. If the static
                 covariate acts globally on a multivariate target series, will show "global_components".
         """
-        return self._lagged_feature_names
+        return None if self._lag_plan is None else self._lag_plan.feature_names
 
     @property
     def lagged_label_names(self) -> list[str] | None:
@@ -1516,7 +1799,27 @@ class SKLearnModel(GlobalForecastingModel):
             - ``{name}`` the component name of the (first) series
             - ``{i}`` is the position in output_chunk_length (label lag)
         """
-        return self._lagged_label_names
+        return None if self._lag_plan is None else self._lag_plan.label_names
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if "_lag_plan" in state:
+            return
+        # models saved before the lag plan was introduced only stored the lagged feature and label names
+        feature_names = self.__dict__.pop("_lagged_feature_names", None)
+        label_names = self.__dict__.pop("_lagged_label_names", None)
+        self._lag_plan = None
+        if self.input_dim is not None:
+            self._lag_plan = LagPlan(
+                lags=self._get_lags("target"),
+                lags_past_covariates=self._get_lags("past"),
+                lags_future_covariates=self._get_lags("future"),
+                n_components=[
+                    self.input_dim[key] for key in ["target", "past", "future"]
+                ],
+                feature_names=feature_names,
+                label_names=label_names,
+            )
 
     def __str__(self):
         return self.model.__str__()
@@ -1775,6 +1775,7 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
         dataloader_kwargs: dict[str, Any] | None = None,
         mc_dropout: bool = False,
         predict_likelihood_parameters: bool = False,
+        predict_quantiles: Sequence[float] | None = None,
         show_warnings: bool = True,
         random_state: int | None = None,
     ) -> TimeSeriesLike:
@@ -1847,6 +1848,11 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
             If set to `True`, the model predicts the parameters of its `likelihood` instead of the target. Only
             supported for probabilistic models with a likelihood, `num_samples = 1` and `n<=output_chunk_length`.
             Default: ``False``.
+        predict_quantiles
+            Optionally, a sequence of increasing quantiles (between 0 and 1) to return instead of the `num_samples`
+            samples. The forecasts are returned as quantile series (see
+            :attr:`~darts.timeseries.TimeSeries.is_quantile`), which take much less memory than the samples. Only
+            supported for `num_samples > 1`.
         show_warnings
             Optionally, control whether warnings are shown. Not effective for all models.
         random_state
@@ -1880,7 +1886,13 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
             show_warnings=show_warnings,
             random_state=random_state,
         )
+        if predict_quantiles is not None:
+            self._sanity_check_predict_quantiles(
+                predict_quantiles, num_samples, predict_likelihood_parameters
+            )
         predictions = self.predict_from_dataset(**params)
+        if predict_quantiles is not None:
+            predictions = self._to_quantile_series(predictions, predict_quantiles)
 
         return predictions[0] if called_with_single_series else predictions
 
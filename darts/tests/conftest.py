@@ -29,6 +29,7 @@ ONNX_AVAILABLE = _package_available("onnx", "onnxruntime")
 OPTUNA_AVAILABLE = _package_available("optuna")
 RAY_AVAILABLE = _package_available("ray")
 POLARS_AVAILABLE = _package_available("polars")
+PYARROW_AVAILABLE = _package_available("pyarrow")
 PLOTLY_AVAILABLE = _package_available("plotly")
 IPYTHON_AVAILABLE = _package_available("IPython")
 TIREX_AVAILABLE = _package_available("tirex")
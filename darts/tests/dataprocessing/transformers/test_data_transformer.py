@@ -206,10 +206,11 @@ class TestDataTransformer:
             ],
             axis=1,
         )
-        vals = s.all_values(copy=False)
+        vals = s.all_values()
 
         if issubclass(tf_cls, MissingValuesFiller):
             vals[1:2] = np.nan
+            s = s.with_values(vals)
 
         if mask_components:
             tf_kwargs = dict(component_mask=component_mask)
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from darts import TimeSeries
+from darts.dataprocessing.transformers import Resampler
+from darts.utils.timeseries_generation import linear_timeseries
+
+
+class TestResampler:
+    times = pd.date_range("20200101", periods=48, freq="15min")
+    values = np.random.normal(size=(48, 2, 3))
+    series = [
+        TimeSeries.from_times_and_values(times, values),
+        TimeSeries.from_times_and_values(times, values.astype(np.float32)),
+        TimeSeries.from_times_and_values(times, values[:, :1, :1] + 1.0),
+        linear_timeseries(start=times[5], length=30, freq="15min"),
+    ]
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"method": "mean"},
+            {"method": "max", "resample_kwargs": {"offset": pd.Timedelta("30min")}},
+            {"method": "pad"},
+            {"method": "reduce", "method_kwargs": {"func": np.mean}},
+        ],
+    )
+    def test_resampler(self, params):
+        transformer = Resampler(freq="1h", **params)
+        kwargs = params.get("resample_kwargs", {})
+        expected = [
+            ts.resample("1h", params["method"], params.get("method_kwargs"), **kwargs)
+            for ts in self.series
+        ]
+
+        # single series
+        assert transformer.transform(self.series[0]) == expected[0]
+
+        # batch of series, sequentially (at once) and in parallel (series by series)
+        for n_jobs in [1, 2]:
+            transformer = Resampler(freq="1h", n_jobs=n_jobs, **params)
+            transformed = transformer.transform(self.series)
+            assert len(transformed) == len(self.series)
+            for ts_transformed, ts_expected in zip(transformed, expected):
+                assert ts_transformed == ts_expected
+                assert ts_transformed.dtype == ts_expected.dtype
@@ -7,6 +7,7 @@ import pytest
 from darts import TimeSeries
 from darts.dataprocessing.pipeline import Pipeline
 from darts.dataprocessing.transformers import Mapper, WindowTransformer
+from darts.utils._windows import WindowEngine
 
 
 def helper_generate_ts_hierarchy(length: int):
@@ -428,6 +429,69 @@ class TestTimeSeriesWindowTransform:
             transformed_series._time_index
         )
 
+    @pytest.mark.parametrize(
+        "config",
+        [
+            ("rolling", "sum", {"window": 3}, {}),
+            ("rolling", "mean", {"window": 4, "min_periods": 2}, {}),
+            ("rolling", "std", {"window": 5}, {}),
+            ("rolling", "var", {"window": 5, "min_periods": 1}, {"ddof": 0}),
+            ("rolling", "min", {"window": 3}, {}),
+            ("rolling", "max", {"window": 30}, {}),
+            ("rolling", "median", {"window": 4}, {}),
+            ("rolling", "quantile", {"window": 6, "min_periods": 2}, {"q": 0.3}),
+            ("expanding", "sum", {}, {}),
+            ("expanding", "mean", {"min_periods": 3}, {}),
+            ("expanding", "min", {}, {}),
+            ("expanding", "max", {}, {}),
+            ("ewm", "mean", {"span": 3}, {}),
+            ("ewm", "mean", {"alpha": 0.01, "min_periods": 2}, {}),
+            ("ewm", "mean", {"com": 0.5, "adjust": False}, {}),
+        ],
+    )
+    @pytest.mark.parametrize("with_nans", [False, True])
+    def test_numpy_engine(self, config, with_nans):
+        mode, fn, window_kwargs, function_kwargs = config
+        values = np.random.default_rng(42).normal(size=(500, 3))
+        if with_nans:
+            values[[0, 10, 11, 12, 250], [0, 1, 1, 1, 2]] = np.nan
+
+        result = WindowEngine(values).compute(
+            np.array([0, 2]), mode, fn, window_kwargs, function_kwargs
+        )
+        if with_nans and (mode == "ewm" or fn in {"median", "quantile"}):
+            # not supported by the engine, falls back to pandas
+            assert result is None
+            return
+        df = pd.DataFrame(values[:, [0, 2]])
+        expected = getattr(getattr(df, mode)(**window_kwargs), fn)(**function_kwargs)
+        np.testing.assert_allclose(result, expected.to_numpy(), rtol=1e-9, atol=1e-12)
+
+        # unsupported configurations fall back to pandas
+        assert (
+            WindowEngine(values).compute(
+                np.array([0]), "rolling", fn, {"window": 3, "center": True}, {}
+            )
+            is None
+        )
+
+    @pytest.mark.parametrize("fn", ["sum", "mean", "std", "var"])
+    def test_numpy_engine_large_offset(self, fn):
+        """The window statistics of values with a large offset keep the precision of an exact computation per
+        window."""
+        values = 1e9 + np.random.default_rng(42).uniform(-1e3, 1e3, size=(100_000, 2))
+        window = 20
+        result = WindowEngine(values).compute(
+            np.array([0, 1]), "rolling", fn, {"window": window}, {}
+        )
+        windows = np.lib.stride_tricks.sliding_window_view(values, window, axis=0)
+        if fn in {"std", "var"}:
+            expected = getattr(windows, fn)(axis=-1, ddof=1)
+        else:
+            expected = getattr(windows, fn)(axis=-1)
+        assert np.isnan(result[: window - 1]).all()
+        np.testing.assert_allclose(result[window - 1 :], expected, rtol=1e-14)
+
     def test_include_current(self):
         # if "closed"="left" should not shift the index
         transformation = {
@@ -798,3 +862,26 @@ class TestWindowTransformer:
 
         transformed = transformer.transform(series)
         assert transformed.dtype == dt_source
+
+    def test_batched_transform(self):
+        # series of different lengths and components are transformed in groups
+        series = [self.series_univ_det, self.series_multi_det, self.series_univ_prob]
+        series += [s + 10 for s in series] + [s[:7] + i for i, s in enumerate(series)]
+        transforms = [
+            {"function": "mean", "mode": "rolling", "window": 3},
+            {"function": "std", "mode": "expanding"},
+            {"function": "mean", "mode": "ewm", "alpha": 0.5},
+            {"function": lambda x: x.max() - x.min(), "window": 2},
+        ]
+        kwargs = {"treat_na": 0.0, "keep_non_transformed": True}
+        transformed = WindowTransformer(transforms=transforms, **kwargs).transform(
+            series
+        )
+        assert len(transformed) == len(series)
+        for ts, ts_transformed in zip(series, transformed):
+            expected = ts.window_transform(transforms=transforms, **kwargs)
+            assert ts_transformed.components.equals(expected.components)
+            assert ts_transformed.time_index.equals(expected.time_index)
+            np.testing.assert_allclose(
+                ts_transformed.all_values(), expected.all_values()
+            )
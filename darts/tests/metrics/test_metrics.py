@@ -2101,8 +2101,9 @@ class TestMetrics:
         for s1, s2 in test_cases:
             # univariate
             non_nan_metric = metric(s1[:9] + 1, s2[:9], **kwargs)
-            nan_s1 = s1.copy()
-            nan_s1._values[-1, :, :] = np.nan
+            nan_vals = s1.all_values()
+            nan_vals[-1, :, :] = np.nan
+            nan_s1 = s1.with_values(nan_vals)
             nan_metric = metric(nan_s1 + 1, s2, **kwargs)
             assert non_nan_metric == nan_metric
 
@@ -2112,9 +2113,11 @@ class TestMetrics:
             non_nan_metric = metric(
                 [s[:9] + 1 for s in s11], [s[:9] for s in s22], **kwargs
             )
-            nan_s11 = s11.copy()
-            for s in nan_s11:
-                s._values[-1, :, :] = np.nan
+            nan_s11 = []
+            for s in s11:
+                nan_vals = s.all_values()
+                nan_vals[-1, :, :] = np.nan
+                nan_s11.append(s.with_values(nan_vals))
             nan_metric = metric([s + 1 for s in nan_s11], s22, **kwargs)
             np.testing.assert_array_equal(non_nan_metric, nan_metric)
 
@@ -2364,6 +2367,39 @@ class TestMetrics:
             metrics.mae(series_a, series_b, q=q),
         )
 
+    def test_quantile_series(self):
+        """Test that metrics interpolate the quantiles from quantile series, and are identical to the sample-based
+        metrics for quantiles at the levels of the quantile series."""
+        np.random.seed(42)
+        levels = [0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95]
+        series_a = TimeSeries.from_values(np.random.random((10, 2, 1)))
+        series_b = TimeSeries.from_values(np.random.random((10, 2, 100)))
+        series_q = series_b.quantile(levels)
+        assert series_q.is_quantile
+
+        for metric in [metrics.mae, metrics.mql]:
+            np.testing.assert_array_almost_equal(
+                metric(series_a, series_q), metric(series_a, series_b)
+            )
+            np.testing.assert_array_almost_equal(
+                metric(series_a, series_q, q=[0.1, 0.5]),
+                metric(series_a, series_b, q=[0.1, 0.5]),
+            )
+        for metric in [metrics.miw, metrics.mic, metrics.mincs_qr]:
+            np.testing.assert_array_almost_equal(
+                metric(series_a, series_q, q_interval=[(0.05, 0.95), (0.25, 0.75)]),
+                metric(series_a, series_b, q_interval=[(0.05, 0.95), (0.25, 0.75)]),
+            )
+
+        # other quantiles are interpolated from the closest levels
+        q_interp = series_q.quantile(0.2)
+        np.testing.assert_array_almost_equal(
+            metrics.mql(series_a, series_q, q=0.2),
+            metrics.mql(series_a, q_interp, q=(np.array([0.2]), q_interp.components)),
+        )
+        with pytest.raises(ValueError, match="is only supported"):
+            _ = metrics.mql(series_a, series_q, q=0.01)
+
     def test_custom_metric_wrong_output_shape(self):
         """Test that custom metrics must have correct output dim."""
 
@@ -9,7 +9,7 @@ from sklearn.base import BaseEstimator
 from sklearn.ensemble import AdaBoostClassifier, RandomForestClassifier
 from sklearn.gaussian_process import GaussianProcessClassifier
 from sklearn.gaussian_process.kernels import RBF
-from sklearn.linear_model import LinearRegression, LogisticRegression
+from sklearn.linear_model import LinearRegression, LogisticRegression, SGDClassifier
 from sklearn.metrics import f1_score
 from sklearn.naive_bayes import GaussianNB
 from sklearn.neighbors import KNeighborsClassifier
@@ -28,6 +28,7 @@ from darts.models.forecasting.sklearn_model import SKLearnModelWithCategoricalFe
 from darts.tests.conftest import CB_AVAILABLE, LGBM_AVAILABLE, XGB_AVAILABLE
 from darts.timeseries import TimeSeries
 from darts.utils import timeseries_generation as tg
+from darts.utils.data.tabularization import create_lagged_training_data
 from darts.utils.likelihood_models.base import LikelihoodType
 from darts.utils.likelihood_models.sklearn import (
     ClassProbabilityLikelihood,
@@ -527,6 +528,54 @@ class TestClassifierModel:
         else:
             assert not isinstance(model.model, MultiOutputClassifier)
 
+    @pytest.mark.parametrize("config", product([1, 3], [True, False]))
+    def test_fit_in_chunks(self, config):
+        """Check that fitting with `max_samples_per_chunk` passes the classes of all chunks to the first
+        `partial_fit()` call of the estimator"""
+        ocl, multi_models = config
+        series = self.sine_univariate1_cat
+        model = SKLearnClassifierModel(
+            model=SGDClassifier(shuffle=False, random_state=42),
+            lags=4,
+            output_chunk_length=ocl,
+            multi_models=multi_models,
+        )
+        model.fit(series, sample_weight="linear", max_samples_per_chunk=2)
+
+        # manually fit a reference estimator on the same chunks
+        expected = SGDClassifier(shuffle=False, random_state=42)
+        if ocl > 1 and multi_models:
+            expected = MultiOutputClassifier(expected)
+            assert isinstance(model.model, MultiOutputClassifier)
+        X, y, _, _, weights = create_lagged_training_data(
+            target_series=series,
+            output_chunk_length=ocl,
+            output_chunk_shift=0,
+            lags=model._get_lags("target"),
+            lags_past_covariates=None,
+            lags_future_covariates=None,
+            uses_static_covariates=model.uses_static_covariates,
+            multi_models=multi_models,
+            sample_weight="linear",
+        )
+        X, y, weights = X[:, :, 0], y[:, :, 0], weights[:, :, 0]
+        # the first chunk does not contain all classes
+        assert any(len(np.unique(y[:2, i])) < 3 for i in range(y.shape[1]))
+        classes = [np.unique(y[:, i]) for i in range(y.shape[1])]
+        if y.shape[1] == 1:
+            y, weights, classes = y.ravel(), weights.ravel(), classes[0]
+        for start in range(0, len(X), 2):
+            chunk = slice(start, start + 2)
+            expected.partial_fit(
+                X[chunk],
+                y[chunk],
+                classes=classes if start == 0 else None,
+                sample_weight=weights[chunk],
+            )
+        for labels in model.class_labels:
+            np.testing.assert_array_equal(labels, [0.0, 1.0, 2.0])
+        np.testing.assert_array_equal(model.model.predict(X), expected.predict(X))
+
     @pytest.mark.parametrize(
         "config", product(process_model_list(classifiers), [True, False])
     )
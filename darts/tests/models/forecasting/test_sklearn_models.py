@@ -3,6 +3,7 @@ import importlib
 import inspect
 import logging
 import math
+import pickle
 from copy import deepcopy
 from itertools import product
 from typing import Any
@@ -12,10 +13,10 @@ import numpy as np
 import pandas as pd
 import pytest
 from sklearn.ensemble import HistGradientBoostingRegressor, RandomForestRegressor
-from sklearn.linear_model import LinearRegression
+from sklearn.linear_model import LinearRegression, SGDRegressor
 from sklearn.neighbors import KNeighborsRegressor
 
-from darts import TimeSeries
+from darts import TimeSeries, option_context
 from darts.dataprocessing.encoders import (
     FutureCyclicEncoder,
     PastDatetimeAttributeEncoder,
@@ -38,6 +39,10 @@ from darts.tests.conftest import (
     XGB_AVAILABLE,
 )
 from darts.utils import timeseries_generation as tg
+from darts.utils.data.tabularization import (
+    create_lagged_prediction_data,
+    create_lagged_training_data,
+)
 from darts.utils.likelihood_models.base import Likelihood, LikelihoodType
 from darts.utils.likelihood_models.sklearn import (
     MultiQuantileRegression,
@@ -430,8 +435,10 @@ class TestSKLearnModels:
                 ]),
             })
             .assign(
-                target_qty=lambda _df: _df.baseline
-                + _df.fut_cov_promo_mechanism.apply(_apply_promo_mechanism)
+                target_qty=lambda _df: (
+                    _df.baseline
+                    + _df.fut_cov_promo_mechanism.apply(_apply_promo_mechanism)
+                )
             )
             .drop(columns=["baseline"])
         )
@@ -883,6 +890,57 @@ class TestSKLearnModels:
                 50.0,
             ]
 
+    @pytest.mark.parametrize("dtype", ["float32", "float64"])
+    def test_compute_dtype_option(self, dtype):
+        """With option `compute.dtype`, the features, labels and forecasts are never silently promoted to
+        another dtype."""
+        times = pd.date_range("2000-01-01", periods=50, freq="D")
+        with option_context("compute.dtype", dtype):
+            series = TimeSeries(
+                times=times,
+                values=np.random.rand(50, 2),
+                static_covariates=pd.DataFrame({"a": [1]}),
+            )
+            past_cov = TimeSeries(
+                times=generate_index(start=times[0], length=60, freq="D"),
+                values=np.arange(60),
+            )
+            future_cov = tg.datetime_attribute_timeseries(
+                times, "day", cyclic=True, add_length=10
+            )
+            model = LinearRegressionModel(
+                lags=3,
+                lags_past_covariates=2,
+                lags_future_covariates=[0, 1],
+                output_chunk_length=2,
+                add_encoders={"cyclic": {"future": ["month"]}},
+            )
+            X, y, _ = model._create_lagged_data(
+                series=[series],
+                past_covariates=[past_cov],
+                future_covariates=[future_cov],
+                max_samples_per_ts=None,
+            )
+            assert X.dtype == dtype and y.dtype == dtype
+
+            model.fit(series, past_covariates=past_cov, future_covariates=future_cov)
+            preds = model.predict(
+                n=4,
+                series=series,
+                past_covariates=past_cov,
+                future_covariates=future_cov,
+            )
+            assert preds.dtype == dtype
+            hfcs = model.historical_forecasts(
+                series,
+                past_covariates=past_cov,
+                future_covariates=future_cov,
+                start=-5,
+                forecast_horizon=2,
+                retrain=False,
+            )
+            assert hfcs.dtype == dtype
+
     @pytest.mark.parametrize("model_cls", models)
     def test_optional_static_covariates(self, model_cls):
         """adding static covariates to lagged data logic is tested in
@@ -1566,6 +1624,240 @@ class TestSKLearnModels:
         else:
             assert not isinstance(model.model, MultiOutputRegressor)
 
+    @pytest.mark.parametrize("config", product([1, 3], [True, False]))
+    def test_fit_in_chunks(self, config):
+        """Check that fitting with `max_samples_per_chunk` calls the estimator's `partial_fit()` on each chunk
+        of the lagged training data"""
+        ocl, multi_models = config
+        series = [self.sine_univariate1, self.sine_univariate1 * 2]
+        model_kwargs = {
+            "lags": 4,
+            "lags_past_covariates": 2,
+            "output_chunk_length": ocl,
+            "multi_models": multi_models,
+        }
+        model = SKLearnModel(
+            model=SGDRegressor(shuffle=False, random_state=42), **model_kwargs
+        )
+        model.fit(
+            series,
+            past_covariates=[self.sine_multivariate1] * 2,
+            sample_weight="linear",
+            max_samples_per_chunk=25,
+        )
+
+        # manually fit a reference estimator on the same chunks
+        expected = SGDRegressor(shuffle=False, random_state=42)
+        if ocl > 1 and multi_models:
+            expected = MultiOutputRegressor(expected)
+            assert isinstance(model.model, MultiOutputRegressor)
+        X, y, _, _, weights = create_lagged_training_data(
+            target_series=series,
+            past_covariates=[self.sine_multivariate1] * 2,
+            output_chunk_length=ocl,
+            output_chunk_shift=0,
+            lags=model._get_lags("target"),
+            lags_past_covariates=model._get_lags("past"),
+            uses_static_covariates=model.uses_static_covariates,
+            multi_models=multi_models,
+            sample_weight="linear",
+        )
+        X, y, weights = X[:, :, 0], y[:, :, 0], weights[:, :, 0]
+        if y.shape[1] == 1:
+            y, weights = y.ravel(), weights.ravel()
+        for start in range(0, len(X), 25):
+            chunk = slice(start, start + 25)
+            expected.partial_fit(X[chunk], y[chunk], sample_weight=weights[chunk])
+        np.testing.assert_array_almost_equal(
+            model.model.predict(X), expected.predict(X)
+        )
+
+        # fitting again trains from scratch
+        pred = model.predict(
+            n=1, series=series, past_covariates=[self.sine_multivariate1] * 2
+        )
+        model.fit(
+            series,
+            past_covariates=[self.sine_multivariate1] * 2,
+            sample_weight="linear",
+            max_samples_per_chunk=25,
+        )
+        assert (
+            model.predict(
+                n=1, series=series, past_covariates=[self.sine_multivariate1] * 2
+            )
+            == pred
+        )
+
+    def test_fit_in_chunks_sample_weight_unsupported(self, caplog):
+        """Check that the support of sample weights is taken from the estimator's `partial_fit()` method when fitting
+        with `max_samples_per_chunk`"""
+
+        class SGDRegressorWithoutPartialFitWeights(SGDRegressor):
+            def partial_fit(self, X, y):
+                return super().partial_fit(X, y)
+
+        for ocl in [1, 2]:
+            model = SKLearnModel(
+                lags=4,
+                output_chunk_length=ocl,
+                model=SGDRegressorWithoutPartialFitWeights(),
+            )
+            # `fit()` of the estimator supports sample weights
+            assert model.supports_sample_weight
+            with caplog.at_level(logging.WARNING):
+                model.fit(
+                    self.sine_univariate1,
+                    sample_weight="linear",
+                    max_samples_per_chunk=25,
+                )
+            assert caplog.records[-1].message == (
+                "`sample_weight` was ignored since underlying regression model's "
+                "`partial_fit()` method does not support it."
+            )
+            caplog.clear()
+
+    def test_fit_in_chunks_invalid(self):
+        """Check that fitting with `max_samples_per_chunk` raises an error for estimators without `partial_fit()`,
+        validation series, or non-positive chunk sizes"""
+        series = self.sine_univariate1
+        model = LinearRegressionModel(lags=4)
+        with pytest.raises(ValueError) as err:
+            model.fit(series, max_samples_per_chunk=10)
+        assert str(err.value) == (
+            "`max_samples_per_chunk` is only supported by estimators with a `partial_fit()` method, "
+            "but `LinearRegression` has none."
+        )
+
+        model = SKLearnModel(lags=4, model=SGDRegressor())
+        with pytest.raises(ValueError) as err:
+            model.fit(series, val_series=series, max_samples_per_chunk=10)
+        assert str(err.value) == (
+            "`max_samples_per_chunk` is not supported with validation series (`val_series`)."
+        )
+        with pytest.raises(ValueError) as err:
+            model.fit(series, max_samples_per_chunk=0)
+        assert str(err.value) == "`max_samples_per_chunk` must be a positive integer."
+
+    @pytest.mark.parametrize("n_jobs", [2, -1])
+    def test_fit_parallel_tabularization(self, n_jobs):
+        """Check that creating the training samples of several series in parallel gives the same model"""
+        series = [self.sine_univariate1, self.sine_univariate1 * 2]
+        past_covariates = [self.sine_multivariate1] * 2
+        model = LinearRegressionModel(lags=4, lags_past_covariates=2)
+        model.fit(series, past_covariates=past_covariates, sample_weight="linear")
+        model_parallel = LinearRegressionModel(lags=4, lags_past_covariates=2)
+        model_parallel.fit(
+            series,
+            past_covariates=past_covariates,
+            sample_weight="linear",
+            n_jobs=n_jobs,
+        )
+        np.testing.assert_array_almost_equal(
+            model.model.coef_, model_parallel.model.coef_
+        )
+
+        # series with an unexpected number of components raise an error before tabularization
+        with pytest.raises(ValueError) as err:
+            model_parallel.fit(
+                series,
+                past_covariates=[self.sine_multivariate1, self.sine_univariate1],
+                n_jobs=n_jobs,
+            )
+        assert str(err.value) == (
+            "Expected 2 components but received 1 components at index 1 of `past_covariates`."
+        )
+
+    @pytest.mark.parametrize("config", product([1, 3], [True, False]))
+    def test_autoregressive_rollout(self, config):
+        """Check that an autoregressive forecast is identical to successive forecasts of `output_chunk_length`
+        appended to the target series"""
+        ocl, multi_models = config
+        series = [
+            (self.sine_univariate1 * (i + 1)).with_static_covariates(
+                pd.Series({"id": float(i)})
+            )
+            for i in range(2)
+        ]
+        future_covariates = [
+            self.sine_multivariate1.append_values(self.sine_multivariate1.values())
+        ] * 2
+        model = LinearRegressionModel(
+            lags={"sine": [-5, -1]},
+            lags_future_covariates=[-1, 0],
+            output_chunk_length=ocl,
+            multi_models=multi_models,
+        )
+        model.fit(series, future_covariates=future_covariates)
+
+        n = 3 * ocl + 2
+        preds = model.predict(n, series=series, future_covariates=future_covariates)
+        expected = series
+        while len(expected[0]) < len(series[0]) + n:
+            expected = [
+                ts.append(pred)
+                for ts, pred in zip(
+                    expected,
+                    model.predict(
+                        ocl, series=expected, future_covariates=future_covariates
+                    ),
+                )
+            ]
+        for pred, exp in zip(preds, expected):
+            np.testing.assert_array_almost_equal(
+                pred.values(), exp[len(series[0]) : len(series[0]) + n].values()
+            )
+
+    def test_lag_plan(self):
+        """Check the lagged features of the plan stored by the fitted model"""
+        series = tg.sine_timeseries(length=30, column_name="a").stack(
+            tg.linear_timeseries(length=30, column_name="b")
+        )
+        past_covariates = tg.linear_timeseries(length=30, column_name="p")
+        model = LinearRegressionModel(
+            lags={"a": [-3, -1], "b": [-2]}, lags_past_covariates=2
+        )
+        assert model._lag_plan is None
+        assert model.lagged_feature_names is None
+        model.fit(series, past_covariates=past_covariates)
+
+        plan = model._lag_plan
+        assert plan.feature_names == model.lagged_feature_names
+        assert model.lagged_feature_names == [
+            "a_target_lag-3",
+            "b_target_lag-2",
+            "a_target_lag-1",
+            "p_pastcov_lag-2",
+            "p_pastcov_lag-1",
+        ]
+        assert (
+            plan.label_names
+            == model.lagged_label_names
+            == ["a_target_hrz0", "b_target_hrz0"]
+        )
+        assert plan.min_lags == {"target": -3, "past": -2}
+        np.testing.assert_array_equal(plan.feature_lags["target"], [-3, -2, -1])
+        np.testing.assert_array_equal(plan.feature_components["target"], [0, 1, 0])
+        np.testing.assert_array_equal(plan.gather_indices["target"], [0, 3, 4])
+        np.testing.assert_array_equal(plan.gather_indices["past"], [0, 1])
+
+        # the gather indices select the lagged features from the values starting at the minimum lag
+        X, _ = create_lagged_prediction_data(
+            target_series=series,
+            past_covariates=past_covariates,
+            lags=model._get_lags("target"),
+            lags_past_covariates=model._get_lags("past"),
+            uses_static_covariates=False,
+            lag_plan=plan,
+        )
+        features = [
+            np.take(
+                ts.values()[plan.min_lags[lags_type] :], plan.gather_indices[lags_type]
+            )
+            for lags_type, ts in [("target", series), ("past", past_covariates)]
+        ]
+        np.testing.assert_array_equal(X[-1, :, 0], np.concatenate(features))
+
     def test_model_representation(self):
         """Check that model representation works with and without MultiOutputRegressor"""
         model_1 = LinearRegressionModel(lags=4, output_chunk_length=1)
@@ -2905,6 +3197,113 @@ class TestSKLearnModels:
                 tg.sine_timeseries(length=27)[-7:].values(), pred["sine"].values()
             )
 
+    @pytest.mark.parametrize(
+        "config",
+        [
+            (
+                {"lags_past_covariates": {"default_lags": 3, "lin_past": [-1]}},
+                {"lags_past_covariates": [-1]},
+            ),
+            (
+                {
+                    "lags_future_covariates": {
+                        "default_lags": [-4, 3],
+                        "lin_future": [0, 1],
+                    }
+                },
+                {"lags_future_covariates": [0, 1]},
+            ),
+        ],
+    )
+    def test_component_specific_lags_unused_default_lags(self, config):
+        """Default lags that are not used by any component must not shift the covariate lags during the
+        auto-regression and the historical forecasts."""
+        dict_lags, list_lags = config
+        np.random.seed(42)
+        series = TimeSeries.from_values(np.random.normal(size=(30, 1)))
+        past_cov = TimeSeries.from_values(
+            np.random.normal(size=(40, 1)), columns=["lin_past"]
+        )
+        future_cov = TimeSeries.from_values(
+            np.random.normal(size=(40, 1)), columns=["lin_future"]
+        )
+
+        preds, hfcs = [], []
+        for lags_kwargs in [dict_lags, list_lags]:
+            model = LinearRegressionModel(lags=2, output_chunk_length=2, **lags_kwargs)
+            cov_kwargs = {
+                "past_covariates": (
+                    past_cov if model.supports_past_covariates else None
+                ),
+                "future_covariates": (
+                    future_cov if model.supports_future_covariates else None
+                ),
+            }
+            model.fit(series, **cov_kwargs)
+            preds.append(model.predict(7, **cov_kwargs))
+            for enable_optimization in [True, False]:
+                hfcs.append(
+                    model.historical_forecasts(
+                        series,
+                        forecast_horizon=5,
+                        start=20,
+                        retrain=False,
+                        enable_optimization=enable_optimization,
+                        **cov_kwargs,
+                    )
+                )
+
+        # identical to the model with the lags of the component as a list
+        assert preds[0] == preds[1]
+        for hfc in hfcs[1:]:
+            assert hfc.time_index.equals(hfcs[0].time_index)
+            np.testing.assert_array_almost_equal(hfc.values(), hfcs[0].values())
+
+    @pytest.mark.parametrize("fitted", [True, False])
+    def test_load_model_without_lag_plan(self, fitted):
+        """Models saved before the `LagPlan` was introduced (with the lagged feature and label names as attributes)
+        can still be loaded and used."""
+        series = self.sine_multivariate1
+        past_cov = tg.linear_timeseries(length=len(series) + 10)
+        model = LinearRegressionModel(
+            lags={"sine": [-3, -1], "default_lags": 2},
+            lags_past_covariates=[-2, -1],
+            output_chunk_length=2,
+        )
+        if fitted:
+            model.fit(series, past_covariates=past_cov)
+
+        # state of a model saved before the `LagPlan` was introduced
+        state = dict(model.__dict__)
+        state.pop("_lag_plan")
+        state["_lagged_feature_names"] = model.lagged_feature_names
+        state["_lagged_label_names"] = model.lagged_label_names
+        with patch.object(
+            LinearRegressionModel, "__getstate__", lambda self: state, create=True
+        ):
+            model_loaded = pickle.loads(pickle.dumps(model))
+        assert not hasattr(model_loaded, "_lagged_feature_names")
+        assert not hasattr(model_loaded, "_lagged_label_names")
+        assert model_loaded.lagged_feature_names == model.lagged_feature_names
+        assert model_loaded.lagged_label_names == model.lagged_label_names
+        if not fitted:
+            assert model_loaded._lag_plan is None
+            return
+
+        assert model_loaded.predict(
+            5, past_covariates=past_cov, show_warnings=False
+        ) == model.predict(5, past_covariates=past_cov, show_warnings=False)
+        hfc_kwargs = {
+            "series": series,
+            "past_covariates": past_cov,
+            "start": 0.5,
+            "forecast_horizon": 3,
+            "retrain": False,
+        }
+        assert model_loaded.historical_forecasts(
+            **hfc_kwargs
+        ) == model.historical_forecasts(**hfc_kwargs)
+
     @pytest.mark.parametrize(
         "config",
         product(
@@ -35,7 +35,7 @@ from torchmetrics import (
 )
 
 import darts.utils.timeseries_generation as tg
-from darts import TimeSeries
+from darts import TimeSeries, option_context
 from darts.dataprocessing.encoders import SequentialEncoder
 from darts.dataprocessing.transformers import BoxCox, Scaler
 from darts.metrics import mape
@@ -1204,6 +1204,38 @@ class TestTorchForecastingModel:
             preds = model.predict(n=10)
             assert preds.dtype == np.float32
 
+    def test_compute_dtype_option(self):
+        # with option `compute.dtype`, the series, encodings, training samples and predictions have the same dtype
+        with option_context("compute.dtype", "float32"):
+            series = TimeSeries.from_times_and_values(
+                times=self.series.time_index, values=self.series.values()
+            )
+            model = RNNModel(
+                12,
+                "RNN",
+                10,
+                10,
+                n_epochs=1,
+                add_encoders={"cyclic": {"future": ["month"]}},
+                **tfm_kwargs,
+            )
+            model.fit(series)
+            assert model.trainer.precision == "32-true"
+
+            _, future_covs = model.generate_fit_encodings(series=series)
+            assert future_covs.dtype == np.float32
+            train_dataset = model._build_train_dataset(
+                series=[series],
+                past_covariates=None,
+                future_covariates=[future_covs],
+                sample_weight=None,
+                max_samples_per_ts=None,
+            )
+            assert all(
+                arr.dtype == np.float32 for arr in train_dataset[0] if arr is not None
+            )
+            assert model.predict(n=10).dtype == np.float32
+
     def test_load_weights_from_checkpoint(self, tmpdir_fn):
         ts_training, ts_test = self.series.split_before(90)
         original_model_name = "original"
@@ -3,6 +3,7 @@ Tests for the configuration system
 """
 
 import matplotlib as mpl
+import numpy as np
 import pytest
 
 from darts.config import (
@@ -83,6 +84,17 @@ class TestConfig:
         with pytest.raises(ValueError, match="must be a boolean"):
             set_option("plotting.use_darts_style", 1)
 
+    def test_set_option_dtype(self):
+        """Test setting dtype option."""
+        assert get_option("compute.dtype") is None
+        for dtype in ["float32", "float64", None]:
+            set_option("compute.dtype", dtype)
+            assert get_option("compute.dtype") == dtype
+
+        for dtype in ["float16", "int64", np.float32]:
+            with pytest.raises(ValueError, match="must be one of"):
+                set_option("compute.dtype", dtype)
+
     def test_reset_option_single(self):
         """Test resetting a single option."""
         # Change the value
@@ -1,6 +1,7 @@
 import itertools
 import logging
 import math
+import pickle
 from tempfile import NamedTemporaryFile
 from unittest.mock import patch
 
@@ -11,13 +12,27 @@ import pytest
 import xarray as xr
 from scipy.stats import kurtosis, skew
 
-from darts import TimeSeries, concatenate, slice_intersect
+from darts import TimeSeries, concatenate, option_context, slice_intersect
 from darts.tests.conftest import POLARS_AVAILABLE
+from darts.timeseries import (
+    TimeSeriesCollection,
+    _resample,
+    _resample_xarray,
+    gaps,
+    longest_contiguous_slice,
+    strip,
+)
+from darts.utils._chunked import LazyValues, NpyChunkStore
 from darts.utils.likelihood_models.base import (
     likelihood_component_names,
     quantile_names,
 )
-from darts.utils.timeseries_generation import constant_timeseries, linear_timeseries
+from darts.utils.timeseries_generation import (
+    constant_timeseries,
+    datetime_attribute_timeseries,
+    linear_timeseries,
+    sine_timeseries,
+)
 from darts.utils.utils import expand_arr, generate_index
 
 TEST_BACKENDS = ["pandas"]
@@ -175,6 +190,55 @@ class TestTimeSeries:
         assert ts_pl_df_2.equals(pl_df)
         assert ts_pl_df_2.dtypes == pl_df.dtypes
 
+    @pytest.mark.skipif(not POLARS_AVAILABLE, reason="requires polars")
+    @pytest.mark.parametrize("copy", [True, False])
+    def test_polars_creation_values(self, copy):
+        n = 10_000
+        times = pd.date_range(start="2023-01-01", periods=n, freq="h")
+        pl_df = pl.DataFrame(
+            data={
+                "time": times,
+                "int": np.arange(n),
+                "int_null": [None] + list(range(1, n)),
+                "float32": np.arange(n, dtype=np.float32),
+                "bool": np.arange(n) % 2 == 0,
+                "str": ["a"] * n,
+            }
+        )
+        value_cols = ["int", "int_null", "float32", "bool"]
+        ts = TimeSeries.from_dataframe(
+            pl_df, time_col="time", value_cols=value_cols, copy=copy
+        )
+        expected = TimeSeries.from_dataframe(
+            pl_df.to_pandas(), time_col="time", value_cols=value_cols
+        )
+        assert ts == expected
+        assert ts.dtype == np.float64
+        assert ts._values.flags.c_contiguous
+        assert ts.time_index.equals(times.rename("time"))
+        assert ts.freq == times.freq
+
+        # a single column with the final dtype is not copied with `copy=False`
+        ts = TimeSeries.from_dataframe(
+            pl_df, time_col="time", value_cols="float32", copy=copy
+        )
+        assert ts.dtype == np.float32
+        np.testing.assert_array_equal(ts.values()[:, 0], np.arange(n))
+        col_vals = pl_df.get_column("float32").to_numpy()
+        assert np.shares_memory(ts._values, col_vals) == (not copy)
+
+        # the values are cast to the dtype from option `compute.dtype`
+        with option_context("compute.dtype", "float32"):
+            ts = TimeSeries.from_dataframe(
+                pl_df, time_col="time", value_cols=value_cols, copy=copy
+            )
+        assert ts.dtype == np.float32
+        np.testing.assert_array_equal(ts.values(), expected.values().astype(np.float32))
+
+        # non-numeric columns are converted as before
+        with pytest.raises(ValueError, match="could not convert string to float"):
+            _ = TimeSeries.from_dataframe(pl_df, time_col="time", copy=copy)
+
     @pytest.mark.parametrize(
         "backend,date_type",
         itertools.product(
@@ -600,6 +664,38 @@ class TestTimeSeries:
         helper_test_drop_before(self.series1, keep_point=False)
         helper_test_drop_before(self.series1, keep_point=True)
 
+    @pytest.mark.parametrize("freq", ["h", "2D", "ME", "W-MON", "B", 3])
+    def test_positional_lookup(self, freq):
+        """Tests the positional lookup of (possibly off-grid) times against a search over the time index, for
+        frequencies with and without a fixed step size."""
+        start = 3 if isinstance(freq, int) else pd.Timestamp("2020-01-31")
+        series = linear_timeseries(start=start, length=20, freq=freq)
+        times = series.time_index
+        step = series.freq if isinstance(freq, int) else pd.Timedelta(hours=7)
+        points = [times[0] + i * step for i in range(-3, 60)] + list(times)
+        points = [p for p in points if p <= times[-1] + 3 * series.freq]
+
+        for point in points:
+            after = np.flatnonzero(times >= point)
+            before = np.flatnonzero(times <= point)
+            assert (point in series) == (point in times)
+            if series.has_datetime_index and times[0] <= point <= times[-1]:
+                assert series.get_index_at_point(point, after=True) == after[0]
+                assert series.get_index_at_point(point, after=False) == before[-1]
+                assert series.slice_n_points_after(point, 3).time_index.equals(
+                    times[after[:3]]
+                )
+                assert series.slice_n_points_before(point, 3).time_index.equals(
+                    times[before[-3:]]
+                )
+            if series.has_datetime_index:
+                end = point + 5 * series.freq
+                expected = times[(times >= point) & (times <= end)]
+                assert series.slice(point, end).time_index.equals(expected)
+            else:
+                closest = min(times, key=lambda t: abs(t - point))
+                assert series._get_closest_time(point) == closest
+
     @pytest.mark.parametrize(
         "config", itertools.product(["D", "2D", 1, 2], [False, True])
     )
@@ -1160,6 +1256,53 @@ class TestTimeSeries:
         assert (series / vals).dtype == dt_source
         assert (series**vals).dtype == dt_source
 
+        series_inplace = series + 0.0
+        series_inplace += vals
+        series_inplace *= vals
+        assert series_inplace.dtype == dt_source
+
+    def test_ops_inplace(self):
+        series = self.series1.with_static_covariates(pd.Series({"a": 1.0}))
+        other = self.series1 + 1
+        vals = series.all_values()
+
+        acc = series + 0.0
+        for _ in range(3):
+            acc += other
+        acc -= 1
+        acc *= 2
+        acc /= other
+        expected = (vals + 3 * other.all_values() - 1) * 2 / other.all_values()
+        np.testing.assert_array_almost_equal(acc.all_values(), expected)
+        assert not acc.all_values(copy=False).flags.writeable
+        assert acc == ((series + 3 * other - 1) * 2 / other).with_values(
+            acc.all_values()
+        )
+        assert acc.static_covariates.equals(series.static_covariates)
+
+        # augmented assignments use the binary operators: they return a new series and
+        # never modify the series, its aliases or its values
+        alias = acc
+        acc_values = acc.values(copy=False)
+        acc_copy = acc.copy()
+        fingerprint = acc.fingerprint
+        acc += 1
+        assert acc is not alias
+        assert alias == acc_copy and alias.fingerprint == fingerprint
+        np.testing.assert_array_equal(acc_values, acc_copy.values())
+        np.testing.assert_array_equal(acc.values(), acc_copy.values() + 1)
+        assert acc.fingerprint != fingerprint
+        np.testing.assert_array_equal(series.all_values(), vals)
+
+        with pytest.raises(ZeroDivisionError, match="Cannot divide by 0"):
+            acc /= 0
+        with pytest.raises(ZeroDivisionError, match="with a value 0"):
+            acc /= series - series
+        with pytest.raises(TypeError, match=r"\+ or add\(\)"):
+            acc += "a"
+        with pytest.raises(ValueError):
+            acc += self.series1[:3]
+
     def test_getitem_datetime_index(self):
         series_short: TimeSeries = self.series1.drop_after(pd.Timestamp("20130105"))
         series_stride_2: TimeSeries = self.series1.with_times_and_values(
@@ -1412,6 +1555,231 @@ class TestTimeSeries:
         assert ts_idx.start_time() == idx[0]
         assert ts_idx.freq == 2 * freq
 
+    def test_from_trusted(self):
+        ts = self.series1.stack(self.series2).with_static_covariates(
+            pd.DataFrame({"st": [0.0, 1.0]}, index=["0", "1"])
+        )
+        kwargs = dict(
+            times=ts._time_index,
+            values=ts.all_values(),
+            components=ts.components,
+            **ts._attrs,
+        )
+        assert TimeSeries._from_trusted(**kwargs) == ts
+
+        # slices share the read-only values of the original series, copies do not
+        for ts_new in [ts[2:5], ts[:-1:2]]:
+            assert np.shares_memory(
+                ts_new.all_values(copy=False), ts.all_values(copy=False)
+            )
+        for ts_new in [ts.with_values(ts.all_values()), ts.copy()]:
+            assert not np.shares_memory(
+                ts_new.all_values(copy=False), ts.all_values(copy=False)
+            )
+
+        # invalid inputs are only detected with full validation
+        times_no_freq = pd.DatetimeIndex(ts.time_index.values)
+        kwargs_no_freq = dict(kwargs, times=times_no_freq)
+        kwargs_int = dict(kwargs, values=ts.all_values().astype(int))
+        assert TimeSeries._from_trusted(**kwargs_int).dtype == int
+        with option_context("debug.validate_series", True):
+            assert TimeSeries._from_trusted(**kwargs) == ts
+            assert ts[2:5] == TimeSeries.from_times_and_values(
+                times=ts.time_index[2:5],
+                values=ts.all_values()[2:5],
+                columns=ts.components,
+                static_covariates=ts.static_covariates,
+            )
+            with pytest.raises(ValueError, match="must be a `pandas.RangeIndex`"):
+                _ = TimeSeries._from_trusted(**kwargs_no_freq)
+            with pytest.raises(
+                ValueError, match=r"modified by the constructor: \['values'\]"
+            ):
+                _ = TimeSeries._from_trusted(**kwargs_int)
+
+    @pytest.mark.parametrize("dtype", ["float32", "float64"])
+    def test_compute_dtype_option(self, dtype):
+        """All series created from user inputs or generated have the dtype from option `compute.dtype`."""
+        times = pd.date_range("2000-01-01", periods=10, freq="D")
+        df = pd.DataFrame({
+            "time": times.append(times),
+            "group": [0] * 10 + [1] * 10,
+            "a": np.arange(20),
+            "b": np.linspace(0.0, 1.0, 20, dtype=np.float32),
+            "static": [1.0] * 20,
+        })
+        with option_context("compute.dtype", dtype):
+            series = [
+                TimeSeries(times=times, values=np.arange(10)),
+                TimeSeries.from_values(np.random.rand(10, 2).astype(np.float32)),
+                TimeSeries.from_dataframe(df.iloc[:10], time_col="time"),
+                TimeSeries.from_series(pd.Series(np.arange(10.0), index=times)),
+                linear_timeseries(length=10),
+                constant_timeseries(length=10, dtype=np.float64),
+                datetime_attribute_timeseries(times, "month", cyclic=True),
+            ]
+            series += TimeSeries.from_group_dataframe(
+                df,
+                group_cols="group",
+                time_col="time",
+                value_cols=["a", "b"],
+                static_cols="static",
+            )
+            for ts in series:
+                assert ts.dtype == dtype
+                if ts.static_covariates is not None:
+                    assert (ts.static_covariates.dtypes == dtype).all()
+
+            # operations on the series keep the dtype
+            ts = series[-1]
+            for ts_new in [ts[2:5], ts + 1, ts.diff(), ts.stack(series[0]), ts.mean()]:
+                assert ts_new.dtype == dtype
+
+        # without the option, floating point inputs keep their dtype
+        assert TimeSeries.from_values(np.zeros(3, dtype=np.float32)).dtype == np.float32
+        assert TimeSeries.from_values(np.zeros(3, dtype=int)).dtype == np.float64
+        assert linear_timeseries(length=3).dtype == np.float64
+
+    @pytest.mark.parametrize("is_dti", [True, False])
+    def test_memmap(self, is_dti, tmpdir_fn):
+        ts = linear_timeseries(
+            start=pd.Timestamp("2000-01-01") if is_dti else 0, length=20
+        )
+        ts = ts.stack(ts + 1).with_static_covariates(
+            pd.Series([0.0, 1.0], index=["a", "b"])
+        )
+        ts = ts.with_metadata({"id": 0})
+        ts.save_memmap("series")
+
+        ts_mm = TimeSeries.load_memmap("series")
+        assert ts_mm == ts
+        assert ts_mm.static_covariates.equals(ts.static_covariates)
+        assert ts_mm.metadata == ts.metadata
+        assert isinstance(ts_mm.all_values(copy=False), np.memmap)
+
+        # read paths and time slices share the read-only memory-mapped values
+        vals = ts_mm.all_values(copy=False)
+        assert np.shares_memory(ts_mm.values(copy=False), vals)
+        assert np.shares_memory(ts_mm.random_component_values(copy=False), vals)
+        for ts_slice in [ts_mm[5:10], ts_mm[3], ts_mm.drop_before(ts_mm.time_index[4])]:
+            assert np.shares_memory(ts_slice.all_values(copy=False), vals)
+        assert ts_mm[5:10] == ts[5:10]
+
+        # computing new values returns in-memory series
+        ts_new = ts_mm + 1
+        assert not np.shares_memory(ts_new.all_values(copy=False), vals)
+        assert ts_new == ts + 1
+        with pytest.raises(ValueError, match="read-only"):
+            ts_mm.all_values(copy=False)[0] = 0.0
+
+        # the values of the series are read-only in any mode
+        ts_cow = TimeSeries.load_memmap("series", mode="c")
+        with pytest.raises(ValueError, match="read-only"):
+            ts_cow.all_values(copy=False)[0] = -1.0
+        assert TimeSeries.load_memmap("series") == ts
+
+    @pytest.mark.parametrize("is_dti", [True, False])
+    def test_chunked(self, is_dti, tmpdir_fn):
+        ts = linear_timeseries(
+            start=pd.Timestamp("2000-01-01") if is_dti else 0, length=100
+        )
+        ts = ts.stack(ts + 1).concatenate(ts.stack(ts - 1), axis=2)
+        ts = ts.with_static_covariates(pd.Series([0.0, 1.0], index=["a", "b"]))
+        ts = ts.with_metadata({"id": 0})
+        ts.save_chunked("series", chunk_length=30)
+
+        ts_lazy = TimeSeries.load_chunked("series")
+        assert isinstance(ts_lazy.all_values(copy=False), LazyValues)
+        assert ts_lazy.shape == ts.shape and ts_lazy.dtype == ts.dtype
+        assert ts_lazy.static_covariates.equals(ts.static_covariates)
+        assert ts_lazy.metadata == ts.metadata
+
+        # time slices only load the chunks holding the selected time steps, and return in-memory series
+        loaded = []
+        load_chunk = NpyChunkStore._chunk
+
+        def spy(store, idx):
+            loaded.append(idx)
+            return load_chunk(store, idx)
+
+        with patch.object(NpyChunkStore, "_chunk", spy):
+            for get_slice, expected, chunks in [
+                (lambda: ts_lazy[35:50], ts[35:50], [1]),
+                (lambda: ts_lazy[-5:], ts[-5:], [3]),
+                (lambda: ts_lazy[29], ts[29], [0]),
+                (lambda: ts_lazy.drop_after(ts.time_index[40]), ts[:40], [0, 1]),
+                (
+                    lambda: ts_lazy.slice(ts.time_index[55], ts.time_index[65]),
+                    ts.slice(ts.time_index[55], ts.time_index[65]),
+                    [1, 2],
+                ),
+            ]:
+                loaded.clear()
+                ts_slice = get_slice()
+                assert loaded == chunks
+                assert isinstance(ts_slice.all_values(copy=False), np.ndarray)
+                assert ts_slice == expected
+
+            # so do the value accessors used by the datasets
+            loaded.clear()
+            vals = ts_lazy.random_component_values(copy=False)
+            assert vals.shape == (100, 2) and not loaded
+            vals = vals[62:70]
+            assert loaded == [2]
+            assert any(
+                np.array_equal(vals, ts.all_values()[62:70, :, sample])
+                for sample in range(ts.n_samples)
+            )
+            loaded.clear()
+            np.testing.assert_array_equal(
+                ts_lazy.all_values(copy=False)[[95, 91], :, 1],
+                ts.all_values()[[95, 91], :, 1],
+            )
+            assert loaded == [3]
+
+        # all other operations load all values
+        assert ts_lazy == ts
+        assert ts_lazy + 1 == ts + 1
+        assert ts_lazy.fingerprint == ts.fingerprint
+        ts_copy = ts_lazy.copy()
+        assert isinstance(ts_copy.all_values(copy=False), np.ndarray)
+        assert ts_copy == ts
+
+        # pickled series stay lazy
+        ts_pickled = pickle.loads(pickle.dumps(ts_lazy))
+        assert isinstance(ts_pickled.all_values(copy=False), LazyValues)
+        assert ts_pickled == ts
+
+        with pytest.raises(ValueError, match="`chunk_length` must be"):
+            ts.save_chunked("series", chunk_length=0)
+
+    def test_from_xarray_lazy(self):
+        ts = linear_timeseries(start=pd.Timestamp("2000-01-01"), length=50)
+        ts = ts.stack(ts + 1).with_static_covariates(
+            pd.Series([0.0, 1.0], index=["a", "b"])
+        )
+        xa = ts.data_array()
+
+        ts_lazy = TimeSeries.from_xarray(xa, lazy=True)
+        assert isinstance(ts_lazy.all_values(copy=False), LazyValues)
+        assert ts_lazy.static_covariates.equals(ts.static_covariates)
+        assert ts_lazy[10:20] == ts[10:20]
+        assert ts_lazy == ts
+
+        # the values are cast like with eager loading
+        xa_int = xa.astype(int)
+        assert TimeSeries.from_xarray(xa_int, lazy=True) == TimeSeries.from_xarray(
+            xa_int
+        )
+        assert TimeSeries.from_xarray(xa_int, lazy=True).dtype == np.float64
+
+        with pytest.raises(ValueError, match="not supported with `lazy=True`"):
+            TimeSeries.from_xarray(xa, fill_missing_dates=True, lazy=True)
+        with pytest.raises(ValueError, match="sorted in increasing order"):
+            TimeSeries.from_xarray(xa[::-1], lazy=True)
+        with pytest.raises(ValueError, match="do not support missing dates"):
+            TimeSeries.from_xarray(xa[[0, 1, 3]], freq="D", lazy=True)
+
     def test_fill_missing_dates(self):
         with pytest.raises(ValueError):
             # Series cannot have date holes without automatic filling
@@ -1788,6 +2156,62 @@ class TestTimeSeries:
         )
         assert resampled_timeseries.to_series().at[pd.Timestamp("20200101233000")] == 0
 
+    @pytest.mark.parametrize(
+        "config",
+        itertools.product(
+            ["sum", "mean", "first", "last", "min", "max", "interpolate"],
+            [
+                ("1h", {}),
+                ("20min", {}),
+                ("3min", {}),
+                ("1h", {"closed": "right", "label": "right"}),
+                ("1h", {"offset": pd.Timedelta("5min")}),
+            ],
+            [np.float64, np.float32],
+        ),
+    )
+    def test_resample_numpy(self, config):
+        """The NumPy resampling gives the same results as xarray (with missing values and empty bins)."""
+        method, (freq, kwargs), dtype = config
+        np.random.seed(42)
+        values = np.random.normal(size=(100, 2, 3)).astype(dtype)
+        values[np.random.random(values.shape) < 0.2] = np.nan
+        series = TimeSeries.from_times_and_values(
+            times=pd.date_range("20200101000700", periods=100, freq="7min"),
+            values=values,
+            static_covariates=pd.DataFrame({"a": [0.0, 1.0]}),
+        )
+        resampled = series.resample(freq, method=method, **kwargs)
+        expected = _resample_xarray(series, freq, method, {}, **kwargs)
+
+        assert resampled.dtype == dtype
+        assert resampled.time_index.equals(expected.time_index)
+        assert resampled.time_index.name == expected.time_index.name
+        assert resampled.freq == expected.freq
+        assert resampled.components.equals(expected.components)
+        assert resampled.static_covariates.equals(expected.static_covariates)
+        np.testing.assert_allclose(
+            resampled.all_values(), expected.all_values(), rtol=1e-5, atol=1e-5
+        )
+
+    def test_resample_batch(self):
+        """Series sharing a time index are resampled at once, others separately."""
+        times = pd.date_range("20200101", periods=50, freq="15min")
+        series = [
+            linear_timeseries(start=times[0], length=50, freq="15min"),
+            TimeSeries.from_times_and_values(times, np.arange(100).reshape(50, 2)),
+            linear_timeseries(start=times[3], length=20, freq="15min"),
+        ]
+        for method, method_kwargs in [
+            ("mean", None),
+            ("pad", None),
+            ("reduce", {"func": np.mean}),
+        ]:
+            resampled = _resample(series, "1h", method, method_kwargs)
+            assert len(resampled) == len(series)
+            for ts, ts_resampled in zip(series, resampled):
+                assert ts_resampled == ts.resample("1h", method, method_kwargs)
+
     def test_short_series_creation(self):
         # test missing freq argument error when filling missing dates on short time series
         with pytest.raises(ValueError):
@@ -2109,6 +2533,85 @@ class TestTimeSeries:
         assert len(series1.longest_contiguous_slice()) == 3
         assert len(series1.longest_contiguous_slice(2)) == 6
 
+        # with a range index, the slice ends at the last time step before the gap
+        series2 = TimeSeries.from_values(np.array([1.0, 2.0, 3.0, np.nan, 5.0]))
+        np.testing.assert_array_equal(
+            series2.longest_contiguous_slice().values().ravel(), [1.0, 2.0, 3.0]
+        )
+        series3 = TimeSeries.from_times_and_values(
+            pd.RangeIndex(10, 20, 2), series2.values()
+        )
+        assert series3.longest_contiguous_slice().time_index.equals(
+            pd.RangeIndex(10, 16, 2)
+        )
+
+        # missing values in only some components leave no gap with `mode="all"`
+        series4 = TimeSeries.from_values(
+            np.array([[np.nan, 1.0], [2.0, 3.0], [4.0, np.nan], [5.0, 6.0], [7.0, 8.0]])
+        )
+        assert series4.longest_contiguous_slice() == series4
+        assert series4.longest_contiguous_slice(mode="any") == series4[3:]
+
+    @pytest.mark.parametrize("as_collection", [False, True])
+    def test_batch_gaps_strip_longest_contiguous_slice(self, as_collection):
+        np.random.seed(0)
+        series = []
+        for length in [1, 5, 20, 30, 30]:
+            vals = np.random.normal(size=(length, 2))
+            vals[np.random.random(vals.shape) < 0.4] = np.nan
+            series.append(
+                TimeSeries.from_times_and_values(
+                    pd.date_range("2020-01-01", periods=length, freq="h"), vals
+                )
+            )
+        series.append(
+            TimeSeries.from_times_and_values(
+                pd.date_range("2020-01-01", periods=4, freq="h"),
+                np.full((4, 2), np.nan),
+            )
+        )
+        batch = TimeSeriesCollection.from_series(series) if as_collection else series
+
+        for mode in ["all", "any"]:
+            # one row per gap of each series, ordered by series
+            gaps_df = gaps(batch, mode=mode)
+            assert list(gaps_df.columns) == [
+                "series_idx",
+                "gap_start",
+                "gap_end",
+                "gap_size",
+            ]
+            assert gaps_df["series_idx"].is_monotonic_increasing
+            for idx, ts in enumerate(series):
+                expected = ts.gaps(mode=mode)
+                gaps_ts = gaps_df[gaps_df["series_idx"] == idx]
+                assert len(gaps_ts) == len(expected)
+                if len(expected):
+                    for col in expected.columns:
+                        assert list(gaps_ts[col]) == list(expected[col])
+
+            for ts_stripped, ts in zip(strip(batch, how=mode), series):
+                assert ts_stripped == ts.strip(how=mode)
+            for max_gap_size in [0, 1, 3]:
+                for ts_slice, ts in zip(
+                    longest_contiguous_slice(
+                        batch, max_gap_size=max_gap_size, mode=mode
+                    ),
+                    series,
+                ):
+                    assert ts_slice == ts.longest_contiguous_slice(
+                        max_gap_size=max_gap_size, mode=mode
+                    )
+
+        assert gaps([]).empty
+        assert strip([]) == [] and longest_contiguous_slice([]) == []
+        with pytest.raises(ValueError, match="mode accepts only"):
+            gaps(batch, mode="some")
+        with pytest.raises(ValueError, match="`how` parameter value not recognized"):
+            strip(batch, how="some")
+        with pytest.raises(ValueError, match="cannot be applied to stochastic"):
+            strip([series[1].concatenate(series[1], axis=2)])
+
     def test_with_columns_renamed(self):
         series1 = linear_timeseries(
             start_value=1,
@@ -2224,18 +2727,13 @@ class TestTimeSeries:
         assert np.array_equal(vals, np.arange(n).reshape(shape))
         assert ts == ts_copy
 
-        # mutating values of a copies series leaves original series unchanged
-        ts2 = ts.copy()
-        vals_ = ts2.all_values(copy=False)
-        vals_[:] = 0.0
-        assert (vals_ == 0.0).all()
-        # copied series has mutated values
-        assert (ts2.all_values() == 0.0).all()
-        # original values are still the same
-        assert np.array_equal(vals, np.arange(n).reshape(shape))
-        assert np.array_equal(ts.all_values(), np.arange(n).reshape(shape))
+        # the values of a series are read-only; views share memory with the series
+        vals_ = ts.all_values(copy=False)
+        assert not vals_.flags.writeable
+        with pytest.raises(ValueError, match="read-only"):
+            vals_[:] = 0.0
+        assert not ts.values(copy=False).flags.writeable
         assert ts == ts_copy
-        assert ts2 != ts_copy
 
         # view of original data (any mutations afterwards affect the original data)
         ts = TimeSeries(times=idx, values=vals, copy=False)
@@ -2249,6 +2747,129 @@ class TestTimeSeries:
         assert np.array_equal(vals, np.arange(n).reshape(shape))
         assert ts == ts_copy
 
+        # the original array remains writable, and mutating it affects the series
+        assert vals.flags.writeable
+        vals[0] = -1.0
+        assert (ts.all_values(copy=False)[0] == -1.0).all()
+
+    def test_interned_time_index(self):
+        def make_series(**kwargs):
+            idx = pd.date_range("2000-01-01", periods=10, freq="D", **kwargs)
+            return TimeSeries.from_times_and_values(idx, np.arange(10.0))
+
+        # series with equal time indexes share the same index object
+        ts1, ts2 = make_series(), make_series()
+        assert ts1._time_index is ts2._time_index
+        assert ts1[2:5]._time_index is ts2[2:5]._time_index
+        assert ts1.shift(1)._time_index is ts2.shift(1)._time_index
+        assert ts1.has_same_time_as(ts2)
+        assert pickle.loads(pickle.dumps(ts1))._time_index is ts1._time_index
+
+        ts_int1 = TimeSeries.from_values(np.arange(10.0))
+        ts_int2 = TimeSeries.from_values(np.arange(10.0) + 1)
+        assert ts_int1._time_index is ts_int2._time_index
+
+        # any difference in the index gives a different object
+        ts_name = make_series(name="time")
+        ts_unit = make_series(unit="s")
+        ts_freq = TimeSeries.from_times_and_values(
+            pd.date_range("2000-01-01", periods=10, freq="24h"), np.arange(10.0)
+        )
+        for ts_other in [ts_name, ts_unit, ts_freq, ts1[1:], ts_int1]:
+            assert ts_other._time_index is not ts1._time_index
+        assert ts_freq.freq_str == "24h"
+        assert ts_name.time_index.name == "time"
+
+        # the series never interns an index that could be mutated from the outside
+        idx = pd.date_range("2001-01-01", periods=10, freq="D")
+        ts = TimeSeries(times=idx, values=np.arange(10.0), copy=False)
+        assert ts._time_index is not idx
+        idx.name = "other"
+        assert ts._time_index.name is None
+
+    def test_fingerprint(self):
+        ts = linear_timeseries(length=20, start=pd.Timestamp("2000-01-01"))
+        fingerprint = ts.fingerprint
+        assert isinstance(fingerprint, str) and len(fingerprint) == 32
+
+        # series with the same content have the same fingerprint, and the fingerprint is cached
+        ts_same = TimeSeries.from_times_and_values(
+            ts.time_index, ts.values(), columns=ts.components
+        )
+        for ts_other in [
+            ts_same,
+            ts.copy(),
+            pickle.loads(pickle.dumps(ts)),
+            ts.with_metadata({"a": 0}),
+        ]:
+            assert ts_other.fingerprint == fingerprint
+        assert ts_same._fingerprint == fingerprint
+
+        # any difference in the content gives a different fingerprint
+        ts_range = linear_timeseries(length=20, start=0)
+        different = [
+            ts + 1e-10,
+            ts.astype(np.float32),
+            ts.shift(1),
+            ts[1:],
+            ts.with_columns_renamed("linear", "other"),
+            ts.with_static_covariates(pd.Series([0.0], index=["st"])),
+            ts.with_static_covariates(pd.Series([1.0], index=["st"])),
+            TimeSeries.from_times_and_values(
+                pd.date_range("2000-01-01", periods=20, freq="24h"),
+                ts.values(),
+                columns=ts.components,
+            ),
+            ts.concatenate(ts, axis=2),
+            ts_range,
+            ts_range.shift(1),
+        ]
+        fingerprints = {fingerprint} | {ts_other.fingerprint for ts_other in different}
+        assert len(fingerprints) == len(different) + 1
+
+        ts_hierarchy = ts.stack(ts.with_columns_renamed("linear", "x"))
+        assert (
+            ts_hierarchy.with_hierarchy({"x": ["linear"]}).fingerprint
+            != ts_hierarchy.fingerprint
+        )
+
+        # the fingerprint is not cached for values shared with a writeable array
+        vals = np.arange(10.0)
+        ts_shared = TimeSeries.from_values(vals, copy=False)
+        fingerprint = ts_shared.fingerprint
+        vals[0] = 99.0
+        assert ts_shared.fingerprint != fingerprint
+        assert ts_shared.fingerprint == ts_shared.copy().fingerprint
+        assert ts_shared[2:].fingerprint == ts_shared.copy()[2:].fingerprint
+        assert ts_shared._fingerprint is None
+
+    def test_shared_values(self):
+        ts = linear_timeseries(length=20).stack(sine_timeseries(length=20))
+        vals = ts.all_values(copy=False)
+
+        # transformations that do not compute new values share the read-only values
+        shared = [
+            ts[2:10],
+            ts.slice(ts.time_index[2], ts.time_index[10]).shift(3),
+            ts.astype(ts.dtype),
+            ts.with_metadata({"a": 0}).with_columns_renamed("linear", "x"),
+            ts.with_static_covariates(pd.Series([0.0], index=["st"])),
+            ts["sine"],
+            ts.strip(),
+        ]
+        for ts_new in shared:
+            vals_new = ts_new.all_values(copy=False)
+            assert np.shares_memory(vals_new, vals)
+            assert not vals_new.flags.writeable
+
+        # transformations computing new values allocate once, and never modify the original values
+        vals_before = ts.all_values()
+        for ts_new in [ts + 1, -ts, abs(ts), round(ts, 1), ts.astype(np.float32)]:
+            vals_new = ts_new.all_values(copy=False)
+            assert not np.shares_memory(vals_new, vals)
+            assert not vals_new.flags.writeable
+        np.testing.assert_array_equal(ts.all_values(), vals_before)
+
     def test_mutability_times(self):
         freq = pd.tseries.frequencies.to_offset("D")
         idx = pd.date_range("2000-01-01", periods=5, freq=freq)
@@ -2947,6 +3568,60 @@ class TestTimeSeriesConcatenate:
         assert series_1.concatenate(series_2).dtype == dt_source
         assert concatenate([series_1, series_2]).dtype == dt_source
 
+    @pytest.mark.parametrize("numeric", [True, False])
+    def test_stack_many(self, numeric):
+        n_series = 50
+        series = [
+            linear_timeseries(
+                start_value=idx, length=10, start=0, column_name=f"c{idx}"
+            ).with_static_covariates(
+                pd.DataFrame({
+                    "idx": [idx],
+                    "cat": [1.0 if numeric else "x"],
+                    "int": [idx * 2],
+                })
+            )
+            for idx in range(n_series)
+        ]
+        series[1] = series[1].astype("float32")
+
+        stacked = series[0].stack(series[1:])
+        stacked_pairwise = series[0]
+        for ts in series[1:]:
+            stacked_pairwise = stacked_pairwise.stack(ts)
+
+        assert stacked == stacked_pairwise
+        assert stacked.dtype == np.float64
+        assert stacked.n_components == n_series
+        np.testing.assert_array_equal(
+            stacked.values(),
+            np.stack([ts.values()[:, 0] for ts in series], axis=1),
+        )
+        covs = stacked.static_covariates
+        pd.testing.assert_frame_equal(covs, stacked_pairwise.static_covariates)
+        assert covs.index.equals(stacked.components)
+        np.testing.assert_array_equal(covs["idx"].values, np.arange(n_series))
+        assert covs["idx"].dtype == np.float64
+        assert covs["cat"].dtype == (np.float64 if numeric else object)
+
+    def test_concatenate_time_many(self):
+        series = [
+            linear_timeseries(start_value=idx, length=5, start=5 * idx, freq=1)
+            for idx in range(10)
+        ]
+        ts = concatenate(series, axis=0)
+        assert ts.time_index.equals(pd.RangeIndex(50))
+        np.testing.assert_array_equal(
+            ts.values(), np.concatenate([s.values() for s in series])
+        )
+
+        # a gap before the last series
+        series[-1] = series[-1].shift(1)
+        with pytest.raises(ValueError, match="need to be contiguous"):
+            _ = concatenate(series, axis=0)
+        ts = concatenate(series, axis=0, ignore_time_axis=True)
+        assert ts.time_index.equals(pd.RangeIndex(50))
+
 
 class TestTimeSeriesHierarchy:
     components = ["total", "a", "b", "x", "y", "ax", "ay", "bx", "by"]
@@ -3560,6 +4235,40 @@ class TestSimpleStatistics:
         assert new_ts == q_ts
         assert new_ts.dtype == dtype
 
+    @pytest.mark.parametrize("dtype", ["float64", "float32"])
+    def test_quantile_series(self, dtype):
+        levels = [0.1, 0.25, 0.5, 0.75, 0.9]
+        ts = self.ts.astype(dtype)
+        q_series = ts.quantile(q=levels)
+        assert q_series.is_quantile
+        np.testing.assert_array_equal(q_series.quantile_levels, levels)
+        assert q_series.is_deterministic
+
+        # sample-based and non-quantile series
+        assert not ts.is_quantile and ts.quantile_levels is None
+        assert not ts.quantile(q=0.5).is_quantile
+        assert not q_series[q_series.components[:7].tolist()].is_quantile
+        assert not q_series.with_columns_renamed("a_q0.100", "x").is_quantile
+
+        # quantiles at the levels are exact, other quantiles are interpolated linearly
+        new_ts = q_series.quantile(q=[0.25, 0.5])
+        assert new_ts.quantile_levels.tolist() == [0.25, 0.5]
+        assert new_ts == ts.quantile(q=[0.25, 0.5])
+        assert new_ts.dtype == dtype
+
+        new_ts = q_series.quantile(q=0.3)
+        assert new_ts.components.tolist() == ["a_q0.300", "b_q0.300"]
+        q_025, q_05 = ts.quantile(q=0.25).values(), ts.quantile(q=0.5).values()
+        np.testing.assert_allclose(new_ts.values(), 0.8 * q_025 + 0.2 * q_05, rtol=1e-5)
+
+        # the median has the original component names
+        median = q_series.median()
+        assert median.components.equals(ts.components)
+        np.testing.assert_array_equal(median.values(), ts.quantile(q=0.5).values())
+
+        with pytest.raises(ValueError, match="within the range of the quantile levels"):
+            q_series.quantile(q=0.05)
+
 
 class TestTimeSeriesInputValidation:
     ts = constant_timeseries(value=1, length=10)
@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from darts import TimeSeries, TimeSeriesCollection
+from darts.dataprocessing.transformers import Scaler
+from darts.metrics import mae
+from darts.models import LinearRegressionModel
+from darts.utils.timeseries_generation import linear_timeseries
+from darts.utils.ts_utils import SeriesType, get_series_seq_type
+
+
+class TestTimeSeriesCollection:
+    n_series = 5
+
+    @staticmethod
+    def make_series(n_series: int, is_dti: bool = True, static_covs: bool = True):
+        series = []
+        for i in range(n_series):
+            start = pd.Timestamp("2020-01-01") + pd.Timedelta(days=i) if is_dti else i
+            ts = linear_timeseries(
+                start=start, length=10 + i, start_value=i, end_value=i + 1
+            )
+            ts = ts.stack(ts + 1)
+            if static_covs:
+                ts = ts.with_static_covariates(pd.Series([i, 2 * i], index=["a", "b"]))
+            series.append(ts.with_metadata({"id": i}))
+        return series
+
+    @pytest.mark.parametrize("is_dti", [True, False])
+    def test_from_series_roundtrip(self, is_dti):
+        series = self.make_series(self.n_series, is_dti=is_dti)
+        collection = TimeSeriesCollection.from_series(series)
+
+        assert len(collection) == self.n_series
+        assert collection.n_components == 2
+        assert collection.n_samples == 1
+        assert collection.has_datetime_index == is_dti
+        np.testing.assert_array_equal(collection.lengths, [len(s) for s in series])
+        assert collection.nbytes == sum(s.all_values(copy=False).nbytes for s in series)
+        assert len(collection.static_covariates) == self.n_series
+
+        for ts, ts_coll in zip(series, collection):
+            assert ts == ts_coll
+        assert collection[-1] == series[-1]
+        assert collection.to_list() == series
+
+    def test_views_share_buffer(self):
+        collection = TimeSeriesCollection.from_series(self.make_series(self.n_series))
+        buffer = collection.all_values(copy=False)
+        for idx in range(self.n_series):
+            assert np.shares_memory(collection[idx].all_values(copy=False), buffer)
+
+        # contiguous slices return a collection sharing the buffer
+        sub = collection[1:3]
+        assert isinstance(sub, TimeSeriesCollection)
+        assert len(sub) == 2
+        assert np.shares_memory(sub.all_values(copy=False), buffer)
+        assert sub[0] == collection[1]
+        assert sub[1].metadata == {"id": 2}
+
+        # stepped slices return a list of views
+        stepped = collection[::2]
+        assert isinstance(stepped, list)
+        assert [ts.metadata["id"] for ts in stepped] == [0, 2, 4]
+
+    def test_component_specific_static_covariates(self):
+        series = [
+            ts.with_static_covariates(
+                pd.DataFrame({"a": [i, i + 1]}, index=ts.components)
+            )
+            for i, ts in enumerate(self.make_series(3, static_covs=False))
+        ]
+        collection = TimeSeriesCollection.from_series(series)
+        assert len(collection.static_covariates) == 6
+        for ts, ts_coll in zip(series, collection):
+            assert ts_coll.static_covariates.equals(ts.static_covariates)
+
+    def test_invalid_inputs(self):
+        series = self.make_series(2)
+        with pytest.raises(ValueError, match="identical components"):
+            TimeSeriesCollection.from_series([series[0], series[1]["linear"]])
+        with pytest.raises(ValueError, match="time index and frequency"):
+            TimeSeriesCollection.from_series([
+                series[0],
+                self.make_series(1, is_dti=False)[0],
+            ])
+        with pytest.raises(ValueError, match="none or all series"):
+            TimeSeriesCollection.from_series([
+                series[0],
+                series[1].with_static_covariates(None),
+            ])
+        with pytest.raises(ValueError, match="`offsets`"):
+            TimeSeriesCollection(
+                values=np.zeros((5, 1)),
+                offsets=[0, 3],
+                start_times=[0],
+                freq=1,
+            )
+        collection = TimeSeriesCollection.from_series(series)
+        with pytest.raises(IndexError):
+            _ = collection[2]
+
+    def test_memmap(self, tmpdir_fn):
+        series = self.make_series(self.n_series)
+        collection = TimeSeriesCollection.from_series(series)
+        collection.save_memmap("collection")
+
+        collection_mm = TimeSeriesCollection.load_memmap("collection")
+        assert collection_mm.to_list() == series
+        assert collection_mm.static_covariates.equals(collection.static_covariates)
+        buffer = collection_mm.all_values(copy=False)
+        assert not buffer.flags.writeable
+        for ts in collection_mm:
+            assert np.shares_memory(ts.all_values(copy=False), buffer)
+            assert np.shares_memory(ts[2:5].all_values(copy=False), buffer)
+
+        model = LinearRegressionModel(lags=3)
+        preds_mm = model.fit(collection_mm).predict(n=2, series=collection_mm)
+        assert preds_mm == model.fit(series).predict(n=2, series=series)
+
+    def test_accepted_as_sequence(self):
+        series = self.make_series(self.n_series)
+        collection = TimeSeriesCollection.from_series(series)
+        assert get_series_seq_type(collection) == SeriesType.SEQ
+
+        model = LinearRegressionModel(lags=3, use_static_covariates=False)
+        model.fit(collection)
+        preds_coll = model.predict(n=2, series=collection)
+        preds_list = model.predict(n=2, series=series)
+        assert preds_coll == preds_list
+
+        hfcs = model.historical_forecasts(
+            collection, start=-3, forecast_horizon=1, retrain=False
+        )
+        assert mae(collection, hfcs) == mae(series, hfcs)
+
+        scaled = Scaler().fit_transform(collection)
+        assert len(scaled) == self.n_series
+        assert isinstance(scaled[0], TimeSeries)
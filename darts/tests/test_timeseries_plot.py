@@ -210,3 +210,25 @@ class TestTimeSeriesPlot:
         # cannot plot a range index on datetime index
         with pytest.raises(TypeError):
             series2.plot()
+
+    @pytest.mark.parametrize("config", ["dt", "ri"])
+    def test_plot_quantile_series(self, mpl_safe_plotting, config):
+        series = getattr(self, f"series_{config}_p").quantile([0.1, 0.5, 0.9])
+        assert series.is_quantile
+        ax = series.plot(low_quantile=0.1, high_quantile=0.9)
+
+        # one line and one area per original component
+        lines = [line for line in ax.lines if len(line.get_xdata()) > 1]
+        assert len(lines) == self.n_comps
+        assert [line.get_label() for line in lines] == ["0", "1"]
+        areas = [
+            coll
+            for coll in ax.collections
+            if isinstance(coll, mcollections.PolyCollection)
+        ]
+        assert len(areas) == self.n_comps
+
+        # the interval is restricted to the quantile levels of the series
+        series.plot()
+        with pytest.raises(ValueError, match="not supported for quantile series"):
+            series.plot(central_quantile="mean")
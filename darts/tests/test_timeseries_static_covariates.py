@@ -10,11 +10,17 @@ import pytest
 
 from darts import TimeSeries, concatenate, to_group_dataframe
 from darts.dataprocessing.transformers import BoxCox, Scaler
-from darts.tests.conftest import PANDAS_30_OR_GREATER, POLARS_AVAILABLE
+from darts.tests.conftest import (
+    PANDAS_30_OR_GREATER,
+    POLARS_AVAILABLE,
+    PYARROW_AVAILABLE,
+)
 from darts.timeseries import (
     DEFAULT_GLOBAL_STATIC_COV_NAME,
     METADATA_TAG,
     STATIC_COV_TAG,
+    to_arrow,
+    to_parquet,
 )
 from darts.utils.timeseries_generation import linear_timeseries
 from darts.utils.utils import generate_index
@@ -721,6 +727,50 @@ class TestTimeSeriesStaticCovariate:
                 == "`time_col` is required when `df` is not a `pandas.DataFrame`."
             )
 
+    @pytest.mark.parametrize(
+        "config",
+        itertools.product(
+            ["int", "dt"], TEST_BACKENDS, [False, True], [["a"], ["a", "b"]]
+        ),
+    )
+    def test_from_group_dataframe_vectorized(self, config, monkeypatch):
+        """Tests that the vectorized extraction of groups gives the same results as the group-wise extraction."""
+        index_type, backend, with_holes, value_cols = config
+        df = copy.deepcopy(self.df_long_multi)
+        if index_type == "int":
+            df["times"] = np.tile(np.arange(self.len_ts) * 2, self.n_groups)
+        df["name"] = df["st1"].map(lambda x: f"group_{x}")
+        # shuffle rows to have unsorted groups and time index
+        df = df.sample(frac=1.0, random_state=42).reset_index(drop=True)
+        freq = None
+        if with_holes:
+            # groups with missing dates go through the full constructor
+            df = df.drop(index=df.index[df["st1"] == 0][:2])
+            freq = 2 if index_type == "int" else "D"
+
+        kwargs = dict(
+            df=self.pd_to_backend(df, backend),
+            group_cols=["st1", "st2"],
+            time_col="times",
+            value_cols=value_cols,
+            static_cols="name",
+            metadata_cols=["constant", "name"],
+            drop_group_cols="st2",
+            freq=freq,
+        )
+        ts_vectorized = TimeSeries.from_group_dataframe(**kwargs)
+        assert len(ts_vectorized) == 2 * self.n_groups
+
+        monkeypatch.setattr(
+            TimeSeries,
+            "_from_group_dataframe_vectorized",
+            classmethod(lambda cls, **kwargs: None),
+        )
+        ts_groupwise = TimeSeries.from_group_dataframe(**kwargs)
+        assert ts_vectorized == ts_groupwise
+        freq_expected = "2" if index_type == "int" else "D"
+        assert all(ts.freq_str == freq_expected for ts in ts_vectorized)
+
     @pytest.mark.parametrize("backend", TEST_BACKENDS)
     def test_from_group_dataframe_warn_on_sorted_index(self, backend, caplog):
         df = copy.deepcopy(self.pd_to_backend(self.df_long_multi, backend))
@@ -1429,3 +1479,106 @@ class TestTimeSeriesJSONSerialization:
         assert ts_restored.static_covariates is None
         assert ts_restored.metadata is None
         assert ts_restored.hierarchy is None
+
+
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason="requires pyarrow")
+class TestTimeSeriesArrowSerialization:
+    """Test Arrow and Parquet serialization with static_covariates, metadata, and hierarchy."""
+
+    @staticmethod
+    def make_series(n_series: int, is_dti: bool = True, n_samples: int = 1):
+        components = ["total", "a", "b"]
+        series = []
+        for i in range(n_series):
+            start = pd.Timestamp("2020-01-01") + pd.Timedelta(days=i) if is_dti else i
+            ts = TimeSeries.from_times_and_values(
+                times=generate_index(
+                    start=start, length=10 + i, freq="D" if is_dti else 2
+                ),
+                values=np.random.rand(10 + i, len(components), n_samples),
+                columns=components,
+                hierarchy={"a": ["total"], "b": ["total"]},
+                static_covariates=pd.DataFrame(
+                    {
+                        "sc1": [i, i + 1.0, i + 2.0],
+                        "sc2": pd.Categorical(["x", "y", "x"]),
+                    },
+                    index=components,
+                ),
+                metadata={"id": i},
+            )
+            series.append(ts)
+        return series
+
+    @pytest.mark.parametrize("config", itertools.product([True, False], [1, 3]))
+    def test_arrow_roundtrip(self, config):
+        is_dti, n_samples = config
+        series = self.make_series(3, is_dti=is_dti, n_samples=n_samples)
+        batch = to_arrow(series)
+        assert batch.num_rows == sum(len(ts) for ts in series)
+        assert batch.schema.names == ["series_id", "time", "total", "a", "b"]
+
+        series_restored = TimeSeries.from_arrow(batch)
+        assert series_restored == series
+        for ts, ts_restored in zip(series, series_restored):
+            assert ts_restored.freq == ts.freq
+            assert ts_restored.static_covariates.equals(ts.static_covariates)
+            assert ts_restored.hierarchy == ts.hierarchy
+            assert ts_restored.metadata == ts.metadata
+
+        # single series and global static covariates
+        ts = linear_timeseries(length=10).with_static_covariates(
+            pd.Series([0.0, 1.0], index=["st1", "st2"])
+        )
+        ts_restored = TimeSeries.from_arrow(ts.to_arrow())
+        assert ts_restored == [ts]
+        assert ts_restored[0].static_covariates.equals(ts.static_covariates)
+
+    def test_parquet_pushdown(self, tmpdir_fn):
+        series = self.make_series(4)
+        path = os.path.join(tmpdir_fn, "series.parquet")
+        to_parquet(series, path, row_group_size=10)
+
+        assert TimeSeries.from_parquet(path) == series
+
+        # subset of series and time range
+        start, end = pd.Timestamp("2020-01-05"), pd.Timestamp("2020-01-09")
+        series_restored = TimeSeries.from_parquet(
+            path, series_ids=[1, 3], start=start, end=end
+        )
+        assert series_restored == [series[1][start:end], series[3][start:end]]
+        assert [ts.metadata["id"] for ts in series_restored] == [1, 3]
+
+        # subset of components drops the hierarchy and keeps the component static covariates
+        series_restored = TimeSeries.from_parquet(path, series_ids=2, components="a")
+        assert series_restored == [series[2]["a"]]
+        assert series_restored[0].hierarchy is None
+        assert series_restored[0].static_covariates.equals(
+            series[2]["a"].static_covariates
+        )
+
+        # rows removed after writing go through the full constructor
+        series_restored = TimeSeries.from_parquet(
+            path, filters=[("time", "!=", pd.Timestamp("2020-01-12"))]
+        )
+        assert series_restored[0] == series[0]
+        assert series_restored[1] == series[1][:-1]
+        assert series_restored[2].freq_str == "D"
+        assert len(series_restored[2]) == len(series[2])
+        assert np.isnan(series_restored[2][pd.Timestamp("2020-01-12")].values()).all()
+
+        with pytest.raises(ValueError, match="not present in the Parquet file"):
+            TimeSeries.from_parquet(path, components="c")
+
+    def test_arrow_invalid_inputs(self):
+        series = self.make_series(2)
+        with pytest.raises(ValueError, match="identical components"):
+            to_arrow([series[0], series[1]["a"]])
+        with pytest.raises(ValueError, match="identical components"):
+            to_arrow([series[0], self.make_series(1, is_dti=False)[0]])
+        with pytest.raises(ValueError, match="JSON serializable"):
+            to_arrow(series[0].with_metadata({"a": object()}))
+        with pytest.raises(ValueError, match="reserved for the series id"):
+            to_arrow(series[0].with_columns_renamed("a", "series_id"))
+        with pytest.raises(ValueError, match="long Darts format"):
+            TimeSeries.from_arrow(to_arrow(series).replace_schema_metadata({}))
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from darts import StreamingTimeSeries
+from darts.models import LinearRegressionModel
+from darts.utils.timeseries_generation import linear_timeseries, sine_timeseries
+
+
+class TestStreamingTimeSeries:
+    series = (
+        linear_timeseries(length=100) + sine_timeseries(length=100, value_frequency=0.1)
+    ).with_static_covariates(pd.Series([0.0, 1.0], index=["a", "b"]))
+
+    @pytest.mark.parametrize("max_length", [None, 1, 20])
+    def test_append_values(self, max_length):
+        stream = StreamingTimeSeries(self.series[:10], max_length=max_length)
+        views = []
+        for idx in range(10, 100):
+            stream.append_values(self.series.values()[idx : idx + 1])
+            start = 0 if max_length is None else max(0, idx + 1 - max_length)
+            expected = self.series[start : idx + 1]
+            assert len(stream) == len(expected)
+            assert stream.series == expected
+            assert stream.series.static_covariates.equals(self.series.static_covariates)
+            views.append((stream.series, expected))
+
+        # previous views are not affected by later appends
+        for view, expected in views:
+            assert view == expected
+
+        # appending several time steps at once
+        stream = StreamingTimeSeries(self.series[:10], max_length=max_length)
+        stream.append_values(self.series.values()[10:95])
+        stream.append_values(self.series.values()[95:])
+        start = 0 if max_length is None else 100 - max_length
+        assert stream.series == self.series[start:]
+
+    def test_append(self):
+        stream = StreamingTimeSeries(self.series[:10], max_length=30)
+        stream.append(self.series[10:50])
+        assert stream.series == self.series[20:50]
+        assert not stream.series.all_values(copy=False).flags.writeable
+
+        with pytest.raises(ValueError, match="one \\(time\\) step after the end"):
+            stream.append(self.series[60:70])
+        with pytest.raises(ValueError, match="same components"):
+            stream.append(self.series[50:60].with_columns_renamed("linear", "x"))
+        with pytest.raises(ValueError, match="same number of components"):
+            stream.append_values(np.zeros((2, 2)))
+        with pytest.raises(ValueError, match="`max_length` must be"):
+            StreamingTimeSeries(self.series, max_length=0)
+
+    def test_predict(self):
+        model = LinearRegressionModel(lags=5).fit(self.series[:60])
+        stream = StreamingTimeSeries(self.series[:60], max_length=30)
+        for idx in range(60, 70):
+            stream.append(self.series[idx : idx + 1])
+            assert model.predict(n=3, series=stream.series) == model.predict(
+                n=3, series=self.series[: idx + 1]
+            )
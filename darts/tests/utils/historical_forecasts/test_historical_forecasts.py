@@ -11,7 +11,7 @@ import pytest
 from sklearn.preprocessing import MaxAbsScaler
 
 import darts
-from darts import TimeSeries, concatenate, slice_intersect
+from darts import TimeSeries, concatenate, metrics, slice_intersect
 from darts.dataprocessing.pipeline import Pipeline
 from darts.dataprocessing.transformers import (
     FittableDataTransformer,
@@ -3035,6 +3035,65 @@ class TestHistoricalforecast:
             if mean_opt_q is not None:
                 assert np.abs(mean_opt - mean_opt_q.values()).max() < 0.1
 
+    @pytest.mark.parametrize(
+        "config",
+        product(
+            [False, True],  # last_points_only
+            [True, False],  # enable_optimization
+        ),
+    )
+    def test_predict_quantiles(self, config):
+        """Tests that historical forecasts with `predict_quantiles` return the quantiles of the probabilistic
+        historical forecasts."""
+        lpo, enable_optimization = config
+        q = [0.1, 0.5, 0.9]
+        y = tg.linear_timeseries(length=20)
+        y = [y.stack(y + 1.0), y.stack(y + 2.0)]
+        model = LinearRegressionModel(
+            lags=3, output_chunk_length=2, likelihood="quantile"
+        ).fit(y)
+
+        kwargs = dict(
+            series=y,
+            forecast_horizon=2,
+            last_points_only=lpo,
+            retrain=False,
+            enable_optimization=enable_optimization,
+            num_samples=100,
+            random_state=42,
+        )
+        hfcs = model.historical_forecasts(**kwargs)
+        hfcs_q = model.historical_forecasts(**kwargs, predict_quantiles=q)
+        if not lpo:
+            hfcs, hfcs_q = hfcs[0], hfcs_q[0]
+        for hfc, hfc_q in zip(hfcs, hfcs_q):
+            assert hfc_q.is_quantile
+            assert hfc_q.quantile_levels.tolist() == q
+            assert hfc_q == hfc.quantile(q)
+
+        # prediction returns the quantiles of the samples as well
+        pred_q = model.predict(
+            n=2, series=y, num_samples=100, predict_quantiles=q, random_state=42
+        )
+        pred = model.predict(n=2, series=y, num_samples=100, random_state=42)
+        assert pred_q == [p.quantile(q) for p in pred]
+
+        # backtest computes the quantile metrics on the quantile forecasts
+        bt = model.backtest(
+            **kwargs, predict_quantiles=q, metric=metrics.mql, metric_kwargs={"q": 0.9}
+        )
+        bt_samples = model.backtest(
+            **kwargs, metric=metrics.mql, metric_kwargs={"q": 0.9}
+        )
+        np.testing.assert_array_almost_equal(bt, bt_samples)
+
+        with pytest.raises(ValueError, match="only supported for `num_samples > 1`"):
+            model.historical_forecasts(
+                **{**kwargs, "num_samples": 1}, predict_quantiles=q
+            )
+        with pytest.raises(ValueError, match="sequence of increasing quantiles"):
+            model.historical_forecasts(**kwargs, predict_quantiles=[0.5, 0.1])
+
     def helper_manual_scaling_prediction(
         self,
         model,
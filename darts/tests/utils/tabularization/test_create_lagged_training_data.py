@@ -14,6 +14,7 @@ from darts.logging import raise_log
 from darts.utils.data.tabularization import (
     create_lagged_component_names,
     create_lagged_training_data,
+    create_lagged_training_data_chunks,
 )
 from darts.utils.timeseries_generation import linear_timeseries
 from darts.utils.utils import generate_index, n_steps_between
@@ -3034,3 +3035,164 @@ class TestCreateLaggedTrainingData:
             "The number of components in `sample_weight` must either be `1` or "
             "match the number of target series components `1`."
         )
+
+    @pytest.mark.parametrize(
+        "config",
+        itertools.product(
+            [1, 5, 10_000],  # max_samples_per_chunk
+            [1, 3],  # stride
+            [None, 7],  # max_samples_per_ts
+            [0, 2],  # output_chunk_shift
+            [True, False],  # multi_models
+            [True, False],  # use_moving_windows
+        ),
+    )
+    def test_lagged_training_data_chunks(self, config):
+        """Checks that the chunks of `create_lagged_training_data_chunks` concatenate to the lagged data of
+        `create_lagged_training_data`, with at most `max_samples_per_chunk` samples each."""
+        (
+            max_samples_per_chunk,
+            stride,
+            max_samples_per_ts,
+            output_chunk_shift,
+            multi_models,
+            use_moving_windows,
+        ) = config
+        target = [
+            helper_create_multivariate_linear_timeseries(
+                n_components=2, start_value=0, end_value=10, start=0, length=30
+            ),
+            helper_create_multivariate_linear_timeseries(
+                n_components=2, start_value=10, end_value=20, start=5, length=25
+            ),
+        ]
+        past = [
+            linear_timeseries(start_value=20, end_value=30, start=-3, length=40),
+            linear_timeseries(start_value=30, end_value=40, start=0, length=35),
+        ]
+        future = [
+            linear_timeseries(start_value=40, end_value=50, start=2, length=40),
+            linear_timeseries(start_value=50, end_value=60, start=5, length=40),
+        ]
+        kwargs = {
+            "target_series": target,
+            "past_covariates": past,
+            "future_covariates": future,
+            # component-specific lags are only supported with moving windows
+            "lags": (
+                {"lin_ts_0": [-3, -1], "default_lags": [-2]}
+                if use_moving_windows
+                else [-3, -1]
+            ),
+            "lags_past_covariates": [-4, -2],
+            "lags_future_covariates": [-1, 0, 2],
+            "output_chunk_length": 3,
+            "output_chunk_shift": output_chunk_shift,
+            "uses_static_covariates": False,
+            "max_samples_per_ts": max_samples_per_ts,
+            "multi_models": multi_models,
+            "use_moving_windows": use_moving_windows,
+            "stride": stride,
+            "sample_weight": "linear",
+        }
+        X, y, times, _, weights = create_lagged_training_data(
+            concatenate=True, **kwargs
+        )
+
+        chunks = list(
+            create_lagged_training_data_chunks(
+                max_samples_per_chunk=max_samples_per_chunk, **kwargs
+            )
+        )
+        assert all(len(chunk[0]) <= max_samples_per_chunk for chunk in chunks)
+        assert len(chunks) == int(np.ceil(len(X) / max_samples_per_chunk))
+        np.testing.assert_array_equal(
+            np.concatenate([chunk[0] for chunk in chunks], axis=0), X
+        )
+        np.testing.assert_array_equal(
+            np.concatenate([chunk[1] for chunk in chunks], axis=0), y
+        )
+        np.testing.assert_array_equal(
+            np.concatenate([chunk[4] for chunk in chunks], axis=0), weights
+        )
+        chunk_times = [t for chunk in chunks for t in chunk[2]]
+        assert pd.Index([]).append(chunk_times).equals(pd.Index([]).append(times))
+
+    def test_lagged_training_data_chunks_invalid_size(self):
+        """Checks that a non-positive `max_samples_per_chunk` raises an error."""
+        for max_samples_per_chunk in [0, -1]:
+            with pytest.raises(ValueError) as err:
+                next(
+                    create_lagged_training_data_chunks(
+                        target_series=linear_timeseries(length=10),
+                        output_chunk_length=1,
+                        output_chunk_shift=0,
+                        lags=[-1],
+                        uses_static_covariates=False,
+                        max_samples_per_chunk=max_samples_per_chunk,
+                    )
+                )
+            assert (
+                str(err.value) == "`max_samples_per_chunk` must be a positive integer."
+            )
+
+    @pytest.mark.parametrize(
+        "config",
+        itertools.product(
+            [True, False],  # concatenate
+            [True, False],  # use_moving_windows
+            [True, False],  # multi_models
+            [1, 3],  # stride
+            [None, "linear"],  # sample_weight
+        ),
+    )
+    def test_lagged_training_data_parallel(self, config):
+        """Checks that creating the lagged data of several series in parallel with `n_jobs` gives the same result as
+        creating it sequentially, also when written into preallocated arrays with `concatenate=True`."""
+        concatenate, use_moving_windows, multi_models, stride, sample_weight = config
+        target = [
+            helper_create_multivariate_linear_timeseries(
+                n_components=2, start_value=i, end_value=10 + i, start=i, length=30 + i
+            ).with_static_covariates(pd.Series({"id": i, "group": 2.0 * i}))
+            for i in range(4)
+        ]
+        past = [
+            linear_timeseries(start_value=20, end_value=30, start=-3, length=40),
+        ] * 4
+        # future covariates of another frequency use the 'time intersection' method
+        future = [
+            linear_timeseries(start_value=40, end_value=50, start=0, length=80, freq=2),
+            linear_timeseries(start_value=40, end_value=50, start=0, length=50),
+        ] * 2
+        kwargs = {
+            "target_series": target,
+            "past_covariates": past,
+            "future_covariates": future,
+            "lags": [-3, -1],
+            "lags_past_covariates": [-4, -2],
+            "lags_future_covariates": [-1, 0, 2],
+            "output_chunk_length": 3,
+            "output_chunk_shift": 1,
+            "uses_static_covariates": True,
+            "multi_models": multi_models,
+            "use_moving_windows": use_moving_windows,
+            "concatenate": concatenate,
+            "stride": stride,
+            "sample_weight": sample_weight,
+        }
+        expected = create_lagged_training_data(**kwargs)
+        result = create_lagged_training_data(n_jobs=2, **kwargs)
+
+        arrays = [0, 1, 4] if sample_weight is not None else [0, 1]
+        for idx in arrays:
+            if concatenate:
+                assert result[idx].dtype == expected[idx].dtype
+                np.testing.assert_array_equal(result[idx], expected[idx])
+            else:
+                assert len(result[idx]) == len(expected[idx])
+                for res, exp in zip(result[idx], expected[idx]):
+                    np.testing.assert_array_equal(res, exp)
+        assert all(res.equals(exp) for res, exp in zip(result[2], expected[2]))
+        assert result[3] == expected[3] == (1, 2)
+        if sample_weight is None:
+            assert result[4] is None
@@ -0,0 +1,187 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from darts.config import option_context, reset_option, set_option
+from darts.models import LinearRegressionModel
+from darts.utils.data.tabularization import (
+    clear_tabularization_cache,
+    tabularization_cache_info,
+)
+from darts.utils.data.tabularization.cache import CACHE_FILE
+from darts.utils.timeseries_generation import linear_timeseries, sine_timeseries
+
+
+@pytest.fixture(scope="function", autouse=True)
+def reset_cache():
+    """Disables the tabularization cache and clears it after each test."""
+    clear_tabularization_cache()
+    yield
+    reset_option("tabularization")
+    clear_tabularization_cache()
+
+
+class TestTabularizationCache:
+    series = [
+        sine_timeseries(
+            length=50, value_frequency=0.1, column_name="a"
+        ).with_static_covariates(pd.Series({"id": 0})),
+        sine_timeseries(
+            length=40, value_frequency=0.2, column_name="a"
+        ).with_static_covariates(pd.Series({"id": 1})),
+    ]
+    past_covariates = [
+        linear_timeseries(length=50, column_name="p"),
+        linear_timeseries(length=40, column_name="p"),
+    ]
+
+    def fit(self, **kwargs):
+        model_kwargs = {
+            "lags": 4,
+            "lags_past_covariates": 2,
+            "output_chunk_length": 2,
+        }
+        model_kwargs.update(kwargs)
+        model = LinearRegressionModel(**model_kwargs)
+        model.fit(self.series, past_covariates=self.past_covariates)
+        return model
+
+    def predict(self, model):
+        return model.predict(
+            n=2, series=self.series, past_covariates=self.past_covariates
+        )
+
+    def test_disabled_by_default(self):
+        self.fit()
+        self.fit()
+        info = tabularization_cache_info()
+        assert info == {
+            "hits": 0,
+            "misses": 0,
+            "disk_hits": 0,
+            "entries": 0,
+            "nbytes": 0,
+            "max_bytes": 0,
+        }
+
+    def test_memory_cache(self):
+        expected = self.predict(self.fit())
+
+        set_option("tabularization.cache_max_bytes", 2**20)
+        model = self.fit()
+        info = tabularization_cache_info()
+        assert (info["hits"], info["misses"], info["entries"]) == (0, 1, 1)
+        assert 0 < info["nbytes"] <= 2**20
+        assert self.predict(model) == expected
+
+        # same lags and series with other estimator parameters skip tabularization
+        model = self.fit(fit_intercept=True, positive=False)
+        info = tabularization_cache_info()
+        assert (info["hits"], info["misses"], info["entries"]) == (1, 1, 1)
+        assert self.predict(model) == expected
+        assert model._static_covariates_shape == (1, 1)
+
+        # the cached lagged data are read-only
+        features, labels, sample_weights = model._create_lagged_data(
+            series=self.series,
+            past_covariates=self.past_covariates,
+            future_covariates=None,
+            max_samples_per_ts=None,
+        )
+        assert not features.flags.writeable
+        assert not labels.flags.writeable
+        assert sample_weights is None
+        assert tabularization_cache_info()["hits"] == 2
+
+        # other settings affecting the lagged data, or other series, are misses
+        self.fit(lags=3)
+        self.fit(output_chunk_length=1)
+        self.fit(multi_models=False)
+        model = LinearRegressionModel(lags=4, lags_past_covariates=2)
+        model.fit(self.series, past_covariates=self.past_covariates, stride=2)
+        model.fit([ts + 1 for ts in self.series], past_covariates=self.past_covariates)
+        info = tabularization_cache_info()
+        assert (info["hits"], info["misses"], info["entries"]) == (2, 6, 6)
+
+    def test_eviction(self):
+        set_option("tabularization.cache_max_bytes", 2**20)
+        self.fit(lags=2)
+        nbytes_2 = tabularization_cache_info()["nbytes"]
+        self.fit(lags=3)
+        nbytes_3 = tabularization_cache_info()["nbytes"] - nbytes_2
+
+        # keep only the most recently used entry
+        set_option("tabularization.cache_max_bytes", nbytes_3)
+        info = tabularization_cache_info()
+        assert (info["entries"], info["nbytes"]) == (1, nbytes_3)
+        self.fit(lags=3)
+        assert tabularization_cache_info()["hits"] == 1
+        self.fit(lags=2)
+        info = tabularization_cache_info()
+        assert (info["hits"], info["misses"], info["entries"]) == (1, 3, 1)
+
+        # entries larger than the cache are not kept
+        set_option("tabularization.cache_max_bytes", 1)
+        self.fit(lags=2)
+        info = tabularization_cache_info()
+        assert (info["misses"], info["entries"], info["nbytes"]) == (4, 0, 0)
+
+    def test_disk_cache(self, tmpdir_module):
+        cache_dir = os.path.join(tmpdir_module, "tabularization_cache")
+        expected = self.predict(self.fit())
+
+        with option_context("tabularization.cache_dir", cache_dir):
+            # without memory, entries are written to disk directly
+            self.fit()
+            files = os.listdir(cache_dir)
+            assert len(files) == 1
+            assert files[0].startswith(CACHE_FILE.split("{}")[0])
+
+            # entries written to disk are hits, also after clearing the memory
+            clear_tabularization_cache()
+            model = self.fit(fit_intercept=False)
+            info = tabularization_cache_info()
+            assert (info["hits"], info["disk_hits"], info["misses"]) == (1, 1, 0)
+            assert self.predict(model) != expected
+            model = self.fit()
+            assert self.predict(model) == expected
+
+            # evicted entries are spilled to disk
+            set_option("tabularization.cache_max_bytes", 2**20)
+            self.fit(lags=3)
+            assert len(os.listdir(cache_dir)) == 1
+            set_option("tabularization.cache_max_bytes", 0)
+            assert len(os.listdir(cache_dir)) == 2
+
+            clear_tabularization_cache(disk=True)
+            assert os.listdir(cache_dir) == []
+
+    def test_sample_weight(self):
+        set_option("tabularization.cache_max_bytes", 2**20)
+        model = LinearRegressionModel(lags=4)
+        model.fit(self.series, sample_weight="linear")
+        pred_linear = model.predict(n=2, series=self.series)
+        model.fit(self.series, sample_weight="exponential")
+        model.fit(self.series, sample_weight="linear")
+        info = tabularization_cache_info()
+        assert (info["hits"], info["misses"]) == (1, 2)
+        assert model.predict(n=2, series=self.series) == pred_linear
+        features, labels, sample_weights = model._create_lagged_data(
+            series=self.series,
+            past_covariates=None,
+            future_covariates=None,
+            max_samples_per_ts=None,
+            sample_weight="linear",
+        )
+        assert not sample_weights.flags.writeable
+        assert np.all(np.diff(sample_weights[: len(features) // 2]) > 0)
+
+    def test_invalid_options(self):
+        with pytest.raises(ValueError, match="non-negative integer"):
+            set_option("tabularization.cache_max_bytes", -1)
+        with pytest.raises(ValueError, match="non-negative integer"):
+            set_option("tabularization.cache_max_bytes", 1.0)
+        with pytest.raises(ValueError, match="string or `None`"):
+            set_option("tabularization.cache_dir", 1)
@@ -0,0 +1,189 @@
+import threading
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from darts import concatenate
+from darts.config import option_context, reset_option, set_option
+from darts.dataprocessing.transformers import Resampler, Scaler, WindowTransformer
+from darts.metrics import mae
+from darts.models import LinearRegressionModel
+from darts.utils import profiling
+from darts.utils.profiling import (
+    get_profiling_report,
+    profile_span,
+    profiled,
+    reset_profiling,
+)
+from darts.utils.timeseries_generation import linear_timeseries
+
+
+@pytest.fixture(scope="function", autouse=True)
+def reset_profiling_state():
+    """Disables profiling and clears the recorded spans after each test."""
+    reset_profiling()
+    yield
+    reset_option("profiling")
+    reset_profiling()
+
+
+class TestProfiling:
+    series = linear_timeseries(length=60)
+
+    def test_disabled_by_default(self):
+        assert not profiling._ENABLED
+        assert isinstance(profile_span("span"), profiling._NoSpan)
+
+        @profiled("decorated")
+        def func(x):
+            return x + 1
+
+        with profile_span("span"):
+            assert func(1) == 2
+        LinearRegressionModel(lags=2).fit(self.series).predict(3)
+
+        report = get_profiling_report()
+        assert report.empty
+        assert report.index.name == "span"
+        assert report.columns.tolist() == [
+            "count",
+            "wall_time",
+            "mean_wall_time",
+            "peak_allocated_bytes",
+            "net_allocated_bytes",
+        ]
+
+    @pytest.mark.parametrize("track_memory", [True, False])
+    def test_spans(self, track_memory):
+        was_tracing = tracemalloc.is_tracing()
+
+        @profiled("decorated")
+        def func(n):
+            return np.ones(n)
+
+        with option_context(
+            "profiling.enabled", True, "profiling.track_memory", track_memory
+        ):
+            assert tracemalloc.is_tracing() == (track_memory or was_tracing)
+            with profile_span("outer"):
+                with profile_span("inner"):
+                    kept = func(100_000)
+                func(200_000)
+        # profiling only stops the `tracemalloc` tracing it started
+        assert tracemalloc.is_tracing() == was_tracing
+
+        report = get_profiling_report()
+        # spans are listed in the order of their first start
+        assert report.index.tolist() == ["outer", "inner", "decorated"]
+        assert report["count"].tolist() == [1, 1, 2]
+        assert (report["wall_time"] > 0).all()
+        assert report.loc["outer", "wall_time"] >= report.loc["inner", "wall_time"]
+        np.testing.assert_allclose(
+            report["mean_wall_time"], report["wall_time"] / report["count"]
+        )
+        if track_memory:
+            # the peak of nested spans propagates to the enclosing spans
+            assert report.loc["decorated", "peak_allocated_bytes"] >= 200_000 * 8
+            assert report.loc["outer", "peak_allocated_bytes"] >= 200_000 * 8
+            assert report.loc["inner", "peak_allocated_bytes"] >= kept.nbytes
+            assert report.loc["inner", "peak_allocated_bytes"] < 200_000 * 8
+            # only the array returned in `inner` is kept alive
+            assert report.loc["inner", "net_allocated_bytes"] >= kept.nbytes
+            assert report.loc["outer", "net_allocated_bytes"] < 200_000 * 8
+        else:
+            assert (report["peak_allocated_bytes"] == 0).all()
+            assert (report["net_allocated_bytes"] == 0).all()
+
+        # disabled profiling does not record any more spans
+        func(10)
+        assert get_profiling_report()["count"].tolist() == [1, 1, 2]
+        reset_profiling()
+        assert get_profiling_report().empty
+
+    def test_nested_same_name(self):
+        class Base:
+            @profiled("fit")
+            def fit(self):
+                return "base"
+
+        class Child(Base):
+            @profiled("fit")
+            def fit(self):
+                return super().fit()
+
+        set_option("profiling.enabled", True)
+        assert Child().fit() == "base"
+        assert get_profiling_report()["count"].tolist() == [1]
+        assert Child.fit.__name__ == "fit"
+
+    def test_span_with_exception(self):
+        set_option("profiling.enabled", True)
+        with pytest.raises(ValueError):
+            with profile_span("failing"):
+                raise ValueError("error")
+        assert get_profiling_report()["count"].tolist() == [1]
+        assert profiling._span_stack() == []
+
+    def test_threads(self):
+        set_option("profiling.enabled", True)
+
+        def run():
+            for _ in range(10):
+                with profile_span("thread"):
+                    with profile_span("nested"):
+                        pass
+
+        threads = [threading.Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        report = get_profiling_report()
+        assert report["count"].tolist() == [40, 40]
+
+    def test_darts_spans(self):
+        series = concatenate([self.series, self.series.shift(len(self.series))], axis=0)
+        with option_context("profiling.enabled", True):
+            series = Scaler().fit_transform(series)
+            model = LinearRegressionModel(lags=4, output_chunk_length=2)
+            model.fit(series[:-10])
+            pred = model.predict(n=5)
+            mae(series, pred)
+            model.historical_forecasts(
+                series, start=len(series) - 3, forecast_horizon=2, retrain=False
+            )
+
+        report = get_profiling_report()
+        assert report.index.tolist() == [
+            "transformer.fit",
+            "transform",
+            "fit",
+            "tabularize",
+            "estimator.fit",
+            "predict",
+            "predict_rollout",
+            "build_forecast_series",
+            "metric",
+            "historical_forecasts",
+        ]
+        assert report.loc["fit", "count"] == 1
+        assert report.loc["estimator.fit", "count"] == 1
+        assert report.loc["metric", "count"] == 1
+        assert report.loc["historical_forecasts", "count"] == 1
+
+    @pytest.mark.parametrize(
+        "transformer",
+        [
+            WindowTransformer({"function": "mean", "mode": "rolling", "window": 3}),
+            Resampler(freq="2D"),
+        ],
+    )
+    @pytest.mark.parametrize("n_series", [1, 3])
+    def test_batched_transformer_spans(self, transformer, n_series):
+        """The transformers transforming many series at once record a single `transform` span per call."""
+        with option_context("profiling.enabled", True):
+            transformer.transform([self.series] * n_series)
+        report = get_profiling_report()
+        assert report.index.tolist() == ["transform"]
+        assert report.loc["transform", "count"] == 1
@@ -2612,6 +2612,33 @@ def generate_series(n_variables: int, length: int, prefix: str):
 
 
 class TestVariableICLDataset:
+    def test_dataset_memmap(self, tmpdir_fn):
+        # samples are read from the memory-mapped values without loading the whole series
+        self.target1.save_memmap("target")
+        target = TimeSeries.load_memmap("target")
+        vals = target.all_values(copy=False)
+        ds = ShiftedTorchTrainingDataset(
+            series=target,
+            input_chunk_length=10,
+            output_chunk_length=5,
+            shift=5,
+        )
+        ds_ref = ShiftedTorchTrainingDataset(
+            series=self.target1,
+            input_chunk_length=10,
+            output_chunk_length=5,
+            shift=5,
+        )
+        for idx in [0, len(ds) - 1]:
+            sample = ds[idx]
+            assert np.shares_memory(sample[0], vals)
+            assert np.shares_memory(sample[-1], vals)
+            for left, right in zip(sample, ds_ref[idx]):
+                if left is None:
+                    assert right is None
+                else:
+                    np.testing.assert_array_equal(left, right)
+
     def test_dataset_padding_training(self):
         """Training dataset should NaN-pad past features for short series."""
         icl, ocl, min_icl = 14, 6, 2
@@ -41,12 +41,15 @@ Optionally, ``TimeSeries`` can store static covariates, a hierarchy, and / or me
 
 from __future__ import annotations
 
+import hashlib
 import itertools
 import json
 import math
+import os
 import pickle
 import re
 import sys
+import weakref
 from collections import defaultdict
 from collections.abc import Callable, Sequence
 from copy import deepcopy
@@ -65,14 +68,23 @@ from darts.config import get_option
 from darts.logging import get_logger, raise_log
 from darts.typing import TimeIndex, TimeZone
 from darts.utils import _build_tqdm_iterator, _parallel_apply
+from darts.utils._chunked import LazyValues, NpyChunkStore, XarrayStore
 from darts.utils._formatting import (
     format_bytes,
     format_dict,
     make_collapsible_section,
     make_paragraph,
 )
+from darts.utils._resampling import (
+    NUMPY_RESAMPLE_KWARGS,
+    NUMPY_RESAMPLE_METHODS,
+    ResampleEngine,
+)
+from darts.utils._windows import WindowEngine
 from darts.utils.utils import (
     SUPPORTED_RESAMPLE_METHODS,
+    _cast_to_compute_dtype,
+    _dataframe_to_values,
     _maybe_cast_array_dtype,
     dataframe_col_to_time_index,
     expand_arr,
@@ -89,6 +101,7 @@ else:
 if TYPE_CHECKING:
     import matplotlib.axes
     import plotly.graph_objects as go
+    import pyarrow as pa
     import xarray as xr
 
 logger = get_logger(__name__)
@@ -106,8 +119,30 @@ DEFAULT_GLOBAL_STATIC_COV_NAME = "global_components"
 HIERARCHY_TAG = "hierarchy"
 METADATA_TAG = "metadata"
 
+# component names of quantile series: "<component>_q<quantile>"
+QUANTILE_COMPONENT_PATTERN = r"^(.+)_q([01]\.\d{3})$"
+
+# long Arrow / Parquet representation: series id column and schema metadata keys
+ARROW_SERIES_ID_COL = "series_id"
+ARROW_METADATA_KEY = b"darts"
+ARROW_STATIC_COV_KEY = b"darts.static_covariates"
+ARROW_FORMAT_VERSION = 1
+
+# file names of memory-mappable series directories
+MEMMAP_VALUES_FILE = "values.npy"
+MEMMAP_ATTRS_FILE = "attributes.pkl"
+
+# minimum number of time steps pre-allocated by `StreamingTimeSeries`
+STREAMING_MIN_CAPACITY = 16
+
+# canonical time indexes shared by all series with the same time index, see `_intern_time_index()`
+_TIME_INDEX_CACHE: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
 
 class TimeSeries:
+    # the cached content hash, see `TimeSeries.fingerprint`
+    _fingerprint: str | None = None
+
     def __init__(
         self,
         times: TimeIndex | pd.Index,
@@ -229,9 +264,8 @@ class TimeSeries:
         # avoid copying if data is already np.ndarray:
         values = np.array(values) if not isinstance(values, np.ndarray) else values
 
-        # optionally, cast values to float
-        if not np.issubdtype(values.dtype, np.floating):
-            values = values.astype(np.float64)
+        # optionally, cast values to float (or to the dtype from option `compute.dtype`)
+        values = _cast_to_compute_dtype(values)
         if not (
             np.issubdtype(values.dtype, np.float64)
             or np.issubdtype(values.dtype, np.float32)
@@ -358,11 +392,12 @@ class TimeSeries:
 
         # how the dimensions are named; we convert hashable to string
         self._time_dim = str(times.name) if times.name is not None else DIMS[TIME_AX]
-        self._time_index = times
+        # without a copy, only a view is interned as the original index could still be mutated (e.g. its name)
+        self._time_index = _intern_time_index(times if copy else times.view())
         self._freq = freq
         self._freq_str = freq_str
         self._has_datetime_index = has_datetime_index
-        self._values = values
+        self._values = _read_only(values, owned=copy)
         self._components = components
 
         # check static covariates
@@ -387,8 +422,8 @@ class TimeSeries:
                         "must map to each TimeSeries component)."
                     ),
                 )
-            if copy:
-                static_covariates = static_covariates.copy()
+            # with `copy=False`, a shallow copy avoids mutating the axes of the input covariates below
+            static_covariates = static_covariates.copy(deep=copy)
         elif isinstance(static_covariates, pd.Series):
             static_covariates = static_covariates.to_frame().T
         else:  # None
@@ -400,7 +435,7 @@ class TimeSeries:
                 if len(static_covariates) == self.n_components
                 else [DEFAULT_GLOBAL_STATIC_COV_NAME]
             )
-            static_covariates.columns.name = STATIC_COV_TAG
+            static_covariates.columns = static_covariates.columns.rename(STATIC_COV_TAG)
             # convert numerical columns to same dtype as series
             # we get all numerical columns, except those that have right dtype already
             cols_to_cast = static_covariates.select_dtypes(
@@ -497,6 +532,7 @@ class TimeSeries:
         freq: str | int | None = None,
         fillna_value: float | None = None,
         copy: bool = True,
+        lazy: bool = False,
     ) -> Self:
         """Create a ``TimeSeries`` from an `xarray.DataArray`.
 
@@ -535,6 +571,14 @@ class TimeSeries:
             Whether to copy the `times` (time index dimension) and `values` (data) objects. If `copy=False`, mutating
             the series data will affect the original data. Additionally, if `times` lack a frequency or step size, it
             will be assigned to the original object.
+        lazy
+            Whether to load the values lazily from `xa`, e.g. a DataArray backed by chunked or on-disk storage opened
+            with ``xarray.open_dataarray()`` or ``xarray.open_zarr()``. The values are then only read for the time
+            steps selected by slicing the series (``series[10:20]``, ``slice()``, ``drop_after()``, ...) or by the
+            training datasets of the models, and the resulting series are regular in-memory series. Operations on
+            all values (e.g. arithmetic, transformations, or ``copy()``) load them into memory. Requires a time index
+            sorted in increasing order without missing dates, `fill_missing_dates` and `fillna_value` are not
+            supported.
 
         Returns
         -------
@@ -565,6 +609,22 @@ class TimeSeries:
         >>> series.shape
         (3, 1, 1)
         """
+        if lazy:
+            if fill_missing_dates or fillna_value is not None:
+                raise_log(
+                    ValueError(
+                        "`fill_missing_dates` and `fillna_value` are not supported with `lazy=True`."
+                    )
+                )
+            return cls._from_store(
+                store=XarrayStore(xa),
+                times=xa.get_index(xa.dims[TIME_AX]),
+                freq=freq,
+                components=xa.get_index(xa.dims[COMP_AX]),
+                static_covariates=xa.attrs.get(STATIC_COV_TAG),
+                hierarchy=xa.attrs.get(HIERARCHY_TAG),
+                metadata=xa.attrs.get(METADATA_TAG),
+            )
         return cls(
             times=xa.get_index(xa.dims[TIME_AX]),
             values=xa.values,
@@ -833,9 +893,19 @@ class TimeSeries:
                 value_cols = [value_cols]
             series_df = df[value_cols]
 
+        values = None
+        if not df.implementation.is_pandas_like():
+            # read the columns of columnar frames (e.g. polars, pyarrow) directly into the final array
+            values = _dataframe_to_values(series_df, copy=copy)
+        if values is not None:
+            # the time index and values were newly created, or are zero-copy views with `copy=False`
+            copy = False
+        else:
+            values = series_df.to_numpy()
+
         return cls(
             times=time_index,
-            values=series_df.to_numpy(),
+            values=values,
             fill_missing_dates=fill_missing_dates,
             freq=freq,
             components=series_df.columns,
@@ -920,13 +990,16 @@ class TimeSeries:
             Optionally, a string or list of strings with `group_cols` column(s) to exclude from the static covariates.
         n_jobs
             Optionally, an integer representing the number of parallel jobs to run. Behavior is the same as in the
-            `joblib.Parallel` class.
+            `joblib.Parallel` class. Only used if the groups have to be extracted one by one (with
+            `fill_missing_dates=True`, or if `group_cols` contain missing values). Otherwise, all groups are extracted
+            at once with a vectorized implementation which is considerably faster.
         verbose
             Optionally, a boolean value indicating whether to display a progress bar.
         copy
             Whether to copy the `times` (DataFrame index or the `time_col` column) and DataFrame `values`.
             If `copy=False`, mutating the series data will affect the original data. Additionally, if `times` lack a
-            frequency or step size, it will be assigned to the original object.
+            frequency or step size, it will be assigned to the original object. With the vectorized extraction, the
+            values are always copied into a new array (sorted by group and time) that is shared by all series.
 
         Returns
         -------
@@ -1057,6 +1130,21 @@ class TimeSeries:
             + extract_metadata_cols
         ]
 
+        if not fill_missing_dates:
+            series = cls._from_group_dataframe_vectorized(
+                df=df,
+                group_cols=group_cols,
+                time_col=time_col,
+                value_cols=extract_value_cols,
+                static_cov_cols=extract_static_cov_cols,
+                metadata_cols=metadata_cols,
+                freq=freq,
+                fillna_value=fillna_value,
+                verbose=verbose,
+            )
+            if series is not None:
+                return series
+
         groups = df.group_by(group_cols[0] if len(group_cols) == 1 else group_cols)
 
         # not all backends maintain the order when grouping; need to sort the groups in the end for reproducibility
@@ -1136,6 +1224,195 @@ class TimeSeries:
             series[sorted_group_idx[group_i]] = series_group
         return series
 
+    @classmethod
+    def _from_group_dataframe_vectorized(
+        cls,
+        df: nw.DataFrame,
+        group_cols: list[str],
+        time_col: str | None,
+        value_cols: list[str],
+        static_cov_cols: list[str],
+        metadata_cols: list[str],
+        freq: str | int | None,
+        fillna_value: float | None,
+        verbose: bool | None,
+    ) -> list[Self] | None:
+        """Create the series for :meth:`from_group_dataframe()` without splitting `df` into group DataFrames.
+
+        Sorts the rows once by group and time, and extracts the values, static covariates and metadata for all
+        groups at once. Series with a regular time index are created through :meth:`_from_trusted()`, all others
+        (e.g. with missing dates) go through the full constructor.
+
+        Returns `None` if the vectorized path cannot be used (missing group keys, timezone-aware or invalid
+        index), in which case the groups must be extracted one by one.
+        """
+        if time_col is not None:
+            times = dataframe_col_to_time_index(df, time_col)
+        else:
+            times = nw.maybe_get_index(df)
+        if isinstance(times, pd.DatetimeIndex):
+            if times.tz is not None or times.hasnans:
+                return None
+            time_vals = times.asi8
+        elif np.issubdtype(times.dtype, np.integer):
+            time_vals = np.asarray(times)
+        else:
+            return None
+
+        # sort rows by group and time; group codes are in the sorted order of the group values
+        group_codes = []
+        try:
+            for col in group_cols:
+                codes, _ = pd.factorize(df.get_column(col).to_numpy(), sort=True)
+                if (codes < 0).any():
+                    return None
+                group_codes.append(codes)
+        except TypeError:
+            # unorderable group values
+            return None
+
+        order = np.lexsort([time_vals] + group_codes[::-1])
+        n_rows = len(order)
+        is_start = np.zeros(n_rows, dtype=bool)
+        is_start[:1] = True
+        for codes in group_codes:
+            codes = codes[order]
+            is_start[1:] |= codes[1:] != codes[:-1]
+        starts = np.flatnonzero(is_start)
+        ends = np.append(starts[1:], n_rows)
+        # row of the first encountered value per group
+        first_rows = np.minimum.reduceat(order, starts) if n_rows else starts
+
+        values = _cast_to_compute_dtype(df[value_cols].to_numpy())
+        values = values[order]
+        if fillna_value is not None:
+            values[np.isnan(values)] = fillna_value
+        values = values[:, :, np.newaxis]
+
+        components = pd.Index(value_cols)
+        if len(set(components)) != len(components) or any([
+            not isinstance(s, str) for s in components
+        ]):
+            components = _clean_components(components)
+
+        static_covs = None
+        if static_cov_cols:
+            static_covs = (
+                df[static_cov_cols].to_pandas().iloc[first_rows].reset_index(drop=True)
+            )
+            cols_to_cast = static_covs.select_dtypes(
+                include=np.number, exclude=values.dtype
+            ).columns
+            if not cols_to_cast.empty:
+                static_covs = static_covs.astype({
+                    col: values.dtype for col in cols_to_cast
+                })
+            # single-row static covariates of univariate series belong to the component
+            static_covs.index = [
+                components[0]
+                if len(components) == 1
+                else DEFAULT_GLOBAL_STATIC_COV_NAME
+            ] * len(static_covs)
+            static_covs.columns.name = STATIC_COV_TAG
+
+        metadata_vals = None
+        if metadata_cols:
+            metadata_vals = list(
+                zip(*[
+                    df.get_column(col).to_numpy()[first_rows].tolist()
+                    for col in metadata_cols
+                ])
+            )
+
+        if isinstance(times, pd.DatetimeIndex):
+            offset = to_offset(freq) if isinstance(freq, str) else None
+        else:
+            offset = freq if isinstance(freq, int) else None
+        sorted_times = times[order]
+        sorted_time_vals = time_vals[order]
+        # groups often share the same time index; reuse it across series
+        index_cache = {}
+
+        def get_time_index(start: int, end: int) -> TimeIndex | None:
+            """Return the regular time index of a group, or `None` if it cannot be trusted."""
+            vals = sorted_time_vals[start:end]
+            key = (vals[0], vals[-1], len(vals))
+            cached = index_cache.get(key)
+            if cached is not None and np.array_equal(cached[0], vals):
+                return cached[1]
+
+            if freq is not None and offset is None:
+                # frequency type does not match the index type
+                return None
+            if isinstance(times, pd.DatetimeIndex):
+                group_times = sorted_times[start:end]
+                group_offset = offset
+                if group_offset is None:
+                    inferred_freq = group_times.inferred_freq
+                    if inferred_freq is None:
+                        return None
+                    group_offset = to_offset(inferred_freq)
+                try:
+                    group_times.freq = group_offset
+                except ValueError:
+                    return None
+            else:
+                step = offset
+                if step is None:
+                    if len(vals) < 2:
+                        return None
+                    step = vals[1] - vals[0]
+                if step <= 0 or (len(vals) > 1 and (np.diff(vals) != step).any()):
+                    return None
+                group_times = pd.RangeIndex(
+                    start=vals[0],
+                    stop=vals[0] + step * len(vals),
+                    step=step,
+                    name=times.name,
+                )
+            index_cache[key] = (vals, group_times)
+            return group_times
+
+        iterator = _build_tqdm_iterator(
+            range(len(starts)),
+            verbose=verbose,
+            total=len(starts),
+            desc="Creating TimeSeries",
+        )
+        series = []
+        for idx in iterator:
+            start, end = starts[idx], ends[idx]
+            group_static_covs = (
+                static_covs.iloc[idx : idx + 1] if static_covs is not None else None
+            )
+            metadata = (
+                dict(zip(metadata_cols, metadata_vals[idx]))
+                if metadata_vals is not None
+                else None
+            )
+            group_times = get_time_index(start, end)
+            if group_times is not None:
+                ts = cls._from_trusted(
+                    times=group_times,
+                    values=values[start:end],
+                    components=components,
+                    static_covariates=group_static_covs,
+                    metadata=metadata,
+                )
+            else:
+                # irregular index, let the constructor restore the frequency or raise an error
+                ts = cls(
+                    times=sorted_times[start:end],
+                    values=values[start:end],
+                    freq=freq,
+                    components=components,
+                    static_covariates=group_static_covs,
+                    metadata=metadata,
+                    copy=False,
+                )
+            series.append(ts)
+        return series
+
     @classmethod
     def from_series(
         cls,
@@ -1535,6 +1812,480 @@ class TimeSeries:
         with open(path, "rb") as fh:
             return pickle.load(fh)
 
+    @classmethod
+    def load_memmap(cls, path: str, mode: Literal["r", "r+", "c"] = "r") -> Self:
+        """Load a ``TimeSeries`` saved with :meth:`TimeSeries.save_memmap()`, whose values are memory-mapped.
+
+        The values are not loaded into memory up front; only the pages that are accessed (e.g. by slicing the series,
+        or by a training dataset) are read from disk. Selecting time steps returns series sharing the memory-mapped
+        values. Operations computing new values (arithmetic, transformations, ...) return regular in-memory series.
+
+        Parameters
+        ----------
+        path
+            The directory the series was saved to.
+        mode
+            The memory-map mode, see :func:`numpy.load()`. `"r"` for read-only, `"r+"` to write changes to the values
+            back to disk, and `"c"` for copy-on-write (changes are kept in memory only). Note that the values of the
+            series itself are read-only in any mode.
+
+        Returns
+        -------
+        TimeSeries
+            The memory-mapped series.
+        """
+        values = np.load(os.path.join(path, MEMMAP_VALUES_FILE), mmap_mode=mode)
+        with open(os.path.join(path, MEMMAP_ATTRS_FILE), "rb") as fh:
+            attrs = pickle.load(fh)
+        times = generate_index(
+            start=attrs.pop("start"),
+            length=attrs.pop("length"),
+            freq=attrs.pop("freq"),
+            name=attrs.pop("time_name"),
+        )
+        return cls._from_trusted(times=times, values=values, **attrs)
+
+    @classmethod
+    def load_chunked(cls, path: str) -> Self:
+        """Load a ``TimeSeries`` saved with :meth:`TimeSeries.save_chunked()`, whose values are loaded lazily.
+
+        The values are not loaded into memory up front; slicing the series (``series[10:20]``, ``slice()``,
+        ``drop_after()``, ...) or the training datasets of the models only read the chunks holding the selected
+        time steps, and the resulting series are regular in-memory series. Operations on all values (e.g.
+        arithmetic, transformations, or ``copy()``) load them into memory.
+
+        Parameters
+        ----------
+        path
+            The directory the series was saved to.
+
+        Returns
+        -------
+        TimeSeries
+            The lazily loaded series.
+        """
+        with open(os.path.join(path, MEMMAP_ATTRS_FILE), "rb") as fh:
+            attrs = pickle.load(fh)
+        store = NpyChunkStore(
+            path, chunk_lengths=attrs.pop("chunk_lengths"), dtype=attrs.pop("dtype")
+        )
+        times = generate_index(
+            start=attrs.pop("start"),
+            length=attrs.pop("length"),
+            freq=attrs.pop("freq"),
+            name=attrs.pop("time_name"),
+        )
+        return cls._from_trusted(
+            times=times, values=LazyValues(store, dtype=store.dtype), **attrs
+        )
+
+    @classmethod
+    def from_arrow(cls, data: pa.RecordBatch | pa.Table) -> list[Self]:
+        """Create a list of ``TimeSeries`` from their long Arrow representation.
+
+        The Arrow representation can be generated with :func:`darts.timeseries.to_arrow()` or
+        :meth:`TimeSeries.to_arrow()`. It holds one row per series and time step, with the series id, the time, and
+        one column per component. The static covariates, hierarchy, metadata and frequency of each series are stored
+        in the schema metadata.
+
+        The values of all series are extracted at once into a single array, and each returned series holds a view
+        of it.
+
+        Requires `pyarrow` to be installed.
+
+        Parameters
+        ----------
+        data
+            A `pyarrow.RecordBatch` or `pyarrow.Table` in the long Darts format. It can contain only a subset of the
+            rows (e.g. some series or a time range), and of the component columns.
+
+        Returns
+        -------
+        list[TimeSeries]
+            The series ordered by their series id. Series without any row in `data` are omitted.
+        """
+        if data.schema.metadata is None or ARROW_METADATA_KEY not in (
+            data.schema.metadata
+        ):
+            raise_log(
+                ValueError(
+                    "`data` is not in the long Darts format. It must be created with "
+                    "`darts.timeseries.to_arrow()`."
+                )
+            )
+        meta = json.loads(data.schema.metadata[ARROW_METADATA_KEY])
+        time_col = meta["time_col"]
+        n_samples = meta["n_samples"]
+        all_components = pd.Index(meta["components"])
+        components = pd.Index([c for c in all_components if c in data.schema.names])
+        missing_cols = {ARROW_SERIES_ID_COL, time_col} - set(data.schema.names)
+        if missing_cols or components.empty:
+            raise_log(
+                ValueError(
+                    f"`data` must contain the series id column `{ARROW_SERIES_ID_COL}`, the time column "
+                    f"`{time_col}` and at least one component column."
+                )
+            )
+        if data.num_rows == 0:
+            return []
+
+        series_ids = data.column(ARROW_SERIES_ID_COL).to_numpy()
+        if (np.diff(series_ids) < 0).any():
+            data = data.sort_by([
+                (ARROW_SERIES_ID_COL, "ascending"),
+                (time_col, "ascending"),
+            ])
+            series_ids = data.column(ARROW_SERIES_ID_COL).to_numpy()
+        starts = np.flatnonzero(np.r_[True, series_ids[1:] != series_ids[:-1]])
+        ends = np.append(starts[1:], len(series_ids))
+
+        times = pd.Index(data.column(time_col).to_pandas(), name=time_col)
+        values = _cast_to_compute_dtype(
+            np.stack(
+                [
+                    _arrow_column_to_numpy(data.column(c)).reshape(-1, n_samples)
+                    for c in components
+                ],
+                axis=1,
+            )
+        )
+
+        static_covs = None
+        if ARROW_STATIC_COV_KEY in data.schema.metadata:
+            pa = _import_pyarrow()
+            static_covs = (
+                pa.ipc.open_stream(data.schema.metadata[ARROW_STATIC_COV_KEY])
+                .read_all()
+                .to_pandas()
+            )
+            # rows are sorted by series id; locate each series' rows by position
+            static_cov_ids = static_covs.index.get_level_values(0).to_numpy()
+            static_covs.index = static_covs.index.get_level_values(1)
+            static_covs.index.name = None
+            static_covs.columns.name = STATIC_COV_TAG
+            cols_to_cast = static_covs.select_dtypes(
+                include=np.number, exclude=values.dtype
+            ).columns
+            if not cols_to_cast.empty:
+                static_covs = static_covs.astype({
+                    col: values.dtype for col in cols_to_cast
+                })
+        is_subset = not components.equals(all_components)
+
+        # series often share the same time index; reuse it across series
+        index_cache = {}
+        series = []
+        for start, end in zip(starts, ends):
+            series_id = int(series_ids[start])
+            series_meta = meta["series"][series_id]
+
+            series_static_covs = None
+            if series_meta["static_covariates"] is not None:
+                sc_start, sc_end = np.searchsorted(
+                    static_cov_ids, [series_id, series_id + 1]
+                )
+                series_static_covs = static_covs.iloc[sc_start:sc_end]
+                if series_meta["static_covariates"] != static_covs.columns.tolist():
+                    series_static_covs = series_static_covs[
+                        series_meta["static_covariates"]
+                    ]
+                if is_subset:
+                    if len(series_static_covs) > 1:
+                        series_static_covs = series_static_covs.loc[components]
+                    series_static_covs = series_static_covs.set_axis(
+                        components
+                        if len(series_static_covs) == len(components)
+                        else [DEFAULT_GLOBAL_STATIC_COV_NAME]
+                    )
+            kwargs = {
+                "values": values[start:end],
+                "components": components,
+                "static_covariates": series_static_covs,
+                "hierarchy": series_meta["hierarchy"] if not is_subset else None,
+                "metadata": series_meta["metadata"],
+            }
+
+            freq = series_meta["freq"]
+            series_times = times[start:end]
+            cache_key = (series_times[0], series_times[-1], end - start, freq)
+            cached = index_cache.get(cache_key)
+            if cached is not None and cached.equals(series_times):
+                is_regular = True
+                series_times = cached
+            elif isinstance(series_times, pd.DatetimeIndex):
+                expected_times = pd.date_range(
+                    start=series_times[0],
+                    periods=len(series_times),
+                    freq=freq,
+                    name=time_col,
+                    unit=series_times.unit,
+                )
+                is_regular = np.array_equal(expected_times.asi8, series_times.asi8)
+                series_times = expected_times
+            else:
+                vals = np.asarray(series_times)
+                is_regular = not (np.diff(vals) != freq).any()
+                series_times = pd.RangeIndex(
+                    start=vals[0],
+                    stop=vals[0] + freq * len(vals),
+                    step=freq,
+                    name=time_col,
+                )
+            if is_regular:
+                index_cache[cache_key] = series_times
+                series.append(cls._from_trusted(times=series_times, **kwargs))
+            else:
+                # e.g. rows were removed after writing; let the constructor validate the index
+                series.append(
+                    cls(times=times[start:end], freq=freq, copy=False, **kwargs)
+                )
+        return series
+
+    @classmethod
+    def from_parquet(
+        cls,
+        path: str,
+        series_ids: int | Sequence[int] | None = None,
+        start: pd.Timestamp | int | None = None,
+        end: pd.Timestamp | int | None = None,
+        components: str | Sequence[str] | None = None,
+        **kwargs,
+    ) -> list[Self]:
+        """Read a list of ``TimeSeries`` from a Parquet file written with :func:`darts.timeseries.to_parquet()`.
+
+        The series, time range and components to load are pushed down to the Parquet reader, so that only the
+        required columns and row groups are read from disk.
+
+        Requires `pyarrow` to be installed.
+
+        Parameters
+        ----------
+        path
+            The path to the Parquet file.
+        series_ids
+            Optionally, the id(s) of the series to load. The id of a series is its position in the sequence of series
+            that was written. If `None`, loads all series.
+        start
+            Optionally, the first time (inclusive) to load. A `pandas.Timestamp` for series with a `DatetimeIndex`,
+            and an integer for series with a `RangeIndex`.
+        end
+            Optionally, the last time (inclusive) to load.
+        components
+            Optionally, the component(s) to load. If `None`, loads all components. The hierarchy is only kept if all
+            components are loaded.
+        **kwargs
+            Additional keyword arguments passed to :func:`pyarrow.parquet.read_table()`. Additional `filters` must be
+            a list of tuples, and are combined with the ones above.
+
+        Returns
+        -------
+        list[TimeSeries]
+            The series ordered by their series id. Series without any time step in the selected time range are
+            omitted.
+
+        Examples
+        --------
+        >>> from darts.timeseries import to_parquet
+        >>> from darts.utils.timeseries_generation import linear_timeseries
+        >>> series = [linear_timeseries(length=10, start_value=i) for i in range(3)]
+        >>> to_parquet(series, "series.parquet")
+        >>> series_loaded = TimeSeries.from_parquet(
+        >>>     "series.parquet", series_ids=[0, 2], start=pd.Timestamp("2000-01-05")
+        >>> )
+        >>> len(series_loaded), len(series_loaded[0])
+        (2, 6)
+        """
+        _import_pyarrow()
+        import pyarrow.parquet as pq
+
+        schema = pq.read_schema(path)
+        if schema.metadata is None or ARROW_METADATA_KEY not in schema.metadata:
+            raise_log(
+                ValueError(
+                    f"The Parquet file `{path}` was not written with `darts.timeseries.to_parquet()`."
+                )
+            )
+        meta = json.loads(schema.metadata[ARROW_METADATA_KEY])
+        time_col = meta["time_col"]
+
+        filters = list(kwargs.pop("filters", None) or [])
+        if series_ids is not None:
+            series_ids = [series_ids] if isinstance(series_ids, int) else series_ids
+            filters.append((ARROW_SERIES_ID_COL, "in", list(series_ids)))
+        if start is not None:
+            filters.append((time_col, ">=", start))
+        if end is not None:
+            filters.append((time_col, "<=", end))
+
+        columns = None
+        if components is not None:
+            components = [components] if isinstance(components, str) else components
+            invalid_components = set(components) - set(meta["components"])
+            if invalid_components:
+                raise_log(
+                    ValueError(
+                        f"Some `components` are not present in the Parquet file: {sorted(invalid_components)}."
+                    )
+                )
+            columns = [ARROW_SERIES_ID_COL, time_col] + list(components)
+
+        table = pq.read_table(path, columns=columns, filters=filters or None, **kwargs)
+        return cls.from_arrow(table)
+
+    @classmethod
+    def _from_store(
+        cls,
+        store: NpyChunkStore | XarrayStore,
+        times: TimeIndex | pd.Index,
+        freq: str | int | None = None,
+        **kwargs,
+    ) -> Self:
+        """Create a ``TimeSeries`` whose values are loaded lazily from `store`, see :class:`LazyValues`.
+
+        The time index, components and attributes (`kwargs`) are validated by the constructor, without loading the
+        values.
+        """
+        if not times.is_monotonic_increasing:
+            raise_log(
+                ValueError(
+                    "Lazily loaded series require a time index sorted in increasing order."
+                )
+            )
+        # validate everything except the values with an empty array (without any sample)
+        dtype = _cast_to_compute_dtype(np.empty(0, dtype=store.dtype)).dtype
+        series = cls(
+            times=times,
+            values=np.empty((len(times), store.shape[COMP_AX], 0), dtype=dtype),
+            freq=freq,
+            copy=False,
+            **kwargs,
+        )
+        if len(series) != len(times):
+            raise_log(
+                ValueError(
+                    "Lazily loaded series do not support missing dates in the time index."
+                )
+            )
+        series._values = LazyValues(store, dtype=dtype)
+        return series
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        times: TimeIndex,
+        values: np.ndarray,
+        components: pd.Index,
+        static_covariates: pd.DataFrame | None = None,
+        hierarchy: dict | None = None,
+        metadata: dict | None = None,
+    ) -> Self:
+        """Create a ``TimeSeries`` from inputs that are known to be valid, without any checks or copies.
+
+        For internal use only. The caller must guarantee that:
+
+        - `times` is a ``pandas.RangeIndex``, or a timezone-naive ``pandas.DatetimeIndex`` with a set `freq`, with a
+          positive step size.
+        - `values` is a 3D floating point array with shape `(len(times), len(components), n_samples)`.
+        - `components` is a ``pandas.Index`` of unique strings.
+        - `static_covariates` (if any) is a ``pandas.DataFrame`` indexed by `components` (or by
+          `DEFAULT_GLOBAL_STATIC_COV_NAME` for a single row), with numeric columns of the same dtype as `values`.
+        - `hierarchy` (if any) is a valid hierarchy for `components`.
+
+        With option ``debug.validate_series`` enabled (see :mod:`darts.config`), the series is created through the
+        full constructor instead, and a `ValueError` is raised if any of the above is violated.
+        """
+        if get_option("debug.validate_series"):
+            return cls._from_trusted_validated(
+                times=times,
+                values=values,
+                components=components,
+                static_covariates=static_covariates,
+                hierarchy=hierarchy,
+                metadata=metadata,
+            )
+
+        series = cls.__new__(cls)
+        series._time_dim = str(times.name) if times.name is not None else DIMS[TIME_AX]
+        series._time_index = _intern_time_index(times)
+        series._has_datetime_index = isinstance(times, pd.DatetimeIndex)
+        if series._has_datetime_index:
+            series._freq = times.freq
+            series._freq_str = times.freq.freqstr
+        else:
+            series._freq = times.step
+            series._freq_str = str(times.step)
+        series._values = _read_only(values)
+        series._components = components
+
+        series._top_level_component = None
+        series._bottom_level_components = None
+        if hierarchy is not None:
+            ancestors = set().union(*hierarchy.values())
+            series._top_level_component = (
+                set(components) - set(hierarchy.keys())
+            ).pop()
+            series._bottom_level_components = [
+                c for c in components if c not in ancestors
+            ]
+
+        series._attrs = {
+            STATIC_COV_TAG: static_covariates,
+            HIERARCHY_TAG: hierarchy,
+            METADATA_TAG: metadata,
+        }
+        return series
+
+    @classmethod
+    def _from_trusted_validated(
+        cls,
+        times: TimeIndex,
+        values: np.ndarray,
+        components: pd.Index,
+        static_covariates: pd.DataFrame | None = None,
+        hierarchy: dict | None = None,
+        metadata: dict | None = None,
+    ) -> Self:
+        """Create a ``TimeSeries`` from the inputs of :meth:`_from_trusted()` through the full constructor, and
+        check that the constructor did not have to modify them."""
+        has_frequency = isinstance(times, pd.RangeIndex) or (
+            isinstance(times, pd.DatetimeIndex) and times.freq is not None
+        )
+        if not has_frequency:
+            raise_log(
+                ValueError(
+                    "Invalid trusted `TimeSeries` inputs: `times` must be a `pandas.RangeIndex` or a "
+                    "`pandas.DatetimeIndex` with a frequency."
+                ),
+            )
+        series = cls(
+            times=times,
+            values=values,
+            components=components,
+            static_covariates=static_covariates,
+            hierarchy=hierarchy,
+            metadata=metadata,
+        )
+        freq = times.freq if isinstance(times, pd.DatetimeIndex) else times.step
+        invalid = []
+        if not (series._time_index.equals(times) and series._freq == freq):
+            invalid.append("times")
+        if values.ndim != len(DIMS) or series._values.dtype != values.dtype:
+            invalid.append("values")
+        if not series.components.equals(components):
+            invalid.append("components")
+        if static_covariates is not None and not series.static_covariates.equals(
+            static_covariates
+        ):
+            invalid.append("static_covariates")
+        if invalid:
+            raise_log(
+                ValueError(
+                    f"Invalid trusted `TimeSeries` inputs: the following inputs had to be modified by the "
+                    f"constructor: {invalid}."
+                ),
+            )
+        return series
+
     """
     Properties
     ==========
@@ -1634,6 +2385,27 @@ class TimeSeries:
         """Whether the series is stochastic (probabilistic)."""
         return self.is_stochastic
 
+    @property
+    def is_quantile(self) -> bool:
+        """Whether the series is a quantile series.
+
+        A quantile series is a compact representation of a probabilistic series: a deterministic series holding the
+        values of each original component at several quantile levels, instead of the samples. Its components are named
+        "<component>_q<quantile>" in the order `[<c_1>_q<q_1>, ... <c_1>_q<q_n>, ..., <c_m>_q<q_1>, ... <c_m>_q<q_n>]`,
+        where all components share the same (at least two, increasing) quantile levels. It is for example returned by
+        :meth:`quantile()` with multiple quantiles, or by the models' `predict()` with `predict_quantiles`.
+
+        :meth:`quantile()` and :meth:`median()` interpolate linearly between the quantile levels of a quantile series,
+        and quantile series are natively supported by the quantile metrics (e.g. `mql`, `miw`, `mic`) and plotting.
+        """
+        return self._quantile_encoding() is not None
+
+    @property
+    def quantile_levels(self) -> np.ndarray | None:
+        """The quantile levels of a quantile series (see :attr:`is_quantile`), or `None` for any other series."""
+        encoding = self._quantile_encoding()
+        return encoding[1].copy() if encoding is not None else None
+
     @property
     def is_univariate(self) -> bool:
         """Whether the series is univariate."""
@@ -1711,6 +2483,23 @@ class TimeSeries:
         """The duration of the series (as a ``pandas.Timedelta`` or `int`)."""
         return self.end_time() - self.start_time()
 
+    @property
+    def fingerprint(self) -> str:
+        """A hash of the content of the series, to cache computations on the series.
+
+        Series with the same time index, values (including their dtype and number of samples), components, static
+        covariates and hierarchy have the same fingerprint, also across Python sessions. The metadata is not
+        included. The fingerprint is computed in a single pass over the values, and cached on the series if its values
+        cannot change. This is not the case if the series was created without copying a writeable array (e.g. with
+        ``copy=False``), then the fingerprint is computed again at every access.
+        """
+        if self._fingerprint is not None:
+            return self._fingerprint
+        fingerprint = _fingerprint(self)
+        if _has_private_values(self._values):
+            self._fingerprint = fingerprint
+        return fingerprint
+
     """
     Export functions
     ================
@@ -1722,7 +2511,8 @@ class TimeSeries:
         Parameters
         ----------
         copy
-            Whether to return a copy of the series. Leave it to True unless you know what you are doing.
+            Whether to return a copy of the series, otherwise the returned array shares the read-only values of the
+            series.
 
         Returns
         -------
@@ -1966,8 +2756,9 @@ class TimeSeries:
         """
         return self.__class__(
             times=self._time_index,
-            values=self._values.astype(dtype),
+            values=self._values.astype(dtype, copy=False),
             components=self.components,
+            copy=False,
             **self._attrs,
         )
 
@@ -2055,8 +2846,7 @@ class TimeSeries:
         Parameters
         ----------
         copy
-            Whether to return a copy of the values, otherwise returns a view.
-            Leave it to True unless you know what you are doing.
+            Whether to return a copy of the values, otherwise returns a read-only view.
         sample
             For stochastic series, the sample for which to return values. Default: 0 (first sample).
 
@@ -2084,8 +2874,7 @@ class TimeSeries:
         Parameters
         ----------
         copy
-            Whether to return a copy of the values, otherwise returns a view.
-            Leave it to True unless you know what you are doing.
+            Whether to return a copy of the values, otherwise returns a read-only view.
 
         Returns
         -------
@@ -2104,8 +2893,7 @@ class TimeSeries:
         Parameters
         ----------
         copy
-            Whether to return a copy of the values, otherwise returns a view.
-            Leave it to True unless you know what you are doing.
+            Whether to return a copy of the values, otherwise returns a read-only view.
 
         Returns
         -------
@@ -2123,7 +2911,7 @@ class TimeSeries:
         Parameters
         ----------
         copy
-            Whether to return a copy of the values. Leave it to True unless you know what you are doing.
+            Whether to return a copy of the values, otherwise returns a read-only view.
         sample
             For stochastic series, the sample for which to return values. Default: 0 (first sample).
 
@@ -2184,9 +2972,9 @@ class TimeSeries:
         elif axis == COMP_AX:
             return self[self.components.tolist()[:display_n]]
         else:
-            return self.__class__(
+            return self._from_trusted(
                 times=self._time_index,
-                values=self._values[:, :, :display_n],
+                values=self._values[:, :, :display_n].copy(),
                 components=self.components,
                 **self._attrs,
             )
@@ -2214,9 +3002,9 @@ class TimeSeries:
         elif axis == COMP_AX:
             return self[self.components.tolist()[-display_n:]]
         else:
-            return self.__class__(
+            return self._from_trusted(
                 times=self._time_index,
-                values=self._values[:, :, -display_n:],
+                values=self._values[:, :, -display_n:].copy(),
                 components=self.components,
                 **self._attrs,
             )
@@ -2303,46 +3091,15 @@ class TimeSeries:
             by a DatetimeIndex).
         """
 
-        df = self.to_dataframe()
-
-        if mode == "all":
-            is_nan_series = df.isna().all(axis=1).astype(int)
-        elif mode == "any":
-            is_nan_series = df.isna().any(axis=1).astype(int)
-        else:
-            raise_log(
-                ValueError(
-                    f"Keyword mode accepts only 'any' or 'all'. Provided {mode}"
-                ),
-            )
-        diff = pd.Series(np.diff(is_nan_series.values), index=is_nan_series.index[:-1])
-        gap_starts = diff[diff == 1].index + self._freq
-        gap_ends = diff[diff == -1].index
-
-        if is_nan_series.iloc[0] == 1:
-            gap_starts = gap_starts.insert(0, self.start_time())
-        if is_nan_series.iloc[-1] == 1:
-            gap_ends = gap_ends.insert(len(gap_ends), self.end_time())
-
-        gap_df = pd.DataFrame(columns=["gap_start", "gap_end"])
-
-        if gap_starts.size == 0:
-            return gap_df
-        else:
-
-            def intvl(start, end):
-                if self._has_datetime_index:
-                    return pd.date_range(start=start, end=end, freq=self._freq).size
-                else:
-                    return int((end - start) / self._freq) + 1
-
-            gap_df["gap_start"] = gap_starts
-            gap_df["gap_end"] = gap_ends
-            gap_df["gap_size"] = gap_df.apply(
-                lambda row: intvl(start=row.gap_start, end=row.gap_end), axis=1
-            )
-
-            return gap_df
+        _check_gap_mode(mode)
+        _, gap_starts, gap_ends = _nan_runs([self], how=mode)
+        if not len(gap_starts):
+            return pd.DataFrame(columns=["gap_start", "gap_end"])
+        return pd.DataFrame({
+            "gap_start": self._time_index[gap_starts],
+            "gap_end": self._time_index[gap_ends],
+            "gap_size": gap_ends - gap_starts + 1,
+        })
 
     def copy(self) -> Self:
         """Create a copy of the series.
@@ -2353,13 +3110,16 @@ class TimeSeries:
             A copy of the series.
         """
 
-        # the data will be copied in the TimeSeries constructor.
-        return self.__class__(
+        static_covariates = self.static_covariates
+        return self._from_trusted(
             times=self._time_index,
-            values=self._values,
+            values=self._values.copy(),
             components=self.components,
-            copy=True,
-            **self._attrs,
+            static_covariates=(
+                static_covariates.copy() if static_covariates is not None else None
+            ),
+            hierarchy=self.hierarchy,
+            metadata=self.metadata,
         )
 
     def get_index_at_point(self, point: pd.Timestamp | float | int, after=True) -> int:
@@ -2424,14 +3184,7 @@ class TimeSeries:
                     ),
                 )
             self._raise_if_not_within(point)
-            if point in self:
-                point_index = self._time_index.get_loc(point)
-            else:
-                point_index = self._time_index.get_loc(
-                    self._get_first_timestamp_after(point)
-                    if after
-                    else self._get_last_timestamp_before(point)
-                )
+            point_index = self._get_index_position(point, after=after)
         else:
             raise_log(
                 TypeError(
@@ -2604,15 +3357,9 @@ class TimeSeries:
                         "indexed using an integer-based RangeIndex."
                     ),
                 )
-            if start_ts in self._time_index and end_ts in self._time_index:
-                return self[
-                    start_ts:end_ts
-                ]  # we assume this is faster than the filtering below
-            else:
-                idx = self._time_index[
-                    (start_ts <= self._time_index) & (self._time_index <= end_ts)
-                ]
-                return self[idx]
+            start = max(self._get_index_position(start_ts, after=True), 0)
+            end = max(self._get_index_position(end_ts, after=False) + 1, start)
+            return self[start:end]
         else:
             if self._has_datetime_index:
                 raise_log(
@@ -2623,7 +3370,7 @@ class TimeSeries:
                 )
             # get closest timestamp if either start or end are not in the index
             effective_start_ts = (
-                min(self._time_index, key=lambda t: abs(t - start_ts))
+                self._get_closest_time(start_ts)
                 if start_ts not in self._time_index
                 else start_ts
             )
@@ -2633,7 +3380,7 @@ class TimeSeries:
                 effective_start_ts += self.freq
 
             effective_end_ts = (
-                min(self._time_index, key=lambda t: abs(t - end_ts))
+                self._get_closest_time(end_ts)
                 if end_ts not in self._time_index
                 else end_ts
             )
@@ -2667,8 +3414,7 @@ class TimeSeries:
             return self[pd.RangeIndex(start=start_ts, stop=start_ts + n)]
         elif isinstance(start_ts, pd.Timestamp):
             # get first timestamp greater or equal to start_ts
-            tss = self._get_first_timestamp_after(start_ts)
-            point_index = self.get_index_at_point(tss)
+            point_index = self._get_index_position(start_ts, after=True)
             return self[point_index : point_index + n]
         else:
             raise_log(
@@ -2698,8 +3444,7 @@ class TimeSeries:
             return self[pd.RangeIndex(start=end_ts - n + 1, stop=end_ts + 1)]
         elif isinstance(end_ts, pd.Timestamp):
             # get last timestamp smaller or equal to start_ts
-            tss = self._get_last_timestamp_before(end_ts)
-            point_index = self.get_index_at_point(tss)
+            point_index = self._get_index_position(end_ts, after=False)
             return self[max(0, point_index - n + 1) : point_index + 1]
         else:
             raise_log(
@@ -2722,7 +3467,7 @@ class TimeSeries:
             A new series, containing the values of this series, over the time-span common to both series.
         """
         if other.has_same_time_as(self):
-            return self.copy()
+            return self._with_trusted_values(self._values)
         elif other.freq == self.freq and len(self) and len(other):
             start, end = self._slice_intersect_bounds(other)
             return self[start:end]
@@ -2832,13 +3577,7 @@ class TimeSeries:
         first_finite_row, last_finite_row = _finite_rows_boundaries(
             self.values(copy=False), how=how
         )
-
-        return self.__class__(
-            times=self._time_index[first_finite_row : last_finite_row + 1],
-            values=self._values[first_finite_row : last_finite_row + 1],
-            components=self.components,
-            **self._attrs,
-        )
+        return self[first_finite_row : last_finite_row + 1]
 
     def longest_contiguous_slice(
         self, max_gap_size: int = 0, mode: str = "all"
@@ -2867,30 +3606,8 @@ class TimeSeries:
         TimeSeries.gaps : return the gaps in the TimeSeries
         """
         if not (np.isnan(self._values)).any():
-            return self.copy()
-        stripped_series = self.strip()
-        gaps = stripped_series.gaps(mode=mode)
-        relevant_gaps = gaps[gaps["gap_size"] > max_gap_size]
-
-        curr_slice_start = stripped_series.start_time()
-        max_size = pd.Timedelta(days=0) if self._has_datetime_index else 0
-        max_slice_start = None
-        max_slice_end = None
-        for index, row in relevant_gaps.iterrows():
-            # evaluate size of the current slice. the slice ends one time step before row['gap_start']
-            curr_slice_end = row["gap_start"] - self.freq
-            size = curr_slice_end - curr_slice_start
-            if size > max_size:
-                max_size = size
-                max_slice_start = curr_slice_start
-                max_slice_end = row["gap_start"] - self._freq
-            curr_slice_start = row["gap_end"] + self._freq
-
-        if stripped_series.end_time() - curr_slice_start > max_size:
-            max_slice_start = curr_slice_start
-            max_slice_end = self.end_time()
-
-        return stripped_series[max_slice_start:max_slice_end]
+            return self._with_trusted_values(self._values)
+        return longest_contiguous_slice([self], max_gap_size=max_gap_size, mode=mode)[0]
 
     def rescale_with_value(self, value_at_first_step: float) -> Self:
         """Return a new series, which is a multiple of this series such that the first value is `value_at_first_step`.
@@ -2911,7 +3628,7 @@ class TimeSeries:
             raise_log(ValueError("Cannot rescale with first value `0`."))
         coef = value_at_first_step / self._values[:1]
         coef = _maybe_cast_array_dtype(coef, self.dtype)
-        return self.__class__(
+        return self._from_trusted(
             times=self._time_index,
             values=self._values * coef,
             components=self.components,
@@ -2955,10 +3672,14 @@ class TimeSeries:
         if self.has_range_index:
             new_time_index = self._time_index + n * self.freq
         else:
-            new_time_index = self._time_index.map(lambda ts: ts + n * self.freq)
-            if new_time_index.freq is None:
-                new_time_index.freq = self.freq
-        return self.__class__(
+            # the shifted index is regular with the same frequency; avoid shifting each timestamp
+            new_time_index = generate_index(
+                start=self.start_time() + n * self.freq,
+                length=len(self),
+                freq=self.freq,
+                name=self._time_index.name,
+            )
+        return self._from_trusted(
             times=new_time_index,
             values=self._values,
             components=self.components,
@@ -3015,7 +3736,7 @@ class TimeSeries:
         values, times = _compute_diff(self._values, self._time_index)
         for _ in range(n - 1):
             values, times = _compute_diff(values, times)
-        return self.__class__(
+        return self._from_trusted(
             times=times,
             values=values,
             components=self.components,
@@ -3030,7 +3751,7 @@ class TimeSeries:
         TimeSeries
             A new series, with the cumulatively summed values.
         """
-        return self.__class__(
+        return self._from_trusted(
             times=self._time_index,
             values=self._values.cumsum(axis=0),
             components=self.components,
@@ -3050,7 +3771,10 @@ class TimeSeries:
         bool
             `True` if both series have the same index, `False` otherwise.
         """
-        if len(other) != len(self):
+        if other._time_index is self._time_index:
+            # regular time indexes are interned
+            return True
+        elif len(other) != len(self):
             return False
         elif other.freq != self.freq:
             return False
@@ -3107,6 +3831,7 @@ class TimeSeries:
             times=times,
             values=values,
             components=self.components,
+            copy=False,
             **self._attrs,
         )
 
@@ -3130,7 +3855,7 @@ class TimeSeries:
         TimeSeries.prepend_values : prepend the values of another series along the time axis.
         """
         if len(values) == 0:
-            return self.copy()
+            return self._with_trusted_values(self._values)
 
         values = np.array(values) if not isinstance(values, np.ndarray) else values
         values = expand_arr(values, ndim=len(DIMS))
@@ -3152,7 +3877,11 @@ class TimeSeries:
 
         return self.append(
             self.__class__(
-                values=values, times=idx, components=self.components, **self._attrs
+                values=values,
+                times=idx,
+                components=self.components,
+                copy=False,
+                **self._attrs,
             )
         )
 
@@ -3206,6 +3935,7 @@ class TimeSeries:
             times=times,
             values=values,
             components=self.components,
+            copy=False,
             **self._attrs,
         )
 
@@ -3229,7 +3959,7 @@ class TimeSeries:
         TimeSeries.append_values : append the values of another series along the time axis.
         """
         if len(values) == 0:
-            return self.copy()
+            return self._with_trusted_values(self._values)
 
         values = np.array(values) if not isinstance(values, np.ndarray) else values
         values = expand_arr(values, ndim=len(DIMS))
@@ -3254,6 +3984,7 @@ class TimeSeries:
                 times=idx,
                 values=values,
                 components=self.columns,
+                copy=False,
                 **self._attrs,
             )
         )
@@ -3331,17 +4062,16 @@ class TimeSeries:
         TimeSeries
             A new series with the new values but same index, static covariates and hierarchy
         """
-        values = np.array(values) if not isinstance(values, np.ndarray) else values
-        values = expand_arr(values, ndim=len(DIMS))
-        if values.shape[:2] != self.shape[:2]:
+        # always copy, the new series must not share memory with the input `values`
+        values = expand_arr(np.array(values, dtype=self.dtype), ndim=len(DIMS))
+        if values.ndim != len(DIMS) or values.shape[:2] != self.shape[:2]:
             raise_log(
                 ValueError(
                     "The new values must have the same shape (time, components) as the present series. "
                     f"Received: {values.shape[:2]}, expected: {self.shape[:2]}"
                 ),
             )
-        values = _maybe_cast_array_dtype(values, self.dtype)
-        return self.__class__(
+        return self._from_trusted(
             times=self._time_index,
             values=values,
             components=self.components,
@@ -3407,6 +4137,7 @@ class TimeSeries:
             static_covariates=covariates,
             hierarchy=self.hierarchy,
             metadata=self.metadata,
+            copy=False,
         )
 
     def with_hierarchy(self, hierarchy: dict[str, str | list[str]]) -> Self:
@@ -3447,6 +4178,7 @@ class TimeSeries:
             static_covariates=self.static_covariates,
             hierarchy=hierarchy,
             metadata=self.metadata,
+            copy=False,
         )
 
     def with_metadata(self, metadata: dict | None) -> Self:
@@ -3479,25 +4211,31 @@ class TimeSeries:
             static_covariates=self.static_covariates,
             hierarchy=self.hierarchy,
             metadata=metadata,
+            copy=False,
         )
 
-    def stack(self, other: Self) -> Self:
+    def stack(self, other: Self | Sequence[Self]) -> Self:
         """Return a new series with the `other` series stacked to this series along the component axis.
 
         The resulting TimeSeries will have the same name for its time dimension as this TimeSeries, and the
         same number of samples.
 
+        To stack many series, pass them all at once instead of stacking them one by one: the values are then
+        copied only once into the resulting series.
+
         Parameters
         ----------
         other
-            A TimeSeries instance with the same index and the same number of samples as the current one.
+            A TimeSeries instance (or a sequence of TimeSeries) with the same index and the same number of samples as
+            the current one.
 
         Returns
         -------
         TimeSeries
             A new series with the components of the other series added to the original.
         """
-        return concatenate([self, other], axis=1)
+        other = [other] if isinstance(other, TimeSeries) else list(other)
+        return concatenate([self] + other, axis=1)
 
     def drop_columns(self, col_names: list[str] | str) -> Self:
         """Return a new series with dropped components (columns).
@@ -3538,6 +4276,7 @@ class TimeSeries:
             ),
             hierarchy=None,
             metadata=self.metadata,
+            copy=False,
         )
 
     def univariate_component(self, index: str | int) -> Self:
@@ -3730,29 +4469,18 @@ class TimeSeries:
         [[0.5]
         [2.5]
         [4.5]]
-        """
-        import xarray as xr
-
-        method_kwargs = method_kwargs or {}
-        if isinstance(freq, pd.DateOffset):
-            freq = freq.freqstr
-
-        resample = self.data_array(copy=False).resample(
-            indexer={self._time_dim: freq},
-            **kwargs,
-        )
-
-        if method in SUPPORTED_RESAMPLE_METHODS:
-            applied_method = getattr(xr.core.resample.DataArrayResample, method)
-            new_xa = applied_method(resample, **method_kwargs)
 
-            # Convert boolean to int as Timeseries must contain numeric values only
-            # method: "all", "any"
-            if new_xa.dtype == "bool":
-                new_xa = new_xa.astype(int)
-        else:
-            raise_log(ValueError(f"Unknown method: {method}"))
-        return self.__class__.from_xarray(new_xa)
+        Notes
+        -----
+        The methods "first", "interpolate", "last", "max", "mean", "min", and "sum" without `method_kwargs` are
+        computed with NumPy for series with a ``pandas.DatetimeIndex`` (and `kwargs` among "closed", "label",
+        "offset", and "origin"), which is considerably faster than xarray and keeps the dtype of the series. The
+        :class:`~darts.dataprocessing.transformers.resampler.Resampler` additionally resamples many series sharing
+        the same time index at once.
+        """
+        return _resample(
+            [self], freq=freq, method=method, method_kwargs=method_kwargs, **kwargs
+        )[0]
 
     def is_within_range(self, ts: pd.Timestamp | int) -> bool:
         """Whether the given timestamp or integer is within the time interval of the series.
@@ -3869,6 +4597,7 @@ class TimeSeries:
             times=self._time_index,
             values=values,
             components=self.components,
+            copy=False,
             **self._attrs,
         )
 
@@ -4001,358 +4730,24 @@ class TimeSeries:
             ewm_mean_comp_1 (i.e., window_mode= ewm, function_name = mean, original_comp_name=comp_1);
             expanding_sum_3_comp_2 (i.e., window_mode= expanding, function_name = sum, window_size=3,
             original_comp_name=comp_2). For user-defined functions, function_name = udf.
-        """
-        VALID_BFILL_NA = {"bfill", "backfill"}
-        VALID_TREAT_NA = VALID_BFILL_NA.union({"dropna"})
-
-        PD_WINDOW_OPERATIONS = {
-            "rolling": pd.DataFrame.rolling,
-            "expanding": pd.DataFrame.expanding,
-            "ewm": pd.DataFrame.ewm,
-        }
-
-        # helper function to read and format kwargs
-        def _get_kwargs(transformation, forecasting_safe):
-            """
-            Builds the kwargs dictionary for the transformation function.
-
-            Parameters
-            ----------
-            transformation
-                The transformation dictionary.
-            builtins
-                The built-in transformations read from the WindowTransformer class.
-
-            Returns
-            -------
-            dict, dict
-                The kwargs dictionaries for both the function group and the specific function.
-            """
-
-            # take expanding as the default window operation if not specified, safer than rolling
-            mode = transformation.get("mode", "expanding")
-            if mode not in PD_WINDOW_OPERATIONS.keys():
-                raise_log(
-                    ValueError(
-                        f"Invalid window operation: '{mode}'. Must be one of {PD_WINDOW_OPERATIONS.keys()}."
-                    ),
-                )
-            window_mode = PD_WINDOW_OPERATIONS[mode]
-
-            # minimum number of observations in window required to have a value (otherwise result in NaN)
-            if "min_periods" not in transformation:
-                transformation["min_periods"] = 0 if mode == "ewm" else 1
-
-            if mode == "rolling":
-                # pandas default for 'center' is False, no need to set it explicitly
-                if "center" in transformation:
-                    if transformation["center"] and forecasting_safe:
-                        raise_log(
-                            ValueError(
-                                "When `forecasting_safe` is True, `center` must be False."
-                            ),
-                        )
-
-            if isinstance(transformation["function"], Callable):
-                fn = "apply"
-                udf = transformation["function"]
-                # make sure that we provide a numpy array to the user function, "raw": True
-                if "raw" not in transformation:
-                    transformation["raw"] = True
-            elif isinstance(transformation["function"], str):
-                fn = transformation["function"]
-            else:
-                raise_log(
-                    ValueError(
-                        "Transformation function must be a string or a callable. "
-                        "String can be the name of any function available for pandas window. "
-                        "A list of those function can be found in the `documentation "
-                        "<https://pandas.pydata.org/pandas-docs/stable/reference/window.html>`."
-                    ),
-                )
-
-            available_keys = set(transformation.keys()) - {
-                "function",
-                "group",
-                "components",
-                "function_name",
-            }
-
-            window_mode_expected_args = set(window_mode.__code__.co_varnames)
-            window_mode_available_keys = window_mode_expected_args.intersection(
-                available_keys
-            )
-
-            window_mode_available_kwargs = {
-                k: v
-                for k, v in transformation.items()
-                if k in window_mode_available_keys
-            }
-
-            available_keys -= window_mode_available_keys
-
-            function_expected_args = set(
-                getattr(
-                    getattr(pd.DataFrame(), window_mode.__name__)(
-                        **window_mode_available_kwargs
-                    ),
-                    fn,
-                ).__code__.co_varnames
-            )
-
-            function_available_keys = function_expected_args.intersection(
-                set(available_keys)
-            )
-
-            function_available_kwargs = {
-                k: v for k, v in transformation.items() if k in function_available_keys
-            }
-
-            available_keys -= function_available_keys
-
-            udf_expected_args = set(udf.__code__.co_varnames) if fn == "apply" else None
-            udf_available_keys = (
-                udf_expected_args.intersection(set(available_keys))
-                if fn == "apply"
-                else None
-            )
-
-            udf_kwargs = (
-                {k: v for k, v in transformation.items() if k in udf_available_keys}
-                if fn == "apply"
-                else None
-            )
-
-            function_available_kwargs.update(
-                {"func": udf, "kwargs": udf_kwargs} if fn == "apply" else {}
-            )
-
-            return (window_mode.__name__, window_mode_available_kwargs), (
-                fn,
-                function_available_kwargs,
-            )
-
-        # make sure we have a list in transforms
-        if isinstance(transforms, dict):
-            transforms = [transforms]
-
-        # check if some transformations are applied to the same components
-        overlapping_transforms = False
-        transformed_components = set()
-        for tr in transforms:
-            if not isinstance(tr, dict):
-                raise_log(
-                    ValueError("Every entry in `transforms` must be a dictionary"),
-                )
-            tr_comps = set(tr["components"] if "components" in tr else self.components)
-            if len(transformed_components.intersection(tr_comps)) > 0:
-                overlapping_transforms = True
-            transformed_components = transformed_components.union(tr_comps)
-
-        if keep_names and overlapping_transforms:
-            raise_log(
-                ValueError(
-                    "Cannot keep the original component names as some transforms are overlapping "
-                    "(applied to the same components). Set `keep_names` to `False`."
-                ),
-            )
-
-        # actually, this could be allowed to allow transformation "in place"?
-        # keep_non_transformed can be changed to False/ignored if the transforms are not partial
-        if keep_names and keep_non_transformed:
-            raise_log(
-                ValueError(
-                    "`keep_names = True` and `keep_non_transformed = True` cannot be used together."
-                ),
-            )
-
-        partial_transforms = transformed_components != set(self.components)
-        new_hierarchy = None
-        convert_hierarchy = False
-        comp_names_map = dict()
-        if self.hierarchy:
-            # the partial_transform covers for scenario keep_non_transformed = True
-            if len(transforms) > 1 or partial_transforms:
-                logger.warning(
-                    "The hierarchy cannot be retained, either because there is more than one transform or "
-                    "because the transform is not applied to all the components of the series."
-                )
-            else:
-                convert_hierarchy = True
-
-        if not all([isinstance(tr, dict) for tr in transforms]):
-            raise_log(
-                ValueError(
-                    "`transforms` must be a non-empty dictionary or a non-empty list of dictionaries."
-                ),
-            )
-
-        # read series DataFrame
-        ts_df = self.to_dataframe(copy=False, suppress_warnings=True)
-
-        # store some original attributes of the series
-        original_components = self.components
-        n_samples = self.n_samples
-        original_index = self._time_index
-
-        resulting_transformations = pd.DataFrame()
-        new_columns = []
-        added_na = []
-
-        # run through all transformations in transforms
-        for transformation in transforms:
-            if "components" in transformation:
-                if isinstance(transformation["components"], str):
-                    transformation["components"] = [transformation["components"]]
-                comps_to_transform = transformation["components"]
-
-            else:
-                comps_to_transform = original_components
-
-            df_cols = ts_df.columns
-
-            if not self.is_deterministic:
-                filter_df_columns = [
-                    df_col
-                    for df_col in df_cols
-                    if re.sub("_s.*$", "", df_col) in comps_to_transform
-                ]
-
-            else:
-                filter_df_columns = [df_col for df_col in comps_to_transform]
-
-            (window_mode, window_mode_kwargs), (fn, function_kwargs) = _get_kwargs(
-                transformation, forecasting_safe
-            )
-
-            closed = transformation.get("closed", None)
-            if not include_current:
-                if window_mode == "rolling":
-                    shifts = 0 if closed == "left" else 1  # avoid shifting twice
-                else:
-                    shifts = 1
-            else:
-                shifts = 0
-
-            resulting_transformations = pd.concat(
-                [
-                    resulting_transformations,
-                    getattr(
-                        getattr(ts_df[filter_df_columns], window_mode)(
-                            **window_mode_kwargs
-                        ),
-                        fn,
-                    )(**function_kwargs).shift(periods=shifts),
-                ],
-                axis=1,
-            )
-            min_periods = transformation["min_periods"]
-            # set new columns names
-            fn_name = transformation.get("function_name")
-            if fn_name:
-                function_name = fn_name
-            else:
-                function_name = fn if fn != "apply" else "udf"
-            name_prefix = (
-                f"{window_mode}_{function_name}"
-                f"{'_' + str(transformation['window']) if 'window' in transformation else ''}"
-                f"{'_' + str(min_periods) if min_periods > 1 else ''}"
-            )
-
-            if keep_names:
-                new_columns.extend(comps_to_transform)
-            else:
-                names_w_prefix = [
-                    f"{name_prefix}_{comp_name}" for comp_name in comps_to_transform
-                ]
-                new_columns.extend(names_w_prefix)
-                if convert_hierarchy:
-                    comp_names_map.update({
-                        c_name: new_c_name
-                        for c_name, new_c_name in zip(
-                            comps_to_transform, names_w_prefix
-                        )
-                    })
-
-        # Detect actual leading NaN count per transformed column.
-        # More robust than predicting from window params, as some functions
-        # (e.g., std with ddof=1) produce NaN even when min_periods is satisfied.
-        if treat_na is not None:
-            na_mask = np.isnan(resulting_transformations.values)
-            has_na = na_mask.any(axis=0)
-            first_valid = np.where(has_na, np.argmax(~na_mask, axis=0), 0)
-            added_na = first_valid.tolist()
-
-        # keep all original components
-        if keep_non_transformed:
-            resulting_transformations = pd.concat(
-                [resulting_transformations, ts_df], axis=1
-            )
-            new_columns.extend(original_components)
-
-        # Treat NaNs that were introduced by the transformations only
-        # Default to leave NaNs
-        if isinstance(treat_na, str):
-            if treat_na not in VALID_TREAT_NA:
-                raise_log(
-                    ValueError(
-                        f"`treat_na` must be one of {VALID_TREAT_NA} or a scalar, but found {treat_na}",
-                    ),
-                )
-
-            if treat_na in VALID_BFILL_NA and forecasting_safe:
-                raise_log(
-                    ValueError(
-                        "when `forecasting_safe` is True, back filling NaNs is not allowed as "
-                        "it risks contaminating past time steps with future values."
-                    ),
-                )
-
-        if isinstance(treat_na, int | float) or (treat_na in VALID_BFILL_NA):
-            for i in range(0, len(added_na), n_samples):
-                s_idx = added_na[i : (i + n_samples)][0]
-                value = (
-                    treat_na
-                    if isinstance(treat_na, int | float)
-                    else resulting_transformations.values[s_idx, i : (i + n_samples)]
-                )
-                resulting_transformations.iloc[:s_idx, i : (i + n_samples)] = value
-        elif treat_na == "dropna":
-            # can only drop the NaN rows that are common among the columns
-            drop_before_index = original_index[np.min(added_na)]
-            resulting_transformations = resulting_transformations.loc[
-                drop_before_index:
-            ]
-
-        # revert DataFrame to TimeSeries
-        new_index = original_index.__class__(resulting_transformations.index)
-
-        if convert_hierarchy:
-            if keep_names:
-                new_hierarchy = self.hierarchy
-            else:
-                new_hierarchy = {
-                    comp_names_map[k]: [comp_names_map[old_name] for old_name in v]
-                    for k, v in self.hierarchy.items()
-                }
-
-        resulting_transformations = resulting_transformations.values.reshape(
-            len(new_index), -1, n_samples
-        )
-        resulting_transformations = _maybe_cast_array_dtype(
-            resulting_transformations, self.dtype
-        )
-        transformed_time_series = TimeSeries(
-            times=new_index,
-            values=resulting_transformations,
-            components=new_columns,
-            static_covariates=self.static_covariates,
-            hierarchy=new_hierarchy,
-            metadata=self.metadata,
-            copy=False,
-        )
 
-        return transformed_time_series
+        Notes
+        -----
+        The builtin rolling `sum`, `mean`, `std`, `var`, `min`, `max`, `median` and `quantile`, expanding `sum`,
+        `mean`, `min` and `max`, and exponentially weighted `mean` functions with integer windows are computed with
+        NumPy instead of pandas, which is considerably faster. The results can differ from pandas by floating point
+        rounding errors. All other transformations (user-defined functions, offset windows, centered windows,
+        ...) are computed with pandas.
+        """
+        return _window_transform(
+            [self],
+            transforms=transforms,
+            treat_na=treat_na,
+            forecasting_safe=forecasting_safe,
+            keep_non_transformed=keep_non_transformed,
+            include_current=include_current,
+            keep_names=keep_names,
+        )[0]
 
     def to_json(self) -> str:
         """Return a JSON string representation of the deterministic series.
@@ -4418,46 +4813,151 @@ class TimeSeries:
         with open(path, "wb") as fh:
             pickle.dump(self, fh, protocol=protocol)
 
-    def plot(
-        self,
-        new_plot: bool = False,
-        central_quantile: float | str = 0.5,
-        low_quantile: float | None = 0.05,
-        high_quantile: float | None = 0.95,
-        default_formatting: bool = True,
-        title: str | None = None,
-        label: str | Sequence[str] | None = "",
-        max_nr_components: int = 10,
-        ax: matplotlib.axes.Axes | None = None,
-        alpha: float | None = None,
-        color: str | tuple | Sequence[str, tuple] | None = None,
-        c: str | tuple | Sequence[str, tuple] | None = None,
-        *args,
-        **kwargs,
-    ) -> matplotlib.axes.Axes:
-        """Plot the series using Matplotlib.
+    def save_memmap(self, path: str):
+        """Save the series to a directory from which it can be loaded with memory-mapped values.
+
+        The values are written to a NumPy `.npy` file, and the time index, components, static covariates, hierarchy
+        and metadata to a pickle file. Use :meth:`TimeSeries.load_memmap()` to load the series without reading the
+        values into memory.
 
         Parameters
         ----------
-        new_plot
-            Whether to spawn a new axis to plot on. See also parameter `ax`.
-        central_quantile
-            The quantile (between 0 and 1) to plot as a "central" value, if the series is stochastic (i.e., if
-            it has multiple samples). This will be applied on each component separately (i.e., to display quantiles
-            of the components' marginal distributions). For instance, setting `central_quantile=0.5` will plot the
-            median of each component. `central_quantile` can also be set to 'mean'.
-        low_quantile
-            The quantile to use for the lower bound of the plotted confidence interval. Similar to `central_quantile`,
-            this is applied to each component separately (i.e., displaying marginal distributions). No confidence
-            interval is shown if `low_quantile` is None (default 0.05).
-        high_quantile
-            The quantile to use for the upper bound of the plotted confidence interval. Similar to `central_quantile`,
-            this is applied to each component separately (i.e., displaying marginal distributions). No confidence
-            interval is shown if `high_quantile` is None (default 0.95).
-        default_formatting
-            Whether to use the darts default scheme.
-        title
-            Optionally, a plot title.
+        path
+            The directory to save the series to. It is created if it does not exist.
+
+        See Also
+        --------
+        TimeSeries.load_memmap : Load a series with memory-mapped values.
+        """
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, MEMMAP_VALUES_FILE), self._values)
+        attrs = {
+            "start": self.start_time(),
+            "length": len(self),
+            "freq": self.freq,
+            "time_name": self._time_index.name,
+            "components": self.components,
+            **self._attrs,
+        }
+        with open(os.path.join(path, MEMMAP_ATTRS_FILE), "wb") as fh:
+            pickle.dump(attrs, fh, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def save_chunked(self, path: str, chunk_length: int = 10_000):
+        """Save the series to a directory from which it can be loaded lazily, chunk by chunk.
+
+        The values are split along the time axis into NumPy `.npy` files of `chunk_length` time steps, and the time
+        index, components, static covariates, hierarchy and metadata are written to a pickle file. Use
+        :meth:`TimeSeries.load_chunked()` to load the series without reading the values into memory.
+
+        Parameters
+        ----------
+        path
+            The directory to save the series to. It is created if it does not exist.
+        chunk_length
+            The number of time steps per chunk.
+
+        See Also
+        --------
+        TimeSeries.load_chunked : Load a series with lazily loaded values.
+        """
+        if not (isinstance(chunk_length, int) and chunk_length > 0):
+            raise_log(
+                ValueError(
+                    f"`chunk_length` must be a positive integer, received: {chunk_length}."
+                )
+            )
+        os.makedirs(path, exist_ok=True)
+        chunk_lengths = NpyChunkStore.save(path, self._values, chunk_length)
+        attrs = {
+            "start": self.start_time(),
+            "length": len(self),
+            "freq": self.freq,
+            "time_name": self._time_index.name,
+            "components": self.components,
+            "chunk_lengths": chunk_lengths,
+            "dtype": self.dtype,
+            **self._attrs,
+        }
+        with open(os.path.join(path, MEMMAP_ATTRS_FILE), "wb") as fh:
+            pickle.dump(attrs, fh, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def to_arrow(self) -> pa.RecordBatch:
+        """Return the long Arrow representation of the series.
+
+        See :func:`darts.timeseries.to_arrow()` for more information, and to convert a sequence of series at once.
+        Requires `pyarrow` to be installed.
+
+        Returns
+        -------
+        pyarrow.RecordBatch
+            The series in long format, with the static covariates, hierarchy and metadata stored in the schema
+            metadata.
+
+        See Also
+        --------
+        TimeSeries.from_arrow : Create a list of TimeSeries from their long Arrow representation.
+        """
+        return to_arrow(self)
+
+    def to_parquet(self, path: str, **kwargs):
+        """Write the series to a Parquet file.
+
+        See :func:`darts.timeseries.to_parquet()` for more information, and to write a sequence of series at once.
+        Requires `pyarrow` to be installed.
+
+        Parameters
+        ----------
+        path
+            The path of the Parquet file.
+        **kwargs
+            Additional keyword arguments passed to :func:`pyarrow.parquet.write_table()`.
+
+        See Also
+        --------
+        TimeSeries.from_parquet : Read a list of TimeSeries from a Parquet file.
+        """
+        to_parquet(self, path, **kwargs)
+
+    def plot(
+        self,
+        new_plot: bool = False,
+        central_quantile: float | str = 0.5,
+        low_quantile: float | None = 0.05,
+        high_quantile: float | None = 0.95,
+        default_formatting: bool = True,
+        title: str | None = None,
+        label: str | Sequence[str] | None = "",
+        max_nr_components: int = 10,
+        ax: matplotlib.axes.Axes | None = None,
+        alpha: float | None = None,
+        color: str | tuple | Sequence[str, tuple] | None = None,
+        c: str | tuple | Sequence[str, tuple] | None = None,
+        *args,
+        **kwargs,
+    ) -> matplotlib.axes.Axes:
+        """Plot the series using Matplotlib.
+
+        Parameters
+        ----------
+        new_plot
+            Whether to spawn a new axis to plot on. See also parameter `ax`.
+        central_quantile
+            The quantile (between 0 and 1) to plot as a "central" value, if the series is stochastic (i.e., if
+            it has multiple samples). This will be applied on each component separately (i.e., to display quantiles
+            of the components' marginal distributions). For instance, setting `central_quantile=0.5` will plot the
+            median of each component. `central_quantile` can also be set to 'mean'.
+        low_quantile
+            The quantile to use for the lower bound of the plotted confidence interval. Similar to `central_quantile`,
+            this is applied to each component separately (i.e., displaying marginal distributions). No confidence
+            interval is shown if `low_quantile` is None (default 0.05).
+        high_quantile
+            The quantile to use for the upper bound of the plotted confidence interval. Similar to `central_quantile`,
+            this is applied to each component separately (i.e., displaying marginal distributions). No confidence
+            interval is shown if `high_quantile` is None (default 0.95).
+        default_formatting
+            Whether to use the darts default scheme.
+        title
+            Optionally, a plot title.
         label
             Can either be a string or list of strings. If a string and the series only has a single component, it is
             used as the label for that component. If a string and the series has multiple components, it is used as
@@ -4655,6 +5155,7 @@ class TimeSeries:
             static_covariates=self.static_covariates,
             hierarchy=hierarchy,
             metadata=self.metadata,
+            copy=False,
         )
 
     """
@@ -4688,6 +5189,7 @@ class TimeSeries:
             times=times,
             values=values,
             components=components,
+            copy=False,
             **(self._attrs if axis != 1 else dict()),
         )
 
@@ -4706,11 +5208,18 @@ class TimeSeries:
         axis
             The axis to reduce over. The default is to calculate over samples, i.e. axis=2.
 
+        For quantile series (see :attr:`is_quantile`) and ``axis=2``, the median is interpolated from the quantile
+        levels, and the resulting components are named after the original components.
+
         Returns
         -------
         TimeSeries
             A new series with median applied to the indicated axis.
         """
+        if axis == 2 and self.is_quantile:
+            return self._quantile_from_levels(
+                0.5, components=self._quantile_encoding()[0]
+            )
         values = np.median(
             self._values, axis=axis, overwrite_input=False, keepdims=True
         )
@@ -4719,6 +5228,7 @@ class TimeSeries:
             times=times,
             values=values,
             components=components,
+            copy=False,
             **(self._attrs if axis != 1 else dict()),
         )
 
@@ -4748,6 +5258,7 @@ class TimeSeries:
             times=times,
             values=values,
             components=components,
+            copy=False,
             **(self._attrs if axis != 1 else dict()),
         )
 
@@ -4777,6 +5288,7 @@ class TimeSeries:
             times=times,
             values=values,
             components=components,
+            copy=False,
             **(self._attrs if axis != 1 else dict()),
         )
 
@@ -4806,6 +5318,7 @@ class TimeSeries:
             times=times,
             values=values,
             components=components,
+            copy=False,
             **(self._attrs if axis != 1 else dict()),
         )
 
@@ -4818,7 +5331,10 @@ class TimeSeries:
 
         The order of the component quantiles is: `[<c_1>_q<q_1>, ... <c_1>_q<q_2>, ..., <c_n>_q<q_n>]`.
 
-        This works only on stochastic series (i.e., with more than 1 sample).
+        This works only on stochastic series (i.e., with more than 1 sample), and on quantile series (see
+        :attr:`is_quantile`). For quantile series, the quantiles are linearly interpolated between the quantile levels
+        of the series, and `q` must lie within the range of these levels. With multiple quantiles, the result is a
+        quantile series itself, which takes much less memory than a stochastic series with many samples.
 
         Parameters
         ----------
@@ -4834,6 +5350,9 @@ class TimeSeries:
         TimeSeries
             A new series containing the desired quantile(s) of each component.
         """
+        if self.is_quantile:
+            return self._quantile_from_levels(q)
+
         self._assert_stochastic()
 
         # `q_arr` must be of same dtype to conserve it in `np.quantile`
@@ -4865,6 +5384,35 @@ class TimeSeries:
             copy=False,
         )
 
+    def _quantile_from_levels(
+        self, q: float | Sequence[float], components: pd.Index | None = None
+    ) -> Self:
+        """Return a deterministic series with the quantile(s) `q` of each component interpolated from the quantile
+        levels of a quantile series. Optionally, use custom component names (only with a single quantile)."""
+        comps, levels = self._quantile_encoding()
+        q_arr = np.array([q] if isinstance(q, float) else q, dtype=np.float64)
+        if not ((levels[0] <= q_arr) & (q_arr <= levels[-1])).all():
+            raise_log(
+                ValueError(
+                    f"The quantile values must be within the range of the quantile levels of the quantile series "
+                    f"`[{levels[0]}, {levels[-1]}]`. Received `q={q}`."
+                ),
+            )
+        values = self._values[:, :, 0].reshape(len(self), len(comps), len(levels))
+        values = _interpolate_quantiles(values, levels, q_arr).astype(
+            self.dtype, copy=False
+        )
+        if components is None:
+            components = pd.Index([
+                f"{comp}_q{q_i:.3f}" for comp in comps for q_i in q_arr
+            ])
+        return self.__class__._from_trusted(
+            times=self._time_index,
+            values=values.reshape(len(self), -1, 1),
+            components=components,
+            metadata=self.metadata,
+        )
+
     def var(self, ddof: int = 1) -> Self:
         """Return a deterministic series with the variance of each component computed over the samples of the
         stochastic series.
@@ -5257,10 +5805,54 @@ class TimeSeries:
             )
 
     def _get_first_timestamp_after(self, ts: pd.Timestamp) -> pd.Timestamp | int:
-        return next(filter(lambda t: t >= ts, self._time_index))
+        return self._time_index[self._get_index_position(ts, after=True)]
 
     def _get_last_timestamp_before(self, ts: pd.Timestamp) -> pd.Timestamp | int:
-        return next(filter(lambda t: t <= ts, self._time_index[::-1]))
+        return self._time_index[self._get_index_position(ts, after=False)]
+
+    def _regular_index_params(self) -> tuple[int, int] | None:
+        """Return the start and the fixed step size of the time index as integers (nanoseconds for a
+        `DatetimeIndex`), or `None` if the frequency has no fixed step size (e.g. "ME", "W", ...).
+        """
+        # cached on first access, like the start and end time
+        params = getattr(self, "_regular_index", False)
+        if params is False:
+            params = None
+            if not self._has_datetime_index:
+                params = (self._time_index.start, self._time_index.step)
+            elif pd.to_timedelta(self._freq, errors="coerce") is not pd.NaT:
+                params = (
+                    self.start_time().value,
+                    pd.to_timedelta(self._freq).value,
+                )
+            self._regular_index = params
+        return params
+
+    def _get_index_position(self, ts: pd.Timestamp | int, after: bool = True) -> int:
+        """Return the position of time `ts` in the time index. If `ts` is not in the index, returns the position of
+        the next (`after=True`) or previous (`after=False`) time step. The position can be out of bounds, in which
+        case it is either negative or `>=len(self)`.
+
+        For indexes with a fixed step size, the position is computed arithmetically from the start and step, without
+        searching the index.
+        """
+        params = self._regular_index_params()
+        if params is not None:
+            start, step = params
+            value = ts.value if isinstance(ts, pd.Timestamp) else ts
+            position, remainder = divmod(value - start, step)
+            return int(position) + int(after and remainder != 0)
+        position = self._time_index.searchsorted(ts, side="left" if after else "right")
+        return int(position) - int(not after)
+
+    def _get_closest_time(self, ts: pd.Timestamp | int) -> pd.Timestamp | int:
+        """Return the time in the index closest to `ts`. In case of a tie, the earlier time is returned."""
+        after = min(max(self._get_index_position(ts, after=True), 0), len(self) - 1)
+        before = min(max(self._get_index_position(ts, after=False), 0), len(self) - 1)
+        time_after, time_before = self._time_index[after], self._time_index[before]
+        return (
+            time_before if abs(ts - time_before) <= abs(time_after - ts) else time_after
+        )
 
     def _assert_univariate(self):
         if not self.is_univariate:
@@ -5278,6 +5870,18 @@ class TimeSeries:
                 ),
             )
 
+    def _quantile_encoding(self) -> tuple[pd.Index, np.ndarray] | None:
+        """Return the original component names and the quantile levels of a quantile series, or `None` if the series
+        is not a quantile series."""
+        # cached on first access, like the start and end time
+        encoding = getattr(self, "_quantiles", False)
+        if encoding is False:
+            encoding = None
+            if self.is_deterministic:
+                encoding = _parse_quantile_components(self.components)
+            self._quantiles = encoding
+        return encoding
+
     def _assert_stochastic(self):
         if not self.is_stochastic:
             raise_log(
@@ -5353,49 +5957,25 @@ class TimeSeries:
         return len(self._values)
 
     def __add__(self, other):
-        if isinstance(other, TimeSeries | np.ndarray) or _is_xarray(other):
-            other = self._extract_values(other)
-        elif not isinstance(other, int | float | np.integer):
-            raise_log(
-                TypeError(
-                    f"unsupported operand type(s) for + or add(): '{type(self).__name__}' and '{type(other).__name__}'."
-                ),
-            )
-        ts = self.copy()
-        np.add(ts._values, other, out=ts._values)
-        return ts
+        other = self._arithmetic_operand(other, "+ or add()")
+        values = np.add(self._values, other, out=np.empty_like(self._values))
+        return self._with_trusted_values(values)
 
     def __radd__(self, other):
         return self + other
 
     def __sub__(self, other):
-        if isinstance(other, TimeSeries | np.ndarray) or _is_xarray(other):
-            other = self._extract_values(other)
-        elif not isinstance(other, int | float | np.integer):
-            raise_log(
-                TypeError(
-                    f"unsupported operand type(s) for - or sub(): '{type(self).__name__}' and '{type(other).__name__}'."
-                ),
-            )
-        ts = self.copy()
-        np.subtract(ts._values, other, out=ts._values)
-        return ts
+        other = self._arithmetic_operand(other, "- or sub()")
+        values = np.subtract(self._values, other, out=np.empty_like(self._values))
+        return self._with_trusted_values(values)
 
     def __rsub__(self, other):
         return other + (-self)
 
     def __mul__(self, other):
-        if isinstance(other, TimeSeries | np.ndarray) or _is_xarray(other):
-            other = self._extract_values(other)
-        elif not isinstance(other, int | float | np.integer):
-            raise_log(
-                TypeError(
-                    f"unsupported operand type(s) for * or mul(): '{type(self).__name__}' and '{type(other).__name__}'."
-                ),
-            )
-        ts = self.copy()
-        np.multiply(ts._values, other, out=ts._values)
-        return ts
+        other = self._arithmetic_operand(other, "* or mul()")
+        values = np.multiply(self._values, other, out=np.empty_like(self._values))
+        return self._with_trusted_values(values)
 
     def __rmul__(self, other):
         return self * other
@@ -5415,51 +5995,67 @@ class TimeSeries:
                     f"unsupported operand type(s) for ** or pow(): '{type(self).__name__}' and '{type(n).__name__}'."
                 ),
             )
-        ts = self.copy()
-        np.power(ts._values, n, out=ts._values)
-        return ts
+        values = np.power(self._values, n, out=np.empty_like(self._values))
+        return self._with_trusted_values(values)
 
     def __truediv__(self, other):
-        if isinstance(other, int | float | np.integer):
-            if other == 0:
-                raise_log(ZeroDivisionError("Cannot divide by 0."))
-        elif isinstance(other, TimeSeries | np.ndarray) or _is_xarray(other):
-            other = self._extract_values(other)
+        other = self._divisor_operand(other, "/ or truediv()")
+        values = np.divide(self._values, other, out=np.empty_like(self._values))
+        return self._with_trusted_values(values)
+
+    def _arithmetic_operand(self, other, operator: str) -> np.ndarray | int | float:
+        """Return the values of the `other` operand of an arithmetic `operator`, with a shape compatible with this
+        series."""
+        if isinstance(other, TimeSeries):
+            return self._extract_values(other)
+        elif isinstance(other, int | float | np.integer):
+            return other
+        elif isinstance(other, np.ndarray) or _is_xarray(other):
+            return self._extract_values(other)
+        raise_log(
+            TypeError(
+                f"unsupported operand type(s) for {operator}: '{type(self).__name__}' and '{type(other).__name__}'."
+            ),
+        )
+
+    def _divisor_operand(self, other, operator: str) -> np.ndarray | int | float:
+        """Return the values of the divisor `other`, and check that it does not contain any zero."""
+        other = self._arithmetic_operand(other, operator)
+        if isinstance(other, np.ndarray):
             if (other == 0).any():
                 raise_log(
                     ZeroDivisionError("Cannot divide by a TimeSeries with a value 0."),
                 )
-        else:
-            raise_log(
-                TypeError(
-                    "unsupported operand type(s) for / or truediv():"
-                    f" '{type(self).__name__}' and '{type(other).__name__}'."
-                ),
-            )
-        ts = self.copy()
-        np.divide(ts._values, other, out=ts._values)
-        return ts
+        elif other == 0:
+            raise_log(ZeroDivisionError("Cannot divide by 0."))
+        return other
 
     def __rtruediv__(self, n):
         return n * (self ** (-1))
 
     def __abs__(self):
-        ts = self.copy()
-        np.absolute(ts._values, out=ts._values)
-        return ts
+        values = np.absolute(self._values, out=np.empty_like(self._values))
+        return self._with_trusted_values(values)
 
     def __neg__(self):
-        ts = self.copy()
-        np.negative(ts._values, out=ts._values)
-        return ts
+        values = np.negative(self._values, out=np.empty_like(self._values))
+        return self._with_trusted_values(values)
 
     def __contains__(self, ts: int | pd.Timestamp) -> bool:
-        return ts in self.time_index
+        if self._has_datetime_index:
+            fast_path = isinstance(ts, pd.Timestamp) and (ts.tz is None) == (
+                self._time_index.tz is None
+            )
+        else:
+            fast_path = isinstance(ts, int | np.integer) and not isinstance(ts, bool)
+        if fast_path:
+            position = self._get_index_position(ts, after=True)
+            return 0 <= position < len(self) and self._time_index[position] == ts
+        return ts in self._time_index
 
     def __round__(self, n=None):
-        ts = self.copy()
-        np.round(ts._values, n, out=ts._values)
-        return ts
+        values = np.round(self._values, n, out=np.empty_like(self._values))
+        return self._with_trusted_values(values)
 
     def __lt__(self, other) -> np.ndarray:
         if isinstance(other, TimeSeries | np.ndarray) or _is_xarray(other):
@@ -5615,6 +6211,40 @@ class TimeSeries:
             **deepcopy(self._attrs, memo),
         )
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # the read-only flag and the interned time index are lost when pickling
+        self._values = _read_only(self._values, owned=True)
+        self._time_index = _intern_time_index(self._time_index)
+
+    def _values_at(self, key: slice | np.ndarray) -> np.ndarray:
+        """Return the values at the time steps `key` for a new series.
+
+        The values are read-only, so slices are returned as views that share memory with this series instead of
+        copies.
+        """
+        return self._values[key]
+
+    def _with_trusted_values(self, values: np.ndarray) -> Self:
+        """Return a new series with the time index, components and attributes of this series, and `values`.
+
+        For internal use only; `values` must have the same shape and dtype as this series, and are not copied. They
+        must not be referenced elsewhere, unless they are already read-only.
+        """
+        if get_option("debug.validate_series"):
+            return self._from_trusted(
+                times=self._time_index,
+                values=values,
+                components=self._components,
+                **self._attrs,
+            )
+        # everything except the values is shared with this series, without deriving it again
+        series = self.__class__.__new__(self.__class__)
+        series.__dict__.update(self.__dict__)
+        series.__dict__.pop("_fingerprint", None)
+        series._values = _read_only(values, owned=True)
+        return series
+
     def __getitem__(
         self,
         key: pd.DatetimeIndex
@@ -5683,7 +6313,7 @@ class TimeSeries:
             if len(key) == 0:
                 # keep original frequency in case of empty index
                 times = self._time_index[:0]
-                values = self._values[:0]
+                values = self._values_at(slice(0))
             else:
                 idx = times.get_indexer(key)
                 if (idx < 0).any():
@@ -5700,7 +6330,13 @@ class TimeSeries:
                         start=times[0], stop=times[-1] + key.step, step=key.step
                     )
 
-            return self.__class__(
+            # the constructor must infer the frequency, or sort a reversed index
+            if is_dti:
+                is_trusted = times.freq is not None and times.freq.n > 0
+            else:
+                is_trusted = times.step > 0
+            ts_constructor = self._from_trusted if is_trusted else self.__class__
+            return ts_constructor(
                 times=times, values=values, components=self.components, **self._attrs
             )
         # handle slices:
@@ -5714,9 +6350,9 @@ class TimeSeries:
                         ),
                     )
                 else:
-                    return self.__class__(
+                    return self._from_trusted(
                         times=self._time_index[key],
-                        values=self._values[key],
+                        values=self._values_at(key),
                         components=self.components,
                         **self._attrs,
                     )
@@ -5742,13 +6378,23 @@ class TimeSeries:
                     ),
                     hierarchy=None,
                     metadata=self.metadata,
+                    copy=False,
                 )
             elif isinstance(key.start, int | np.int64) or isinstance(
                 key.stop, int | np.int64
             ):
-                return self.__class__(
+                if key.step is not None and key.step < 0:
+                    # reverse slices are sorted in the constructor
+                    return self.__class__(
+                        times=self._time_index[key],
+                        values=self._values[key],
+                        components=self.components,
+                        copy=False,
+                        **self._attrs,
+                    )
+                return self._from_trusted(
                     times=self._time_index[key],
-                    values=self._values[key],
+                    values=self._values_at(key),
                     components=self.components,
                     **self._attrs,
                 )
@@ -5782,9 +6428,9 @@ class TimeSeries:
                 else:
                     end = len(self) - 1
                 key = slice(start, end + 1, key.step)
-                return self.__class__(
+                return self._from_trusted(
                     times=self._time_index[key],
-                    values=self._values[key],
+                    values=self._values_at(key),
                     components=self.components,
                     **self._attrs,
                 )
@@ -5804,12 +6450,13 @@ class TimeSeries:
                 ),
                 hierarchy=None,
                 metadata=self.metadata,
+                copy=False,
             )
         elif isinstance(key, int | np.int64):
             key = slice(key, key + 1 if key != -1 else None)
-            ts = self.__class__(
+            ts = self._from_trusted(
                 times=self._time_index[key],
-                values=self._values[key],
+                values=self._values_at(key),
                 components=self.components,
                 **self._attrs,
             )
@@ -5820,9 +6467,9 @@ class TimeSeries:
             _check_dt()
             key = self._time_index.get_loc(key)
             key = slice(key, key + 1)
-            return self.__class__(
+            return self._from_trusted(
                 times=self._time_index[key],
-                values=self._values[key],
+                values=self._values_at(key),
                 components=self.components,
                 **self._attrs,
             )
@@ -5850,6 +6497,7 @@ class TimeSeries:
                     ),
                     hierarchy=None,
                     metadata=self.metadata,
+                    copy=False,
                 )
             elif all(isinstance(i, int | np.int64) for i in key):
                 # convert list of integers to slice (must have constant step size)
@@ -5882,332 +6530,1952 @@ class TimeSeries:
                     times=self._time_index[key],
                     values=self._values[key],
                     components=self.components,
+                    copy=False,
                     **self._attrs,
                 )
 
         raise_log(IndexError("The type of your index was not matched."))
 
 
-def _concat_static_covs(series: Sequence[TimeSeries]) -> pd.DataFrame | None:
-    """Concatenate static covariates along the component axis (rows of static covariates). Use this for stacking or
-    concatenating time series along component dimension (axis=1).
-
-    Some context for stacking or concatenating two or more TimeSeries with static covariates:
-
-    - Concat along axis=0 (time): Along the time dimension, we only take the static covariates of the first series (as
-      static covariates are time-independent).
-    - Concat along axis=1 (components) or stacking: Along the component dimension, we either concatenate or transfer
-      the static covariates of the series if one of below cases applies:
-      1) concatenate along component dimension (rows of static covariates) when for each series the number of static
-         covariate components is equal to the number of components in the series. The static variable names (columns in
-         series.static_covariates) must be identical across all series
-      2) if only the first series contains static covariates transfer only those
-      3) if `ignore_static_covariates=True` (with `concatenate()`), case 1) is ignored and only the static covariates
-         of the first series are transferred
-    - Concat along axis=2 (samples): Along the sample dimension, we only take the static covariates of the first series
-      (as the components and time don't change).
-    """
-
-    if not any([ts.has_static_covariates for ts in series]):
-        return None
+class TimeSeriesCollection(Sequence):
+    def __init__(
+        self,
+        values: np.ndarray,
+        offsets: np.ndarray | Sequence[int],
+        start_times: pd.DatetimeIndex | np.ndarray | Sequence[int],
+        freq: str | int | pd.DateOffset,
+        components: Sequence | str | None = None,
+        time_name: str | None = None,
+        static_covariates: pd.DataFrame | None = None,
+        hierarchy: dict | None = None,
+        metadata: Sequence[dict | None] | None = None,
+    ):
+        """A contiguous container for many ``TimeSeries`` sharing the same components, number of samples and
+        frequency.
 
-    only_first = series[0].has_static_covariates and not any([
-        ts.has_static_covariates for ts in series[1:]
-    ])
-    all_have = all([ts.has_static_covariates for ts in series])
+        All values are stored in one ragged array of shape `(sum of lengths, components, samples)`, where series `i`
+        occupies rows `offsets[i]` to `offsets[i + 1]`. The static covariates of all series are stored in one shared
+        table. Indexing the collection with an integer returns a ``TimeSeries`` whose values are a view (no copy) of
+        the shared buffer; indexing with a contiguous slice returns a new collection sharing the same buffer.
 
-    if not (only_first or all_have):
-        raise_log(
-            ValueError(
-                "Either none, only the first or all TimeSeries must have `static_covariates`."
-            ),
-        )
+        ``TimeSeriesCollection`` is a `Sequence[TimeSeries]` and can be used wherever Darts accepts a sequence of
+        series (models, metrics, data transformers, ...).
 
-    if only_first:
-        return series[0].static_covariates
+        See Also
+        --------
+        TimeSeriesCollection.from_series : Create a collection from a sequence of ``TimeSeries``.
 
-    if not (
-        all([len(ts.static_covariates) == ts.n_components for ts in series])
-        and all([
-            ts.static_covariates.columns.equals(series[0].static_covariates.columns)
-            for ts in series
-        ])
-    ):
-        raise_log(
-            ValueError(
-                "Concatenation of multiple TimeSeries with static covariates requires all `static_covariates` "
-                "DataFrames to have identical columns (static variable names), and the number of each TimeSeries' "
-                "components must match the number of corresponding static covariate components (the number of rows "
-                "in `series.static_covariates`)."
-            ),
-        )
+        Parameters
+        ----------
+        values
+            A Numpy array of shape `(sum of lengths, components)` or `(sum of lengths, components, samples)` with the
+            values of all series stacked along the time axis.
+        offsets
+            A monotonically increasing integer array of length `n_series + 1` with the row offsets of each series in
+            `values`. The first offset must be `0` and the last one `len(values)`.
+        start_times
+            The start time of each series. A `pandas.DatetimeIndex` for datetime-indexed series, or integers for
+            range-indexed series.
+        freq
+            The frequency shared by all series. A pandas frequency offset (or alias) for datetime-indexed series, or
+            the integer step size for range-indexed series.
+        components
+            Optionally, the component names shared by all series.
+        time_name
+            Optionally, the name of the time index of all series.
+        static_covariates
+            Optionally, a `pandas.DataFrame` with the static covariates of all series. It must have either one row
+            per series (global static covariates), or `n_components` rows per series (component-specific static
+            covariates), in the order of the series.
+        hierarchy
+            Optionally, a hierarchy shared by all series. See :class:`TimeSeries` for more information.
+        metadata
+            Optionally, a sequence with one metadata dictionary (or `None`) per series.
 
-    return pd.concat(
-        [ts.static_covariates for ts in series if ts.has_static_covariates], axis=0
-    )
+        Examples
+        --------
+        >>> from darts import TimeSeriesCollection
+        >>> from darts.utils.timeseries_generation import linear_timeseries
+        >>> series = [linear_timeseries(length=10), linear_timeseries(length=5)]
+        >>> collection = TimeSeriesCollection.from_series(series)
+        >>> len(collection), collection[1].shape
+        (2, (5, 1, 1))
+        """
+        values = _cast_to_compute_dtype(np.asarray(values))
+        values = expand_arr(values, ndim=len(DIMS))
+        if values.ndim != 3:
+            raise_log(
+                ValueError(
+                    f"TimeSeriesCollection requires a `values` array that has or can be expanded to "
+                    f"3 dimensions ({DIMS})."
+                ),
+            )
+
+        offsets = np.asarray(offsets, dtype=np.int64)
+        if (
+            offsets.ndim != 1
+            or len(offsets) < 1
+            or offsets[0] != 0
+            or offsets[-1] != len(values)
+            or (np.diff(offsets) < 0).any()
+        ):
+            raise_log(
+                ValueError(
+                    "`offsets` must be a monotonically increasing 1-D integer array starting at `0` and "
+                    "ending at `len(values)`."
+                ),
+            )
+        n_series = len(offsets) - 1
+
+        if isinstance(freq, str):
+            freq = to_offset(freq)
+        has_datetime_index = isinstance(freq, pd.DateOffset)
+        if has_datetime_index:
+            start_times = pd.DatetimeIndex(start_times)
+        else:
+            start_times = np.asarray(start_times, dtype=np.int64)
+        if len(start_times) != n_series:
+            raise_log(
+                ValueError(
+                    f"Expected one start time per series ({n_series}), received {len(start_times)}."
+                ),
+            )
+
+        if components is None:
+            components = pd.Index([str(idx) for idx in range(values.shape[COMP_AX])])
+        elif isinstance(components, str):
+            components = pd.Index([components])
+        elif not isinstance(components, pd.Index):
+            components = pd.Index(components)
+        if len(components) != values.shape[COMP_AX]:
+            raise_log(
+                ValueError(
+                    "The number of provided components must match the number of components from `values` "
+                    f"(`values.shape[1]`). Expected: `{values.shape[1]}`, received: `{len(components)}`."
+                ),
+            )
+        if len(set(components)) != len(components) or any([
+            not isinstance(s, str) for s in components
+        ]):
+            components = _clean_components(components)
+
+        static_cov_stride = 0
+        if static_covariates is not None:
+            if not isinstance(static_covariates, pd.DataFrame):
+                raise_log(
+                    ValueError(
+                        "`static_covariates` must be a pandas DataFrame or None"
+                    ),
+                )
+            if n_series and len(static_covariates) == n_series:
+                static_cov_stride = 1
+            elif n_series and len(static_covariates) == n_series * len(components):
+                static_cov_stride = len(components)
+            else:
+                raise_log(
+                    ValueError(
+                        "`static_covariates` must have either one row per series, or one row per series and "
+                        "component."
+                    ),
+                )
+            static_covariates = static_covariates.reset_index(drop=True)
+            static_covariates.columns.name = STATIC_COV_TAG
+            cols_to_cast = static_covariates.select_dtypes(
+                include=np.number, exclude=values.dtype
+            ).columns
+            if not cols_to_cast.empty:
+                static_covariates = static_covariates.astype({
+                    col: values.dtype for col in cols_to_cast
+                })
+
+        if metadata is not None:
+            metadata = list(metadata)
+            if len(metadata) != n_series:
+                raise_log(
+                    ValueError(
+                        f"Expected one metadata entry per series ({n_series}), received {len(metadata)}."
+                    ),
+                )
+
+        self._values = values
+        self._offsets = offsets
+        self._start_times = start_times
+        self._freq = freq
+        self._has_datetime_index = has_datetime_index
+        self._components = components
+        self._time_name = time_name
+        self._static_covariates = static_covariates
+        self._static_cov_stride = static_cov_stride
+        self._hierarchy = hierarchy
+        self._metadata = metadata
+
+    @classmethod
+    def from_series(cls, series: Sequence[TimeSeries]) -> Self:
+        """Create a ``TimeSeriesCollection`` from a sequence of ``TimeSeries``.
+
+        All series must have the same components, number of samples, type of time index and frequency. The values
+        are copied once into a single contiguous buffer.
+
+        Parameters
+        ----------
+        series
+            The sequence of series.
+
+        Returns
+        -------
+        TimeSeriesCollection
+            The resulting collection.
+        """
+        if isinstance(series, TimeSeries):
+            series = [series]
+        elif isinstance(series, TimeSeriesCollection):
+            return series
+        if not len(series):
+            raise_log(ValueError("`series` must contain at least one `TimeSeries`."))
+
+        first = series[0]
+        for ts in series[1:]:
+            if not ts.components.equals(first.components):
+                raise_log(
+                    ValueError("All series must have identical components."),
+                )
+            if ts.n_samples != first.n_samples:
+                raise_log(
+                    ValueError("All series must have the same number of samples."),
+                )
+            if (
+                ts.has_datetime_index != first.has_datetime_index
+                or ts.freq != first.freq
+            ):
+                raise_log(
+                    ValueError(
+                        "All series must have the same type of time index and frequency."
+                    ),
+                )
+            if ts.hierarchy != first.hierarchy:
+                raise_log(ValueError("All series must have the same hierarchy."))
+
+        lengths = np.fromiter((len(ts) for ts in series), dtype=np.int64)
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+        values = np.empty(
+            (offsets[-1], first.n_components, first.n_samples), dtype=first.dtype
+        )
+        for ts, start, end in zip(series, offsets[:-1], offsets[1:]):
+            values[start:end] = ts._values
+
+        if first.has_datetime_index:
+            start_times = pd.DatetimeIndex([ts.start_time() for ts in series])
+        else:
+            start_times = np.array([ts.start_time() for ts in series], dtype=np.int64)
+
+        static_covariates = None
+        has_static_covs = [ts.has_static_covariates for ts in series]
+        if any(has_static_covs):
+            if not all(has_static_covs):
+                raise_log(
+                    ValueError(
+                        "Either none or all series must have `static_covariates`."
+                    ),
+                )
+            n_rows = {len(ts.static_covariates) for ts in series}
+            if len(n_rows) > 1 or not all(
+                ts.static_covariates.columns.equals(first.static_covariates.columns)
+                for ts in series
+            ):
+                raise_log(
+                    ValueError(
+                        "All `static_covariates` must have identical columns (static variable names) and the "
+                        "same number of rows (global or component-specific)."
+                    ),
+                )
+            static_covariates = pd.concat(
+                [ts.static_covariates for ts in series], axis=0, ignore_index=True
+            )
+
+        metadata = None
+        if any(ts.has_metadata for ts in series):
+            metadata = [ts.metadata for ts in series]
+
+        return cls(
+            values=values,
+            offsets=offsets,
+            start_times=start_times,
+            freq=first.freq,
+            components=first.components,
+            time_name=first._time_index.name,
+            static_covariates=static_covariates,
+            hierarchy=first.hierarchy,
+            metadata=metadata,
+        )
+
+    @classmethod
+    def load_memmap(cls, path: str, mode: Literal["r", "r+", "c"] = "r") -> Self:
+        """Load a ``TimeSeriesCollection`` saved with :meth:`TimeSeriesCollection.save_memmap()`, whose values are
+        memory-mapped.
+
+        The values are not loaded into memory up front; only the pages of the series that are accessed (e.g. by a
+        training dataset) are read from disk. The series returned by the collection are views of the memory-mapped
+        buffer.
+
+        A collection larger than memory can also be created directly from a memory-mapped array (e.g. from
+        :func:`numpy.lib.format.open_memmap()` filled chunk by chunk) with the ``TimeSeriesCollection`` constructor.
+
+        Parameters
+        ----------
+        path
+            The directory the collection was saved to.
+        mode
+            The memory-map mode, see :func:`numpy.load()`. `"r"` for read-only, `"r+"` to write changes to the values
+            back to disk, and `"c"` for copy-on-write (changes are kept in memory only).
+
+        Returns
+        -------
+        TimeSeriesCollection
+            The memory-mapped collection.
+        """
+        values = np.load(os.path.join(path, MEMMAP_VALUES_FILE), mmap_mode=mode)
+        with open(os.path.join(path, MEMMAP_ATTRS_FILE), "rb") as fh:
+            attrs = pickle.load(fh)
+        return cls(values=values, **attrs)
+
+    @property
+    def n_series(self) -> int:
+        """The number of series in the collection."""
+        return len(self._offsets) - 1
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """The number of time steps of each series."""
+        return np.diff(self._offsets)
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """The row offsets of each series in the shared values buffer (length `n_series + 1`)."""
+        return self._offsets.copy()
+
+    @property
+    def start_times(self) -> pd.DatetimeIndex | np.ndarray:
+        """The start time of each series."""
+        return self._start_times.copy()
+
+    @property
+    def freq(self) -> pd.DateOffset | int:
+        """The frequency shared by all series."""
+        return self._freq
+
+    @property
+    def has_datetime_index(self) -> bool:
+        """Whether the series are indexed with a ``pandas.DatetimeIndex``."""
+        return self._has_datetime_index
+
+    @property
+    def components(self) -> pd.Index:
+        """The component names shared by all series."""
+        return self._components
+
+    @property
+    def n_components(self) -> int:
+        """The number of components of each series."""
+        return self._values.shape[COMP_AX]
+
+    @property
+    def n_samples(self) -> int:
+        """The number of samples of each series."""
+        return self._values.shape[SMPL_AX]
+
+    @property
+    def dtype(self):
+        """The dtype of the values."""
+        return self._values.dtype
+
+    @property
+    def static_covariates(self) -> pd.DataFrame | None:
+        """The shared static covariates table of all series, or `None`."""
+        return self._static_covariates
+
+    @property
+    def hierarchy(self) -> dict | None:
+        """The hierarchy shared by all series, or `None`."""
+        return self._hierarchy
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes consumed by the shared values buffer."""
+        return self._values.nbytes
+
+    def all_values(self, copy: bool = True) -> np.ndarray:
+        """Return the shared values buffer of shape `(sum of lengths, component, sample)`.
+
+        Parameters
+        ----------
+        copy
+            Whether to return a copy of the values, otherwise returns a view.
+            Leave it to True unless you know what you are doing.
+        """
+        return self._values.copy() if copy else self._values
+
+    def to_list(self) -> list[TimeSeries]:
+        """Return a list with (zero-copy) views of all series."""
+        return [self._get_series(idx) for idx in range(self.n_series)]
+
+    def save_memmap(self, path: str):
+        """Save the collection to a directory from which it can be loaded with memory-mapped values.
+
+        The values buffer is written to a NumPy `.npy` file, and all other attributes to a pickle file. Use
+        :meth:`TimeSeriesCollection.load_memmap()` to load the collection without reading the values into memory.
+
+        Parameters
+        ----------
+        path
+            The directory to save the collection to. It is created if it does not exist.
+        """
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, MEMMAP_VALUES_FILE), self._values)
+        attrs = {
+            "offsets": self._offsets,
+            "start_times": self._start_times,
+            "freq": self._freq,
+            "components": self._components,
+            "time_name": self._time_name,
+            "static_covariates": self._static_covariates,
+            "hierarchy": self._hierarchy,
+            "metadata": self._metadata,
+        }
+        with open(os.path.join(path, MEMMAP_ATTRS_FILE), "wb") as fh:
+            pickle.dump(attrs, fh, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _get_time_index(self, idx: int) -> TimeIndex:
+        """Return the time index of the `idx`-th series."""
+        return generate_index(
+            start=(
+                self._start_times[idx]
+                if self._has_datetime_index
+                else int(self._start_times[idx])
+            ),
+            length=self._offsets[idx + 1] - self._offsets[idx],
+            freq=self._freq,
+            name=self._time_name,
+        )
+
+    def _get_series(self, idx: int) -> TimeSeries:
+        """Return a ``TimeSeries`` view of the `idx`-th series."""
+        start, end = self._offsets[idx], self._offsets[idx + 1]
+        times = self._get_time_index(idx)
+        static_covariates = None
+        if self._static_covariates is not None:
+            stride = self._static_cov_stride
+            static_covariates = self._static_covariates.iloc[
+                idx * stride : (idx + 1) * stride
+            ]
+        return TimeSeries(
+            times=times,
+            values=self._values[start:end],
+            components=self._components,
+            static_covariates=static_covariates,
+            hierarchy=self._hierarchy,
+            metadata=None if self._metadata is None else self._metadata[idx],
+            copy=False,
+        )
+
+    def _get_slice(self, key: slice) -> Self:
+        """Return a new collection sharing the values buffer for a contiguous range of series."""
+        start, stop, _ = key.indices(self.n_series)
+        stop = max(start, stop)
+        row_start, row_end = self._offsets[start], self._offsets[stop]
+        static_covariates = None
+        if self._static_covariates is not None:
+            stride = self._static_cov_stride
+            static_covariates = self._static_covariates.iloc[
+                start * stride : stop * stride
+            ]
+        return self.__class__(
+            values=self._values[row_start:row_end],
+            offsets=self._offsets[start : stop + 1] - row_start,
+            start_times=self._start_times[start:stop],
+            freq=self._freq,
+            components=self._components,
+            time_name=self._time_name,
+            static_covariates=static_covariates,
+            hierarchy=self._hierarchy,
+            metadata=None if self._metadata is None else self._metadata[start:stop],
+        )
+
+    def __len__(self) -> int:
+        return self.n_series
+
+    def __getitem__(self, key: int | slice) -> TimeSeries | Self | list[TimeSeries]:
+        """Return the series at position `key` (an integer), or the series in `key` (a slice).
+
+        Contiguous slices (step of `1`) return a ``TimeSeriesCollection`` sharing the values buffer, other slices
+        return a list of ``TimeSeries`` views.
+        """
+        if isinstance(key, int | np.integer):
+            idx = int(key)
+            if idx < 0:
+                idx += self.n_series
+            if not 0 <= idx < self.n_series:
+                raise_log(IndexError("TimeSeriesCollection index out of range."))
+            return self._get_series(idx)
+        elif isinstance(key, slice):
+            if key.step is None or key.step == 1:
+                return self._get_slice(key)
+            return [self._get_series(idx) for idx in range(self.n_series)[key]]
+        raise_log(
+            TypeError(
+                f"TimeSeriesCollection indices must be integers or slices, not {type(key).__name__}."
+            ),
+        )
+
+    def __iter__(self):
+        for idx in range(self.n_series):
+            yield self._get_series(idx)
+
+    def __str__(self):
+        freq_str = self._freq.freqstr if self._has_datetime_index else str(self._freq)
+        return (
+            f"TimeSeriesCollection(n_series: {self.n_series}, n_components: {self.n_components}, "
+            f"n_samples: {self.n_samples}, freq: {freq_str}, size: {format_bytes(self.nbytes)})"
+        )
+
+    def __repr__(self):
+        return str(self)
+
+
+class StreamingTimeSeries:
+    def __init__(self, series: TimeSeries, max_length: int | None = None):
+        """A ``TimeSeries`` that can be extended in-place with new observations, e.g. for streaming applications.
+
+        The values are stored in a pre-allocated buffer with spare capacity at the end, so that appending new time
+        steps with :meth:`append_values()` or :meth:`append()` costs amortized `O(1)` per step instead of copying the
+        whole series. Optionally, only the most recent `max_length` time steps are kept (a fixed history window).
+
+        The current state is accessible as a regular ``TimeSeries`` with :attr:`series`, which is a read-only view
+        of the buffer and can be passed directly to any Darts model or function (e.g. `model.predict(series=...)`).
+        Views returned before an append are not affected by it.
+
+        Parameters
+        ----------
+        series
+            The initial series. Its components, number of samples, frequency, static covariates, hierarchy and
+            metadata are kept for all future time steps.
+        max_length
+            Optionally, the maximum number of most recent time steps to keep. If `None`, keeps all time steps.
+
+        Examples
+        --------
+        >>> from darts import StreamingTimeSeries
+        >>> from darts.utils.timeseries_generation import linear_timeseries
+        >>> stream = StreamingTimeSeries(linear_timeseries(length=10), max_length=12)
+        >>> for value in [1.0, 2.0, 3.0]:
+        >>>     stream.append_values([value])
+        >>> len(stream), stream.series.end_time()
+        (12, Timestamp('2000-01-13 00:00:00'))
+        """
+        if max_length is not None and not (
+            isinstance(max_length, int) and max_length > 0
+        ):
+            raise_log(ValueError("`max_length` must be a positive integer or `None`."))
+        if not len(series):
+            raise_log(ValueError("`series` must contain at least one time step."))
+
+        values = series.all_values(copy=False)
+        if max_length is not None:
+            values = values[-max_length:]
+        capacity = max(
+            2 * (max_length if max_length is not None else len(values)),
+            STREAMING_MIN_CAPACITY,
+        )
+        self._buffer = np.empty((capacity,) + values.shape[1:], dtype=values.dtype)
+        self._buffer[: len(values)] = values
+        self._start = 0
+        self._end = len(values)
+        self._start_time = series.time_index[-len(values)]
+        self._max_length = max_length
+        self._freq = series.freq
+        self._time_name = series._time_index.name
+        self._components = series.components
+        self._attrs = series._attrs
+        self._series = None
+
+    @property
+    def series(self) -> TimeSeries:
+        """The current series; a read-only view of the most recent time steps."""
+        if self._series is None:
+            values = self._buffer[self._start : self._end]
+            values.flags.writeable = False
+            self._series = TimeSeries._from_trusted(
+                times=generate_index(
+                    start=self._start_time,
+                    length=len(values),
+                    freq=self._freq,
+                    name=self._time_name,
+                ),
+                values=values,
+                components=self._components,
+                **self._attrs,
+            )
+        return self._series
+
+    @property
+    def max_length(self) -> int | None:
+        """The maximum number of time steps kept, or `None` if all time steps are kept."""
+        return self._max_length
+
+    def append_values(self, values: np.ndarray):
+        """Append `values` to the end of the series (in-place).
+
+        Parameters
+        ----------
+        values
+            An array with the values of the new time steps, of shape `(time,)`, `(time, components)` or
+            `(time, components, samples)`.
+        """
+        values = np.array(values) if not isinstance(values, np.ndarray) else values
+        values = expand_arr(values, ndim=len(DIMS))
+        if not values.shape[1:] == self._buffer.shape[1:]:
+            raise_log(
+                ValueError(
+                    f"The (expanded) values must have the same number of components and samples "
+                    f"(second and third dims) as the series to append to. "
+                    f"Received shape: {values.shape}, expected: {(len(self),) + self._buffer.shape[1:]}"
+                ),
+            )
+        n_new = len(values)
+        if not n_new:
+            return
+
+        n_keep = len(self) + n_new
+        if self._max_length is not None:
+            n_keep = min(n_keep, self._max_length)
+            values = values[-n_keep:]
+        # number of existing time steps that are kept
+        n_old = n_keep - len(values)
+        self._start_time += (len(self) + n_new - n_keep) * self._freq
+
+        if self._end + len(values) > len(self._buffer):
+            # move the kept time steps into a new buffer; existing views keep the old one
+            capacity = len(self._buffer)
+            if self._max_length is None:
+                capacity = max(capacity, 2 * n_keep)
+            buffer = np.empty(
+                (capacity,) + self._buffer.shape[1:], dtype=self._buffer.dtype
+            )
+            buffer[:n_old] = self._buffer[self._end - n_old : self._end]
+            self._buffer, self._end = buffer, n_old
+
+        self._buffer[self._end : self._end + len(values)] = values
+        self._end += len(values)
+        self._start = self._end - n_keep
+        self._series = None
+
+    def append(self, other: TimeSeries):
+        """Append the time steps of `other` to the end of the series (in-place).
+
+        Parameters
+        ----------
+        other
+            A series with the same components and number of samples, starting one time step after the end of this
+            series.
+        """
+        if other.start_time() != self.series.end_time() + self._freq:
+            raise_log(
+                ValueError(
+                    "Appended `TimeSeries` must start one (time) step after the end of the series."
+                ),
+            )
+        if not other.components.equals(self._components):
+            raise_log(
+                ValueError("Both series must have the same components."),
+            )
+        self.append_values(other.all_values(copy=False))
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __str__(self):
+        freq_str = (
+            self._freq.freqstr
+            if isinstance(self._freq, pd.DateOffset)
+            else str(self._freq)
+        )
+        return (
+            f"StreamingTimeSeries(length: {len(self)}, max_length: {self._max_length}, "
+            f"n_components: {len(self._components)}, freq: {freq_str})"
+        )
+
+    def __repr__(self):
+        return str(self)
+
+
+def _concat_static_covs(series: Sequence[TimeSeries]) -> pd.DataFrame | None:
+    """Concatenate static covariates along the component axis (rows of static covariates). Use this for stacking or
+    concatenating time series along component dimension (axis=1).
+
+    Some context for stacking or concatenating two or more TimeSeries with static covariates:
+
+    - Concat along axis=0 (time): Along the time dimension, we only take the static covariates of the first series (as
+      static covariates are time-independent).
+    - Concat along axis=1 (components) or stacking: Along the component dimension, we either concatenate or transfer
+      the static covariates of the series if one of below cases applies:
+      1) concatenate along component dimension (rows of static covariates) when for each series the number of static
+         covariate components is equal to the number of components in the series. The static variable names (columns in
+         series.static_covariates) must be identical across all series
+      2) if only the first series contains static covariates transfer only those
+      3) if `ignore_static_covariates=True` (with `concatenate()`), case 1) is ignored and only the static covariates
+         of the first series are transferred
+    - Concat along axis=2 (samples): Along the sample dimension, we only take the static covariates of the first series
+      (as the components and time don't change).
+    """
+
+    if not any([ts.has_static_covariates for ts in series]):
+        return None
+
+    only_first = series[0].has_static_covariates and not any([
+        ts.has_static_covariates for ts in series[1:]
+    ])
+    all_have = all([ts.has_static_covariates for ts in series])
+
+    if not (only_first or all_have):
+        raise_log(
+            ValueError(
+                "Either none, only the first or all TimeSeries must have `static_covariates`."
+            ),
+        )
+
+    if only_first:
+        return series[0].static_covariates
+
+    static_covs = [ts.static_covariates for ts in series]
+    columns = static_covs[0].columns
+    column_names = columns.tolist()
+    if not (
+        all([len(covs) == ts.n_components for covs, ts in zip(static_covs, series)])
+        and all([covs.columns.tolist() == column_names for covs in static_covs])
+    ):
+        raise_log(
+            ValueError(
+                "Concatenation of multiple TimeSeries with static covariates requires all `static_covariates` "
+                "DataFrames to have identical columns (static variable names), and the number of each TimeSeries' "
+                "components must match the number of corresponding static covariate components (the number of rows "
+                "in `series.static_covariates`)."
+            ),
+        )
+
+    if all([dtype.kind in "iuf" for dtype in static_covs[0].dtypes]):
+        # numeric static covariates are concatenated at once with NumPy, which is much faster than `pd.concat()`
+        # for many series; numeric columns are cast to the dtype of the series by the constructor anyway
+        values = np.concatenate([covs.to_numpy() for covs in static_covs], axis=0)
+        if values.dtype.kind in "iuf":
+            return pd.DataFrame(
+                values,
+                index=static_covs[0].index.append([
+                    covs.index for covs in static_covs[1:]
+                ]),
+                columns=columns,
+            )
+
+    return pd.concat(static_covs, axis=0)
 
 
 def _concat_hierarchy(series: Sequence[TimeSeries]):
     """Concatenate the hierarchies of multiple series, when concatenating series along axis 1 (components). This simply
     merges the hierarchy dictionaries.
     """
-    concat_hierarchy = dict()
-    for s in series:
-        if s.has_hierarchy:
-            concat_hierarchy.update(s.hierarchy)
-    return None if len(concat_hierarchy) == 0 else concat_hierarchy
+    concat_hierarchy = dict()
+    for s in series:
+        if s.has_hierarchy:
+            concat_hierarchy.update(s.hierarchy)
+    return None if len(concat_hierarchy) == 0 else concat_hierarchy
+
+
+def concatenate(
+    series: Sequence[TimeSeries],
+    axis: str | int = 0,
+    ignore_time_axis: bool = False,
+    ignore_static_covariates: bool = False,
+    drop_hierarchy: bool = True,
+    drop_metadata: bool = False,
+) -> TimeSeries:
+    """Concatenates multiple series along a given axis.
+
+    ``axis`` can be an integer in (0, 1, 2) to denote (time, component, sample) or, alternatively, a string denoting
+    the corresponding dimension of the underlying ``DataArray``.
+
+    Parameters
+    ----------
+    series
+        Sequence of ``TimeSeries`` to concatenate.
+    axis
+        Axis along which the series will be concatenated.
+    ignore_time_axis
+        Allow concatenation even when some series do not have matching time axes.
+        When done along component or sample dimensions, concatenation will work as long as the series
+        have the same lengths (in this case the resulting series will have the time axis of the first
+        provided series). When done along time dimension, concatenation will work even if the time axes
+        are not contiguous (in this case, the resulting series will have a start time matching the start time
+        of the first provided series). Default: False.
+    ignore_static_covariates
+        Whether to ignore all requirements for static covariate concatenation and only transfer the static covariates
+        of the first TimeSeries element in `series` to the concatenated TimeSeries. Only effective when `axis=1`.
+    drop_hierarchy
+        When `axis=1`, whether to drop hierarchy information. True by default. When False, the hierarchies will be
+        "concatenated" as well (by merging the hierarchy dictionaries), which may cause issues if the component
+        names of the resulting series and that of the merged hierarchy do not match.
+        When `axis=0` or `axis=2`, the hierarchy of the first series is always kept.
+    drop_metadata
+        Whether to drop the metadata information of the concatenated series. False by default.
+        When False, the concatenated series will inherit the metadata from the first TimeSeries element in `series`.
+
+    Returns
+    -------
+    TimeSeries
+        The concatenated series.
+    """
+    if isinstance(series, TimeSeries):
+        series = [series]
+
+    axis = TimeSeries._get_axis(axis)
+    vals = [ts.all_values(copy=False) for ts in series]
+
+    component_axis_equal = len({ts.shape[COMP_AX] for ts in series}) == 1
+    sample_axis_equal = len({ts.shape[SMPL_AX] for ts in series}) == 1
+
+    times = series[0]._time_index
+    components = series[0].components
+    static_covariates = series[0].static_covariates
+    hierarchy = series[0].hierarchy
+    metadata = None if drop_metadata else series[0].metadata
+
+    # a single allocation of the concatenated values with the dtype of the first series
+    vals = np.concatenate(vals, axis=axis, dtype=vals[0].dtype)
+
+    if axis == 0:
+        # time
+        if not (component_axis_equal and sample_axis_equal):
+            raise_log(
+                ValueError(
+                    "when concatenating along time dimension, the component and sample dimensions of all "
+                    "provided series must match."
+                ),
+            )
+
+        # check, if timeseries are consecutive
+        start_times = [ts._time_index[0] for ts in series[1:]]
+        end_times = [ts._time_index[-1] for ts in series[:-1]]
+        if series[0]._has_datetime_index:
+            start_times = pd.DatetimeIndex(start_times)
+            end_times = pd.DatetimeIndex(end_times)
+        else:
+            start_times = np.array(start_times, dtype=int)
+            end_times = np.array(end_times, dtype=int)
+        consecutive_time_axes = bool(np.all(end_times + series[0].freq == start_times))
+
+        if not consecutive_time_axes:
+            if not ignore_time_axis:
+                raise_log(
+                    ValueError(
+                        "When concatenating over time axis, all series need to be contiguous "
+                        "in the time dimension. Use `ignore_time_axis=True` to override "
+                        "this behavior and concatenate the series by extending the time axis "
+                        "of the first series."
+                    ),
+                )
+
+        times = generate_index(
+            start=series[0].start_time(),
+            freq=series[0].freq,
+            length=len(vals),
+            name=times.name,
+        )
+    else:
+        if ignore_time_axis:
+            time_axes_ok = len({len(ts) for ts in series}) == 1
+        else:
+            time_axes_ok = all([
+                ts.has_same_time_as(ts_next)
+                for ts, ts_next in zip(series[0:-1], series[1:])
+            ])
+
+        if (
+            (not time_axes_ok)
+            or (axis == 1 and not sample_axis_equal)
+            or (axis == 2 and not component_axis_equal)
+        ):
+            raise_log(
+                ValueError(
+                    "When concatenating along component or sample dimensions, all the series must have the same time "
+                    "axes (unless `ignore_time_axis` is True), or time axes of same lengths (if `ignore_time_axis` is "
+                    "True), and all series must have the same number of samples (if concatenating along component "
+                    "dimension), or the same number of components (if concatenating along sample dimension)."
+                ),
+            )
+
+        if axis == 1:
+            # When concatenating along component dimension, we have to re-create a component index
+            # we rely on the factory method of TimeSeries to disambiguate names later on if needed.
+            components = series[0].components.append([
+                ts.components for ts in series[1:]
+            ])
+            static_covariates = (
+                _concat_static_covs(series)
+                if not ignore_static_covariates
+                else static_covariates
+            )
+            hierarchy = None if drop_hierarchy else _concat_hierarchy(series)
+
+    # the concatenated values are a new array
+    return series[0].__class__(
+        times=times,
+        values=vals,
+        components=components,
+        static_covariates=static_covariates,
+        hierarchy=hierarchy,
+        metadata=metadata,
+        copy=False,
+    )
+
+
+def slice_intersect(series: Sequence[TimeSeries]) -> list[TimeSeries]:
+    """Returns a list of series, where all series have been intersected along the time index.
+
+    Parameters
+    ----------
+    series
+        sequence of ``TimeSeries`` to intersect
+
+    Returns
+    -------
+    Sequence[TimeSeries]
+        The intersected series.
+    """
+    if not series:
+        return []
+
+    # find global intersection on first series
+    intersection = series[0]
+    for series_ in series[1:]:
+        intersection = intersection.slice_intersect(series_)
+
+    # intersect all other series
+    series_intersected = [intersection]
+    for series_ in series[1:]:
+        series_intersected.append(series_.slice_intersect(intersection))
+
+    return series_intersected
+
+
+def gaps(
+    series: Sequence[TimeSeries], mode: Literal["all", "any"] = "all"
+) -> pd.DataFrame:
+    """Compute the gaps of many series at once, see :meth:`TimeSeries.gaps`.
+
+    The missing time steps of all series are detected in a single pass with NumPy. With a
+    :class:`TimeSeriesCollection`, they are read directly from its shared values buffer.
+
+    Parameters
+    ----------
+    series
+        The sequence of series.
+    mode
+        Only relevant for multivariate time series. The mode defines how gaps are defined. Set to
+        'any' if a NaN value in any columns should be considered as as gaps. 'all' will only
+        consider periods where all columns' values are NaN. Defaults to 'all'.
+
+    Returns
+    -------
+    pandas.DataFrame
+        A pandas.DataFrame containing a row for every gap of every series, ordered by series and time. It contains the
+        position `series_idx` of the series in `series`, the start and end time stamps of the gap, and the integer
+        length of the gap (in units of the series' frequency).
+    """
+    _check_gap_mode(mode)
+    series_idx, gap_starts, gap_ends = _nan_runs(series, how=mode)
+    gap_start_times, gap_end_times = [], []
+    is_collection = isinstance(series, TimeSeriesCollection)
+    # the gaps are ordered by series
+    splits = np.flatnonzero(np.diff(series_idx)) + 1
+    for idx, starts, ends in zip(
+        series_idx[np.r_[0, splits]] if len(series_idx) else [],
+        np.split(gap_starts, splits),
+        np.split(gap_ends, splits),
+    ):
+        times = (
+            series._get_time_index(idx) if is_collection else series[idx]._time_index
+        )
+        gap_start_times.append(times[starts])
+        gap_end_times.append(times[ends])
+    return pd.DataFrame({
+        "series_idx": series_idx,
+        "gap_start": _concat_time_values(gap_start_times),
+        "gap_end": _concat_time_values(gap_end_times),
+        "gap_size": gap_ends - gap_starts + 1,
+    })
+
+
+def strip(series: Sequence[TimeSeries], how: str = "all") -> list[TimeSeries]:
+    """Strip the NaN-containing entries at the beginning and the end of many deterministic series at once, see
+    :meth:`TimeSeries.strip`.
+
+    The missing time steps of all series are detected in a single pass with NumPy. With a
+    :class:`TimeSeriesCollection`, they are read directly from its shared values buffer.
+
+    Parameters
+    ----------
+    series
+        The sequence of deterministic series.
+    how
+        Define if the entries containing `NaN` in all the components ('all') or in any of the components ('any')
+        should be stripped. Default: 'all'
+
+    Returns
+    -------
+    list[TimeSeries]
+        The stripped series, sharing the values of the original series.
+    """
+    _check_strip_how(how)
+    _check_deterministic(series, "strip")
+    if not len(series):
+        return []
+    is_nan, offsets = _nan_rows(series, how=how)
+    firsts, lasts = _finite_bounds(is_nan, offsets)
+    return [ts[first : last + 1] for ts, first, last in zip(series, firsts, lasts)]
+
+
+def longest_contiguous_slice(
+    series: Sequence[TimeSeries], max_gap_size: int = 0, mode: str = "all"
+) -> list[TimeSeries]:
+    """Return the largest slice without any gaps larger than `max_gap_size` of many deterministic series at once, see
+    :meth:`TimeSeries.longest_contiguous_slice`.
+
+    The missing time steps and the slices of all series are computed in a single pass with NumPy. With a
+    :class:`TimeSeriesCollection`, the missing time steps are read directly from its shared values buffer.
+
+    Parameters
+    ----------
+    series
+        The sequence of deterministic series.
+    max_gap_size
+        Indicate the maximum gap size that the series can contain.
+    mode
+        Only relevant for multivariate time series. The mode defines how gaps are defined. Set to
+        'any' if a NaN value in any columns should be considered as as gaps. 'all' will only
+        consider periods where all columns' values are NaN. Defaults to 'all'.
+
+    Returns
+    -------
+    list[TimeSeries]
+        The largest slice of each series, sharing the values of the original series.
+    """
+    _check_gap_mode(mode)
+    _check_deterministic(series, "longest_contiguous_slice")
+    if not len(series):
+        return []
+    is_nan_all, offsets = _nan_rows(series, how="all")
+    is_nan = is_nan_all if mode == "all" else _nan_rows(series, how=mode)[0]
+    starts, ends = _longest_slices(is_nan_all, is_nan, offsets, max_gap_size)
+    return [ts[start : end + 1] for ts, start, end in zip(series, starts, ends)]
+
+
+def to_group_dataframe(
+    series: Sequence[TimeSeries],
+    copy: bool = True,
+    backend: ModuleType | Implementation | str = Implementation.PANDAS,
+    time_as_index: bool = True,
+    suppress_warnings: bool = False,
+    add_static_covariates: bool | str | list[str] = True,
+    add_metadata: bool | str | list[str] = False,
+    add_group_col: bool | str = False,
+):
+    """Converts a sequence of `TimeSeries` into a long DataFrame representation.
+
+    It converts each series into individual DataFrames and then concatenates them row-wise into a long DataFrame
+    using the specified backend.
+
+    This is particularly useful when working with collections of time series that share a common schema
+    and need to be represented in a tabular format for downstream processing.
+
+    Parameters
+    ----------
+    series
+        A sequence of `TimeSeries` to convert into a long DataFrame.
+    copy
+        Whether to return a copy of the resulting DataFrame. Leave it to True unless you know what you are doing.
+    backend
+        The backend to which to export the `TimeSeries`. See the `narwhals documentation
+        <https://narwhals-dev.github.io/narwhals/api-reference/narwhals/#narwhals.from_dict>`__ for all supported
+        backends.
+    time_as_index
+        Whether to set the time index as the index of the DataFrame or in the left-most column.
+        Only effective with the pandas `backend`.
+    suppress_warnings
+        Whether to suppress warnings raised during the DataFrame creation.
+    add_static_covariates
+        Whether to add the series' static covariates to the resulting DataFrame (one column per component-static
+        covariate pair). If a bool, controls whether to add all static covariates or none. If a string, or list of
+        strings, specifies the subset of static covariate columns / names to add.
+    add_metadata
+        Whether to add the series' metadata to the resulting DataFrame (one column per metadata entry). If a bool,
+        controls whether to add all metadata entries or none. If a string, or list of strings, specifies the subset
+        of metadata keys / names to add.
+    add_group_col
+        Whether to add a integer group column to the resulting DataFrame that serves as a mapping between DataFrame
+        rows and their corresponding time series. If a bool, indicates whether to add a group column with the name
+        "group". If a string, adds a group column with the name being that string value.
+
+    Returns
+    -------
+    DataFrame
+        A long DataFrame representation of the input sequence of `TimeSeries` in the specified `backend`.
+    """
 
+    backend = Implementation.from_backend(backend)
 
-def concatenate(
-    series: Sequence[TimeSeries],
-    axis: str | int = 0,
-    ignore_time_axis: bool = False,
-    ignore_static_covariates: bool = False,
-    drop_hierarchy: bool = True,
-    drop_metadata: bool = False,
-) -> TimeSeries:
-    """Concatenates multiple series along a given axis.
+    if isinstance(series, TimeSeries):
+        series = [series]
 
-    ``axis`` can be an integer in (0, 1, 2) to denote (time, component, sample) or, alternatively, a string denoting
-    the corresponding dimension of the underlying ``DataArray``.
+    df = []
+    group_col = add_group_col if isinstance(add_group_col, str) else "group"
+    for idx, series_ in enumerate(series):
+        df_ = series_.to_dataframe(
+            copy=copy,
+            backend=backend,
+            time_as_index=time_as_index,
+            suppress_warnings=suppress_warnings,
+            add_static_covariates=add_static_covariates,
+            add_metadata=add_metadata,
+        )
+        df_ = nw.from_native(df_)
+        if add_group_col:
+            df_ = df_.with_columns(nw.lit(idx).alias(group_col))
+        df.append(df_)
+
+    df = nw.concat(df).to_native()
+
+    # pandas keeps the row index of each df, reset it here if it does not represent the time index
+    if backend.is_pandas() and not time_as_index:
+        df.reset_index(inplace=True, drop=True)
+    return df
+
+
+def to_arrow(series: TimeSeries | Sequence[TimeSeries]) -> pa.RecordBatch:
+    """Converts a sequence of `TimeSeries` into a long Arrow representation.
+
+    The resulting `RecordBatch` has one row per series and time step, with the following columns:
+
+    - ``"series_id"``: the position of the series in `series`.
+    - the time column, named after the time dimension of the first series.
+    - one column per component. For stochastic series, each component column is a fixed size list with one entry
+      per sample.
+
+    The rows are sorted by series id and time. The frequency, static covariates, hierarchy and metadata of each
+    series are stored in the schema metadata, so that the series can be restored with
+    :meth:`TimeSeries.from_arrow()`. The values are converted without going through pandas.
+
+    All series must have the same components, number of samples, and time index type (and time zone). The metadata
+    must be JSON serializable.
+
+    Requires `pyarrow` to be installed.
 
     Parameters
     ----------
     series
-        Sequence of ``TimeSeries`` to concatenate.
-    axis
-        Axis along which the series will be concatenated.
-    ignore_time_axis
-        Allow concatenation even when some series do not have matching time axes.
-        When done along component or sample dimensions, concatenation will work as long as the series
-        have the same lengths (in this case the resulting series will have the time axis of the first
-        provided series). When done along time dimension, concatenation will work even if the time axes
-        are not contiguous (in this case, the resulting series will have a start time matching the start time
-        of the first provided series). Default: False.
-    ignore_static_covariates
-        Whether to ignore all requirements for static covariate concatenation and only transfer the static covariates
-        of the first TimeSeries element in `series` to the concatenated TimeSeries. Only effective when `axis=1`.
-    drop_hierarchy
-        When `axis=1`, whether to drop hierarchy information. True by default. When False, the hierarchies will be
-        "concatenated" as well (by merging the hierarchy dictionaries), which may cause issues if the component
-        names of the resulting series and that of the merged hierarchy do not match.
-        When `axis=0` or `axis=2`, the hierarchy of the first series is always kept.
-    drop_metadata
-        Whether to drop the metadata information of the concatenated series. False by default.
-        When False, the concatenated series will inherit the metadata from the first TimeSeries element in `series`.
+        A `TimeSeries` or a sequence of `TimeSeries` to convert.
 
     Returns
     -------
-    TimeSeries
-        The concatenated series.
+    pyarrow.RecordBatch
+        The long Arrow representation of the series.
     """
+    pa = _import_pyarrow()
+
     if isinstance(series, TimeSeries):
         series = [series]
+    if not len(series):
+        raise_log(ValueError("`series` must contain at least one series."))
 
-    axis = TimeSeries._get_axis(axis)
-    vals = [ts.all_values(copy=False) for ts in series]
+    first = series[0]
+    components = first.components
+    time_col = first.time_dim
+    tz = first.time_index.tz if first.has_datetime_index else None
+    for series_ in series[1:]:
+        if (
+            not series_.components.equals(components)
+            or series_.n_samples != first.n_samples
+            or series_.has_datetime_index != first.has_datetime_index
+            or (series_.has_datetime_index and series_.time_index.tz != tz)
+        ):
+            raise_log(
+                ValueError(
+                    "All series must have identical components, number of samples, and time index type "
+                    "(and time zone)."
+                )
+            )
+    if ARROW_SERIES_ID_COL == time_col or ARROW_SERIES_ID_COL in components:
+        raise_log(
+            ValueError(
+                f"The column name `{ARROW_SERIES_ID_COL}` is reserved for the series id and cannot be used as time "
+                f"dimension or component name."
+            )
+        )
+    if time_col in components:
+        raise_log(
+            ValueError(
+                f"The time dimension `{time_col}` cannot also be a component name."
+            )
+        )
 
-    component_axis_equal = len({ts.shape[COMP_AX] for ts in series}) == 1
-    sample_axis_equal = len({ts.shape[SMPL_AX] for ts in series}) == 1
+    lengths = [len(series_) for series_ in series]
+    series_ids = np.repeat(np.arange(len(series), dtype=np.int64), lengths)
+    values = np.concatenate(
+        [series_.all_values(copy=False) for series_ in series], axis=0
+    )
+    if first.has_datetime_index:
+        times = pa.array(first.time_index.append([s.time_index for s in series[1:]]))
+    else:
+        times = pa.array(
+            np.concatenate([np.asarray(s.time_index) for s in series]).astype(np.int64)
+        )
+
+    n_samples = first.n_samples
+    arrays = [pa.array(series_ids), times]
+    for comp_idx in range(len(components)):
+        comp_vals = pa.array(np.ascontiguousarray(values[:, comp_idx]).reshape(-1))
+        if n_samples > 1:
+            comp_vals = pa.FixedSizeListArray.from_arrays(comp_vals, n_samples)
+        arrays.append(comp_vals)
+
+    series_meta = []
+    static_covs, static_cov_ids = [], []
+    for series_id, series_ in enumerate(series):
+        series_static_covs = series_.static_covariates
+        if series_static_covs is not None:
+            static_covs.append(series_static_covs)
+            static_cov_ids.append(np.full(len(series_static_covs), series_id))
+        series_meta.append({
+            "freq": series_.freq
+            if not series_.has_datetime_index
+            else series_.freq_str,
+            "static_covariates": (
+                series_static_covs.columns.tolist()
+                if series_static_covs is not None
+                else None
+            ),
+            "hierarchy": series_.hierarchy,
+            "metadata": series_.metadata,
+        })
+
+    try:
+        schema_meta = {
+            ARROW_METADATA_KEY: json.dumps({
+                "version": ARROW_FORMAT_VERSION,
+                "time_col": time_col,
+                "n_samples": n_samples,
+                "components": components.tolist(),
+                "series": series_meta,
+            })
+        }
+    except TypeError as err:
+        raise_log(
+            ValueError(
+                f"The metadata of all series must be JSON serializable. Error: {err}"
+            )
+        )
+    if static_covs:
+        # one table for all series, indexed by series id and component
+        static_covs = pd.concat(static_covs)
+        static_covs.index = pd.MultiIndex.from_arrays([
+            np.concatenate(static_cov_ids),
+            static_covs.index,
+        ])
+        static_covs = pa.Table.from_pandas(static_covs, preserve_index=True)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, static_covs.schema) as writer:
+            writer.write_table(static_covs)
+        schema_meta[ARROW_STATIC_COV_KEY] = sink.getvalue().to_pybytes()
+
+    return pa.RecordBatch.from_arrays(
+        arrays,
+        names=[ARROW_SERIES_ID_COL, time_col] + components.tolist(),
+        metadata=schema_meta,
+    )
+
+
+def to_parquet(series: TimeSeries | Sequence[TimeSeries], path: str, **kwargs):
+    """Writes a sequence of `TimeSeries` to a Parquet file in long format.
+
+    The series are stored in the long representation from :func:`to_arrow()`. Since the rows are sorted by series id
+    and time, the row group statistics allow to load only a subset of the series, components or a time range with
+    :meth:`TimeSeries.from_parquet()`.
+
+    Requires `pyarrow` to be installed.
+
+    Parameters
+    ----------
+    series
+        A `TimeSeries` or a sequence of `TimeSeries` to write.
+    path
+        The path of the Parquet file.
+    **kwargs
+        Additional keyword arguments passed to :func:`pyarrow.parquet.write_table()`, e.g. `row_group_size` or
+        `compression`.
+    """
+    pa = _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    pq.write_table(pa.Table.from_batches([to_arrow(series)]), path, **kwargs)
+
+
+def _import_pyarrow() -> ModuleType:
+    """Import the optional `pyarrow` dependency of the Arrow and Parquet I/O."""
+    try:
+        import pyarrow
+    except ImportError:
+        raise_log(
+            ImportError(
+                "pyarrow is not installed. Please install it with: `pip install pyarrow`"
+            )
+        )
+    return pyarrow
+
+
+def _arrow_column_to_numpy(column: pa.Array | pa.ChunkedArray) -> np.ndarray:
+    """Return the flat values of a (fixed size list) Arrow column as a NumPy array."""
+    if hasattr(column, "combine_chunks"):
+        column = column.combine_chunks()
+    if hasattr(column, "flatten"):
+        column = column.flatten()
+    return column.to_numpy(zero_copy_only=False)
+
+
+def _resample(
+    series: Sequence[TimeSeries],
+    freq: str | pd.DateOffset,
+    method: str = "pad",
+    method_kwargs: dict[str, Any] | None = None,
+    **kwargs,
+) -> list[TimeSeries]:
+    """Resample one or several series with a given frequency, see :meth:`TimeSeries.resample`.
+
+    The methods supported by the NumPy `ResampleEngine` are computed at once for all series sharing the same time
+    index and dtype (stacked along the component axis), with bins computed only once per time index. All other
+    methods are computed with xarray, series by series.
+    """
+    method_kwargs = method_kwargs or {}
+    if isinstance(freq, pd.DateOffset):
+        freq = freq.freqstr
+
+    use_numpy = (
+        method in NUMPY_RESAMPLE_METHODS
+        and not method_kwargs
+        and set(kwargs) <= NUMPY_RESAMPLE_KWARGS
+    )
+    resampled = [None] * len(series)
+    # series sharing an (interned) time index and dtype are resampled together
+    groups = defaultdict(list)
+    for idx, ts in enumerate(series):
+        if use_numpy and ts._has_datetime_index and len(ts) > 1:
+            groups[(id(ts._time_index), ts.dtype)].append(idx)
+        else:
+            resampled[idx] = _resample_xarray(
+                ts, freq=freq, method=method, method_kwargs=method_kwargs, **kwargs
+            )
+
+    for group in groups.values():
+        first = series[group[0]]
+        engine = ResampleEngine(first._time_index, freq, **kwargs)
+        times = engine.time_index.rename(first._time_dim)
+        values = engine.compute(
+            np.concatenate(
+                [series[idx]._values.reshape(len(first), -1) for idx in group], axis=1
+            ),
+            method=method,
+        )
+        col = 0
+        for idx in group:
+            ts = series[idx]
+            n_cols = ts.n_components * ts.n_samples
+            resampled[idx] = ts._from_trusted(
+                times=times,
+                values=values[:, col : col + n_cols].reshape(
+                    len(times), ts.n_components, ts.n_samples
+                ),
+                components=ts.components,
+                **ts._attrs,
+            )
+            col += n_cols
+    return resampled
+
+
+def _resample_xarray(
+    series: TimeSeries,
+    freq: str,
+    method: str,
+    method_kwargs: dict[str, Any],
+    **kwargs,
+) -> TimeSeries:
+    """Resample a series with xarray."""
+    import xarray as xr
+
+    resample = series.data_array(copy=False).resample(
+        indexer={series._time_dim: freq},
+        **kwargs,
+    )
+
+    if method in SUPPORTED_RESAMPLE_METHODS:
+        applied_method = getattr(xr.core.resample.DataArrayResample, method)
+        new_xa = applied_method(resample, **method_kwargs)
+
+        # Convert boolean to int as Timeseries must contain numeric values only
+        # method: "all", "any"
+        if new_xa.dtype == "bool":
+            new_xa = new_xa.astype(int)
+    else:
+        raise_log(ValueError(f"Unknown method: {method}"))
+    return series.__class__.from_xarray(new_xa)
+
+
+def _window_transform(
+    series: Sequence[TimeSeries],
+    transforms: dict | Sequence[dict],
+    treat_na: str | int | float | None = None,
+    forecasting_safe: bool | None = True,
+    keep_non_transformed: bool | None = False,
+    include_current: bool | None = True,
+    keep_names: bool | None = False,
+) -> list[TimeSeries]:
+    """Apply window transformations to one or several series of the same length, components and number of samples.
+
+    The builtin functions supported by the NumPy `WindowEngine` are computed at once for all series (stacked along
+    the component axis). All other transformations are computed with pandas, series by series. See
+    :meth:`TimeSeries.window_transform` for a description of the parameters.
+    """
+    VALID_BFILL_NA = {"bfill", "backfill"}
+    VALID_TREAT_NA = VALID_BFILL_NA.union({"dropna"})
+
+    PD_WINDOW_OPERATIONS = {
+        "rolling": pd.DataFrame.rolling,
+        "expanding": pd.DataFrame.expanding,
+        "ewm": pd.DataFrame.ewm,
+    }
+
+    # helper function to read and format kwargs
+    def _get_kwargs(transformation, forecasting_safe):
+        """
+        Builds the kwargs dictionary for the transformation function.
+
+        Parameters
+        ----------
+        transformation
+            The transformation dictionary.
+        builtins
+            The built-in transformations read from the WindowTransformer class.
+
+        Returns
+        -------
+        dict, dict
+            The kwargs dictionaries for both the function group and the specific function.
+        """
+
+        # take expanding as the default window operation if not specified, safer than rolling
+        mode = transformation.get("mode", "expanding")
+        if mode not in PD_WINDOW_OPERATIONS.keys():
+            raise_log(
+                ValueError(
+                    f"Invalid window operation: '{mode}'. Must be one of {PD_WINDOW_OPERATIONS.keys()}."
+                ),
+            )
+        window_mode = PD_WINDOW_OPERATIONS[mode]
+
+        # minimum number of observations in window required to have a value (otherwise result in NaN)
+        if "min_periods" not in transformation:
+            transformation["min_periods"] = 0 if mode == "ewm" else 1
+
+        if mode == "rolling":
+            # pandas default for 'center' is False, no need to set it explicitly
+            if "center" in transformation:
+                if transformation["center"] and forecasting_safe:
+                    raise_log(
+                        ValueError(
+                            "When `forecasting_safe` is True, `center` must be False."
+                        ),
+                    )
+
+        if isinstance(transformation["function"], Callable):
+            fn = "apply"
+            udf = transformation["function"]
+            # make sure that we provide a numpy array to the user function, "raw": True
+            if "raw" not in transformation:
+                transformation["raw"] = True
+        elif isinstance(transformation["function"], str):
+            fn = transformation["function"]
+        else:
+            raise_log(
+                ValueError(
+                    "Transformation function must be a string or a callable. "
+                    "String can be the name of any function available for pandas window. "
+                    "A list of those function can be found in the `documentation "
+                    "<https://pandas.pydata.org/pandas-docs/stable/reference/window.html>`."
+                ),
+            )
+
+        available_keys = set(transformation.keys()) - {
+            "function",
+            "group",
+            "components",
+            "function_name",
+        }
+
+        window_mode_expected_args = set(window_mode.__code__.co_varnames)
+        window_mode_available_keys = window_mode_expected_args.intersection(
+            available_keys
+        )
+
+        window_mode_available_kwargs = {
+            k: v for k, v in transformation.items() if k in window_mode_available_keys
+        }
+
+        available_keys -= window_mode_available_keys
+
+        function_expected_args = set(
+            getattr(
+                getattr(pd.DataFrame(), window_mode.__name__)(
+                    **window_mode_available_kwargs
+                ),
+                fn,
+            ).__code__.co_varnames
+        )
+
+        function_available_keys = function_expected_args.intersection(
+            set(available_keys)
+        )
+
+        function_available_kwargs = {
+            k: v for k, v in transformation.items() if k in function_available_keys
+        }
+
+        available_keys -= function_available_keys
+
+        udf_expected_args = set(udf.__code__.co_varnames) if fn == "apply" else None
+        udf_available_keys = (
+            udf_expected_args.intersection(set(available_keys))
+            if fn == "apply"
+            else None
+        )
+
+        udf_kwargs = (
+            {k: v for k, v in transformation.items() if k in udf_available_keys}
+            if fn == "apply"
+            else None
+        )
+
+        function_available_kwargs.update(
+            {"func": udf, "kwargs": udf_kwargs} if fn == "apply" else {}
+        )
+
+        return (window_mode.__name__, window_mode_available_kwargs), (
+            fn,
+            function_available_kwargs,
+        )
+
+    first = series[0]
+
+    # make sure we have a list in transforms
+    if isinstance(transforms, dict):
+        transforms = [transforms]
+
+    # check if some transformations are applied to the same components
+    overlapping_transforms = False
+    transformed_components = set()
+    for tr in transforms:
+        if not isinstance(tr, dict):
+            raise_log(
+                ValueError("Every entry in `transforms` must be a dictionary"),
+            )
+        tr_comps = set(tr["components"] if "components" in tr else first.components)
+        if len(transformed_components.intersection(tr_comps)) > 0:
+            overlapping_transforms = True
+        transformed_components = transformed_components.union(tr_comps)
+
+    if keep_names and overlapping_transforms:
+        raise_log(
+            ValueError(
+                "Cannot keep the original component names as some transforms are overlapping "
+                "(applied to the same components). Set `keep_names` to `False`."
+            ),
+        )
+
+    # actually, this could be allowed to allow transformation "in place"?
+    # keep_non_transformed can be changed to False/ignored if the transforms are not partial
+    if keep_names and keep_non_transformed:
+        raise_log(
+            ValueError(
+                "`keep_names = True` and `keep_non_transformed = True` cannot be used together."
+            ),
+        )
+
+    partial_transforms = transformed_components != set(first.components)
+    convert_hierarchy = False
+    comp_names_map = dict()
+    if any(ts.hierarchy for ts in series):
+        # the partial_transform covers for scenario keep_non_transformed = True
+        if len(transforms) > 1 or partial_transforms:
+            logger.warning(
+                "The hierarchy cannot be retained, either because there is more than one transform or "
+                "because the transform is not applied to all the components of the series."
+            )
+        else:
+            convert_hierarchy = True
+
+    if not all([isinstance(tr, dict) for tr in transforms]):
+        raise_log(
+            ValueError(
+                "`transforms` must be a non-empty dictionary or a non-empty list of dictionaries."
+            ),
+        )
+
+    # store some original attributes of the series
+    original_components = first.components
+    n_samples = first.n_samples
+    n_times = len(first)
+    n_cols = first.n_components * n_samples
+    # the DataFrame column names of the components (and samples), as used by the pandas window functions
+    df_cols = (
+        original_components
+        if first.is_deterministic
+        else pd.Index([
+            f"{comp}_s{sample}"
+            for comp in original_components
+            for sample in range(n_samples)
+        ])
+    )
+
+    # stack the values of all series along the columns: (time, series x component x sample)
+    values = np.concatenate(
+        [ts.all_values(copy=False).reshape(n_times, n_cols) for ts in series], axis=1
+    )
+    engine = WindowEngine(values)
+    ts_dfs = [None] * len(series)
+
+    transformed_values = []
+    new_columns = []
+
+    # run through all transformations in transforms
+    for transformation in transforms:
+        if "components" in transformation:
+            if isinstance(transformation["components"], str):
+                transformation["components"] = [transformation["components"]]
+            comps_to_transform = transformation["components"]
 
-    times = series[0]._time_index
-    components = series[0].components
-    static_covariates = series[0].static_covariates
-    hierarchy = series[0].hierarchy
-    metadata = None if drop_metadata else series[0].metadata
+        else:
+            comps_to_transform = original_components
 
-    dtype_source = vals[0].dtype
-    vals = np.concatenate(vals, axis=axis)
-    vals = _maybe_cast_array_dtype(vals, dtype_source)
+        if not first.is_deterministic:
+            filter_df_columns = [
+                df_col
+                for df_col in df_cols
+                if re.sub("_s.*$", "", df_col) in comps_to_transform
+            ]
 
-    if axis == 0:
-        # time
-        if not (component_axis_equal and sample_axis_equal):
-            raise_log(
-                ValueError(
-                    "when concatenating along time dimension, the component and sample dimensions of all "
-                    "provided series must match."
-                ),
-            )
+        else:
+            filter_df_columns = [df_col for df_col in comps_to_transform]
 
-        # check, if timeseries are consecutive
-        consecutive_time_axes = True
-        for i in range(1, len(series)):
-            if series[i - 1].end_time() + series[0].freq != series[i].start_time():
-                consecutive_time_axes = False
-                break
+        (window_mode, window_mode_kwargs), (fn, function_kwargs) = _get_kwargs(
+            transformation, forecasting_safe
+        )
 
-        if not consecutive_time_axes:
-            if not ignore_time_axis:
-                raise_log(
-                    ValueError(
-                        "When concatenating over time axis, all series need to be contiguous "
-                        "in the time dimension. Use `ignore_time_axis=True` to override "
-                        "this behavior and concatenate the series by extending the time axis "
-                        "of the first series."
-                    ),
+        closed = transformation.get("closed", None)
+        if not include_current:
+            if window_mode == "rolling":
+                shifts = 0 if closed == "left" else 1  # avoid shifting twice
+            else:
+                shifts = 1
+        else:
+            shifts = 0
+
+        # compute builtin functions with NumPy for all series at once, and fall back to pandas otherwise
+        result = None
+        if fn != "apply":
+            cols = df_cols.get_indexer(filter_df_columns)
+            if (cols >= 0).all():
+                result = engine.compute(
+                    columns=(np.arange(len(series))[:, None] * n_cols + cols).ravel(),
+                    mode=window_mode,
+                    fn=fn,
+                    window_kwargs=window_mode_kwargs,
+                    function_kwargs=function_kwargs,
+                )
+        if result is None:
+            results = []
+            for idx, ts in enumerate(series):
+                if ts_dfs[idx] is None:
+                    ts_dfs[idx] = ts.to_dataframe(copy=False, suppress_warnings=True)
+                results.append(
+                    getattr(
+                        getattr(ts_dfs[idx][filter_df_columns], window_mode)(
+                            **window_mode_kwargs
+                        ),
+                        fn,
+                    )(**function_kwargs).to_numpy()
                 )
+            result = np.concatenate(results, axis=1)
+        if shifts:
+            result = np.concatenate([
+                np.full((shifts, result.shape[1]), np.nan),
+                result[: n_times - shifts],
+            ])
+        transformed_values.append(result.reshape(n_times, len(series), -1))
 
-        times = generate_index(
-            start=series[0].start_time(),
-            freq=series[0].freq,
-            length=len(vals),
-            name=times.name,
+        min_periods = transformation["min_periods"]
+        # set new columns names
+        fn_name = transformation.get("function_name")
+        if fn_name:
+            function_name = fn_name
+        else:
+            function_name = fn if fn != "apply" else "udf"
+        name_prefix = (
+            f"{window_mode}_{function_name}"
+            f"{'_' + str(transformation['window']) if 'window' in transformation else ''}"
+            f"{'_' + str(min_periods) if min_periods > 1 else ''}"
         )
-    else:
-        if ignore_time_axis:
-            time_axes_ok = len({len(ts) for ts in series}) == 1
+
+        if keep_names:
+            new_columns.extend(comps_to_transform)
         else:
-            time_axes_ok = all([
-                ts.has_same_time_as(ts_next)
-                for ts, ts_next in zip(series[0:-1], series[1:])
-            ])
+            names_w_prefix = [
+                f"{name_prefix}_{comp_name}" for comp_name in comps_to_transform
+            ]
+            new_columns.extend(names_w_prefix)
+            if convert_hierarchy:
+                comp_names_map.update({
+                    c_name: new_c_name
+                    for c_name, new_c_name in zip(comps_to_transform, names_w_prefix)
+                })
 
-        if (
-            (not time_axes_ok)
-            or (axis == 1 and not sample_axis_equal)
-            or (axis == 2 and not component_axis_equal)
-        ):
+    # keep all original components
+    if keep_non_transformed:
+        new_columns.extend(original_components)
+
+    # Treat NaNs that were introduced by the transformations only
+    # Default to leave NaNs
+    if isinstance(treat_na, str):
+        if treat_na not in VALID_TREAT_NA:
             raise_log(
                 ValueError(
-                    "When concatenating along component or sample dimensions, all the series must have the same time "
-                    "axes (unless `ignore_time_axis` is True), or time axes of same lengths (if `ignore_time_axis` is "
-                    "True), and all series must have the same number of samples (if concatenating along component "
-                    "dimension), or the same number of components (if concatenating along sample dimension)."
+                    f"`treat_na` must be one of {VALID_TREAT_NA} or a scalar, but found {treat_na}",
                 ),
             )
 
-        if axis == 1:
-            # When concatenating along component dimension, we have to re-create a component index
-            # we rely on the factory method of TimeSeries to disambiguate names later on if needed.
-            components = pd.Index([
-                c for cl in [ts.components for ts in series] for c in cl
-            ])
-            static_covariates = (
-                _concat_static_covs(series)
-                if not ignore_static_covariates
-                else static_covariates
+        if treat_na in VALID_BFILL_NA and forecasting_safe:
+            raise_log(
+                ValueError(
+                    "when `forecasting_safe` is True, back filling NaNs is not allowed as "
+                    "it risks contaminating past time steps with future values."
+                ),
             )
-            hierarchy = None if drop_hierarchy else _concat_hierarchy(series)
 
-    return series[0].__class__(
-        times=times,
-        values=vals,
-        components=components,
-        static_covariates=static_covariates,
-        hierarchy=hierarchy,
-        metadata=metadata,
-    )
+    transformed_series = []
+    for idx, ts in enumerate(series):
+        resulting_transformations = np.concatenate(
+            [values_tr[:, idx] for values_tr in transformed_values], axis=1
+        )
 
+        # Detect actual leading NaN count per transformed column.
+        # More robust than predicting from window params, as some functions
+        # (e.g., std with ddof=1) produce NaN even when min_periods is satisfied.
+        added_na = []
+        if treat_na is not None:
+            na_mask = np.isnan(resulting_transformations)
+            has_na = na_mask.any(axis=0)
+            first_valid = np.where(has_na, np.argmax(~na_mask, axis=0), 0)
+            added_na = first_valid.tolist()
 
-def slice_intersect(series: Sequence[TimeSeries]) -> list[TimeSeries]:
-    """Returns a list of series, where all series have been intersected along the time index.
+        if keep_non_transformed:
+            resulting_transformations = np.concatenate(
+                [
+                    resulting_transformations,
+                    values[:, idx * n_cols : (idx + 1) * n_cols],
+                ],
+                axis=1,
+            )
 
-    Parameters
-    ----------
-    series
-        sequence of ``TimeSeries`` to intersect
+        new_index = ts._time_index
+        if isinstance(treat_na, int | float) or (treat_na in VALID_BFILL_NA):
+            for i in range(0, len(added_na), n_samples):
+                s_idx = added_na[i : (i + n_samples)][0]
+                value = (
+                    treat_na
+                    if isinstance(treat_na, int | float)
+                    else resulting_transformations[s_idx, i : (i + n_samples)]
+                )
+                resulting_transformations[:s_idx, i : (i + n_samples)] = value
+        elif treat_na == "dropna":
+            # can only drop the NaN rows that are common among the columns
+            drop_before_idx = np.min(added_na)
+            resulting_transformations = resulting_transformations[drop_before_idx:]
+            new_index = new_index[drop_before_idx:]
 
-    Returns
-    -------
-    Sequence[TimeSeries]
-        The intersected series.
-    """
-    if not series:
-        return []
+        new_hierarchy = None
+        if convert_hierarchy and ts.hierarchy:
+            if keep_names:
+                new_hierarchy = ts.hierarchy
+            else:
+                new_hierarchy = {
+                    comp_names_map[k]: [comp_names_map[old_name] for old_name in v]
+                    for k, v in ts.hierarchy.items()
+                }
 
-    # find global intersection on first series
-    intersection = series[0]
-    for series_ in series[1:]:
-        intersection = intersection.slice_intersect(series_)
+        resulting_transformations = resulting_transformations.reshape(
+            len(new_index), -1, n_samples
+        )
+        resulting_transformations = _maybe_cast_array_dtype(
+            resulting_transformations, ts.dtype
+        )
+        transformed_series.append(
+            TimeSeries(
+                times=new_index,
+                values=resulting_transformations,
+                components=new_columns,
+                static_covariates=ts.static_covariates,
+                hierarchy=new_hierarchy,
+                metadata=ts.metadata,
+                copy=False,
+            )
+        )
+    return transformed_series
 
-    # intersect all other series
-    series_intersected = [intersection]
-    for series_ in series[1:]:
-        series_intersected.append(series_.slice_intersect(intersection))
 
-    return series_intersected
+def _parse_quantile_components(
+    components: pd.Index,
+) -> tuple[pd.Index, np.ndarray] | None:
+    """Return the original component names and the quantile levels of quantile components named
+    "<component>_q<quantile>" (see :attr:`TimeSeries.is_quantile`), or `None` if the components do not follow this
+    convention."""
+    if not len(components) or not isinstance(components[0], str):
+        return None
+    parts = components.str.extract(QUANTILE_COMPONENT_PATTERN)
+    if parts.isna().any(axis=None):
+        return None
+    levels = parts[1].astype(float).to_numpy()
+    # all original components share the same increasing quantile levels
+    n_levels = int(np.argmax(parts[0].to_numpy() != parts[0].iloc[0]))
+    n_levels = n_levels or len(components)
+    if n_levels < 2 or len(components) % n_levels:
+        return None
+    levels = levels.reshape(-1, n_levels)
+    comps = parts[0].to_numpy().reshape(-1, n_levels)
+    if (
+        (levels != levels[0]).any()
+        or (comps != comps[:, :1]).any()
+        or not (np.diff(levels[0]) > 0).all()
+        or len(set(comps[:, 0])) != len(comps)
+    ):
+        return None
+    return pd.Index(comps[:, 0]), levels[0]
 
 
-def to_group_dataframe(
-    series: Sequence[TimeSeries],
-    copy: bool = True,
-    backend: ModuleType | Implementation | str = Implementation.PANDAS,
-    time_as_index: bool = True,
-    suppress_warnings: bool = False,
-    add_static_covariates: bool | str | list[str] = True,
-    add_metadata: bool | str | list[str] = False,
-    add_group_col: bool | str = False,
-):
-    """Converts a sequence of `TimeSeries` into a long DataFrame representation.
+def _interpolate_quantiles(
+    values: np.ndarray, levels: np.ndarray, q: np.ndarray
+) -> np.ndarray:
+    """Linearly interpolate the quantiles `q` from values of shape `(..., n levels)` at the quantile `levels`.
+    Returns an array of shape `(..., n quantiles)`."""
+    idx = np.clip(np.searchsorted(levels, q, side="right") - 1, 0, len(levels) - 2)
+    weights = (q - levels[idx]) / (levels[idx + 1] - levels[idx])
+    return values[..., idx] * (1.0 - weights) + values[..., idx + 1] * weights
 
-    It converts each series into individual DataFrames and then concatenates them row-wise into a long DataFrame
-    using the specified backend.
 
-    This is particularly useful when working with collections of time series that share a common schema
-    and need to be represented in a tabular format for downstream processing.
+def _intern_time_index(times: TimeIndex) -> TimeIndex:
+    """Return the canonical instance of the regular time index `times`.
 
-    Parameters
-    ----------
-    series
-        A sequence of `TimeSeries` to convert into a long DataFrame.
-    copy
-        Whether to return a copy of the resulting DataFrame. Leave it to True unless you know what you are doing.
-    backend
-        The backend to which to export the `TimeSeries`. See the `narwhals documentation
-        <https://narwhals-dev.github.io/narwhals/api-reference/narwhals/#narwhals.from_dict>`__ for all supported
-        backends.
-    time_as_index
-        Whether to set the time index as the index of the DataFrame or in the left-most column.
-        Only effective with the pandas `backend`.
-    suppress_warnings
-        Whether to suppress warnings raised during the DataFrame creation.
-    add_static_covariates
-        Whether to add the series' static covariates to the resulting DataFrame (one column per component-static
-        covariate pair). If a bool, controls whether to add all static covariates or none. If a string, or list of
-        strings, specifies the subset of static covariate columns / names to add.
-    add_metadata
-        Whether to add the series' metadata to the resulting DataFrame (one column per metadata entry). If a bool,
-        controls whether to add all metadata entries or none. If a string, or list of strings, specifies the subset
-        of metadata keys / names to add.
-    add_group_col
-        Whether to add a integer group column to the resulting DataFrame that serves as a mapping between DataFrame
-        rows and their corresponding time series. If a bool, indicates whether to add a group column with the name
-        "group". If a string, adds a group column with the name being that string value.
+    All series with the same time index (same type, dtype, frequency, start, length and name) share a single index
+    object, so that comparing their time indexes is an identity check. The canonical indexes are only referenced
+    weakly, and are released once no series uses them anymore.
+    """
+    if isinstance(times, pd.RangeIndex):
+        key = (times.start, times.step, len(times), times.name)
+    else:
+        # the frequency string distinguishes equal offsets such as `Day(1)` and `Hour(24)`
+        freq = times.freq
+        start = times.asi8[0] if len(times) else None
+        key = (times.dtype, freq, freq.freqstr, start, len(times), times.name)
+    try:
+        return _TIME_INDEX_CACHE.setdefault(key, times)
+    except TypeError:
+        # unhashable frequency or name
+        return times
+
+
+def _read_only(values: np.ndarray, owned: bool = False) -> np.ndarray:
+    """Return a read-only view of `values` (or `values` itself if it is already read-only).
+
+    The values of a ``TimeSeries`` are never modified in-place, so series can safely share their buffers. If `owned`,
+    `values` was created for the series and is not referenced elsewhere; it is then made read-only itself instead of
+    a view.
+    """
+    # lazily loaded values are never written to
+    if isinstance(values, LazyValues) or not values.flags.writeable:
+        return values
+    if not owned:
+        values = values.view()
+    values.flags.writeable = False
+    return values
 
-    Returns
-    -------
-    DataFrame
-        A long DataFrame representation of the input sequence of `TimeSeries` in the specified `backend`.
+
+def _has_private_values(values: np.ndarray) -> bool:
+    """Whether `values` cannot change, i.e. neither `values` nor any array it is a view of is writeable.
+
+    This is not the case for series created without a copy of a writeable array (e.g. ``from_values(..., copy=False)``),
+    as the array can still be modified by the caller.
     """
+    if isinstance(values, LazyValues):
+        return True
+    while isinstance(values, np.ndarray):
+        if values.flags.writeable:
+            return False
+        values = values.base
+    return True
 
-    backend = Implementation.from_backend(backend)
 
-    if isinstance(series, TimeSeries):
-        series = [series]
+def _fingerprint(series: TimeSeries) -> str:
+    """Return a stable hash of the time index, values, components, static covariates and hierarchy of `series`.
 
-    df = []
-    group_col = add_group_col if isinstance(add_group_col, str) else "group"
-    for idx, series_ in enumerate(series):
-        df_ = series_.to_dataframe(
-            copy=copy,
-            backend=backend,
-            time_as_index=time_as_index,
-            suppress_warnings=suppress_warnings,
-            add_static_covariates=add_static_covariates,
-            add_metadata=add_metadata,
-        )
-        df_ = nw.from_native(df_)
-        if add_group_col:
-            df_ = df_.with_columns(nw.lit(idx).alias(group_col))
-        df.append(df_)
+    The hash does not depend on the Python session (no `hash()` of strings), so it can also key persistent caches.
+    """
+    digest = hashlib.blake2b(digest_size=16)
 
-    df = nw.concat(df).to_native()
+    def _update(obj: Any):
+        digest.update(json.dumps(obj, default=repr).encode())
 
-    # pandas keeps the row index of each df, reset it here if it does not represent the time index
-    if backend.is_pandas() and not time_as_index:
-        df.reset_index(inplace=True, drop=True)
-    return df
+    times = series._time_index
+    if series._has_datetime_index:
+        start = int(times.asi8[0]) if len(times) else None
+        _update(["datetime", str(times.dtype), series._freq_str, start, len(times)])
+    else:
+        _update(["range", times.start, times.step, len(times)])
+    _update(repr(times.name))
+
+    values = series._values
+    _update([str(values.dtype), values.shape])
+    digest.update(np.ascontiguousarray(values).data)
+
+    _update(list(series.components))
+    static_covariates = series.static_covariates
+    if static_covariates is None:
+        _update(None)
+    else:
+        _update([
+            list(static_covariates.columns),
+            list(static_covariates.index),
+            [str(dtype) for dtype in static_covariates.dtypes],
+        ])
+        hashes = pd.util.hash_pandas_object(static_covariates, index=False)
+        digest.update(hashes.to_numpy().data)
+    hierarchy = series.hierarchy
+    _update(
+        None
+        if hierarchy is None
+        else sorted((k, list(v)) for k, v in hierarchy.items())
+    )
+    return digest.hexdigest()
 
 
 def _finite_rows_boundaries(
@@ -6256,6 +8524,165 @@ def _finite_rows_boundaries(
     return first_finite_row, last_finite_row
 
 
+def _check_gap_mode(mode: str):
+    if mode not in {"all", "any"}:
+        raise_log(
+            ValueError(f"Keyword mode accepts only 'any' or 'all'. Provided {mode}"),
+        )
+
+
+def _check_strip_how(how: str):
+    if how not in {"all", "any"}:
+        raise_log(
+            ValueError(
+                f"`how` parameter value not recognized, should be either 'all' or 'any', "
+                f"received {how}"
+            )
+        )
+
+
+def _check_deterministic(series: Sequence[TimeSeries], method: str):
+    if isinstance(series, TimeSeriesCollection):
+        is_probabilistic = series.n_samples > 1
+    else:
+        is_probabilistic = any(ts.is_probabilistic for ts in series)
+    if is_probabilistic:
+        raise_log(
+            ValueError(f"`{method}` cannot be applied to stochastic TimeSeries"),
+        )
+
+
+def _nan_rows(
+    series: Sequence[TimeSeries], how: str = "all"
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return whether each time step of `series` is missing, concatenated over all series, and the offsets of each
+    series in the result (of length `len(series) + 1`).
+
+    A time step is missing if all its values (across components and samples) are NaN with `how="all"`, and if any of
+    them is NaN with `how="any"`.
+    """
+
+    def _is_nan(values: np.ndarray) -> np.ndarray:
+        is_nan = np.isnan(values.reshape(len(values), -1))
+        return is_nan.all(axis=1) if how == "all" else is_nan.any(axis=1)
+
+    if isinstance(series, TimeSeriesCollection):
+        return _is_nan(series.all_values(copy=False)), series._offsets
+    offsets = np.zeros(len(series) + 1, dtype=int)
+    np.cumsum([len(ts) for ts in series], out=offsets[1:])
+    if not len(series):
+        return np.zeros(0, dtype=bool), offsets
+    return np.concatenate([_is_nan(ts._values) for ts in series]), offsets
+
+
+def _nan_runs(
+    series: Sequence[TimeSeries], how: str = "all"
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the series index, and the (local) first and last positions of each run of missing time steps in
+    `series` (see :func:`_nan_rows`), ordered by series and position."""
+    is_nan, offsets = _nan_rows(series, how=how)
+    starts, ends = _runs(is_nan, offsets)
+    series_idx = np.searchsorted(offsets, starts, side="right") - 1
+    return series_idx, starts - offsets[series_idx], ends - offsets[series_idx]
+
+
+def _runs(mask: np.ndarray, offsets: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the first and last positions of the runs of `True` in `mask`, where runs never span two series of the
+    concatenated `mask` delimited by `offsets`."""
+    is_first = mask.copy()
+    is_first[1:] &= ~mask[:-1]
+    is_last = mask.copy()
+    is_last[:-1] &= ~mask[1:]
+    # the first and last time steps of a series start and end a run
+    series_firsts, series_lasts = offsets[:-1], offsets[1:] - 1
+    non_empty = series_firsts <= series_lasts
+    is_first[series_firsts[non_empty]] = mask[series_firsts[non_empty]]
+    is_last[series_lasts[non_empty]] = mask[series_lasts[non_empty]]
+    return np.flatnonzero(is_first), np.flatnonzero(is_last)
+
+
+def _finite_bounds(
+    is_nan: np.ndarray, offsets: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the (local) positions of the first and last non-missing time step of each series in the concatenated
+    `is_nan`. As with :meth:`TimeSeries.strip`, series without any non-missing time step are kept entirely."""
+    finite_pos = np.flatnonzero(~is_nan)
+    lengths = np.diff(offsets)
+    if not len(finite_pos):
+        return np.zeros_like(lengths), lengths - 1
+    # position in `finite_pos` of the first finite time step at or after the start of each series, and of the last
+    # one before the end of each series
+    first_idx = np.searchsorted(finite_pos, offsets[:-1], side="left")
+    last_idx = np.searchsorted(finite_pos, offsets[1:], side="left") - 1
+    has_finite = first_idx <= last_idx
+    firsts = np.where(
+        has_finite,
+        finite_pos[np.minimum(first_idx, len(finite_pos) - 1)] - offsets[:-1],
+        0,
+    )
+    lasts = np.where(
+        has_finite, finite_pos[np.maximum(last_idx, 0)] - offsets[:-1], lengths - 1
+    )
+    return firsts, lasts
+
+
+def _longest_slices(
+    is_nan_all: np.ndarray,
+    is_nan: np.ndarray,
+    offsets: np.ndarray,
+    max_gap_size: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the (local) first and last positions of the longest slice of each series without gaps larger than
+    `max_gap_size`, see :meth:`TimeSeries.longest_contiguous_slice`.
+
+    `is_nan_all` gives the missing time steps to strip (in all components), and `is_nan` the ones forming gaps.
+    """
+    n_series = len(offsets) - 1
+    firsts, lasts = _finite_bounds(is_nan_all, offsets)
+    firsts, lasts = firsts + offsets[:-1], lasts + offsets[:-1]
+
+    # the gaps larger than `max_gap_size` in the stripped series, ordered by series and position
+    gap_starts, gap_ends = _runs(is_nan, offsets)
+    gap_series = np.searchsorted(offsets, gap_starts, side="right") - 1
+    gap_starts = np.maximum(gap_starts, firsts[gap_series])
+    gap_ends = np.minimum(gap_ends, lasts[gap_series])
+    is_relevant = (gap_ends >= gap_starts) & (gap_ends - gap_starts + 1 > max_gap_size)
+    gap_starts, gap_ends = gap_starts[is_relevant], gap_ends[is_relevant]
+    n_gaps = np.bincount(gap_series[is_relevant], minlength=n_series)
+
+    # the slices before, between and after the gaps of each series
+    slice_offsets = np.zeros(n_series + 1, dtype=int)
+    np.cumsum(n_gaps + 1, out=slice_offsets[1:])
+    is_first_slice = np.zeros(slice_offsets[-1], dtype=bool)
+    is_first_slice[slice_offsets[:-1]] = True
+    slice_starts = np.empty(slice_offsets[-1], dtype=int)
+    slice_starts[is_first_slice] = firsts
+    slice_starts[~is_first_slice] = gap_ends + 1
+    is_last_slice = np.zeros(slice_offsets[-1], dtype=bool)
+    is_last_slice[slice_offsets[1:] - 1] = True
+    slice_ends = np.empty(slice_offsets[-1], dtype=int)
+    slice_ends[is_last_slice] = lasts
+    slice_ends[~is_last_slice] = gap_starts - 1
+
+    # the first slice of maximum size of each series; if no slice spans more than one time step, the whole stripped
+    # series is kept
+    sizes = slice_ends - slice_starts
+    max_sizes = np.maximum.reduceat(sizes, slice_offsets[:-1])
+    is_max = np.flatnonzero(sizes == np.repeat(max_sizes, n_gaps + 1))
+    longest = is_max[np.searchsorted(is_max, slice_offsets[:-1])]
+    has_slice = max_sizes > 0
+    starts = np.where(has_slice, slice_starts[longest], firsts) - offsets[:-1]
+    ends = np.where(has_slice, slice_ends[longest], lasts) - offsets[:-1]
+    return starts, ends
+
+
+def _concat_time_values(times: list[TimeIndex]) -> np.ndarray | pd.Index:
+    """Concatenate the time indexes `times` (which can be empty)."""
+    if not times:
+        return np.array([], dtype=int)
+    return times[0].append(times[1:]) if len(times) > 1 else times[0]
+
+
 def _clean_components(components: pd.Index) -> pd.Index:
     """Return a `pandas.Index` with unique string component / column names"""
     # convert everything to string if needed
@@ -0,0 +1,185 @@
+"""Lazily loaded values of out-of-core ``TimeSeries``, read chunk by chunk from a store."""
+
+import os
+
+import numpy as np
+
+# file name pattern of the values chunks written by `TimeSeries.save_chunked()`
+CHUNK_VALUES_FILE = "values_{}.npy"
+
+
+class NpyChunkStore:
+    def __init__(self, path: str, chunk_lengths: list[int], dtype: np.dtype):
+        """A store of values of shape `(time, component, sample)` split along the time axis into `.npy` files.
+
+        Each chunk is memory-mapped when it is first accessed.
+
+        Parameters
+        ----------
+        path
+            The directory containing the chunks named after `CHUNK_VALUES_FILE`.
+        chunk_lengths
+            The number of time steps of each chunk.
+        dtype
+            The dtype of the values.
+        """
+        self.path = path
+        self.bounds = np.concatenate([[0], np.cumsum(chunk_lengths)]).astype(int)
+        first_chunk = self._chunk(0)
+        self.shape = (int(self.bounds[-1]),) + first_chunk.shape[1:]
+        self.dtype = np.dtype(dtype)
+
+    @staticmethod
+    def save(path: str, values: np.ndarray, chunk_length: int) -> list[int]:
+        """Write `values` to `.npy` chunks of `chunk_length` time steps, and return the lengths of the chunks."""
+        chunk_lengths = []
+        for chunk_idx, start in enumerate(range(0, max(len(values), 1), chunk_length)):
+            chunk = values[start : start + chunk_length]
+            np.save(os.path.join(path, CHUNK_VALUES_FILE.format(chunk_idx)), chunk)
+            chunk_lengths.append(len(chunk))
+        return chunk_lengths
+
+    def load(self, start: int, stop: int) -> np.ndarray:
+        """Return the values of the time steps `start` (inclusive) to `stop` (exclusive), reading only the chunks
+        that overlap with them."""
+        first = max(np.searchsorted(self.bounds, start, side="right") - 1, 0)
+        last = max(np.searchsorted(self.bounds, stop, side="left"), first + 1)
+        parts = [
+            self._chunk(idx)[
+                max(start - self.bounds[idx], 0) : max(stop - self.bounds[idx], 0)
+            ]
+            for idx in range(first, min(last, len(self.bounds) - 1))
+        ]
+        return parts[0] if len(parts) == 1 else np.concatenate(parts, axis=0)
+
+    def _chunk(self, idx: int) -> np.ndarray:
+        return np.load(
+            os.path.join(self.path, CHUNK_VALUES_FILE.format(idx)), mmap_mode="r"
+        )
+
+
+class XarrayStore:
+    def __init__(self, xa):
+        """A store of values of shape `(time, component, sample)` held by a (lazily loaded) ``xarray.DataArray``.
+
+        With DataArrays backed by chunked or on-disk storage (e.g. opened with ``xarray.open_dataarray()`` or
+        ``xarray.open_zarr()``), xarray only reads the data of the selected time steps.
+
+        Parameters
+        ----------
+        xa
+            The DataArray with dimensions `(time, component, sample)`.
+        """
+        self.xa = xa
+        self.shape = xa.shape
+        self.dtype = xa.dtype
+
+    def load(self, start: int, stop: int) -> np.ndarray:
+        """Return the values of the time steps `start` (inclusive) to `stop` (exclusive)."""
+        return self.xa.isel({self.xa.dims[0]: slice(start, stop)}).values
+
+
+class LazyValues:
+    def __init__(
+        self,
+        store: NpyChunkStore | XarrayStore,
+        dtype: np.dtype | None = None,
+        keys: tuple[tuple, ...] = (),
+    ):
+        """The values of an out-of-core ``TimeSeries``, which are only loaded from the `store` when they are indexed.
+
+        Indexing the time axis (with an integer, a slice or an array of positions) loads only the time steps between
+        the first and last selected positions, and returns a NumPy array. Indexing only the component or sample axes
+        (e.g. `values[:, :, 0]`) is deferred until the time axis is indexed. All other operations (NumPy functions,
+        array methods and attributes) load all values.
+
+        Parameters
+        ----------
+        store
+            The store holding the values of shape `(time, component, sample)`.
+        dtype
+            Optionally, the dtype to cast the loaded values to. Defaults to the dtype of the store.
+        keys
+            The deferred keys indexing the component and sample axes, applied in order after loading.
+        """
+        self._store = store
+        self.dtype = np.dtype(dtype if dtype is not None else store.dtype)
+        self._keys = keys
+        # apply the deferred keys to an empty array to get the shape of the other axes
+        empty = np.empty((0,) + tuple(store.shape[1:]), dtype=self.dtype)
+        for key in keys:
+            empty = empty[(slice(None),) + key]
+        self.shape = (store.shape[0],) + empty.shape[1:]
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape))
+
+    @property
+    def nbytes(self) -> int:
+        return self.size * self.dtype.itemsize
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __getitem__(self, key):
+        key = key if isinstance(key, tuple) else (key,)
+        if not key:
+            return self
+        if any(k is Ellipsis or k is None for k in key):
+            return np.asarray(self)[key]
+
+        time_key, other_keys = key[0], key[1:]
+        n = len(self)
+        if isinstance(time_key, slice):
+            if time_key == slice(None):
+                if not other_keys:
+                    return self
+                return LazyValues(self._store, self.dtype, self._keys + (other_keys,))
+            start, stop, step = time_key.indices(n)
+            if step < 0:
+                return np.asarray(self)[key]
+            values = self._load(start, max(start, stop))
+            return values[(slice(None, None, step),) + other_keys]
+
+        if isinstance(time_key, int | np.integer):
+            idx = time_key + n if time_key < 0 else time_key
+            if not 0 <= idx < n:
+                raise IndexError(
+                    f"index {time_key} is out of bounds for axis 0 with size {n}"
+                )
+            return self._load(idx, idx + 1)[(0,) + other_keys]
+
+        idx = np.asarray(time_key)
+        if idx.dtype == bool:
+            idx = np.flatnonzero(idx)
+        idx = np.where(idx < 0, idx + n, idx)
+        start, stop = (int(idx.min()), int(idx.max()) + 1) if idx.size else (0, 0)
+        return self._load(start, stop)[(idx - start,) + other_keys]
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        values = self._load(0, len(self))
+        return values if dtype is None else values.astype(dtype, copy=False)
+
+    def __getattr__(self, name: str):
+        # private and special attributes are never delegated (e.g. while unpickling)
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(np.asarray(self), name)
+
+    def __repr__(self) -> str:
+        return f"LazyValues(shape={self.shape}, dtype={self.dtype})"
+
+    def copy(self) -> np.ndarray:
+        """Load all values into a new in-memory array."""
+        return np.array(self._load(0, len(self)))
+
+    def _load(self, start: int, stop: int) -> np.ndarray:
+        values = self._store.load(start, stop).astype(self.dtype, copy=False)
+        for key in self._keys:
+            values = values[(slice(None),) + key]
+        return values
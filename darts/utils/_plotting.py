@@ -13,6 +13,7 @@ import matplotlib.axes
 import matplotlib.colors as mcolors
 import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
 
 from darts.logging import get_logger, raise_log
 
@@ -38,6 +39,13 @@ def _prepare_plot_params(
     """Shared input validation and parameter preparation for plot() and plotly()."""
 
     # quantile validation
+    is_probabilistic = series.is_stochastic or series.is_quantile
+    if central_quantile == "mean" and series.is_quantile:
+        raise_log(
+            ValueError(
+                '`central_quantile="mean"` is not supported for quantile series; use a quantile instead.'
+            ),
+        )
     if central_quantile != "mean":
         if not (isinstance(central_quantile, float) and 0.0 <= central_quantile <= 1.0):
             raise_log(
@@ -60,15 +68,36 @@ def _prepare_plot_params(
                 ),
             )
 
-    # component slicing
+    # quantile series can only show intervals within their quantile levels
+    if series.is_quantile and low_quantile is not None and high_quantile is not None:
+        levels = series.quantile_levels
+        if low_quantile < levels[0] or high_quantile > levels[-1]:
+            low_quantile = min(max(low_quantile, levels[0]), levels[-1])
+            high_quantile = min(max(high_quantile, levels[0]), levels[-1])
+            if low_quantile >= high_quantile:
+                raise_log(
+                    ValueError(
+                        f"The confidence interval quantiles must overlap with the quantile levels of the quantile "
+                        f"series `[{levels[0]}, {levels[-1]}]`."
+                    ),
+                )
+            logger.warning(
+                f"The confidence interval quantiles are outside the quantile levels of the quantile series "
+                f"`[{levels[0]}, {levels[-1]}]`. Plotting the interval between quantiles `{low_quantile}` and "
+                f"`{high_quantile}` instead."
+            )
+
+    # component slicing; quantile series are plotted per original component
+    components = _get_plot_components(series)
+    n_components = len(components)
     n_components_to_plot = (
-        series.n_components
+        n_components
         if max_nr_components == -1
-        else min(series.n_components, max_nr_components)
+        else min(n_components, max_nr_components)
     )
-    if series.n_components > n_components_to_plot:
+    if n_components > n_components_to_plot:
         logger.warning(
-            f"Number of series components ({series.n_components}) is larger than the maximum number of "
+            f"Number of series components ({n_components}) is larger than the maximum number of "
             f"components to plot ({max_nr_components}). Plotting only the first `{n_components_to_plot}` "
             f"components. You can adjust the number of components to plot using `max_nr_components`."
         )
@@ -76,22 +105,22 @@ def _prepare_plot_params(
     # label resolution
     custom_labels = not isinstance(label, str) and isinstance(label, Sequence)
     if custom_labels:
-        if len(label) != series.n_components and len(label) != n_components_to_plot:
+        if len(label) != n_components and len(label) != n_components_to_plot:
             raise_log(
                 ValueError(
                     f"The `label` sequence must have the same length as the number of series components "
-                    f"({series.n_components}) or as the number of plotted components ({n_components_to_plot}). "
+                    f"({n_components}) or as the number of plotted components ({n_components_to_plot}). "
                     f"Received length `{len(label)}`."
                 ),
             )
 
     resolved_labels = []
-    for i, comp_name in enumerate(series.components[:n_components_to_plot]):
+    for i, comp_name in enumerate(components[:n_components_to_plot]):
         if custom_labels:
             lbl = label[i]
         elif label == "":
             lbl = comp_name
-        elif series.n_components == 1:
+        elif n_components == 1:
             lbl = label
         else:
             lbl = f"{label}_{comp_name}"
@@ -112,37 +141,54 @@ def _prepare_plot_params(
         and not isinstance(color, str)
         and not isinstance(color, tuple)
     ):
-        if len(color) not in {series.n_components, n_components_to_plot}:
+        if len(color) not in {n_components, n_components_to_plot}:
             raise_log(
                 ValueError(
                     f"The `color` sequence must have the same length as the number of series components "
-                    f"({series.n_components}) or as the number of plotted components ({n_components_to_plot}). "
+                    f"({n_components}) or as the number of plotted components ({n_components_to_plot}). "
                     f"Received length `{len(color)}`."
                 ),
             )
 
     # alpha preprocessing
     alpha_ci = alpha if alpha is not None else 0.25
-    alpha_line = 1 if series.is_stochastic else alpha
+    alpha_line = 1 if is_probabilistic else alpha
 
     return {
+        "components": components,
         "n_components_to_plot": n_components_to_plot,
         "resolved_labels": resolved_labels,
         "color": color,
-        "plot_ci": series.is_stochastic
+        "plot_ci": is_probabilistic
         and low_quantile is not None
         and high_quantile is not None,
         "alpha_ci": alpha_ci,
+        "low_quantile": low_quantile,
+        "high_quantile": high_quantile,
         "alpha_line": alpha_line,
     }
 
 
+def _get_plot_components(series: TimeSeries) -> pd.Index:
+    """Return the components to plot: the original components for quantile series, the series components
+    otherwise."""
+    encoding = series._quantile_encoding()
+    return encoding[0] if encoding is not None else series.components
+
+
+def _get_component_series(series: TimeSeries, comp_name: str) -> TimeSeries:
+    """Return the series of a plotted component, including all its quantile components for quantile series."""
+    if series.is_quantile:
+        return series[[f"{comp_name}_q{q:.3f}" for q in series.quantile_levels]]
+    return series[comp_name]
+
+
 def _compute_central_series(
     comp_ts: TimeSeries,
     central_quantile: float | str,
 ) -> TimeSeries:
     """Compute the central TimeSeries for a component."""
-    if comp_ts.is_stochastic:
+    if comp_ts.is_stochastic or comp_ts.is_quantile:
         if central_quantile == "mean":
             return comp_ts.mean()
         else:
@@ -253,12 +299,15 @@ def plot(
         c,
         alpha,
     )
+    components = prepared_params["components"]
     n_components_to_plot = prepared_params["n_components_to_plot"]
     resolved_labels = prepared_params["resolved_labels"]
     color = prepared_params["color"]
     plot_ci = prepared_params["plot_ci"]
     alpha_ci = prepared_params["alpha_ci"]
     alpha_line = prepared_params["alpha_line"]
+    low_quantile = prepared_params["low_quantile"]
+    high_quantile = prepared_params["high_quantile"]
 
     # determine if custom colors (sequence of colors) are provided
     custom_colors = isinstance(color, Sequence) and not isinstance(color, str | tuple)
@@ -273,8 +322,8 @@ def plot(
         if ax is None:
             ax = plt.gca()
 
-    for i, comp_name in enumerate(series.components[:n_components_to_plot]):
-        comp_ts = series[comp_name]
+    for i, comp_name in enumerate(components[:n_components_to_plot]):
+        comp_ts = _get_component_series(series, comp_name)
 
         central_ts = _compute_central_series(comp_ts, central_quantile)
         central_series = central_ts.to_series()  # shape: (time,)
@@ -466,12 +515,15 @@ def plotly(
         c,
         alpha,
     )
+    components = prepared_params["components"]
     n_components_to_plot = prepared_params["n_components_to_plot"]
     resolved_labels = prepared_params["resolved_labels"]
     color = prepared_params["color"]
     plot_ci = prepared_params["plot_ci"]
     alpha_ci = prepared_params["alpha_ci"]
     alpha_line = prepared_params["alpha_line"]
+    low_quantile = prepared_params["low_quantile"]
+    high_quantile = prepared_params["high_quantile"]
 
     # initialize figure
     fig = fig or go.Figure()
@@ -512,8 +564,8 @@ def plotly(
     time_idx = series.time_index[::step]
     is_single_point = len(time_idx) == 1
 
-    for i, comp_name in enumerate(series.components[:n_components_to_plot]):
-        comp_ts = series[comp_name]
+    for i, comp_name in enumerate(components[:n_components_to_plot]):
+        comp_ts = _get_component_series(series, comp_name)
 
         # determine central series
         central_ts = _compute_central_series(comp_ts, central_quantile)
@@ -0,0 +1,116 @@
+"""NumPy implementations of the most common resampling methods, used by ``TimeSeries.resample()``."""
+
+import numpy as np
+import pandas as pd
+
+# resampling methods (without method keyword arguments) computed with NumPy
+NUMPY_RESAMPLE_METHODS = {"sum", "mean", "first", "last", "min", "max", "interpolate"}
+# keyword arguments of `xarray.DataArray.resample()` supported by the NumPy engine
+NUMPY_RESAMPLE_KWARGS = {"closed", "label", "offset", "origin"}
+
+
+class ResampleEngine:
+    def __init__(self, times: pd.DatetimeIndex, freq: str, **kwargs):
+        """Resamples the columns of 2D arrays of shape `(time, columns)` sharing the time index `times` with NumPy.
+
+        The columns can belong to different series with the same time index (e.g. a stacked batch of series). The
+        bins of the resampled time index are computed once with pandas (with the same semantics as
+        ``xarray.DataArray.resample()``), and the values of all columns are reduced per bin with `numpy.ufunc.reduceat`.
+        Missing values are skipped, as with the default `skipna=True` of xarray.
+
+        Parameters
+        ----------
+        times
+            The time index of the values.
+        freq
+            The frequency of the resampled time index.
+        kwargs
+            Keyword arguments in `NUMPY_RESAMPLE_KWARGS` for the bins, see ``pandas.Series.resample()``.
+        """
+        counts = (
+            pd.Series(np.ones(len(times), dtype=np.int64), index=times)
+            .resample(freq, **kwargs)
+            .count()
+        )
+        self.times = times
+        self.time_index: pd.DatetimeIndex = counts.index
+        counts = counts.to_numpy()
+        # the bins are contiguous, as the time index is sorted
+        self._ends = np.cumsum(counts)
+        self._starts = self._ends - counts
+        self._non_empty = counts > 0
+
+    def compute(self, values: np.ndarray, method: str) -> np.ndarray:
+        """Resample the values with a method from `NUMPY_RESAMPLE_METHODS`.
+
+        Parameters
+        ----------
+        values
+            The values of shape `(time, columns)`.
+        method
+            The resampling method.
+
+        Returns
+        -------
+        np.ndarray
+            The resampled values of shape `(len(time_index), columns)` with the same dtype as `values`.
+        """
+        if method == "interpolate":
+            return self._interpolate(values)
+
+        is_valid = ~np.isnan(values)
+        starts = self._starts[self._non_empty]
+        ends = self._ends[self._non_empty]
+        if method in {"first", "last"}:
+            positions = np.arange(len(values))[:, None]
+            if method == "first":
+                # position of the next valid value
+                valid_pos = np.where(is_valid, positions, len(values))
+                valid_pos = np.minimum.accumulate(valid_pos[::-1], axis=0)[::-1]
+                idx = valid_pos[starts]
+                is_valid_bin = idx < ends[:, None]
+            else:
+                # position of the previous valid value
+                valid_pos = np.where(is_valid, positions, -1)
+                valid_pos = np.maximum.accumulate(valid_pos, axis=0)
+                idx = valid_pos[ends - 1]
+                is_valid_bin = idx >= starts[:, None]
+            reduced = np.take_along_axis(
+                values, np.clip(idx, 0, len(values) - 1), axis=0
+            )
+            return self._expand(np.where(is_valid_bin, reduced, np.nan), values.dtype)
+
+        n_valid = np.add.reduceat(is_valid, starts, axis=0)
+        if method in {"sum", "mean"}:
+            reduced = np.add.reduceat(np.where(is_valid, values, 0), starts, axis=0)
+            if method == "sum":
+                # the sum of a bin with only missing values is 0, but the one of an empty bin is NaN
+                return self._expand(reduced, values.dtype)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                reduced = reduced / n_valid
+        else:
+            ufunc, skip_value = (
+                (np.minimum, np.inf) if method == "min" else (np.maximum, -np.inf)
+            )
+            reduced = ufunc.reduceat(
+                np.where(is_valid, values, skip_value), starts, axis=0
+            )
+        return self._expand(np.where(n_valid > 0, reduced, np.nan), values.dtype)
+
+    def _expand(self, reduced: np.ndarray, dtype: np.dtype) -> np.ndarray:
+        """Insert the reduced values of the non-empty bins into the resampled values (NaN for empty bins)."""
+        out = np.full((len(self.time_index), reduced.shape[1]), np.nan, dtype=dtype)
+        out[self._non_empty] = reduced
+        return out
+
+    def _interpolate(self, values: np.ndarray) -> np.ndarray:
+        """Linear interpolation at the resampled times (as `scipy.interpolate.interp1d`, used by xarray)."""
+        times = self.times.asi8
+        new_times = self.time_index.asi8
+        # interval `[times[hi - 1], times[hi]]` containing each new time, where existing times use the left interval
+        hi = np.clip(np.searchsorted(times, new_times, side="left"), 1, len(times) - 1)
+        lo = hi - 1
+        weights = ((new_times - times[lo]) / (times[hi] - times[lo]))[:, None]
+        out = values[lo] + (values[hi] - values[lo]) * weights.astype(values.dtype)
+        out[(new_times < times[0]) | (new_times > times[-1])] = np.nan
+        return out
@@ -0,0 +1,345 @@
+"""NumPy implementations of the most common pandas window functions, used by ``TimeSeries.window_transform()``."""
+
+import math
+
+import numpy as np
+
+# builtin functions supported per window mode
+NUMPY_WINDOW_FUNCTIONS = {
+    "rolling": {"sum", "mean", "std", "var", "min", "max", "median", "quantile"},
+    "expanding": {"sum", "mean", "min", "max"},
+    "ewm": {"mean"},
+}
+# maximum number of elements of the temporary arrays when reducing over sliding windows
+_MAX_CHUNK_SIZE = 2**22
+
+
+class WindowEngine:
+    def __init__(self, values: np.ndarray):
+        """Computes builtin window functions on the columns of a 2D array of shape `(time, columns)` with NumPy.
+
+        The columns can belong to different series of equal length (e.g. a stacked batch of series), as window
+        functions are computed independently per column. The prefix sums used by the rolling and expanding sum and
+        mean are cached per set of columns, so that transformations with several window sizes on the same columns
+        share a single pass over the values.
+
+        The engine supports the functions in `NUMPY_WINDOW_FUNCTIONS`, with integer windows, right-closed and
+        non-centered rolling windows, and exponentially weighted means of series without missing values. For any
+        other configuration, :meth:`compute` returns `None` and the caller should fall back to pandas. The results
+        can differ from pandas by floating point rounding errors.
+
+        Parameters
+        ----------
+        values
+            The values of shape `(time, columns)`.
+        """
+        self.values = values
+        self._prefix_sums: dict[bytes, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+    def compute(
+        self,
+        columns: np.ndarray,
+        mode: str,
+        fn: str,
+        window_kwargs: dict,
+        function_kwargs: dict,
+    ) -> np.ndarray | None:
+        """Compute a window function on some columns.
+
+        Parameters
+        ----------
+        columns
+            The indices of the columns to transform.
+        mode
+            The window mode ("rolling", "expanding" or "ewm").
+        fn
+            The name of the pandas window function.
+        window_kwargs
+            The keyword arguments of the pandas window mode (e.g. `pandas.DataFrame.rolling()`).
+        function_kwargs
+            The keyword arguments of the pandas window function.
+
+        Returns
+        -------
+        np.ndarray | None
+            The transformed values of shape `(time, len(columns))`, or `None` if the transformation is not supported.
+        """
+        params = _parse_window_params(mode, fn, window_kwargs, function_kwargs)
+        if params is None:
+            return None
+        values = self.values[:, columns]
+        if np.isinf(values).any():
+            return None
+
+        min_periods = params["min_periods"]
+        if mode == "ewm":
+            if np.isnan(values).any():
+                return None
+            return _ewm_mean(values, params["alpha"], params["adjust"], min_periods)
+
+        window = params.get("window", len(values))
+        if fn in {"sum", "mean"}:
+            sums, counts, shift = self._get_prefix_sums(values, columns)
+            sums, counts = _window_diff(sums, window), _window_diff(counts, window)
+            # add the shift of the (non-missing) values back
+            if fn == "mean":
+                sums = np.divide(
+                    sums, counts, out=np.full_like(sums, np.nan), where=counts > 0
+                )
+                sums += shift
+            else:
+                sums += counts * shift
+            sums[counts < min_periods] = np.nan
+            return sums
+
+        if mode == "expanding":
+            accumulate = np.fmin.accumulate if fn == "min" else np.fmax.accumulate
+            result = accumulate(values.astype(np.float64), axis=0)
+            counts = np.cumsum(~np.isnan(values), axis=0)
+            result[counts < min_periods] = np.nan
+            return result
+
+        if fn in {"median", "quantile"}:
+            if np.isnan(values).any():
+                return None
+            q = 0.5 if fn == "median" else params["q"]
+            return _rolling_quantile(values, window, q, min_periods)
+        return _rolling_reduce(values, window, fn, min_periods, params.get("ddof", 1))
+
+    def _get_prefix_sums(
+        self, values: np.ndarray, columns: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the prefix sums of the (non-missing) values, the prefix counts of non-missing values, and the shift
+        of each column.
+
+        The values are shifted by the mean of their column before accumulating, so that the window sums obtained as
+        differences of prefix sums keep their precision for values with a large offset (e.g. `1e9 +- 1e3`).
+        """
+        key = np.asarray(columns).tobytes()
+        if key not in self._prefix_sums:
+            is_valid = ~np.isnan(values)
+            counts = np.zeros((len(values) + 1, values.shape[1]), dtype=np.int64)
+            np.cumsum(is_valid, axis=0, out=counts[1:])
+            zeros = np.where(is_valid, values, 0.0)
+            shift = np.divide(
+                zeros.sum(axis=0, dtype=np.float64),
+                counts[-1],
+                out=np.zeros(values.shape[1]),
+                where=counts[-1] > 0,
+            )
+            sums = np.zeros((len(values) + 1, values.shape[1]), dtype=np.float64)
+            np.cumsum(np.where(is_valid, zeros - shift, 0.0), axis=0, out=sums[1:])
+            self._prefix_sums[key] = (sums, counts, shift)
+        return self._prefix_sums[key]
+
+
+def _parse_window_params(
+    mode: str, fn: str, window_kwargs: dict, function_kwargs: dict
+) -> dict | None:
+    """Return the parameters of a supported window function, or `None` if not supported by the NumPy engine."""
+    if fn not in NUMPY_WINDOW_FUNCTIONS.get(mode, set()):
+        return None
+
+    window_kwargs = dict(window_kwargs)
+    params = {"min_periods": window_kwargs.pop("min_periods", None)}
+    if window_kwargs.pop("method", "single") != "single":
+        return None
+    if mode == "rolling":
+        window = window_kwargs.pop("window", None)
+        if not _is_int(window) or window < 1:
+            return None
+        params["window"] = int(window)
+        if params["min_periods"] is None:
+            params["min_periods"] = window
+        if (
+            window_kwargs.pop("center", False)
+            or window_kwargs.pop("win_type", None) is not None
+            or window_kwargs.pop("closed", None) not in {None, "right"}
+            or window_kwargs.pop("step", None) not in {None, 1}
+        ):
+            return None
+    elif mode == "ewm":
+        decays = {
+            key: window_kwargs.pop(key, None)
+            for key in ["com", "span", "halflife", "alpha"]
+        }
+        decays = {key: value for key, value in decays.items() if value is not None}
+        if len(decays) != 1 or window_kwargs.pop("times", None) is not None:
+            return None
+        ((decay, value),) = decays.items()
+        if not isinstance(value, int | float) or isinstance(value, bool):
+            return None
+        if decay == "com" and value >= 0:
+            params["alpha"] = 1.0 / (1.0 + value)
+        elif decay == "span" and value >= 1:
+            params["alpha"] = 2.0 / (value + 1.0)
+        elif decay == "halflife" and value > 0:
+            params["alpha"] = 1.0 - math.exp(-math.log(2.0) / value)
+        elif decay == "alpha" and 0 < value <= 1:
+            params["alpha"] = float(value)
+        else:
+            return None
+        params["adjust"] = window_kwargs.pop("adjust", True)
+        # only relevant with missing values, which are not supported
+        window_kwargs.pop("ignore_na", None)
+        if params["min_periods"] is None:
+            params["min_periods"] = 0
+
+    if params["min_periods"] is None:
+        params["min_periods"] = 1
+    if not _is_int(params["min_periods"]) or not (
+        0 <= params["min_periods"] <= params.get("window", np.inf)
+    ):
+        return None
+    if window_kwargs:
+        return None
+
+    function_kwargs = dict(function_kwargs)
+    function_kwargs.pop("engine", None)
+    function_kwargs.pop("engine_kwargs", None)
+    if function_kwargs.pop("numeric_only", False):
+        return None
+    if fn in {"std", "var"}:
+        ddof = function_kwargs.pop("ddof", 1)
+        if not _is_int(ddof):
+            return None
+        params["ddof"] = int(ddof)
+    elif fn == "quantile":
+        q = function_kwargs.pop("q", function_kwargs.pop("quantile", None))
+        if (
+            not isinstance(q, float | int)
+            or not 0 <= q <= 1
+            or function_kwargs.pop("interpolation", "linear") != "linear"
+        ):
+            return None
+        params["q"] = float(q)
+    if function_kwargs:
+        return None
+    return params
+
+
+def _is_int(value) -> bool:
+    return isinstance(value, int | np.integer) and not isinstance(value, bool)
+
+
+def _window_diff(prefix: np.ndarray, window: int) -> np.ndarray:
+    """Return the window sums (over the last `window` rows) from the prefix sums with a leading zero row."""
+    result = prefix[1:].copy()
+    result[window:] -= prefix[1:-window] if window < len(prefix) - 1 else 0
+    return result
+
+
+def _iter_windows(values: np.ndarray, window: int):
+    """Yield the row offsets and sliding windows of shape `(rows, columns, window)` over the values, padded with
+    NaNs at the beginning so that there is one window per row. Iterates over chunks of rows to bound the memory
+    usage."""
+    padded = np.concatenate([
+        np.full((window - 1, values.shape[1]), np.nan),
+        values.astype(np.float64),
+    ])
+    windows = np.lib.stride_tricks.sliding_window_view(padded, window, axis=0)
+    chunk_size = max(1, _MAX_CHUNK_SIZE // max(1, window * values.shape[1]))
+    for start in range(0, len(values), chunk_size):
+        yield start, windows[start : start + chunk_size]
+
+
+def _rolling_reduce(
+    values: np.ndarray, window: int, fn: str, min_periods: int, ddof: int
+) -> np.ndarray:
+    """Rolling min, max, std and var, ignoring missing values."""
+    result = np.empty(values.shape, dtype=np.float64)
+    for start, windows in _iter_windows(values, window):
+        is_valid = ~np.isnan(windows)
+        counts = is_valid.sum(axis=-1)
+        if fn == "min":
+            res = np.fmin.reduce(windows, axis=-1)
+        elif fn == "max":
+            res = np.fmax.reduce(windows, axis=-1)
+        else:
+            zeros = np.where(is_valid, windows, 0.0)
+            means = np.divide(
+                zeros.sum(axis=-1),
+                counts,
+                out=np.zeros(counts.shape),
+                where=counts > 0,
+            )
+            sq_devs = np.where(is_valid, (zeros - means[..., None]) ** 2, 0.0)
+            res = np.divide(
+                sq_devs.sum(axis=-1),
+                counts - ddof,
+                out=np.full(counts.shape, np.nan),
+                where=counts > ddof,
+            )
+            if fn == "std":
+                res = np.sqrt(res)
+        res[counts < min_periods] = np.nan
+        result[start : start + len(res)] = res
+    return result
+
+
+def _rolling_quantile(
+    values: np.ndarray, window: int, q: float, min_periods: int
+) -> np.ndarray:
+    """Rolling quantile (with linear interpolation) of values without missing values."""
+    result = np.empty(values.shape, dtype=np.float64)
+    # the first windows are incomplete
+    n_partial = min(window - 1, len(values))
+    for idx in range(n_partial):
+        result[idx] = np.quantile(values[: idx + 1], q, axis=0)
+    if len(values) >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(values, window, axis=0)
+        chunk_size = max(1, _MAX_CHUNK_SIZE // max(1, window * values.shape[1]))
+        for start in range(0, len(windows), chunk_size):
+            chunk = windows[start : start + chunk_size]
+            result[n_partial + start : n_partial + start + len(chunk)] = np.quantile(
+                chunk, q, axis=-1
+            )
+    result[: max(0, min_periods - 1)] = np.nan
+    return result
+
+
+def _ewm_mean(
+    values: np.ndarray, alpha: float, adjust: bool, min_periods: int
+) -> np.ndarray:
+    """Exponentially weighted mean of values without missing values."""
+    values = values.astype(np.float64)
+    beta = 1.0 - alpha
+    if adjust:
+        # weighted sum of all past values divided by the sum of weights
+        weighted_sums = _linear_recurrence(values, beta, 1.0, np.zeros(values.shape[1]))
+        weights = np.cumsum(beta ** np.arange(len(values)))
+        result = weighted_sums / weights[:, None]
+    else:
+        # recursive y_t = (1 - alpha) * y_t-1 + alpha * x_t, with y_0 = x_0
+        result = _linear_recurrence(values, beta, alpha, values[0])
+    result[: max(0, min_periods - 1)] = np.nan
+    return result
+
+
+def _linear_recurrence(
+    values: np.ndarray, beta: float, scale: float, initial: np.ndarray
+) -> np.ndarray:
+    """Compute `s_t = beta * s_t-1 + scale * x_t` with `s_-1 = initial` along the first axis.
+
+    Within blocks of rows, `s_t = beta^t * (beta * s_-1 + cumsum(scale * beta^-i * x_i))`. The blocks are short
+    enough for `beta^-i` not to overflow.
+    """
+    if beta == 0:
+        return scale * values
+    block_size = len(values)
+    if beta < 1:
+        block_size = min(block_size, max(1, int(100 * math.log(10) / -math.log(beta))))
+    powers = beta ** np.arange(block_size)
+    inv_powers = scale / powers
+
+    result = np.empty_like(values)
+    state = initial
+    for start in range(0, len(values), block_size):
+        block = values[start : start + block_size]
+        n = len(block)
+        res = powers[:n, None] * (
+            beta * state + np.cumsum(inv_powers[:n, None] * block, axis=0)
+        )
+        result[start : start + n] = res
+        state = res[-1]
+    return result
@@ -6,30 +6,42 @@ Functions for converting time series data into tabular format with lagged featur
 of scikit-learn compatible models for time series forecasting.
 """
 
+from darts.utils.data.tabularization.cache import (
+    clear_tabularization_cache,
+    tabularization_cache_info,
+)
 from darts.utils.data.tabularization.tabularization import (
+    LagPlan,
     _create_lagged_data_autoregression,
     _extend_time_index,
     _get_feature_times,
+    _get_static_covariates_values,
     add_static_covariates_to_lagged_data,
     create_lagged_component_names,
     create_lagged_data,
     create_lagged_prediction_data,
     create_lagged_training_data,
+    create_lagged_training_data_chunks,
     get_shared_times,
     get_shared_times_bounds,
     strided_moving_window,
 )
 
 __all__ = [
+    "LagPlan",
     "_create_lagged_data_autoregression",
     "_extend_time_index",
     "_get_feature_times",
+    "_get_static_covariates_values",
     "add_static_covariates_to_lagged_data",
+    "clear_tabularization_cache",
     "create_lagged_component_names",
     "create_lagged_data",
     "create_lagged_prediction_data",
     "create_lagged_training_data",
+    "create_lagged_training_data_chunks",
     "get_shared_times",
     "get_shared_times_bounds",
     "strided_moving_window",
+    "tabularization_cache_info",
 ]
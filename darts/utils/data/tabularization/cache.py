@@ -0,0 +1,229 @@
+"""
+Tabularization Cache
+--------------------
+
+A bounded cache of the lagged training data (features, labels and sample weights) created by ``SKLearnModel`` on
+``fit()``, so that repeated fits on the same series with the same lag configuration (e.g. in a gridsearch over the
+estimator hyperparameters, or in scheduled retrains) skip the tabularization entirely.
+
+The cache is disabled by default, and configured with options ``tabularization.cache_max_bytes`` and
+``tabularization.cache_dir`` (see :mod:`darts.config`):
+
+- The most recently used entries are kept in memory, up to ``tabularization.cache_max_bytes`` bytes.
+- If ``tabularization.cache_dir`` is set, the entries evicted from memory are written to `.npz` files in that
+  directory, and read again on a later hit. As the keys are stable across Python sessions, the entries written by
+  previous sessions are hits as well.
+
+The entries are keyed by the fingerprints of the series (see :attr:`TimeSeries.fingerprint
+<darts.timeseries.TimeSeries.fingerprint>`), covariates and sample weights, together with all settings affecting the
+lagged data (lags, `output_chunk_length`, `output_chunk_shift`, `multi_models`, `max_samples_per_ts`, `stride`,
+...). The cached arrays are read-only.
+
+Examples
+--------
+>>> from darts import option_context
+>>> from darts.utils.data.tabularization import tabularization_cache_info
+>>> with option_context("tabularization.cache_max_bytes", 2**30):
+...     for alpha in [0.1, 1.0, 10.0]:
+...         RegressionModel(lags=24, model=Ridge(alpha=alpha)).fit(series)
+>>> tabularization_cache_info()
+{'hits': 2, 'misses': 1, 'disk_hits': 0, 'entries': 1, 'nbytes': 2342400, 'max_bytes': 1073741824}
+"""
+
+import glob
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+
+from darts.config import get_option
+
+# file name pattern of the entries spilled to `tabularization.cache_dir`
+CACHE_FILE = "tabularization_{}.npz"
+
+_lock = threading.Lock()
+# the in-memory entries from least to most recently used: key -> (features, labels, sample weights, static covariates
+# shape)
+_entries: OrderedDict[str, tuple] = OrderedDict()
+_stats = {"hits": 0, "misses": 0, "disk_hits": 0, "nbytes": 0}
+
+
+def tabularization_cache_info() -> dict[str, int]:
+    """Return the statistics of the tabularization cache.
+
+    Returns
+    -------
+    dict[str, int]
+        A dictionary with keys:
+
+        - `hits`: the number of lookups of the lagged data that were found in the cache (in memory or on disk).
+        - `misses`: the number of lookups of the lagged data that had to be created.
+        - `disk_hits`: the number of hits that were read from ``tabularization.cache_dir``.
+        - `entries`: the number of entries held in memory.
+        - `nbytes`: the number of bytes held in memory.
+        - `max_bytes`: the maximum number of bytes held in memory (option ``tabularization.cache_max_bytes``).
+    """
+    with _lock:
+        return {
+            "hits": _stats["hits"],
+            "misses": _stats["misses"],
+            "disk_hits": _stats["disk_hits"],
+            "entries": len(_entries),
+            "nbytes": _stats["nbytes"],
+            "max_bytes": get_option("tabularization.cache_max_bytes"),
+        }
+
+
+def clear_tabularization_cache(disk: bool = False) -> None:
+    """Remove all entries held in memory by the tabularization cache and reset its statistics.
+
+    Parameters
+    ----------
+    disk
+        Whether to also remove the entries written to the directory of option ``tabularization.cache_dir``.
+    """
+    with _lock:
+        _entries.clear()
+        _stats.update(hits=0, misses=0, disk_hits=0, nbytes=0)
+        cache_dir = get_option("tabularization.cache_dir")
+        if disk and cache_dir is not None:
+            for path in glob.glob(os.path.join(cache_dir, CACHE_FILE.format("*"))):
+                os.remove(path)
+
+
+def _cache_enabled() -> bool:
+    """Whether the lagged data is cached, according to the `tabularization.cache_*` options."""
+    return (
+        get_option("tabularization.cache_max_bytes") > 0
+        or get_option("tabularization.cache_dir") is not None
+    )
+
+
+def _cache_key(
+    series: Sequence,
+    past_covariates: Sequence | None,
+    future_covariates: Sequence | None,
+    sample_weight: Sequence | str | None,
+    **settings: Any,
+) -> str:
+    """Return the key of the lagged data created from the series and the `settings` (lags, output_chunk_length,
+    ...), computed from the fingerprints of the series."""
+
+    def fingerprints(series_seq):
+        if series_seq is None or isinstance(series_seq, str):
+            return series_seq
+        if not isinstance(series_seq, Sequence):
+            series_seq = [series_seq]
+        return tuple(ts.fingerprint for ts in series_seq)
+
+    key = (
+        fingerprints(series),
+        fingerprints(past_covariates),
+        fingerprints(future_covariates),
+        fingerprints(sample_weight),
+        sorted(settings.items()),
+    )
+    return hashlib.sha256(repr(key).encode()).hexdigest()
+
+
+def _cache_get(key: str) -> tuple | None:
+    """Return the cached `(features, labels, sample_weights, static_covariates_shape)` of `key` (or `None`)."""
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None:
+            _entries.move_to_end(key)
+            _stats["hits"] += 1
+            return entry
+
+        cache_dir = get_option("tabularization.cache_dir")
+        path = None if cache_dir is None else _cache_path(cache_dir, key)
+        if path is None or not os.path.exists(path):
+            _stats["misses"] += 1
+            return None
+
+        with np.load(path, allow_pickle=False) as data:
+            entry = (
+                data["features"],
+                data["labels"],
+                data["sample_weights"] if "sample_weights" in data else None,
+                (
+                    tuple(int(dim) for dim in data["static_covariates_shape"])
+                    if "static_covariates_shape" in data
+                    else None
+                ),
+            )
+        _stats["hits"] += 1
+        _stats["disk_hits"] += 1
+        return _insert(key, _read_only(entry), cache_dir)
+
+
+def _cache_put(key: str, entry: tuple) -> tuple:
+    """Add `(features, labels, sample_weights, static_covariates_shape)` to the cache, and return the (read-only)
+    cached entry."""
+    with _lock:
+        return _insert(key, _read_only(entry), get_option("tabularization.cache_dir"))
+
+
+def _evict(max_bytes: int | None = None) -> None:
+    """Evict the least recently used entries until at most `max_bytes` bytes are held in memory."""
+    with _lock:
+        _evict_unlocked(
+            get_option("tabularization.cache_max_bytes")
+            if max_bytes is None
+            else max_bytes,
+            get_option("tabularization.cache_dir"),
+        )
+
+
+def _insert(key: str, entry: tuple, cache_dir: str | None) -> tuple:
+    if key not in _entries:
+        _entries[key] = entry
+        _stats["nbytes"] += _nbytes(entry)
+    _entries.move_to_end(key)
+    _evict_unlocked(get_option("tabularization.cache_max_bytes"), cache_dir)
+    return entry
+
+
+def _evict_unlocked(max_bytes: int, cache_dir: str | None) -> None:
+    while _entries and _stats["nbytes"] > max_bytes:
+        key, entry = _entries.popitem(last=False)
+        _stats["nbytes"] -= _nbytes(entry)
+        if cache_dir is not None:
+            _spill(_cache_path(cache_dir, key), entry)
+
+
+def _spill(path: str, entry: tuple) -> None:
+    """Write an entry evicted from memory to `path`, unless it was already written."""
+    if os.path.exists(path):
+        return
+    features, labels, sample_weights, static_covariates_shape = entry
+    arrays = {"features": features, "labels": labels}
+    if sample_weights is not None:
+        arrays["sample_weights"] = sample_weights
+    if static_covariates_shape is not None:
+        arrays["static_covariates_shape"] = np.array(static_covariates_shape)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # write to a temporary file first, so that concurrent readers never see partially written entries
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_path, path)
+
+
+def _cache_path(cache_dir: str, key: str) -> str:
+    return os.path.join(cache_dir, CACHE_FILE.format(key))
+
+
+def _nbytes(entry: tuple) -> int:
+    return sum(arr.nbytes for arr in entry[:3] if arr is not None)
+
+
+def _read_only(entry: tuple) -> tuple:
+    for arr in entry[:3]:
+        if arr is not None:
+            arr.flags.writeable = False
+    return entry
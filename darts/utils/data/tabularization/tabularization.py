@@ -5,8 +5,9 @@ Data Tabularization Methods
 Tabularization methods to convert time series data into tabular format for usage with SKLearn-like models.
 """
 
+import threading
 import warnings
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from functools import reduce
 from itertools import chain
 from math import inf
@@ -49,6 +50,8 @@ def create_lagged_data(
     sample_weight: str | TimeSeriesLike | None = None,
     stride: int = 1,
     show_warnings: bool = True,
+    n_jobs: int = 1,
+    lag_plan: "LagPlan | None" = None,
 ) -> tuple[
     ArrayOrArraySequence,
     None | ArrayOrArraySequence,
@@ -253,6 +256,15 @@ def create_lagged_data(
         be used with caution as it might introduce bias in the forecasts.
     show_warnings
         Whether to show warnings.
+    n_jobs
+        The number of jobs to run in parallel, each one creating the lagged data of a series (if a
+        `Sequence[TimeSeries]` is provided). Defaults to `1` (sequential). Setting the parameter to `-1` means using
+        all the available processors. The series are processed in threads, and with `concatenate = True` their
+        lagged data is written directly into the preallocated (concatenated) output arrays.
+    lag_plan
+        Optionally, the `LagPlan` computed from `lags`, `lags_past_covariates` and `lags_future_covariates` (e.g. the
+        one of a fitted `SKLearnModel`), to avoid computing the indices of the lagged features again. Must be computed
+        from the same lags.
 
     Returns
     -------
@@ -346,65 +358,61 @@ def create_lagged_data(
         max_samples_per_ts = inf
 
     # lags are identical for multiple series: pre-compute lagged features and reordered lagged features
-    lags_extract, lags_order = _get_lagged_indices(
-        lags,
-        lags_past_covariates,
-        lags_future_covariates,
-    )
+    if lag_plan is None:
+        lag_plan = LagPlan(lags, lags_past_covariates, lags_future_covariates)
+    lags_extract, lags_order = lag_plan.lags_extract, lag_plan.lags_order
+    n_series = max(seq_ts_lens)
+    series = [
+        (
+            target_series[i] if target_series else None,
+            past_covariates[i] if past_covariates else None,
+            future_covariates[i] if future_covariates else None,
+            sample_weight[i] if sample_weight else None,
+        )
+        for i in range(n_series)
+    ]
+    # the arguments of `_create_lagged_data_of_series()` shared by all series
+    series_kwargs = {
+        "use_moving_windows": use_moving_windows,
+        "lags_passed_as_dict": lags_passed_as_dict,
+        "lags_extract": lags_extract,
+        "lags_order": lags_order,
+        "output_chunk_length": output_chunk_length,
+        "output_chunk_shift": output_chunk_shift,
+        "lags": lags,
+        "lags_past_covariates": lags_past_covariates,
+        "lags_future_covariates": lags_future_covariates,
+        "max_samples_per_ts": max_samples_per_ts,
+        "multi_models": multi_models,
+        "check_inputs": check_inputs,
+        "is_training": is_training,
+        "stride": stride,
+        "show_warnings": show_warnings,
+    }
+    parallel = n_jobs != 1 and n_series > 1
+    if parallel and concatenate:
+        return _create_concatenated_lagged_data_in_parallel(
+            series=series,
+            n_jobs=n_jobs,
+            uses_static_covariates=uses_static_covariates,
+            last_static_covariates_shape=last_static_covariates_shape,
+            series_kwargs=series_kwargs,
+        )
+
+    if parallel:
+        from joblib import Parallel, delayed
+
+        results = Parallel(n_jobs=n_jobs, backend="threading")(
+            delayed(_create_lagged_data_of_series)(i, *series_i, **series_kwargs)
+            for i, series_i in enumerate(series)
+        )
+    else:
+        results = (
+            _create_lagged_data_of_series(i, *series_i, **series_kwargs)
+            for i, series_i in enumerate(series)
+        )
     X, y, times, sample_weights = [], [], [], []
-    for i in range(max(seq_ts_lens)):
-        target_i = target_series[i] if target_series else None
-        past_i = past_covariates[i] if past_covariates else None
-        future_i = future_covariates[i] if future_covariates else None
-        sample_weight_i = sample_weight[i] if sample_weight else None
-        series_equal_freq = _all_equal_freq(target_i, past_i, future_i)
-        # component-wise lags extraction is not support with times intersection at the moment
-        if use_moving_windows and lags_passed_as_dict and (not series_equal_freq):
-            raise_log(
-                ValueError(
-                    f"Cannot create tabularized data for the {i}th series because target and covariates don't have "
-                    "the same frequency and some of the lags are provided as a dictionary. Either resample the "
-                    "series or change the lags definition."
-                ),
-            )
-        if use_moving_windows and series_equal_freq:
-            X_i, y_i, times_i, weights_i = _create_lagged_data_by_moving_window(
-                target_series=target_i,
-                output_chunk_length=output_chunk_length,
-                output_chunk_shift=output_chunk_shift,
-                past_covariates=past_i,
-                future_covariates=future_i,
-                sample_weight=sample_weight_i,
-                lags=lags,
-                lags_past_covariates=lags_past_covariates,
-                lags_future_covariates=lags_future_covariates,
-                lags_extract=lags_extract,
-                lags_order=lags_order,
-                max_samples_per_ts=max_samples_per_ts,
-                multi_models=multi_models,
-                check_inputs=check_inputs,
-                is_training=is_training,
-                stride=stride,
-                show_warnings=show_warnings,
-            )
-        else:
-            X_i, y_i, times_i, weights_i = _create_lagged_data_by_intersecting_times(
-                target_series=target_i,
-                output_chunk_length=output_chunk_length,
-                output_chunk_shift=output_chunk_shift,
-                past_covariates=past_i,
-                future_covariates=future_i,
-                sample_weight=sample_weight_i,
-                lags=lags,
-                lags_past_covariates=lags_past_covariates,
-                lags_future_covariates=lags_future_covariates,
-                max_samples_per_ts=max_samples_per_ts,
-                multi_models=multi_models,
-                check_inputs=check_inputs,
-                is_training=is_training,
-                stride=stride,
-                show_warnings=show_warnings,
-            )
+    for (target_i, _, _, _), (X_i, y_i, times_i, weights_i) in zip(series, results):
         X_i, last_static_covariates_shape = add_static_covariates_to_lagged_data(
             features=X_i,
             target_series=target_i,
@@ -431,6 +439,165 @@ def create_lagged_data(
     return X, y, times, last_static_covariates_shape, sample_weights
 
 
+def _create_lagged_data_of_series(
+    idx: int,
+    target_series: TimeSeries | None,
+    past_covariates: TimeSeries | None,
+    future_covariates: TimeSeries | None,
+    sample_weight: TimeSeries | None,
+    use_moving_windows: bool,
+    lags_passed_as_dict: bool,
+    lags_extract: list[np.ndarray | None],
+    lags_order: list[np.ndarray | None],
+    **kwargs,
+) -> tuple[np.ndarray, np.ndarray | None, pd.Index, np.ndarray | None]:
+    """Creates the lagged data (without static covariates) of the `idx`-th series with the 'moving window' or
+    'time intersection' method."""
+    series_equal_freq = _all_equal_freq(
+        target_series, past_covariates, future_covariates
+    )
+    # component-wise lags extraction is not support with times intersection at the moment
+    if use_moving_windows and lags_passed_as_dict and (not series_equal_freq):
+        raise_log(
+            ValueError(
+                f"Cannot create tabularized data for the {idx}th series because target and covariates don't have "
+                "the same frequency and some of the lags are provided as a dictionary. Either resample the "
+                "series or change the lags definition."
+            ),
+        )
+    if use_moving_windows and series_equal_freq:
+        return _create_lagged_data_by_moving_window(
+            target_series=target_series,
+            past_covariates=past_covariates,
+            future_covariates=future_covariates,
+            sample_weight=sample_weight,
+            lags_extract=lags_extract,
+            lags_order=lags_order,
+            **kwargs,
+        )
+    return _create_lagged_data_by_intersecting_times(
+        target_series=target_series,
+        past_covariates=past_covariates,
+        future_covariates=future_covariates,
+        sample_weight=sample_weight,
+        **kwargs,
+    )
+
+
+def _create_concatenated_lagged_data_in_parallel(
+    series: list[tuple],
+    n_jobs: int,
+    uses_static_covariates: bool,
+    last_static_covariates_shape: tuple[int, int] | None,
+    series_kwargs: dict,
+) -> tuple[
+    np.ndarray,
+    np.ndarray | None,
+    Sequence[pd.Index],
+    tuple[int, int] | None,
+    np.ndarray | None,
+]:
+    """Creates the concatenated lagged data of `create_lagged_data()` with the series processed in parallel threads.
+
+    The number of observations of each series is computed first, so that the lagged data of each series is written
+    directly into its rows of the preallocated output arrays instead of being concatenated at the end. The lagged
+    values are extracted and copied by NumPy, which releases the GIL.
+    """
+    from joblib import Parallel, delayed
+
+    is_training = series_kwargs["is_training"]
+    targets = [series_i[0] for series_i in series]
+    static_covs, last_static_covariates_shape = _get_static_covariates_values(
+        targets, uses_static_covariates, last_static_covariates_shape
+    )
+    parallel = Parallel(n_jobs=n_jobs, backend="threading")
+    times_kwargs = {
+        key: series_kwargs[key]
+        for key in [
+            "lags",
+            "lags_past_covariates",
+            "lags_future_covariates",
+            "output_chunk_length",
+            "output_chunk_shift",
+            "is_training",
+            "max_samples_per_ts",
+            "stride",
+            "check_inputs",
+        ]
+    }
+    # the warnings are shown when extracting the lagged values
+    times = parallel(
+        delayed(_get_observation_times)(
+            *series_i[:3], show_warnings=False, **times_kwargs
+        )
+        for series_i in series
+    )
+    offsets = np.cumsum([0] + [len(times_i) for times_i, _ in times])
+
+    # the dtypes of the concatenated arrays, as if created by `np.concatenate()`
+    lags = [
+        series_kwargs["lags"],
+        series_kwargs["lags_past_covariates"],
+        series_kwargs["lags_future_covariates"],
+    ]
+    X_dtype = np.result_type(
+        *[
+            series_i[j].dtype
+            for series_i in series
+            for j in range(3)
+            if series_i[j] is not None and lags[j] is not None
+        ],
+        *([] if static_covs is None else [static_covs[0].dtype]),
+    )
+    arrays = {}
+    lock = threading.Lock()
+
+    def create_lagged_data_of_series(idx):
+        X_i, y_i, times_i, weights_i = _create_lagged_data_of_series(
+            idx, *series[idx], **series_kwargs
+        )
+        with lock:
+            # the number of lagged features is known from the first created series
+            if not arrays:
+                n_static = 0 if static_covs is None else len(static_covs[0])
+                arrays["X"] = np.empty(
+                    (offsets[-1], X_i.shape[1] + n_static, X_i.shape[2]),
+                    dtype=X_dtype,
+                )
+                if is_training:
+                    arrays["y"] = np.empty(
+                        (offsets[-1],) + y_i.shape[1:],
+                        dtype=np.result_type(*[ts.dtype for ts in targets]),
+                    )
+                if weights_i is not None:
+                    arrays["weights"] = np.empty(
+                        (offsets[-1],) + weights_i.shape[1:],
+                        dtype=np.result_type(*[
+                            series_i[3].dtype for series_i in series
+                        ]),
+                    )
+        rows = slice(offsets[idx], offsets[idx + 1])
+        arrays["X"][rows, : X_i.shape[1]] = X_i
+        if static_covs is not None:
+            arrays["X"][rows, X_i.shape[1] :] = static_covs[idx][None, :, None]
+        if is_training:
+            arrays["y"][rows] = y_i
+        if weights_i is not None:
+            arrays["weights"][rows] = weights_i
+        return times_i
+
+    times = parallel(
+        delayed(create_lagged_data_of_series)(idx) for idx in range(len(series))
+    )
+    return (
+        arrays["X"],
+        arrays.get("y"),
+        times,
+        last_static_covariates_shape,
+        arrays.get("weights"),
+    )
+
+
 def create_lagged_training_data(
     target_series: TimeSeriesLike,
     output_chunk_length: int,
@@ -449,6 +616,8 @@ def create_lagged_training_data(
     concatenate: bool = True,
     stride: int = 1,
     sample_weight: TimeSeries | str | None = None,
+    n_jobs: int = 1,
+    lag_plan: "LagPlan | None" = None,
 ) -> tuple[
     ArrayOrArraySequence,
     None | ArrayOrArraySequence,
@@ -540,6 +709,15 @@ def create_lagged_training_data(
         `"linear"` or `"exponential"` decay - the further in the past, the lower the weight. The weights are
         computed globally based on the length of the longest series in `series`. Then for each series, the weights
         are extracted from the end of the global weights. This gives a common time weighting across all series.
+    n_jobs
+        The number of jobs to run in parallel, each one creating the lagged data of a series (if a
+        `Sequence[TimeSeries]` is provided). Defaults to `1` (sequential). Setting the parameter to `-1` means using
+        all the available processors. The series are processed in threads, and with `concatenate = True` their
+        lagged data is written directly into the preallocated (concatenated) output arrays.
+    lag_plan
+        Optionally, the `LagPlan` computed from `lags`, `lags_past_covariates` and `lags_future_covariates` (e.g. the
+        one of a fitted `SKLearnModel`), to avoid computing the indices of the lagged features again. Must be computed
+        from the same lags.
 
     Returns
     -------
@@ -594,6 +772,278 @@ def create_lagged_training_data(
         concatenate=concatenate,
         stride=stride,
         sample_weight=sample_weight,
+        n_jobs=n_jobs,
+        lag_plan=lag_plan,
+    )
+
+
+def create_lagged_training_data_chunks(
+    target_series: TimeSeriesLike,
+    output_chunk_length: int,
+    output_chunk_shift: int,
+    past_covariates: TimeSeriesLike | None = None,
+    future_covariates: TimeSeriesLike | None = None,
+    lags: Sequence[int] | dict[str, list[int]] | None = None,
+    lags_past_covariates: Sequence[int] | dict[str, list[int]] | None = None,
+    lags_future_covariates: Sequence[int] | dict[str, list[int]] | None = None,
+    uses_static_covariates: bool = True,
+    last_static_covariates_shape: tuple[int, int] | None = None,
+    max_samples_per_ts: int | None = None,
+    multi_models: bool = True,
+    check_inputs: bool = True,
+    use_moving_windows: bool = True,
+    stride: int = 1,
+    sample_weight: TimeSeries | str | None = None,
+    max_samples_per_chunk: int = 10_000,
+    lag_plan: "LagPlan | None" = None,
+) -> Iterator[
+    tuple[
+        np.ndarray,
+        np.ndarray,
+        Sequence[pd.Index],
+        tuple[int, int] | None,
+        np.ndarray | None,
+    ]
+]:
+    """
+    Generator variant of `create_lagged_training_data` yielding the features array `X`, labels array `y` and
+    sample weights in chunks of at most `max_samples_per_chunk` observations, to train a lagged-variables
+    `SKLearnModel` on more data than fits in memory (e.g. with estimators supporting `partial_fit()`).
+
+    The observations are yielded in the same order as the rows of the arrays returned by
+    `create_lagged_training_data` with `concatenate=True`, and a chunk can hold observations from several series.
+    Only the observations of the current chunk are materialized: the eligible times of each series are computed
+    first, and the lagged values are then extracted for consecutive ranges of these times.
+
+    Parameters
+    ----------
+    target_series
+        The series for the `SKLearnModel` to predict.
+    output_chunk_length
+        The number of time steps ahead into the future the `SKLearnModel` is to predict.
+    output_chunk_shift
+        Optionally, the number of time steps to shift the output chunk ahead into the future.
+    past_covariates
+        Optionally, the past covariates series that the `SKLearnModel` will use as inputs.
+    future_covariates
+        Optionally, the future covariates (i.e. exogenous covariates) series that the `SKLearnModel` will
+        use as inputs.
+    lags
+        Optionally, the lags of the target series to be used as (autoregressive) features.
+    lags_past_covariates
+        Optionally, the lags of `past_covariates` to be used as features.
+    lags_future_covariates
+        Optionally, the lags of `future_covariates` to be used as features.
+    uses_static_covariates
+        Whether the model uses/expects static covariates.
+    last_static_covariates_shape
+        Optionally, the last observed shape of the static covariates.
+    max_samples_per_ts
+        Optionally, the maximum number of samples to be drawn for training/validation; only the most recent
+        samples are kept.
+    multi_models
+        Optionally, specifies whether the `SKLearnModel` predicts multiple time steps into the future.
+    check_inputs
+        Optionally, specifies that the `lags_*` and `series_*` inputs should be checked for validity.
+    use_moving_windows
+        Optionally, specifies that the 'moving window' method should be used to construct `X` and `y` if all
+        provided series are of the same frequency.
+    stride
+        The number of time steps between consecutive samples, applied starting from the end of the series.
+    sample_weight
+        Optionally, some sample weights to apply to the target `series` labels, see `create_lagged_training_data`.
+    max_samples_per_chunk
+        The maximum number of observations of each chunk.
+    lag_plan
+        Optionally, the `LagPlan` computed from `lags`, `lags_past_covariates` and `lags_future_covariates` (e.g. the
+        one of a fitted `SKLearnModel`), to avoid computing the indices of the lagged features again. Must be computed
+        from the same lags.
+
+    Yields
+    ------
+    X
+        The features array of the chunk, with shape `(n_observations, n_lagged_features, n_samples)`.
+    y
+        The labels array of the chunk, with shape `(n_observations, output_chunk_length, n_samples)` if
+        `multi_models = True`, and `(n_observations, 1, n_samples)` otherwise.
+    times
+        The `time_index` of the observations of the chunk, as a `Sequence` of `pd.Index`es with one element per
+        series (part) included in the chunk.
+    last_static_covariates_shape
+        The last observed shape of the static covariates. This is ``None`` when `uses_static_covariates` is
+        ``False``.
+    sample_weight
+        The weights of the observations of the chunk (or ``None``), with the same shape as `y`.
+
+    Raises
+    ------
+    ValueError
+        If `max_samples_per_chunk` is not a positive integer, or for any of the reasons listed in
+        `create_lagged_training_data`.
+    """
+    if not (isinstance(max_samples_per_chunk, int) and max_samples_per_chunk > 0):
+        raise_log(
+            ValueError("`max_samples_per_chunk` must be a positive integer."),
+        )
+    target_series = series2seq(target_series)
+    past_covariates = series2seq(past_covariates)
+    future_covariates = series2seq(future_covariates)
+    if (
+        len({
+            len(seq_ts)
+            for seq_ts in (target_series, past_covariates, future_covariates)
+            if seq_ts is not None
+        })
+        > 1
+    ):
+        raise_log(
+            ValueError(
+                "Must specify the same number of `TimeSeries` for each series input."
+            ),
+        )
+    # built-in weights are generated once from all series, and sliced by each chunk
+    sample_weight = _process_sample_weight(sample_weight, target_series)
+    if max_samples_per_ts is None:
+        max_samples_per_ts = inf
+    # the indices of the lagged features are shared by all chunks
+    if lag_plan is None:
+        lag_plan = LagPlan(lags, lags_past_covariates, lags_future_covariates)
+
+    X, y, times, weights = [], [], [], []
+    num_chunk_samples = 0
+    for i, target_i in enumerate(target_series):
+        past_i = past_covariates[i] if past_covariates else None
+        future_i = future_covariates[i] if future_covariates else None
+        weight_i = sample_weight[i] if sample_weight else None
+
+        # the times of all observations of the series, as in `create_lagged_data()`
+        times_i, max_lags = _get_observation_times(
+            target_series=target_i,
+            past_covariates=past_i,
+            future_covariates=future_i,
+            lags=lags,
+            lags_past_covariates=lags_past_covariates,
+            lags_future_covariates=lags_future_covariates,
+            output_chunk_length=output_chunk_length,
+            output_chunk_shift=output_chunk_shift,
+            is_training=True,
+            max_samples_per_ts=max_samples_per_ts,
+            stride=stride,
+            check_inputs=check_inputs,
+        )
+
+        # the target values required before (lags) and after (labels) the time of an observation
+        target_start_offset = -max_lags[0] if max_lags[0] is not None else 0
+        target_end_offset = output_chunk_shift + output_chunk_length
+        start = 0
+        while start < len(times_i):
+            stop = min(start + max_samples_per_chunk - num_chunk_samples, len(times_i))
+            # the target slice restricts the observations to times `times_i[start:stop]`
+            first_idx = target_i.get_index_at_point(times_i[start])
+            last_idx = target_i.get_index_at_point(times_i[stop - 1])
+            X_i, y_i, times_part, last_static_covariates_shape, weights_i = (
+                create_lagged_data(
+                    target_series=target_i[
+                        first_idx + target_start_offset : last_idx + target_end_offset
+                    ],
+                    past_covariates=past_i,
+                    future_covariates=future_i,
+                    lags=lags,
+                    lags_past_covariates=lags_past_covariates,
+                    lags_future_covariates=lags_future_covariates,
+                    output_chunk_length=output_chunk_length,
+                    output_chunk_shift=output_chunk_shift,
+                    uses_static_covariates=uses_static_covariates,
+                    last_static_covariates_shape=last_static_covariates_shape,
+                    multi_models=multi_models,
+                    check_inputs=False,
+                    use_moving_windows=use_moving_windows,
+                    is_training=True,
+                    sample_weight=weight_i,
+                    stride=stride,
+                    show_warnings=False,
+                    lag_plan=lag_plan,
+                )
+            )
+            X.append(X_i)
+            y.append(y_i)
+            times.append(times_part[0])
+            if weights_i is not None:
+                weights.append(weights_i)
+            num_chunk_samples += stop - start
+            start = stop
+            if num_chunk_samples == max_samples_per_chunk:
+                yield _concatenate_chunk(
+                    X, y, times, last_static_covariates_shape, weights
+                )
+                X, y, times, weights = [], [], [], []
+                num_chunk_samples = 0
+    if num_chunk_samples:
+        yield _concatenate_chunk(X, y, times, last_static_covariates_shape, weights)
+
+
+def _get_observation_times(
+    target_series: TimeSeries | None,
+    past_covariates: TimeSeries | None,
+    future_covariates: TimeSeries | None,
+    lags: Sequence[int] | dict[str, list[int]] | None,
+    lags_past_covariates: Sequence[int] | dict[str, list[int]] | None,
+    lags_future_covariates: Sequence[int] | dict[str, list[int]] | None,
+    output_chunk_length: int,
+    output_chunk_shift: int,
+    is_training: bool,
+    max_samples_per_ts: int | float,
+    stride: int,
+    check_inputs: bool,
+    show_warnings: bool = True,
+) -> tuple[pd.Index, list[int | None]]:
+    """Returns the times of the observations created by `create_lagged_data()` from a single series (after applying
+    `stride` and `max_samples_per_ts`), and the maximum lag of each series (see `_get_feature_times()`), without
+    extracting the lagged values."""
+    feature_times, _, max_lags = _get_feature_times(
+        target_series=target_series,
+        past_covariates=past_covariates,
+        future_covariates=future_covariates,
+        lags=lags,
+        lags_past_covariates=lags_past_covariates,
+        lags_future_covariates=lags_future_covariates,
+        output_chunk_length=output_chunk_length,
+        output_chunk_shift=output_chunk_shift,
+        is_training=is_training,
+        return_min_and_max_lags=True,
+        check_inputs=check_inputs,
+        show_warnings=show_warnings,
+    )
+    times = get_shared_times(*feature_times, sort=True)
+    if times is None:
+        raise_log(
+            ValueError(
+                "Specified series do not share any common times for which features can be created."
+            ),
+        )
+    if stride > 1:
+        times = times[(len(times) - 1) % stride :: stride]
+    if len(times) > max_samples_per_ts:
+        times = times[-max_samples_per_ts:]
+    return times, max_lags
+
+
+def _concatenate_chunk(
+    X: list[np.ndarray],
+    y: list[np.ndarray],
+    times: list[pd.Index],
+    last_static_covariates_shape: tuple[int, int] | None,
+    weights: list[np.ndarray],
+) -> tuple:
+    """Concatenates the parts of a chunk yielded by `create_lagged_training_data_chunks()`."""
+    return (
+        X[0] if len(X) == 1 else np.concatenate(X, axis=0),
+        y[0] if len(y) == 1 else np.concatenate(y, axis=0),
+        times,
+        last_static_covariates_shape,
+        (weights[0] if len(weights) == 1 else np.concatenate(weights, axis=0))
+        if weights
+        else None,
     )
 
 
@@ -612,6 +1062,7 @@ def create_lagged_prediction_data(
     concatenate: bool = True,
     stride: int = 1,
     show_warnings: bool = True,
+    lag_plan: "LagPlan | None" = None,
 ) -> tuple[ArrayOrArraySequence, Sequence[pd.Index]]:
     """
     Creates the features array `X` to produce a series of prediction from an already-trained `SKLearnModel`; the
@@ -681,6 +1132,10 @@ def create_lagged_prediction_data(
         be used with caution as it will cause gaps in the forecasts.
     show_warnings
         Whether to show warnings.
+    lag_plan
+        Optionally, the `LagPlan` computed from `lags`, `lags_past_covariates` and `lags_future_covariates` (e.g. the
+        one of a fitted `SKLearnModel`), to avoid computing the indices of the lagged features again. Must be computed
+        from the same lags.
 
     Returns
     -------
@@ -723,6 +1178,7 @@ def create_lagged_prediction_data(
         concatenate=concatenate,
         stride=stride,
         show_warnings=show_warnings,
+        lag_plan=lag_plan,
     )
     return X, times
 
@@ -781,8 +1237,40 @@ def add_static_covariates_to_lagged_data(
     target_series = series2seq(target_series)
 
     # go through series, check static covariates, and stack them to the right of the lagged features
+    all_static_covs, last_shape = _get_static_covariates_values(
+        target_series, uses_static_covariates, last_shape
+    )
+    for idx, static_covs in enumerate(all_static_covs):
+        # we stack the static covariates to the right of lagged features
+        # the broadcasting repeats the static covariates along axis=0 to match the number of feature rows
+        shape_out = (
+            (len(features[idx]), len(static_covs))
+            if len(features[idx].shape) == 2
+            else (len(features[idx]), len(static_covs), 1)
+        )
+        features[idx] = np.hstack([
+            features[idx],
+            np.broadcast_to(static_covs, shape_out[:2]).reshape(shape_out),
+        ])
+
+    if input_not_list:
+        features = features[0]
+    return features, last_shape
+
+
+def _get_static_covariates_values(
+    target_series: Sequence[TimeSeries],
+    uses_static_covariates: bool,
+    last_shape: tuple[int, int] | None,
+) -> tuple[list[np.ndarray] | None, tuple[int, int] | None]:
+    """Checks that the static covariates of all target series have identical shapes, and returns them flattened
+    along columns (``None`` if `uses_static_covariates` is ``False``), and their shape."""
+    if not uses_static_covariates:
+        return None, last_shape
+
     # try to abort early in case there is a mismatch in static covariates
-    for idx, ts in enumerate(target_series):
+    static_covs = []
+    for ts in target_series:
         if not ts.has_static_covariates:
             raise_log(
                 ValueError(
@@ -790,33 +1278,18 @@ def add_static_covariates_to_lagged_data(
                     "contain static covariates and others do not."
                 ),
             )
-        else:
-            if last_shape is None:
-                last_shape = ts.static_covariates.shape
-            if ts.static_covariates.shape != last_shape:
-                raise_log(
-                    ValueError(
-                        "Static covariates dimension mismatch across the sequence of target series. The static "
-                        "covariates must have the same number of columns and rows across all target series."
-                    ),
-                )
-            # flatten static covariates along columns -> results in [scov0_comp0, scov0_comp1, scov1_comp0, ...]
-            static_covs = ts.static_covariates.values.flatten(order="F")
-            # we stack the static covariates to the right of lagged features
-            # the broadcasting repeats the static covariates along axis=0 to match the number of feature rows
-            shape_out = (
-                (len(features[idx]), len(static_covs))
-                if len(features[idx].shape) == 2
-                else (len(features[idx]), len(static_covs), 1)
+        if last_shape is None:
+            last_shape = ts.static_covariates.shape
+        if ts.static_covariates.shape != last_shape:
+            raise_log(
+                ValueError(
+                    "Static covariates dimension mismatch across the sequence of target series. The static "
+                    "covariates must have the same number of columns and rows across all target series."
+                ),
             )
-            features[idx] = np.hstack([
-                features[idx],
-                np.broadcast_to(static_covs, shape_out[:2]).reshape(shape_out),
-            ])
-
-    if input_not_list:
-        features = features[0]
-    return features, last_shape
+        # flatten static covariates along columns -> results in [scov0_comp0, scov0_comp1, scov1_comp0, ...]
+        static_covs.append(ts.static_covariates.values.flatten(order="F"))
+    return static_covs, last_shape
 
 
 def create_lagged_component_names(
@@ -1022,6 +1495,89 @@ def _get_lagged_indices(
     return lags_extract, lags_order
 
 
+class LagPlan:
+    def __init__(
+        self,
+        lags: Sequence[int] | dict[str, list[int]] | None = None,
+        lags_past_covariates: Sequence[int] | dict[str, list[int]] | None = None,
+        lags_future_covariates: Sequence[int] | dict[str, list[int]] | None = None,
+        n_components: Sequence[int | None] | None = None,
+        feature_names: list[str] | None = None,
+        label_names: list[str] | None = None,
+    ):
+        """The lagged features of the target series, past and future covariates, computed once from the lags.
+
+        The plan holds the indices to extract the lagged values from the moving windows of each series (used by
+        `create_lagged_data()`), and, given the number of components of each series, the lag and component of
+        each lagged feature in the order of the features `X`. From the latter, the flat indices `gather_indices`
+        select the lagged features from the values of shape `(n_times, n_components)` (flattened row-major) that
+        start at the minimum lag of the series, e.g. with ``np.take(values.reshape(n, -1), gather_indices, axis=1)``.
+
+        A fitted `SKLearnModel` stores the plan of its lags, and reuses it for the tabularization, the
+        autoregressive predictions and the optimized historical forecasts.
+
+        Parameters
+        ----------
+        lags
+            The lags of the target series, as passed to `create_lagged_data()`.
+        lags_past_covariates
+            The lags of the past covariates, as passed to `create_lagged_data()`.
+        lags_future_covariates
+            The lags of the future covariates, as passed to `create_lagged_data()`.
+        n_components
+            Optionally, the number of components of the target series, past and future covariates (`None` for series
+            without lags). Only required to compute the lag, component and gather index of each lagged feature of
+            the series with lags given as a list.
+        feature_names
+            Optionally, the names of the lagged features (see `create_lagged_component_names()`).
+        label_names
+            Optionally, the names of the lagged labels (see `create_lagged_component_names()`).
+        """
+        self.lags = (lags, lags_past_covariates, lags_future_covariates)
+        self.lags_extract, self.lags_order = _get_lagged_indices(*self.lags)
+        self.feature_names = feature_names
+        self.label_names = label_names
+
+        # for each series type: the lag, component, and gather index of each lagged feature
+        self.min_lags: dict[str, int] = {}
+        self.feature_lags: dict[str, np.ndarray] = {}
+        self.feature_components: dict[str, np.ndarray] = {}
+        self.gather_indices: dict[str, np.ndarray] = {}
+        n_components = n_components or [None] * 3
+        for i, (series_type, lags_i, n_components_i) in enumerate(
+            zip(["target", "past", "future"], self.lags, n_components)
+        ):
+            if lags_i is None:
+                continue
+            if isinstance(lags_i, dict):
+                n_components_i = len(lags_i)
+                # the features are sorted by lags across the components (as `lags_order`)
+                feature_lags = np.concatenate(self.lags_extract[i])
+                feature_components = np.repeat(
+                    np.arange(n_components_i),
+                    [len(comp_lags) for comp_lags in lags_i.values()],
+                )
+                order = self.lags_order[i]
+                feature_lags, feature_components = (
+                    feature_lags[order],
+                    feature_components[order],
+                )
+            elif n_components_i is not None:
+                # the features are grouped by lags, and ordered by components within each lag
+                feature_lags = np.repeat(np.array(lags_i, dtype=int), n_components_i)
+                feature_components = np.tile(np.arange(n_components_i), len(lags_i))
+            else:
+                self.min_lags[series_type] = min(lags_i)
+                continue
+            min_lag = int(feature_lags.min())
+            self.min_lags[series_type] = min_lag
+            self.feature_lags[series_type] = feature_lags
+            self.feature_components[series_type] = feature_components
+            self.gather_indices[series_type] = (
+                feature_lags - min_lag
+            ) * n_components_i + feature_components
+
+
 def _create_lagged_data_by_moving_window(
     target_series: TimeSeries | None,
     output_chunk_length: int,
@@ -1406,110 +1962,60 @@ def _create_lagged_data_autoregression(
     series_matrix: np.ndarray,
     covariate_matrices: dict[str, np.ndarray],
     lags: dict[str, list[int]],
-    component_lags: dict[str, dict[str, list[int]]],
-    relative_cov_lags: dict[str, np.ndarray],
-    uses_static_covariates: bool,
-    last_static_covariates_shape: tuple[int, int] | None,
+    lag_plan: LagPlan,
+    static_covariates: np.ndarray | None,
     num_samples: int,
 ) -> np.ndarray:
     """Extract lagged data from target, past covariates and future covariates for auto-regression
     with SKLearnModels.
+
+    The rows of `series_matrix` and `covariate_matrices` are either one per series and sample (`[series 0 sample 0,
+    series 0 sample 1, ..., series n sample k]`), or one per series if the values are identical for all samples. In
+    the latter case, the lagged values are only extracted once per series and then repeated for each sample.
+    `static_covariates` holds the (flattened) static covariates of each series and sample, or ``None`` if they are
+    not used.
+
+    The covariate matrices start at the minimum lag of `lags`. With component-specific lags, this can be smaller than
+    the minimum lag of `lag_plan` (e.g. with default lags that are not used by any component).
+
+    The lagged features (also component-specific lags) are gathered in a single `np.take()` with the flat indices of
+    `lag_plan` (computed with the number of components of each series), offset by the position of the minimum lag.
     """
     series_length = len(target_series)
     X = []
-    for series_type in ["target", "past", "future"]:
-        if series_type not in lags:
-            continue
-
+    for series_type, gather_indices in lag_plan.gather_indices.items():
         # extract series specific data
         values_matrix = (
             series_matrix
             if series_type == "target"
             else covariate_matrices[series_type]
         )
+        n_values, n_times, n_components = values_matrix.shape
 
-        if series_type not in component_lags:
-            # for global lags over all components, directly extract lagged values from the data
-            if series_type == "target":
-                relative_lags = [
-                    lag - (shift + last_step_shift) for lag in lags[series_type]
-                ]
-            else:
-                relative_lags = relative_cov_lags[series_type] + t_pred
-
-            lagged_data = values_matrix[:, relative_lags].reshape(
-                series_length * num_samples, -1
-            )
+        # position of the minimum lag: relative to the end of the target history, and to the first time step of the
+        # covariates required for the first prediction
+        if series_type == "target":
+            start = n_times + lag_plan.min_lags[series_type] - shift - last_step_shift
         else:
-            # for component-specific lags, sort by lags and components and then extract
-            tmp_X = _extract_component_lags_autoregression(
-                series_type=series_type,
-                values_matrix=values_matrix,
-                shift=shift,
-                last_step_shift=last_step_shift,
-                t_pred=t_pred,
-                lags=lags,
-                component_lags=component_lags,
-            )
-            lagged_data = tmp_X.reshape(series_length * num_samples, -1)
+            start = t_pred + lag_plan.min_lags[series_type] - lags[series_type][0]
+
+        # merging the time and component axes gives a view, also for the rollout buffer
+        lagged_data = np.take(
+            values_matrix.reshape(n_values, n_times * n_components),
+            gather_indices + start * n_components,
+            axis=1,
+        )
+        if n_values != series_length * num_samples:
+            # values shared by all samples of a series
+            lagged_data = np.repeat(lagged_data, num_samples, axis=0)
         X.append(lagged_data)
-    # concatenate retrieved lags
-    X = np.concatenate(X, axis=1)
 
-    if not uses_static_covariates:
-        return X
-
-    # Need to split up `X` into three equally-sized sub-blocks
-    # corresponding to each timeseries in `series`, so that
-    # static covariates can be added to each block; valid since
-    # each block contains same number of observations:
-    X = np.split(X, series_length, axis=0)
-    X, _ = add_static_covariates_to_lagged_data(
-        features=X,
-        target_series=target_series,
-        uses_static_covariates=uses_static_covariates,
-        last_shape=last_static_covariates_shape,
-    )
+    # static covariates are added to the right of the lagged features
+    if static_covariates is not None:
+        X.append(static_covariates)
 
     # concatenate retrieved lags
-    return np.concatenate(X, axis=0)
-
-
-def _extract_component_lags_autoregression(
-    series_type: str,
-    values_matrix: np.ndarray,
-    shift: int,
-    last_step_shift: int,
-    t_pred: int,
-    lags: dict[str, list[int]],
-    component_lags: dict[str, dict[str, list[int]]],
-) -> np.ndarray:
-    """Extract, concatenate and reorder component-wise lags to obtain a feature order
-    identical to tabularization.
-    """
-    # prepare index to reorder features by lags across components
-    comp_lags_reordered = np.concatenate([
-        comp_lags for comp_lags in component_lags[series_type].values()
-    ]).argsort(**STABLE_SORT_KWARGS)
-
-    # convert relative lags to absolute
-    if series_type == "target":
-        lags_shift = -shift - last_step_shift
-    else:
-        lags_shift = -lags[series_type][0] + t_pred
-
-    # extract features
-    tmp_X = [
-        values_matrix[
-            :,
-            [lag + lags_shift for lag in comp_lags],
-            comp_i,
-        ]
-        for comp_i, comp_lags in enumerate(component_lags[series_type].values())
-    ]
-
-    # concatenate on features dimension and reorder
-    return np.concatenate(tmp_X, axis=1)[:, comp_lags_reordered]
+    return np.concatenate(X, axis=1)
 
 
 # For convenience, define following types for `_get_feature_times`:
@@ -1815,6 +2321,9 @@ def get_shared_times(
             if isinstance(series_or_times_2, TimeSeries)
             else series_or_times_2
         )
+        if times_1 is times_2:
+            # series with the same regular time index share the same (interned) index object
+            return times_1
         return times_1.intersection(times_2, sort=sort)
 
     specified_inputs = [series for series in series_or_times if series is not None]
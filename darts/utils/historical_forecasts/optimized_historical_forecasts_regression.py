@@ -16,7 +16,6 @@ from darts.typing import TimeSeriesLike
 from darts.utils import _build_tqdm_iterator
 from darts.utils.data.tabularization import create_lagged_prediction_data
 from darts.utils.historical_forecasts.utils import _get_historical_forecast_boundaries
-from darts.utils.ts_utils import get_single_series
 from darts.utils.utils import generate_index
 
 
@@ -66,25 +65,11 @@ def _optimized_historical_forecasts_regression(
     output_chunk_length = model.output_chunk_length
     output_chunk_shift = model.output_chunk_shift
 
-    # get target lags and X positions for auto-regression
-    if model._get_lags("target") is not None:
-        if "target" in model.component_lags:
-            target_lags = model.component_lags["target"].values()
-        else:
-            target_lags = [model.lags["target"]] * get_single_series(
-                series
-            ).n_components
-
-        # map which target component lag belongs to which position in X
-        counter = 0
-        target_lag_positions = [[] for _ in range(len(target_lags))]
-        for lag in range(min(model.lags["target"]), max(model.lags["target"]) + 1):
-            for comp_idx, comp_lags in enumerate(target_lags):
-                if lag in comp_lags:
-                    target_lag_positions[comp_idx].append(counter)
-                    counter += 1
-    else:
-        target_lags, target_lag_positions = [], []
+    # the lag and component of the target features for auto-regression; the target features are the first
+    # features of X
+    lag_plan = model._lag_plan
+    target_feature_lags = lag_plan.feature_lags.get("target")
+    target_feature_components = lag_plan.feature_components.get("target")
 
     # determine the forecast scenario
     is_auto_regression = forecast_horizon > output_chunk_length + output_chunk_shift
@@ -150,7 +135,7 @@ def _optimized_historical_forecasts_regression(
             show_warnings=show_warnings,
         )
 
-        if target_lags or model.uses_static_covariates:
+        if target_feature_lags is not None or model.uses_static_covariates:
             series_adjusted = series_[hist_fct_tgt_start:hist_fct_tgt_end]
             if is_auto_regression:
                 # add values to end of target series, to get all examples for auto-regression
@@ -186,6 +171,7 @@ def _optimized_historical_forecasts_regression(
             use_moving_windows=True,
             concatenate=False,
             show_warnings=False,
+            lag_plan=lag_plan,
         )
 
         # -> (n_forecasts, n_lags)
@@ -230,39 +216,37 @@ def _optimized_historical_forecasts_regression(
             # -> (n_forecasts * n_samples, n_lags)
             current_X = np.repeat(current_X, num_samples, axis=0)
 
-            if pred_idx > 0:
+            if pred_idx > 0 and target_feature_lags is not None:
                 # auto-regression requires updating current X with previous predictions;
-                # determine what lags the previous forecasts correspond for the current iteration
-                forecast_length = predictions.shape[1]
+                # determine what step of the previous forecasts each target lag corresponds to:
                 # lag = (
                 #     step
                 #     - forecast_length  # shift back into past
                 #     + output_step_adjust  # adjust for multi_models
                 #     + roll_shift  # adjust for non-round-multiple auto-regression
                 # )
-                forecasted_lags = {
-                    step - forecast_length + output_step_adjust + roll_shift: step
-                    for step in range(forecast_length)
-                }
-
-                # find matches between forecasted components and component-specific lags of the
-                # future iteration
-                for comp_idx, comp_lags in enumerate(target_lags):
-                    update_x_indices = []
-                    take_y_indices = []
-                    for lag_idx, lag in enumerate(comp_lags):
-                        y_pos = forecasted_lags.get(lag, None)
-                        if y_pos is not None:
-                            update_x_indices.append(
-                                target_lag_positions[comp_idx][lag_idx]
-                            )
-                            take_y_indices.append(y_pos)
+                forecast_length = predictions.shape[1]
+                take_y_indices = (
+                    target_feature_lags
+                    + forecast_length
+                    - output_step_adjust
+                    - roll_shift
+                )
+                update_x_indices = np.flatnonzero(
+                    (take_y_indices >= 0) & (take_y_indices < forecast_length)
+                )
 
-                    # update X with matched predictions (move around axes for correct reshaping
-                    # of samples)
-                    current_X[:, update_x_indices] = np.moveaxis(
-                        predictions[:, take_y_indices, comp_idx], 1, -1
-                    ).reshape(len(current_X), -1)
+                # update X with the matched predictions of all target components at once (move around axes for
+                # correct reshaping of samples)
+                current_X[:, update_x_indices] = np.moveaxis(
+                    predictions[
+                        :,
+                        take_y_indices[update_x_indices],
+                        target_feature_components[update_x_indices],
+                    ],
+                    1,
+                    -1,
+                ).reshape(len(current_X), -1)
 
             # forecast shape: (n_forecasts * num_samples, n_output_steps, n_components),
             forecast = model._predict(
@@ -335,18 +319,25 @@ def _optimized_historical_forecasts_regression(
                 freq=freq,
                 name=series_._time_index.name,
             )
+            # the forecasts have the same components and attributes as `series_`; no need to re-validate them
+            is_trusted = (
+                not predict_likelihood_parameters and predictions.dtype == series_.dtype
+            )
             for idx_ftc, step_fct in enumerate(
                 range(0, forecast.shape[0] * stride, stride)
             ):
-                ts = TimeSeries(
+                ts_kwargs = dict(
                     times=new_times[step_fct : step_fct + forecast_horizon],
                     values=predictions[idx_ftc],
                     components=forecast_components,
                     static_covariates=series_.static_covariates,
                     hierarchy=series_.hierarchy,
                     metadata=series_.metadata,
-                    copy=False,
                 )
+                if is_trusted:
+                    ts = TimeSeries._from_trusted(**ts_kwargs)
+                else:
+                    ts = TimeSeries(**ts_kwargs, copy=False)
                 forecasts.append(ts)
 
         forecasts_list.append(forecasts)
@@ -8,7 +8,8 @@ import inspect
 from sklearn.base import is_classifier
 from sklearn.multioutput import MultiOutputClassifier as sk_MultiOutputClassifier
 from sklearn.multioutput import MultiOutputRegressor as sk_MultiOutputRegressor
-from sklearn.multioutput import _fit_estimator
+from sklearn.multioutput import _fit_estimator, _partial_fit_estimator
+from sklearn.utils.metaestimators import available_if
 from sklearn.utils.multiclass import check_classification_targets
 from sklearn.utils.parallel import Parallel, delayed
 from sklearn.utils.validation import (
@@ -150,6 +151,93 @@ class MultiOutputMixin:
 
         return self
 
+    @available_if(lambda self: hasattr(self.estimator, "partial_fit"))
+    def partial_fit(self, X, y, classes=None, sample_weight=None, **partial_fit_params):
+        """Incrementally fit the model to data, separately for each output variable.
+
+        Parameters
+        ----------
+        X : {array-like, sparse matrix} of shape (n_samples, n_features)
+            The input data.
+
+        y : {array-like, sparse matrix} of shape (n_samples, n_outputs)
+            Multi-output targets.
+
+        classes : list of ndarray of shape (n_outputs,), default=None
+            Each array is unique classes for one output. Only used by classifiers, and required for the first call
+            to ``partial_fit()``.
+
+        sample_weight : array-like of shape (n_samples, n_outputs), default=None
+            Sample weights. If `None`, then samples are equally weighted.
+            Only supported if the underlying estimator supports sample
+            weights.
+
+        **partial_fit_params : dict of string -> object
+            Parameters passed to the ``estimator.partial_fit`` method of each step.
+
+        Returns
+        -------
+        self : object
+            Returns a partially fitted instance.
+        """
+        first_time = not hasattr(self, "estimators_")
+        y = validate_data(self.estimator, X="no_validation", y=y, multi_output=True)
+
+        if y.ndim == 1:
+            raise_log(
+                ValueError(
+                    "`y` must have at least two dimensions for multi-output but has only one."
+                ),
+            )
+        if sample_weight is not None and (
+            sample_weight.ndim == 1 or sample_weight.shape[1] != y.shape[1]
+        ):
+            raise_log(
+                ValueError("`sample_weight` must have the same dimensions as `y`."),
+            )
+
+        if (
+            sample_weight is not None
+            and "sample_weight"
+            not in inspect.signature(self.estimator.partial_fit).parameters
+        ):
+            raise_log(
+                ValueError("Underlying estimator does not support sample weights."),
+            )
+
+        if (
+            partial_fit_params.get("verbose") is not None
+            and "verbose"
+            not in inspect.signature(self.estimator.partial_fit).parameters
+        ):
+            partial_fit_params.pop("verbose")
+
+        self.estimators_ = Parallel(n_jobs=self.n_jobs)(
+            delayed(_partial_fit_estimator)(
+                self.estimator if first_time else self.estimators_[i],
+                X,
+                y[:, i],
+                classes[i] if classes is not None else None,
+                partial_fit_params=dict(
+                    partial_fit_params,
+                    **(
+                        {"sample_weight": sample_weight[:, i]}
+                        if sample_weight is not None
+                        else {}
+                    ),
+                ),
+                first_time=first_time,
+            )
+            for i in range(y.shape[1])
+        )
+
+        if first_time and hasattr(self.estimators_[0], "n_features_in_"):
+            self.n_features_in_ = self.estimators_[0].n_features_in_
+        if first_time and hasattr(self.estimators_[0], "feature_names_in_"):
+            self.feature_names_in_ = self.estimators_[0].feature_names_in_
+
+        return self
+
     @property
     def supports_sample_weight(self) -> bool:
         """
@@ -176,6 +264,14 @@ class MultiOutputClassifier(MultiOutputMixin, sk_MultiOutputClassifier):
         self.classes_ = [estimator.classes_ for estimator in self.estimators_]
         return self
 
+    @available_if(lambda self: hasattr(self.estimator, "partial_fit"))
+    def partial_fit(self, X, y, classes=None, sample_weight=None, **partial_fit_params):
+        super().partial_fit(
+            X=X, y=y, classes=classes, sample_weight=sample_weight, **partial_fit_params
+        )
+        self.classes_ = [estimator.classes_ for estimator in self.estimators_]
+        return self
+
 
 def get_multioutput_estimator_cls(model_type: ModelType) -> type[MultiOutputMixin]:
     if model_type == ModelType.FORECASTING_REGRESSOR:
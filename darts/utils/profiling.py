@@ -0,0 +1,231 @@
+"""
+Profiling
+---------
+
+Opt-in instrumentation of the hot paths of Darts, to see where time (and memory) goes inside ``fit()``,
+``predict()``, ``historical_forecasts()``, tabularization, data transformers or metrics without an external profiler.
+
+Enable it with option ``profiling.enabled`` (see :mod:`darts.config`). Darts then records named spans with their
+number of calls, wall time and allocated memory, which can be retrieved with :func:`get_profiling_report()`.
+When disabled (the default), entering a span only costs a single check.
+
+Recorded spans:
+
+- ``"fit"``, ``"predict"``: the fit and predict methods of the regression models (``SKLearnModel`` and subclasses).
+- ``"tabularize"``: the creation of the lagged features and labels to fit the regression models.
+- ``"estimator.fit"``: the fit of the underlying (e.g. scikit-learn) estimator of the regression models.
+- ``"predict_rollout"``: the (autoregressive) prediction loop of the regression models.
+- ``"build_forecast_series"``: the creation of the forecast series from the predicted values.
+- ``"historical_forecasts"``: the historical forecasts of all forecasting models.
+- ``"transform"``, ``"inverse_transform"``, ``"transformer.fit"``: the data transformers.
+- ``"metric"``: the computation of the metrics.
+
+Custom code can be instrumented with :func:`profile_span()`.
+
+Examples
+--------
+>>> from darts import option_context
+>>> from darts.utils.profiling import get_profiling_report, reset_profiling
+>>> with option_context("profiling.enabled", True):
+...     model.fit(series)
+...     pred = model.predict(12)
+>>> report = get_profiling_report()
+>>> report.index.tolist()
+['fit', 'tabularize', 'estimator.fit', 'predict', 'predict_rollout', 'build_forecast_series']
+>>> report.columns.tolist()
+['count', 'wall_time', 'mean_wall_time', 'peak_allocated_bytes', 'net_allocated_bytes']
+>>> reset_profiling()
+"""
+
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable
+from functools import wraps
+
+import pandas as pd
+
+from darts.config import get_option
+
+# whether spans are recorded, kept in sync with option `profiling.enabled`
+_ENABLED = False
+# whether the memory allocated by spans is traced, kept in sync with option `profiling.track_memory`
+_TRACK_MEMORY = True
+# whether profiling started `tracemalloc` (and must stop it when disabled)
+_STARTED_TRACEMALLOC = False
+
+_REPORT_COLUMNS = [
+    "count",
+    "wall_time",
+    "mean_wall_time",
+    "peak_allocated_bytes",
+    "net_allocated_bytes",
+]
+
+_lock = threading.Lock()
+# the statistics of each span: [count, wall time, peak allocated bytes, net allocated bytes]
+_stats: dict[str, list] = {}
+# the stack of active spans of each thread
+_local = threading.local()
+
+
+class _Span:
+    __slots__ = ("name", "start_time", "start_memory", "peak_memory")
+
+    def __init__(self, name: str):
+        """A named span, recording its wall time and allocated memory while active."""
+        self.name = name
+        self.start_time = 0.0
+        self.start_memory = 0
+        self.peak_memory = 0
+
+    def __enter__(self):
+        stack = _span_stack()
+        if _TRACK_MEMORY and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                # the peak of the enclosing span so far, before resetting it for this span
+                stack[-1].peak_memory = max(stack[-1].peak_memory, peak)
+            tracemalloc.reset_peak()
+            self.start_memory = self.peak_memory = current
+        with _lock:
+            # the report lists the spans in order of their first start
+            _stats.setdefault(self.name, [0, 0.0, 0, 0])
+        stack.append(self)
+        self.start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        wall_time = time.perf_counter() - self.start_time
+        stack = _span_stack()
+        stack.pop()
+        peak_bytes = net_bytes = 0
+        if _TRACK_MEMORY and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            self.peak_memory = max(self.peak_memory, peak)
+            peak_bytes = self.peak_memory - self.start_memory
+            net_bytes = current - self.start_memory
+            if stack:
+                stack[-1].peak_memory = max(stack[-1].peak_memory, self.peak_memory)
+        with _lock:
+            stats = _stats.setdefault(self.name, [0, 0.0, 0, 0])
+            stats[0] += 1
+            stats[1] += wall_time
+            stats[2] = max(stats[2], peak_bytes)
+            stats[3] += net_bytes
+        return False
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def _span_stack() -> list[_Span]:
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def profile_span(name: str) -> _Span | _NoSpan:
+    """Return a context manager recording a span `name` if option ``profiling.enabled`` is set.
+
+    Spans can be nested. The wall time of a span includes the time of its nested spans.
+
+    Parameters
+    ----------
+    name
+        The name of the span. All calls with the same name are aggregated in the report.
+
+    Returns
+    -------
+    _Span | _NoSpan
+        The context manager recording the span, or a no-op context manager when profiling is disabled.
+
+    Examples
+    --------
+    >>> from darts.utils.profiling import profile_span
+    >>> with profile_span("preprocessing"):
+    ...     series = scaler.fit_transform(series)
+    """
+    return _Span(name) if _ENABLED else _NO_SPAN
+
+
+def profiled(name: str) -> Callable:
+    """Decorator recording each call of the decorated function as a span `name`, see :func:`profile_span()`.
+
+    Calls made while a span of the same name is the innermost active span (e.g. an overridden method calling
+    ``super()``) are part of that span and are not recorded again.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _ENABLED:
+                return func(*args, **kwargs)
+            stack = _span_stack()
+            if stack and stack[-1].name == name:
+                return func(*args, **kwargs)
+            with _Span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def get_profiling_report() -> pd.DataFrame:
+    """Return the statistics of all spans recorded since profiling was enabled or last reset.
+
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame indexed by span name (in order of their first start) with columns:
+
+        - `count`: the number of calls.
+        - `wall_time`: the total wall time in seconds.
+        - `mean_wall_time`: the mean wall time per call in seconds.
+        - `peak_allocated_bytes`: the maximum (over all calls) of the peak memory allocated during a call, above the
+          memory allocated at its start. Traced with ``tracemalloc`` if option ``profiling.track_memory`` is set
+          (otherwise `0`).
+        - `net_allocated_bytes`: the total memory allocated by all calls that was not released at their end.
+    """
+    with _lock:
+        rows = {name: list(stats) for name, stats in _stats.items()}
+    report = pd.DataFrame.from_dict(
+        rows,
+        orient="index",
+        columns=["count", "wall_time", "peak_allocated_bytes", "net_allocated_bytes"],
+    )
+    report.insert(2, "mean_wall_time", report["wall_time"] / report["count"])
+    report.index.name = "span"
+    return report[_REPORT_COLUMNS]
+
+
+def reset_profiling() -> None:
+    """Clear all recorded spans."""
+    with _lock:
+        _stats.clear()
+
+
+def _update_profiling(value=None) -> None:
+    """Synchronize the profiling state with options ``profiling.enabled`` and ``profiling.track_memory``."""
+    global _ENABLED, _TRACK_MEMORY, _STARTED_TRACEMALLOC
+    _ENABLED = get_option("profiling.enabled")
+    _TRACK_MEMORY = get_option("profiling.track_memory")
+    trace_memory = _ENABLED and _TRACK_MEMORY
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _STARTED_TRACEMALLOC = True
+    elif not trace_memory and _STARTED_TRACEMALLOC:
+        tracemalloc.stop()
+        _STARTED_TRACEMALLOC = False
@@ -20,7 +20,11 @@ from darts.timeseries import (
     TimeSeries,
 )
 from darts.typing import TimeIndex, TimeZone
-from darts.utils.utils import _maybe_cast_array_dtype, generate_index
+from darts.utils.utils import (
+    _get_compute_dtype,
+    _maybe_cast_array_dtype,
+    generate_index,
+)
 
 ONE_INDEXED_FREQS = {
     "day",
@@ -42,7 +46,7 @@ def constant_timeseries(
     length: int | None = None,
     freq: str | int | None = None,
     column_name: str | None = "constant",
-    dtype: np.typing.DTypeLike = np.float64,
+    dtype: np.typing.DTypeLike | None = None,
 ) -> TimeSeries:
     """
     Creates a constant univariate TimeSeries with the given value, length (or end date), start date and frequency.
@@ -70,13 +74,15 @@ def constant_timeseries(
     column_name
         Optionally, the name of the value column for the returned TimeSeries
     dtype
-        The desired NumPy dtype (np.float32 or np.float64) for the resulting series
+        The desired NumPy dtype (np.float32 or np.float64) for the resulting series. If `None`, uses the dtype
+        from option ``compute.dtype`` (np.float64 if not set).
 
     Returns
     -------
     TimeSeries
         A constant TimeSeries with value 'value'.
     """
+    dtype = _get_compute_dtype(dtype)
 
     index = generate_index(
         start=start, end=end, freq=freq, length=length, name=TIMES_NAME
@@ -98,7 +104,7 @@ def linear_timeseries(
     length: int | None = None,
     freq: str | int | None = None,
     column_name: str | None = "linear",
-    dtype: np.typing.DTypeLike = np.float64,
+    dtype: np.typing.DTypeLike | None = None,
 ) -> TimeSeries:
     """
     Creates a univariate TimeSeries with a starting value of `start_value` that increases linearly such that
@@ -131,13 +137,15 @@ def linear_timeseries(
     column_name
         Optionally, the name of the value column for the returned TimeSeries
     dtype
-        The desired NumPy dtype (np.float32 or np.float64) for the resulting series
+        The desired NumPy dtype (np.float32 or np.float64) for the resulting series. If `None`, uses the dtype
+        from option ``compute.dtype`` (np.float64 if not set).
 
     Returns
     -------
     TimeSeries
         A linear TimeSeries created as indicated above.
     """
+    dtype = _get_compute_dtype(dtype)
 
     index = generate_index(
         start=start, end=end, freq=freq, length=length, name=TIMES_NAME
@@ -161,7 +169,7 @@ def sine_timeseries(
     length: int | None = None,
     freq: str | int | None = None,
     column_name: str | None = "sine",
-    dtype: np.typing.DTypeLike = np.float64,
+    dtype: np.typing.DTypeLike | None = None,
 ) -> TimeSeries:
     """
     Creates a univariate TimeSeries with a sinusoidal value progression with a given frequency, amplitude,
@@ -196,13 +204,15 @@ def sine_timeseries(
     column_name
         Optionally, the name of the value column for the returned TimeSeries
     dtype
-        The desired NumPy dtype (np.float32 or np.float64) for the resulting series
+        The desired NumPy dtype (np.float32 or np.float64) for the resulting series. If `None`, uses the dtype
+        from option ``compute.dtype`` (np.float64 if not set).
 
     Returns
     -------
     TimeSeries
         A sinusoidal TimeSeries parametrized as indicated above.
     """
+    dtype = _get_compute_dtype(dtype)
 
     index = generate_index(
         start=start, end=end, freq=freq, length=length, name=TIMES_NAME
@@ -228,7 +238,7 @@ def gaussian_timeseries(
     length: int | None = None,
     freq: str | int | None = None,
     column_name: str | None = "gaussian",
-    dtype: np.typing.DTypeLike = np.float64,
+    dtype: np.typing.DTypeLike | None = None,
 ) -> TimeSeries:
     """
     Creates a gaussian univariate TimeSeries by sampling all the series values independently,
@@ -265,13 +275,15 @@ def gaussian_timeseries(
     column_name
         Optionally, the name of the value column for the returned TimeSeries
     dtype
-        The desired NumPy dtype (np.float32 or np.float64) for the resulting series
+        The desired NumPy dtype (np.float32 or np.float64) for the resulting series. If `None`, uses the dtype
+        from option ``compute.dtype`` (np.float64 if not set).
 
     Returns
     -------
     TimeSeries
         A white noise TimeSeries created as indicated above.
     """
+    dtype = _get_compute_dtype(dtype)
 
     if isinstance(mean, np.ndarray):
         if mean.shape != (length,):
@@ -310,7 +322,7 @@ def random_walk_timeseries(
     length: int | None = None,
     freq: str | int | None = None,
     column_name: str | None = "random_walk",
-    dtype: np.typing.DTypeLike = np.float64,
+    dtype: np.typing.DTypeLike | None = None,
 ) -> TimeSeries:
     """
     Creates a random walk univariate TimeSeries, where each step is obtained by sampling a gaussian distribution
@@ -341,13 +353,15 @@ def random_walk_timeseries(
     column_name
         Optionally, the name of the value column for the returned TimeSeries
     dtype
-        The desired NumPy dtype (np.float32 or np.float64) for the resulting series
+        The desired NumPy dtype (np.float32 or np.float64) for the resulting series. If `None`, uses the dtype
+        from option ``compute.dtype`` (np.float64 if not set).
 
     Returns
     -------
     TimeSeries
         A random walk TimeSeries created as indicated above.
     """
+    dtype = _get_compute_dtype(dtype)
 
     index = generate_index(
         start=start, end=end, freq=freq, length=length, name=TIMES_NAME
@@ -369,7 +383,7 @@ def autoregressive_timeseries(
     length: int | None = None,
     freq: str | int | None = None,
     column_name: str | None = "autoregressive",
-    dtype: np.typing.DTypeLike = np.float64,
+    dtype: np.typing.DTypeLike | None = None,
 ) -> TimeSeries:
     """
     Creates a univariate, autoregressive TimeSeries whose values are calculated using specified coefficients `coef` and
@@ -402,13 +416,15 @@ def autoregressive_timeseries(
     column_name
         Optionally, the name of the value column for the returned TimeSeries
     dtype
-        The desired NumPy dtype (np.float32 or np.float64) for the resulting series
+        The desired NumPy dtype (np.float32 or np.float64) for the resulting series. If `None`, uses the dtype
+        from option ``compute.dtype`` (np.float64 if not set).
 
     Returns
     -------
     TimeSeries
         An autoregressive TimeSeries created as indicated above.
     """
+    dtype = _get_compute_dtype(dtype)
 
     # if no start values specified default to a list of 1s
     if start_values is None:
@@ -481,7 +497,7 @@ def holidays_timeseries(
     column_name: str | None = "holidays",
     until: int | str | pd.Timestamp | None = None,
     add_length: int = 0,
-    dtype: np.typing.DTypeLike = np.float64,
+    dtype: np.typing.DTypeLike | None = None,
     tz: TimeZone = None,
 ) -> TimeSeries:
     """
@@ -509,7 +525,8 @@ def holidays_timeseries(
     column_name
         Optionally, the name of the value column for the returned TimeSeries.
     dtype
-        The desired NumPy dtype (np.float32 or np.float64) for the resulting series.
+        The desired NumPy dtype (np.float32 or np.float64) for the resulting series. If `None`, uses the dtype
+        from option ``compute.dtype`` (np.float64 if not set).
     tz
         Optionally, a time zone to convert the time index before computing attributes.
         Supports any type handled by pandas
@@ -520,6 +537,7 @@ def holidays_timeseries(
     TimeSeries
         A new binary holiday TimeSeries instance.
     """
+    dtype = _get_compute_dtype(dtype)
     time_index_ts, time_index = _process_time_index(
         time_index=time_index,
         tz=tz,
@@ -548,7 +566,7 @@ def datetime_attribute_timeseries(
     cyclic: bool = False,
     until: int | str | pd.Timestamp | None = None,
     add_length: int = 0,
-    dtype=np.float64,
+    dtype: np.typing.DTypeLike | None = None,
     with_columns: list[str] | str | None = None,
     tz: TimeZone = None,
 ) -> TimeSeries:
@@ -581,7 +599,8 @@ def datetime_attribute_timeseries(
         Extend the time_index by add_length, should match or exceed forecasting window.
         Set only one of until and add_length.
     dtype
-        The desired NumPy dtype (np.float32 or np.float64) for the resulting series
+        The desired NumPy dtype (np.float32 or np.float64) for the resulting series. If `None`, uses the dtype
+        from option ``compute.dtype`` (np.float64 if not set).
     with_columns
         Optionally, specify the output component names.
 
@@ -600,6 +619,7 @@ def datetime_attribute_timeseries(
     TimeSeries
         New datetime attribute TimeSeries instance.
     """
+    dtype = _get_compute_dtype(dtype)
 
     time_index_ts, time_index = _process_time_index(
         time_index=time_index,
@@ -798,6 +818,8 @@ def _build_forecast_series(
     TimeSeries
         New TimeSeries instance starting after the input series
     """
+    # the generated time index and the input series attributes are valid
+    is_trusted = time_index is None and custom_columns is None
     if time_index is None:
         time_index_length = (
             len(points_preds)
@@ -815,6 +837,17 @@ def _build_forecast_series(
         else np.stack(points_preds, axis=2)
     )
     values = _maybe_cast_array_dtype(values, input_series.dtype)
+    if is_trusted and values.ndim == 3:
+        return TimeSeries._from_trusted(
+            times=time_index,
+            values=values.copy() if copy else values,
+            components=input_series.components,
+            static_covariates=(
+                input_series.static_covariates if with_static_covs else None
+            ),
+            hierarchy=input_series.hierarchy if with_hierarchy else None,
+            metadata=input_series.metadata,
+        )
     return TimeSeries(
         times=time_index,
         values=values,
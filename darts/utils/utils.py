@@ -18,6 +18,7 @@ import pandas as pd
 from narwhals import DataFrame
 from pandas._libs.tslibs.offsets import BusinessMixin
 
+from darts.config import get_option
 from darts.logging import get_logger, raise_log
 from darts.typing import TimeIndex
 
@@ -820,8 +821,75 @@ def dataframe_col_to_time_index(
     return time_index
 
 
+def _dataframe_to_values(df: DataFrame, copy: bool = True) -> np.ndarray | None:
+    """Convert the numeric columns of a columnar dataframe (e.g. polars or pyarrow) to an array of shape
+    `(time, component, sample)`, cast to the dtype from option ``compute.dtype`` (see `_cast_to_compute_dtype()`).
+
+    Each column is read through a zero-copy view of its buffer where its dtype allows it (numeric without missing
+    values), and written directly into a single array with the final dtype, without an intermediate 2D array. With
+    `copy=False`, a single column that already has the final dtype is returned as a (read-only) view of its buffer.
+
+    Parameters
+    ----------
+    df
+        The dataframe containing only the value columns.
+    copy
+        Whether the values may be a view of the dataframe's memory.
+
+    Returns
+    -------
+    np.ndarray | None
+        The values, or `None` if not all columns are numeric.
+    """
+    # common dtype of all columns, read from an empty frame
+    dtype = df.head(0).to_numpy().dtype
+    if dtype.kind not in "biuf":
+        return None
+
+    compute_dtype = get_option("compute.dtype")
+    if compute_dtype is None:
+        compute_dtype = dtype if np.issubdtype(dtype, np.floating) else np.float64
+    compute_dtype = np.dtype(compute_dtype)
+
+    columns = df.columns
+    if not copy and len(columns) == 1:
+        vals = df.get_column(columns[0]).to_numpy()
+        if vals.dtype == compute_dtype:
+            return vals[:, np.newaxis, np.newaxis]
+
+    arrays = [df.get_column(col).to_numpy() for col in columns]
+    values = np.empty((len(df), len(columns), 1), dtype=compute_dtype)
+    # write blocks of rows at once, which is much faster than writing each column with a large stride
+    block_length = 4096
+    for start in range(0, len(df), block_length):
+        end = start + block_length
+        np.stack(
+            [arr[start:end] for arr in arrays],
+            axis=1,
+            out=values[start:end, :, 0],
+            casting="unsafe",
+        )
+    return values
+
+
 def _maybe_cast_array_dtype(vals: np.ndarray, dtype):
     """Cast an array to `dtype` if it does not yet have the correct data type."""
     if vals.dtype != dtype:
         vals = vals.astype(dtype)
     return vals
+
+
+def _get_compute_dtype(dtype: np.typing.DTypeLike | None = None) -> np.dtype:
+    """Return `dtype` if given, otherwise the dtype from option ``compute.dtype`` (`np.float64` if not set)."""
+    if dtype is None:
+        dtype = get_option("compute.dtype") or np.float64
+    return np.dtype(dtype)
+
+
+def _cast_to_compute_dtype(vals: np.ndarray) -> np.ndarray:
+    """Cast an array to the dtype from option ``compute.dtype``. If the option is not set, only non floating point
+    arrays are cast to `np.float64`."""
+    dtype = get_option("compute.dtype")
+    if dtype is None:
+        dtype = vals.dtype if np.issubdtype(vals.dtype, np.floating) else np.float64
+    return _maybe_cast_array_dtype(vals, dtype)